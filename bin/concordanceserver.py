@@ -0,0 +1,59 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import getopt
+import logging
+import sys
+from trnltk.treebank.service import ConcordanceService, ConcordanceServer
+
+USAGE = """
+Serves concordance queries on a parseset over HTTP. See trnltk.treebank.service for the request format.
+
+Usage: python concordanceserver.py [options] <parseset_path>
+
+Options:
+    --host=<host>                : host to bind to, defaults to localhost
+    --port=<port>                : port to listen, defaults to 8080
+    --index-folder=<folder>      : folder to keep the indexes. if indexes are there, they are loaded instead of being
+                                   built from the parseset
+"""
+
+def main(args):
+    try:
+        options, arguments = getopt.getopt(args, '', ['host=', 'port=', 'index-folder='])
+    except getopt.GetoptError, e:
+        print e
+        print USAGE
+        return
+
+    if len(arguments) != 1:
+        print USAGE
+        return
+
+    options = dict(options)
+
+    logging.basicConfig(level=logging.INFO)
+
+    service = ConcordanceService.from_parseset(arguments[0], options.get('--index-folder'))
+    server = ConcordanceServer(service, (options.get('--host', 'localhost'), int(options.get('--port', 8080))))
+
+    print 'Serving concordance of {} words at {}'.format(service.word_count, server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,47 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import sys
+from trnltk.morphology.lexicon.compiledlexicon import LexiconCompiler
+
+RESOURCES_FOLDER = os.path.join(os.path.dirname(__file__), '../trnltk/resources')
+
+DEFAULT_SOURCE_FILE_PATHS = [os.path.join(RESOURCES_FOLDER, 'master_dictionary.txt'),
+                             os.path.join(RESOURCES_FOLDER, 'proper_nouns_extracted_from_dic.txt')]
+
+USAGE = """
+Compiles lexicon text files into a compiled lexicon file, which is loaded much faster than the text files.
+See trnltk.morphology.lexicon.compiledlexicon for loading it.
+
+Usage: python lexiconcompiler.py <compiled_file_path> [<dictionary_file_path>...]
+
+Dictionary files default to the master dictionary and the proper nouns in the resources folder.
+"""
+
+def main(args):
+    if not args:
+        print USAGE
+        return
+
+    compiled_file_path = args[0]
+    source_file_paths = args[1:] or DEFAULT_SOURCE_FILE_PATHS
+
+    lexemes = LexiconCompiler.compile_files(source_file_paths, compiled_file_path)
+
+    print 'Compiled {} lexemes from {} files into {}'.format(len(lexemes), len(source_file_paths), compiled_file_path)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
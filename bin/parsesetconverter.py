@@ -0,0 +1,44 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import sys
+from trnltk.parseset.binaryparseset import convert_xml_to_binary
+
+USAGE = """
+Converts a parseset XML file to the binary parseset format, which can be read with BinaryParseSetReader.
+
+Usage: python parsesetconverter.py <parseset_xml_path> [<output_path>]
+
+Output path defaults to the XML path with the extension replaced by ".bin".
+"""
+
+def main(args):
+    if not args:
+        print USAGE
+        return
+
+    xml_path = args[0]
+    if len(args) > 1:
+        output_path = args[1]
+    else:
+        base_path = xml_path[:-len('.gz')] if xml_path.endswith('.gz') else xml_path
+        output_path = (base_path[:-len('.xml')] if base_path.endswith('.xml') else base_path) + '.bin'
+
+    sentence_count = convert_xml_to_binary(xml_path, output_path)
+
+    print 'Written {} sentences to {}'.format(sentence_count, output_path)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import getopt
+import logging
+import sys
+from trnltk.parseset.pipeline import ParseSetGenerationPipeline, ContextlessSentenceParserFactory, ContextfulSentenceParserFactory
+
+USAGE = """
+Generates parsesets from raw text files, which have a sentence in each line unless --split-sentences is given. Files
+ending with ".gz" are read gzip compressed.
+
+Usage: python parsesetgenerator.py [options] <output_folder> <text_file_path>...
+
+Options:
+    --processes=<count>             : number of worker processes, defaults to the number of CPUs. 0 runs in a single process
+    --batch-size=<count>            : number of sentences sent to a worker at once
+    --sentences-per-part=<count>    : number of sentences in each part file of the output
+    --contextful=<parseset_index>   : parse with the contextful parser, using the ngrams of the given parseset
+    --db-host=<host>                : host of the ngram database for the contextful parser
+    --likelihood-cache-size=<count> : number of likelihoods the contextful parser caches in each worker
+    --likelihood-cache-path=<path>  : file to load the likelihood cache from and to save it to when the workers are done
+    --split-sentences               : split the text into sentences, instead of taking each line as a sentence
+
+Parsesets are written to gzip compressed part files in the output folder. When stopped, running again with the same
+arguments continues from the last completed part.
+"""
+
+def main(args):
+    try:
+        options, arguments = getopt.getopt(args, '', ['processes=', 'batch-size=', 'sentences-per-part=', 'contextful=', 'db-host=',
+                                                       'likelihood-cache-size=', 'likelihood-cache-path=', 'split-sentences'])
+    except getopt.GetoptError, e:
+        print e
+        print USAGE
+        return
+
+    if len(arguments) < 2:
+        print USAGE
+        return
+
+    options = dict(options)
+
+    if '--contextful' in options:
+        factory_kwargs = {'parseset_index': options['--contextful']}
+        if '--db-host' in options:
+            factory_kwargs['db_host'] = options['--db-host']
+        if '--likelihood-cache-size' in options:
+            factory_kwargs['likelihood_cache_size'] = int(options['--likelihood-cache-size'])
+        if '--likelihood-cache-path' in options:
+            factory_kwargs['likelihood_cache_path'] = options['--likelihood-cache-path']
+        sentence_parser_factory = ContextfulSentenceParserFactory(**factory_kwargs)
+    else:
+        sentence_parser_factory = ContextlessSentenceParserFactory()
+
+    pipeline_kwargs = {}
+    if '--processes' in options:
+        pipeline_kwargs['process_count'] = int(options['--processes'])
+    if '--batch-size' in options:
+        pipeline_kwargs['batch_size'] = int(options['--batch-size'])
+    if '--sentences-per-part' in options:
+        pipeline_kwargs['sentences_per_part'] = int(options['--sentences-per-part'])
+    if '--split-sentences' in options:
+        pipeline_kwargs['split_sentences'] = True
+
+    logging.basicConfig(level=logging.INFO)
+
+    pipeline = ParseSetGenerationPipeline(sentence_parser_factory, arguments[0], **pipeline_kwargs)
+    part_paths = pipeline.run(arguments[1:])
+
+    print 'Written {} parts to {}'.format(len(part_paths), arguments[0])
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import sys
+from trnltk.morphology.contextful.likelihoodmetrics.contextlessdistribution.contextlessdistributionsmoother import SimpleGoodTuringContextlessDistributionSmoother
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.smoothingtable import SmoothingTableBuilder, DEFAULT_SMOOTHING_TABLE_PATH
+from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.ngramfrequencysmoother import SimpleGoodTuringNGramFrequencySmoother
+
+SMOOTHING_THRESHOLD = 5
+
+USAGE = """
+Builds the smoothing table used by CachedSimpleGoodTuringNGramFrequencySmoother and
+CachedContextlessDistributionSmoother from the ngram collections of a parse set.
+
+Usage: python smoothingtablebuilder.py <parseset_index> [<output_path>] [<db_host>]
+"""
+
+def build_smoothing_table(connection_provider, parseset_index, smoothing_threshold=SMOOTHING_THRESHOLD):
+    collection_map = connection_provider.get_ngram_collection_map(parseset_index)
+    unigram_collection = collection_map[1]
+
+    ngram_frequency_smoothers = []
+    for n in (2, 3):
+        ngram_frequency_smoother = SimpleGoodTuringNGramFrequencySmoother(n, smoothing_threshold, collection_map[n], unigram_collection)
+        ngram_frequency_smoother.initialize()
+        ngram_frequency_smoothers.append(ngram_frequency_smoother)
+
+    contextless_distribution_smoother = SimpleGoodTuringContextlessDistributionSmoother(smoothing_threshold, unigram_collection)
+    contextless_distribution_smoother.initialize()
+
+    return SmoothingTableBuilder(smoothing_threshold, ngram_frequency_smoothers, contextless_distribution_smoother).build()
+
+def main(args):
+    if not args:
+        print USAGE
+        return
+
+    parseset_index = args[0]
+    output_path = args[1] if len(args) > 1 else DEFAULT_SMOOTHING_TABLE_PATH
+    db_host = args[2] if len(args) > 2 else ConnectionProvider.DEFAULT_HOST
+
+    smoothing_table = build_smoothing_table(ConnectionProvider(host=db_host), parseset_index)
+    smoothing_table.save(output_path)
+
+    print 'Written smoothing table for {} ngram types to {}'.format(len(smoothing_table.ngram_types), output_path)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -17,6 +17,7 @@ import logging
 from pprint import pformat
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.ngramtypefrequencyfinder import NgramTypeFrequencyFinder
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.simplegoodturing import SimpleGoodTuringSmoother
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.smoothingtable import SmoothingTable
 
 logger = logging.getLogger('contextlessDistributionSmoother')
 
@@ -36,39 +37,37 @@ class CachedContextlessDistributionSmoother(ContextlessDistributionSmoother):
      Since SimpleGoodTuringContextlessDistributionSmoother takes a lot of time to initialize,
      this class returns the smooth counts which are calculated before.
 
-     The values are calculated using test_simplegoodturingcontextlessdistributionsmoother.py.
+     The values are read from a smoothing table built by SmoothingTableBuilder. If no table is given, the bundled
+     table which is generated from parse set 999 is used.
 
      In a production app, these values should be cached in a db collection and updated incrementally
      over the time.
     """
 
-    def __init__(self):
-        self._parse_result_smooth_count_map = {
-            0: 0.008502447849533839,
-            1: 0.21471040149642595,
-            2: 1.1129522477195453,
-            3: 1.8991528085245906,
-            4: 3.488358849588453,
-            5: 3.9048094131380293
-        }
-        self._word_smooth_count_map = {
-            0: 0.05562595701990601,
-            1: 0.22317104256946213,
-            2: 1.0726985250469303,
-            3: 1.9161010077475567,
-            4: 3.182159988876787,
-            5: 4.016279163368528
-        }
+    def __init__(self, smoothing_table=None):
+        """
+        @type smoothing_table: SmoothingTable or None
+        """
+        smoothing_table = smoothing_table or SmoothingTable.load()
+        self._parse_result_smoothed_counts = smoothing_table.parse_result_smoothed_counts
+        self._word_smoothed_counts = smoothing_table.word_smoothed_counts
+        self._smoothing_threshold = smoothing_table.smoothing_threshold
 
     def initialize(self):
         # do nothing
         pass
 
     def smooth_parse_result_occurrence_count(self, parse_result_occurrence_count):
-        return self._parse_result_smooth_count_map.get(parse_result_occurrence_count, parse_result_occurrence_count)
+        return self._smooth(parse_result_occurrence_count, self._parse_result_smoothed_counts)
 
     def smooth_word_occurrence_count(self, word_occurrence_count):
-        return self._word_smooth_count_map.get(word_occurrence_count, word_occurrence_count)
+        return self._smooth(word_occurrence_count, self._word_smoothed_counts)
+
+    def _smooth(self, count, smoothed_counts):
+        # only the integer counts up to the threshold have smoothed counts, others are returned as they are
+        if 0 <= count <= self._smoothing_threshold and count == int(count):
+            return smoothed_counts[int(count)]
+        return count
 
 
 class SimpleGoodTuringContextlessDistributionSmoother(ContextlessDistributionSmoother):
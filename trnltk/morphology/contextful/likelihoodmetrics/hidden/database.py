@@ -14,11 +14,150 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import logging
+import threading
 import pymongo
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.query import WordNGramQueryContainer, QueryExecutionIndexContextBuilder
 
 logger = logging.getLogger('database')
 
+class ConnectionProvider(object):
+    """
+    Central place to get the database connection and the collections from.
+
+    The connection is not created until it is first needed and then it is shared by all the users of the provider.
+    The connection keeps a pool of at most max_pool_size sockets and, since requests are started automatically,
+    a thread keeps using the same socket for its subsequent operations. Thus, many threads of the learner web
+    app or a batch worker end up using a bounded number of sockets instead of opening a new connection each.
+    """
+
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_DATABASE_NAME = 'trnltk'
+    DEFAULT_MAX_POOL_SIZE = 10
+
+    NGRAM_COLLECTION_NAME_PATTERNS = {
+        1: 'wordUnigrams{}',
+        2: 'wordBigrams{}',
+        3: 'wordTrigrams{}'
+    }
+
+    def __init__(self, host=DEFAULT_HOST, port=None, database_name=DEFAULT_DATABASE_NAME, max_pool_size=DEFAULT_MAX_POOL_SIZE,
+                 read_preference=None):
+        """
+        @type host: str
+        @type port: int or None
+        @type database_name: str
+        @type max_pool_size: int
+        @param read_preference: one of pymongo.ReadPreference values. Server default is used if None
+        """
+        assert max_pool_size > 0
+
+        self._host = host
+        self._port = port
+        self._database_name = database_name
+        self._max_pool_size = max_pool_size
+        self._read_preference = read_preference
+
+        self._connection = None
+        self._collections = {}
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        """
+        @rtype: Connection
+        """
+        if self._connection is None:
+            with self._lock:
+                # check again, another thread might have created the connection while this one is waiting for the lock
+                if self._connection is None:
+                    self._connection = self._create_connection()
+
+        return self._connection
+
+    def _create_connection(self):
+        connection_args = {'max_pool_size': self._max_pool_size, 'auto_start_request': True}
+        if self._read_preference is not None:
+            connection_args['read_preference'] = self._read_preference
+
+        logger.log(logging.DEBUG, u'Creating connection to {}:{} with args {}'.format(self._host, self._port, connection_args))
+        return pymongo.Connection(host=self._host, port=self._port, **connection_args)
+
+    def get_database(self):
+        """
+        @rtype: Database
+        """
+        return self.get_connection()[self._database_name]
+
+    def get_collection(self, collection_name):
+        """
+        @type collection_name: str
+        @rtype: Collection
+        """
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self.get_database()[collection_name]
+            self._collections[collection_name] = collection
+
+        return collection
+
+    def get_ngram_collection_map(self, parseset_index):
+        """
+        Creates a collection map for the ngram collections of the given parse set. Collections in the map are resolved
+        on access, thus creating the map doesn't open a connection.
+
+        @type parseset_index: str
+        @rtype: LazyCollectionMap
+        """
+        collection_names = {}
+        for n, collection_name_pattern in self.NGRAM_COLLECTION_NAME_PATTERNS.iteritems():
+            collection_names[n] = collection_name_pattern.format(parseset_index)
+
+        return LazyCollectionMap(self, collection_names)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.disconnect()
+            self._connection = None
+            self._collections = {}
+
+
+class LazyCollectionMap(object):
+    """
+    Read only map of keys to collections, which asks the connection provider for a collection only when it is accessed.
+
+    Can be used as a collection map anywhere; e.g. for QueryExecutionContextBuilder and DatabaseIndexBuilder.
+    """
+
+    def __init__(self, connection_provider, collection_names):
+        """
+        @type connection_provider: ConnectionProvider
+        @type collection_names: dict
+        """
+        self._connection_provider = connection_provider
+        self._collection_names = dict(collection_names)
+
+    def __getitem__(self, key):
+        return self._connection_provider.get_collection(self._collection_names[key])
+
+    def get(self, key, default=None):
+        if key in self._collection_names:
+            return self[key]
+        else:
+            return default
+
+    def __contains__(self, key):
+        return key in self._collection_names
+
+    def __len__(self):
+        return len(self._collection_names)
+
+    def __iter__(self):
+        return iter(self._collection_names)
+
+    def keys(self):
+        return self._collection_names.keys()
+
+
 class DatabaseIndexBuilder(object):
     def __init__(self, collection_map):
         self._collection_map = collection_map
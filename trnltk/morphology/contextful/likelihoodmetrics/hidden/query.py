@@ -96,6 +96,12 @@ class QueryExecutionContextBuilder(object):
         self._collection_map = collection_map
 
     def create_context(self, query_container, target_comes_after):
+        keys = self.create_keys(query_container, target_comes_after)
+        collection = self._collection_map[query_container.n]
+
+        return QueryExecutionContext(keys, collection)
+
+    def create_keys(self, query_container, target_comes_after):
         item_count = (1 if query_container.target_item else 0) + len(query_container.given_items)
         assert query_container.n == item_count, "n: {}, item count : {}".format(query_container.n, item_count)
 
@@ -118,9 +124,7 @@ class QueryExecutionContextBuilder(object):
             item_keys = self._build_key(item, item_index)
             keys.extend(item_keys)
 
-        collection = self._collection_map[query_container.n]
-
-        return QueryExecutionContext(keys, collection)
+        return keys
 
     def _build_key(self, query_item, index):
         keys = ["item_{}.word.{}.value".format(index, query_item.str_type)]
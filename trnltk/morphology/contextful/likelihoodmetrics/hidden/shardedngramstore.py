@@ -0,0 +1,339 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Ngram store which partitions the ngrams across multiple shards.
+
+An ngram is stored in exactly one shard, which is chosen by the consistent hash of its shard key. Shard key of an
+ngram is its context key: the values of the same item type (surface by default) of its context items. Context items are
+all items except the target, which is the last item if the target comes after the context and the first item otherwise.
+Unigrams have no context, so their single item is the key. Since the shards are disjoint, count of a query is the sum of
+the counts from all shards. If the query specifies the full context key, it is sent to a single shard, whatever it asks
+for the target.
+
+Context of an ngram depends on the side the target is on, so a store is partitioned either for leading contexts or for
+following contexts. Queries of the other side, and queries which specify the context with another item type, are still
+counted correctly but are sent to all shards. Thus, to route all queries to single shards, the ngrams are inserted to
+two stores; one for each side.
+
+Shards can be in the same process (LocalNGramShard) or in another process, possibly on another machine
+(RemoteNGramShard talking to an NGramShardServer).
+
+Protocol between RemoteNGramShard and NGramShardServer is line based; each request and response is a single line of
+JSON. Requests are like {"method": "count", "n": 2, "query": {...}} or {"method": "insert", "n": 2, "documents": [...]}
+and responses are like {"result": 12} or {"error": "message"}.
+"""
+import SocketServer
+import bisect
+import hashlib
+import json
+import logging
+import socket
+import threading
+from multiprocessing.pool import ThreadPool
+
+logger = logging.getLogger('shardedngramstore')
+
+class ConsistentHashRing(object):
+    """
+    Maps keys to shard indexes. Adding a shard to the ring moves only about 1/N of the keys.
+    """
+
+    DEFAULT_REPLICA_COUNT = 100
+
+    def __init__(self, shard_count, replica_count=DEFAULT_REPLICA_COUNT):
+        """
+        @param shard_count: number of shards
+        @param replica_count: number of virtual nodes for each shard on the ring
+        """
+        assert shard_count > 0
+        assert replica_count > 0
+
+        self._shard_count = shard_count
+        self._ring = []
+        for shard_index in range(0, shard_count):
+            for replica_index in range(0, replica_count):
+                self._ring.append((self._hash('{}#{}'.format(shard_index, replica_index)), shard_index))
+
+        self._ring.sort()
+        self._ring_hashes = [ring_hash for ring_hash, shard_index in self._ring]
+
+    def get_shard_index(self, key):
+        """
+        @type key: str or unicode
+        @rtype: int
+        """
+        position = bisect.bisect(self._ring_hashes, self._hash(key))
+        if position == len(self._ring):
+            position = 0
+        return self._ring[position][1]
+
+    @classmethod
+    def _hash(cls, key):
+        if isinstance(key, unicode):
+            key = key.encode('utf-8')
+        return long(hashlib.md5(key).hexdigest(), 16)
+
+
+class NGramShardKeyExtractor(object):
+    """
+    Extracts the shard key, which is the context key, from ngram documents and from queries.
+    """
+
+    def __init__(self, item_type='surface', target_comes_after=True):
+        """
+        @param item_type: one of 'surface', 'stem', 'lemma_root'
+        @param target_comes_after: if True, context items are the leading items of the ngrams, and the following items
+            otherwise
+        """
+        self._item_type = item_type
+        self._target_comes_after = target_comes_after
+
+    def get_key_fields(self, n):
+        if n == 1:
+            item_indexes = [0]
+        elif self._target_comes_after:
+            item_indexes = range(0, n - 1)
+        else:
+            item_indexes = range(1, n)
+
+        return ["item_{}.word.{}.value".format(i, self._item_type) for i in item_indexes]
+
+    def get_query_shard_key(self, n, query):
+        """
+        @return: shard key if the query specifies all fields of it, None otherwise
+        @rtype: unicode or None
+        """
+        values = []
+        for key_field in self.get_key_fields(n):
+            if key_field not in query:
+                return None
+            values.append(query[key_field])
+
+        return self._join(values)
+
+    def get_document_shard_key(self, n, document):
+        values = []
+        for key_field in self.get_key_fields(n):
+            value = document
+            for path_item in key_field.split('.'):
+                value = value[path_item]
+            values.append(value)
+
+        return self._join(values)
+
+    def _join(self, values):
+        return u'\t'.join([unicode(value) for value in values])
+
+
+class LocalNGramShard(object):
+    """
+    Shard which holds its ngrams in the given collections.
+    """
+
+    def __init__(self, collection_map):
+        """
+        @param collection_map: map of n to the collection of the ngrams
+        """
+        self._collection_map = collection_map
+
+    def count(self, n, query):
+        return self._collection_map[n].find(query).count()
+
+    def insert(self, n, documents):
+        if not documents:
+            return 0
+        self._collection_map[n].insert(documents)
+        return len(documents)
+
+
+class RemoteNGramShard(object):
+    """
+    Shard which is served by an NGramShardServer. The connection is opened on first request and reused.
+    """
+
+    def __init__(self, host, port, timeout=None):
+        self._address = (host, port)
+        self._timeout = timeout
+
+        self._socket = None
+        self._socket_file = None
+        self._lock = threading.Lock()
+
+    def count(self, n, query):
+        return self._call({'method': 'count', 'n': n, 'query': query})
+
+    def insert(self, n, documents):
+        return self._call({'method': 'insert', 'n': n, 'documents': documents})
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+    def _call(self, request):
+        request_line = json.dumps(request) + '\n'
+        with self._lock:
+            try:
+                if self._socket is None:
+                    self._connect()
+                self._socket_file.write(request_line)
+                self._socket_file.flush()
+                response_line = self._socket_file.readline()
+            except socket.error:
+                self._disconnect()
+                raise
+
+            if not response_line:
+                self._disconnect()
+                raise Exception('Shard {}:{} closed the connection'.format(*self._address))
+
+        response = json.loads(response_line)
+        if 'error' in response:
+            raise Exception('Shard {}:{} failed: {}'.format(self._address[0], self._address[1], response['error']))
+
+        return response['result']
+
+    def _connect(self):
+        logger.log(logging.DEBUG, u'Connecting to shard {}:{}'.format(*self._address))
+        self._socket = socket.create_connection(self._address, self._timeout)
+        self._socket_file = self._socket.makefile('rwb')
+
+    def _disconnect(self):
+        if self._socket is not None:
+            try:
+                self._socket_file.close()
+                self._socket.close()
+            except socket.error:
+                pass
+        self._socket = None
+        self._socket_file = None
+
+
+class _NGramShardRequestHandler(SocketServer.StreamRequestHandler):
+    def handle(self):
+        while True:
+            request_line = self.rfile.readline()
+            if not request_line:
+                break
+
+            try:
+                response = {'result': self._handle_request(json.loads(request_line))}
+            except Exception as e:
+                logger.exception(u'Failed to handle shard request')
+                response = {'error': unicode(e)}
+
+            self.wfile.write(json.dumps(response) + '\n')
+            self.wfile.flush()
+
+    def _handle_request(self, request):
+        shard = self.server.shard
+        method = request['method']
+        n = int(request['n'])
+
+        if method == 'count':
+            return shard.count(n, request['query'])
+        elif method == 'insert':
+            return shard.insert(n, request['documents'])
+        else:
+            raise Exception('Unknown method {}'.format(method))
+
+
+class NGramShardServer(SocketServer.ThreadingTCPServer):
+    """
+    Serves a shard over TCP. Use port 0 to pick a free port, and server_address to find out the used one.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, shard, host='127.0.0.1', port=0):
+        """
+        @type shard: LocalNGramShard
+        """
+        SocketServer.ThreadingTCPServer.__init__(self, (host, port), _NGramShardRequestHandler)
+        self.shard = shard
+
+    def start(self):
+        """
+        Starts serving in a daemon thread.
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class ShardedNGramStore(object):
+    """
+    Routes the ngram queries and inserts to the shards, and merges the results.
+    """
+
+    def __init__(self, shards, shard_key_extractor=None, hash_ring=None):
+        """
+        @type shards: list<LocalNGramShard or RemoteNGramShard>
+        @type shard_key_extractor: NGramShardKeyExtractor or None
+        @type hash_ring: ConsistentHashRing or None
+        """
+        assert shards
+
+        self._shards = shards
+        self._shard_key_extractor = shard_key_extractor or NGramShardKeyExtractor()
+        self._hash_ring = hash_ring or ConsistentHashRing(len(shards))
+
+        self._fan_out_pool = None
+        self._fan_out_pool_lock = threading.Lock()
+
+    def count(self, n, query):
+        shard_key = self._shard_key_extractor.get_query_shard_key(n, query)
+        if shard_key is not None:
+            shard_index = self._hash_ring.get_shard_index(shard_key)
+            logger.log(logging.DEBUG, u'Routing query to shard {}'.format(shard_index))
+            return self._shards[shard_index].count(n, query)
+
+        logger.log(logging.DEBUG, u'Query does not specify the shard key, fanning out to {} shards'.format(len(self._shards)))
+        return sum(self._fan_out(lambda shard: shard.count(n, query)))
+
+    def insert(self, n, documents):
+        documents_for_shards = [[] for shard in self._shards]
+        for document in documents:
+            shard_key = self._shard_key_extractor.get_document_shard_key(n, document)
+            documents_for_shards[self._hash_ring.get_shard_index(shard_key)].append(document)
+
+        inserted_count = 0
+        for shard, shard_documents in zip(self._shards, documents_for_shards):
+            if shard_documents:
+                inserted_count += shard.insert(n, shard_documents)
+
+        return inserted_count
+
+    def _fan_out(self, call):
+        if len(self._shards) == 1:
+            return [call(self._shards[0])]
+
+        if self._fan_out_pool is None:
+            with self._fan_out_pool_lock:
+                if self._fan_out_pool is None:
+                    self._fan_out_pool = ThreadPool(len(self._shards))
+
+        return self._fan_out_pool.map(call, self._shards)
+
+    def close(self):
+        if self._fan_out_pool is not None:
+            self._fan_out_pool.close()
+            self._fan_out_pool = None
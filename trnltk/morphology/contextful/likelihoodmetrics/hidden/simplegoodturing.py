@@ -41,6 +41,7 @@ class SimpleGoodTuringSmoother(object):
 
     def initialize(self, plot=False):
         self._calculate_loglinregression_coefficients(plot)
+        self._smoothed_counts = numpy.array([self.smooth(count) for count in range(0, self._smoothing_threshold + 1)], dtype=float)
 
     def _calculate_loglinregression_coefficients(self, plot=False):
         self._loglinregression_m = None
@@ -153,6 +154,25 @@ class SimpleGoodTuringSmoother(object):
 
         return smoothed_count
 
+    def smooth_many(self, counts):
+        """
+        Smooths all the counts in the given array at once. Results are the same with calling smooth for each count.
+
+        Counts up to K are looked up from the smoothed counts calculated with smooth at initialization, bigger
+        counts are returned as they are.
+
+        @param counts: array of non-negative integer counts (could be int, stored in float)
+        @type counts: numpy.ndarray
+        @rtype: numpy.ndarray
+        """
+        counts = numpy.asarray(counts, dtype=float)
+        assert numpy.all(counts >= 0)
+        assert numpy.all(numpy.floor(counts) == counts)
+
+        K = self._smoothing_threshold
+        indexes = numpy.minimum(counts, K).astype(int)
+        return numpy.where(counts > K, counts, self._smoothed_counts[indexes])
+
     def _map_c_to_Nc(self, count):
         m = self._loglinregression_m
         c = self._loglinregression_c
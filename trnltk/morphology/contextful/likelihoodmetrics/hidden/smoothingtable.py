@@ -0,0 +1,123 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import logging
+import os
+import numpy
+
+logger = logging.getLogger('smoothingtable')
+
+DEFAULT_SMOOTHING_TABLE_PATH = os.path.join(os.path.dirname(__file__), '../../../../resources/smoothingtables.npz')
+
+class SmoothingTable(object):
+    """
+    Smoothed counts for counts 0..K, precomputed with Simple Good-Turing smoothers.
+
+    Ngram frequency smoothed counts are held in a 2D array; rows are ngram types and columns are counts.
+    Contextless distribution smoothed counts are held in 1D arrays indexed by count.
+    """
+
+    def __init__(self, ngram_types, ngram_smoothed_counts, parse_result_smoothed_counts, word_smoothed_counts):
+        """
+        @type ngram_types: list<list<str>>
+        @type ngram_smoothed_counts: numpy.ndarray
+        @type parse_result_smoothed_counts: numpy.ndarray
+        @type word_smoothed_counts: numpy.ndarray
+        """
+        assert len(ngram_types) == ngram_smoothed_counts.shape[0]
+        assert ngram_smoothed_counts.shape[1] == len(parse_result_smoothed_counts) == len(word_smoothed_counts)
+
+        self.ngram_types = [list(ngram_type) for ngram_type in ngram_types]
+        self.ngram_smoothed_counts = ngram_smoothed_counts
+        self.parse_result_smoothed_counts = parse_result_smoothed_counts
+        self.word_smoothed_counts = word_smoothed_counts
+
+        self.smoothing_threshold = ngram_smoothed_counts.shape[1] - 1
+
+        self._ngram_type_ids = {}
+        for ngram_type_id, ngram_type in enumerate(self.ngram_types):
+            self._ngram_type_ids[tuple(ngram_type)] = ngram_type_id
+
+    def get_ngram_type_id(self, ngram_type):
+        """
+        @type ngram_type: list<str> or tuple<str>
+        @rtype: int
+        """
+        return self._ngram_type_ids[tuple(ngram_type)]
+
+    def save(self, file_path):
+        # ngram types are stored like "surface|lemma_root", since the item types have underscores
+        ngram_type_keys = numpy.array(['|'.join(ngram_type) for ngram_type in self.ngram_types], dtype=str)
+        with open(file_path, 'wb') as f:
+            numpy.savez_compressed(f,
+                ngram_types=ngram_type_keys,
+                ngram_smoothed_counts=self.ngram_smoothed_counts,
+                parse_result_smoothed_counts=self.parse_result_smoothed_counts,
+                word_smoothed_counts=self.word_smoothed_counts)
+
+    @classmethod
+    def load(cls, file_path=DEFAULT_SMOOTHING_TABLE_PATH):
+        """
+        @rtype: SmoothingTable
+        """
+        logger.debug("Loading smoothing table from {}".format(file_path))
+        with open(file_path, 'rb') as f:
+            arrays = numpy.load(f)
+            ngram_types = [str(ngram_type_key).split('|') for ngram_type_key in arrays['ngram_types']]
+            return SmoothingTable(ngram_types,
+                numpy.array(arrays['ngram_smoothed_counts'], dtype=float),
+                numpy.array(arrays['parse_result_smoothed_counts'], dtype=float),
+                numpy.array(arrays['word_smoothed_counts'], dtype=float))
+
+
+class SmoothingTableBuilder(object):
+    """
+    Builds a SmoothingTable from initialized Simple Good-Turing smoothers, thus from the current ngram collections.
+    """
+
+    def __init__(self, smoothing_threshold, ngram_frequency_smoothers, contextless_distribution_smoother):
+        """
+        @type smoothing_threshold: int
+        @type ngram_frequency_smoothers: list<SimpleGoodTuringNGramFrequencySmoother>
+        @type contextless_distribution_smoother: SimpleGoodTuringContextlessDistributionSmoother
+        """
+        self._smoothing_threshold = smoothing_threshold
+        self._ngram_frequency_smoothers = ngram_frequency_smoothers
+        self._contextless_distribution_smoother = contextless_distribution_smoother
+
+    def build(self):
+        """
+        Smoothers must be initialized before.
+
+        @rtype: SmoothingTable
+        """
+        K = self._smoothing_threshold
+
+        ngram_types = []
+        rows = []
+        for ngram_frequency_smoother in self._ngram_frequency_smoothers:
+            for ngram_type in ngram_frequency_smoother.get_ngram_types():
+                logger.debug("Building smoothing table row for ngram type {}".format(ngram_type))
+                ngram_types.append(ngram_type)
+                rows.append([ngram_frequency_smoother.smooth(count, ngram_type) for count in range(0, K + 1)])
+
+        ngram_smoothed_counts = numpy.array(rows, dtype=float).reshape(len(rows), K + 1)
+
+        parse_result_smoothed_counts = numpy.array(
+            [self._contextless_distribution_smoother.smooth_parse_result_occurrence_count(count) for count in range(0, K + 1)], dtype=float)
+        word_smoothed_counts = numpy.array(
+            [self._contextless_distribution_smoother.smooth_word_occurrence_count(count) for count in range(0, K + 1)], dtype=float)
+
+        return SmoothingTable(ngram_types, ngram_smoothed_counts, parse_result_smoothed_counts, word_smoothed_counts)
@@ -51,4 +51,30 @@ class InMemoryCachingTargetFormGivenContextCounter(TargetFormGivenContextCounter
 
     def _find_count_for_query(self, params, query_container, target_comes_after):
         query_execution_context = QueryExecutionContextBuilder(self._collection_map).create_context(query_container, target_comes_after)
-        return InMemoryCachingQueryExecutor().query_execution_context(query_execution_context).params(*params).count()
\ No newline at end of file
+        return InMemoryCachingQueryExecutor().query_execution_context(query_execution_context).params(*params).count()
+
+class ShardedTargetFormGivenContextCounter(TargetFormGivenContextCounter):
+    """
+    Counts the ngrams in ShardedNGramStores instead of the ngram collections. Queries with leading context are counted
+    in the leading context store and queries with following context are counted in the following context store, so
+    that queries with full context are sent to a single shard.
+    """
+    def __init__(self, leading_context_store, following_context_store=None):
+        """
+        @param leading_context_store: store partitioned with target_comes_after=True
+        @type leading_context_store: ShardedNGramStore
+        @param following_context_store: store partitioned with target_comes_after=False. If None, leading context store
+            is used for both.
+        @type following_context_store: ShardedNGramStore or None
+        """
+        super(ShardedTargetFormGivenContextCounter, self).__init__(None)
+        self._leading_context_store = leading_context_store
+        self._following_context_store = following_context_store or leading_context_store
+
+    def _find_count_for_query(self, params, query_container, target_comes_after):
+        keys = QueryExecutionContextBuilder(None).create_keys(query_container, target_comes_after)
+        assert len(params) == len(keys)
+
+        query = dict(zip(keys, params))
+        store = self._leading_context_store if target_comes_after else self._following_context_store
+        return float(store.count(query_container.n, query))
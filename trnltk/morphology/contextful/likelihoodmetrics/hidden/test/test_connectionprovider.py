@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import threading
+import unittest
+from hamcrest import *
+from mock import MagicMock, patch
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
+
+class ConnectionProviderTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('pymongo.Connection')
+        self.connection_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.connection = MagicMock(name='connection')
+        self.connection_class.return_value = self.connection
+
+    def test_should_not_connect_until_needed(self):
+        connection_provider = ConnectionProvider(host='somehost', max_pool_size=3)
+        collection_map = connection_provider.get_ngram_collection_map('999')
+
+        assert_that(self.connection_class.call_count, equal_to(0))
+        assert_that(sorted(collection_map.keys()), equal_to([1, 2, 3]))
+        assert_that(self.connection_class.call_count, equal_to(0))
+
+        collection_map[2]
+
+        assert_that(self.connection_class.call_count, equal_to(1))
+        self.connection_class.assert_called_with(host='somehost', port=None, max_pool_size=3, auto_start_request=True)
+        self.connection.__getitem__.assert_called_with('trnltk')
+        self.connection.__getitem__.return_value.__getitem__.assert_called_with('wordBigrams999')
+
+    def test_should_pass_read_preference(self):
+        connection_provider = ConnectionProvider(read_preference='some_read_preference')
+        connection_provider.get_connection()
+
+        self.connection_class.assert_called_with(host='127.0.0.1', port=None, max_pool_size=ConnectionProvider.DEFAULT_MAX_POOL_SIZE,
+            auto_start_request=True, read_preference='some_read_preference')
+
+    def test_should_reuse_connection_and_collections(self):
+        connection_provider = ConnectionProvider()
+
+        assert_that(connection_provider.get_connection(), same_instance(connection_provider.get_connection()))
+        assert_that(connection_provider.get_collection('words'), same_instance(connection_provider.get_collection('words')))
+        assert_that(self.connection_class.call_count, equal_to(1))
+        assert_that(self.connection.__getitem__.return_value.__getitem__.call_count, equal_to(1))
+
+    def test_should_create_single_connection_for_concurrent_threads(self):
+        connection_provider = ConnectionProvider()
+        connections = []
+
+        def get_connection():
+            connections.append(connection_provider.get_connection())
+
+        threads = [threading.Thread(target=get_connection) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_that(self.connection_class.call_count, equal_to(1))
+        assert_that(len(connections), equal_to(20))
+        assert_that(all([connection is self.connection for connection in connections]))
+
+    def test_should_reconnect_after_close(self):
+        connection_provider = ConnectionProvider()
+        connection_provider.get_collection('words')
+        connection_provider.close()
+
+        self.connection.disconnect.assert_called_once_with()
+
+        connection_provider.get_collection('words')
+        assert_that(self.connection_class.call_count, equal_to(2))
+
+if __name__ == '__main__':
+    unittest.main()
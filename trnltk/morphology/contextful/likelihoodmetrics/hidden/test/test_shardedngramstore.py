@@ -0,0 +1,281 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import copy
+import unittest
+from hamcrest import *
+from mock import Mock
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.querykeyappender import _target_surface_syn_cat_appender, _context_surface_syn_cat_appender, _context_stem_syn_cat_appender, _target_lemma_root_syn_cat_appender, _target_stem_syn_cat_appender, _context_word_appender
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.shardedngramstore import ConsistentHashRing, LocalNGramShard, ShardedNGramStore, NGramShardServer, RemoteNGramShard, NGramShardKeyExtractor
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.targetformgivencontextcounter import ShardedTargetFormGivenContextCounter
+
+class _InMemoryCursor(object):
+    def __init__(self, documents):
+        self._documents = documents
+
+    def count(self):
+        return len(self._documents)
+
+class _InMemoryCollection(object):
+    """
+    Supports the subset of the collection api which is used by the shards: insert and find with equality criteria
+    """
+    def __init__(self):
+        self.documents = []
+
+    def insert(self, documents):
+        self.documents.extend(copy.deepcopy(documents))
+
+    def find(self, query):
+        return _InMemoryCursor([document for document in self.documents if self._matches(document, query)])
+
+    def _matches(self, document, query):
+        for key, value in query.iteritems():
+            document_value = document
+            for path_item in key.split('.'):
+                document_value = document_value[path_item]
+            if document_value != value:
+                return False
+        return True
+
+def _word(surface, stem, lemma_root, syntactic_category):
+    return {
+        'word': {
+            'surface': {'value': surface, 'syntactic_category': syntactic_category},
+            'stem': {'value': stem, 'syntactic_category': syntactic_category},
+            'lemma_root': {'value': lemma_root, 'syntactic_category': syntactic_category}
+        }
+    }
+
+WORDS = [
+    _word(u'kitabı', u'kitap', u'kitap', u'Noun'),
+    _word(u'kitapçı', u'kitapçı', u'kitap', u'Noun'),
+    _word(u'okudum', u'oku', u'oku', u'Verb'),
+    _word(u'okuyucu', u'okuyucu', u'oku', u'Noun'),
+    _word(u'güzel', u'güzel', u'güzel', u'Adj'),
+    _word(u'ev', u'ev', u'ev', u'Noun'),
+]
+
+def _create_bigrams():
+    bigrams = []
+    for i in range(0, 200):
+        first = WORDS[i % len(WORDS)]
+        second = WORDS[(i * 7 + i / 5) % len(WORDS)]
+        bigrams.append({'item_0': first, 'item_1': second})
+    return bigrams
+
+def _create_unigrams():
+    return [{'item_0': WORDS[(i * 5) % len(WORDS)]} for i in range(0, 50)]
+
+def _morpheme_container(word):
+    morpheme_container = Mock()
+    morpheme_container.get_surface.return_value = word['word']['surface']['value']
+    morpheme_container.get_surface_syntactic_category.return_value = word['word']['surface']['syntactic_category']
+    morpheme_container.get_surface_secondary_syntactic_category.return_value = None
+    morpheme_container.get_stem.return_value = word['word']['stem']['value']
+    morpheme_container.get_stem_syntactic_category.return_value = word['word']['stem']['syntactic_category']
+    morpheme_container.get_stem_secondary_syntactic_category.return_value = None
+    morpheme_container.get_lemma_root.return_value = word['word']['lemma_root']['value']
+    morpheme_container.get_lemma_root_syntactic_category.return_value = word['word']['lemma_root']['syntactic_category']
+    morpheme_container.get_lemma_root_secondary_syntactic_category.return_value = None
+    return morpheme_container
+
+class ConsistentHashRingTest(unittest.TestCase):
+    def test_should_map_keys_to_shards(self):
+        ring = ConsistentHashRing(4)
+        keys = [u'key_{}'.format(i) for i in range(0, 1000)]
+
+        shard_indexes = [ring.get_shard_index(key) for key in keys]
+
+        assert_that(set(shard_indexes), equal_to({0, 1, 2, 3}))
+        assert_that(shard_indexes, equal_to([ConsistentHashRing(4).get_shard_index(key) for key in keys]))
+        for shard_index in range(0, 4):
+            assert_that(shard_indexes.count(shard_index), greater_than(100))
+
+    def test_should_move_few_keys_when_a_shard_is_added(self):
+        keys = [u'key_{}'.format(i) for i in range(0, 1000)]
+        ring_4 = ConsistentHashRing(4)
+        ring_5 = ConsistentHashRing(5)
+
+        moved_keys = [key for key in keys if ring_4.get_shard_index(key) != ring_5.get_shard_index(key)]
+
+        assert_that(len(moved_keys), less_than(350))
+        assert_that(all([ring_5.get_shard_index(key) == 4 for key in moved_keys]))
+
+    def test_should_hash_unicode_keys(self):
+        assert_that(ConsistentHashRing(3).get_shard_index(u'kitapçı\tgüzel'), is_in([0, 1, 2]))
+
+
+class ShardedNGramStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.single_collection_map = {1: _InMemoryCollection(), 2: _InMemoryCollection()}
+        self.shard_collection_maps = [{1: _InMemoryCollection(), 2: _InMemoryCollection()} for i in range(0, 3)]
+
+        self.store = ShardedNGramStore([LocalNGramShard(collection_map) for collection_map in self.shard_collection_maps])
+
+        for n, documents in ((1, _create_unigrams()), (2, _create_bigrams())):
+            self.single_collection_map[n].insert(documents)
+            assert_that(self.store.insert(n, documents), equal_to(len(documents)))
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_should_partition_ngrams(self):
+        bigram_counts = [len(collection_map[2].documents) for collection_map in self.shard_collection_maps]
+        assert_that(sum(bigram_counts), equal_to(200))
+        assert_that(len(filter(None, bigram_counts)), greater_than(1))
+
+        # all ngrams with the same context must be in the same shard
+        for collection_map in self.shard_collection_maps:
+            for other_collection_map in self.shard_collection_maps:
+                if collection_map is other_collection_map:
+                    continue
+                keys = set([d['item_0']['word']['surface']['value'] for d in collection_map[2].documents])
+                other_keys = set([d['item_0']['word']['surface']['value'] for d in other_collection_map[2].documents])
+                assert_that(keys & other_keys, equal_to(set()))
+
+    def test_should_extract_context_key_fields(self):
+        assert_that(NGramShardKeyExtractor().get_key_fields(1), equal_to(['item_0.word.surface.value']))
+        assert_that(NGramShardKeyExtractor().get_key_fields(3), equal_to(['item_0.word.surface.value', 'item_1.word.surface.value']))
+        assert_that(NGramShardKeyExtractor('stem', False).get_key_fields(3), equal_to(['item_1.word.stem.value', 'item_2.word.stem.value']))
+
+    def test_should_count_same_with_single_collection(self):
+        queries = [
+            (2, {'item_0.word.surface.value': u'kitabı', 'item_1.word.surface.value': u'okudum'}),
+            (2, {'item_0.word.surface.value': u'güzel', 'item_0.word.surface.syntactic_category': u'Adj', 'item_1.word.surface.value': u'ev'}),
+            (2, {'item_0.word.stem.value': u'kitap', 'item_1.word.lemma_root.value': u'oku'}),
+            (2, {'item_1.word.surface.value': u'ev'}),
+            (2, {'item_0.word.surface.value': u'yok', 'item_1.word.surface.value': u'yok'}),
+            (1, {'item_0.word.surface.value': u'ev'}),
+            (1, {'item_0.word.lemma_root.value': u'kitap'}),
+        ]
+
+        for n, query in queries:
+            assert_that(self.store.count(n, query), equal_to(self.single_collection_map[n].find(query).count()), str(query))
+
+    def test_should_route_query_with_shard_key_to_single_shard(self):
+        shards = [Mock(wraps=LocalNGramShard(collection_map)) for collection_map in self.shard_collection_maps]
+        store = ShardedNGramStore(shards)
+
+        store.count(2, {'item_0.word.surface.value': u'kitabı', 'item_1.word.surface.value': u'okudum', 'item_1.word.stem.value': u'oku'})
+        assert_that(sum([shard.count.call_count for shard in shards]), equal_to(1))
+
+        store.count(2, {'item_0.word.stem.value': u'kitap', 'item_1.word.surface.value': u'okudum'})
+        assert_that(sum([shard.count.call_count for shard in shards]), equal_to(4))
+
+        store.close()
+
+    def test_sharded_counter_should_count_same_with_single_collection(self):
+        counter = ShardedTargetFormGivenContextCounter(self.store)
+
+        target = _morpheme_container(WORDS[2])
+        context = [_morpheme_container(WORDS[0])]
+
+        def count_in_single_collection(query):
+            return self.single_collection_map[2].find(query).count()
+
+        count = counter._count_target_form_given_context(target, context, True, _target_surface_syn_cat_appender, _context_surface_syn_cat_appender)
+        assert_that(count, equal_to(count_in_single_collection({
+            'item_1.word.surface.value': u'okudum', 'item_1.word.surface.syntactic_category': u'Verb',
+            'item_0.word.surface.value': u'kitabı', 'item_0.word.surface.syntactic_category': u'Noun'})))
+        assert_that(count, greater_than(0))
+
+        count = counter._count_target_form_given_context(target, context, False, _target_lemma_root_syn_cat_appender, _context_stem_syn_cat_appender)
+        assert_that(count, equal_to(count_in_single_collection({
+            'item_0.word.lemma_root.value': u'oku', 'item_0.word.lemma_root.syntactic_category': u'Verb',
+            'item_1.word.stem.value': u'kitap', 'item_1.word.stem.syntactic_category': u'Noun'})))
+
+        count = counter._count_target_form_given_context(None, context + [target], False, None, _context_surface_syn_cat_appender)
+        assert_that(count, equal_to(count_in_single_collection({
+            'item_0.word.surface.value': u'kitabı', 'item_0.word.surface.syntactic_category': u'Noun',
+            'item_1.word.surface.value': u'okudum', 'item_1.word.surface.syntactic_category': u'Verb'})))
+
+
+    def test_sharded_counter_should_route_queries_with_full_context_to_single_shard(self):
+        leading_shards = [Mock(wraps=LocalNGramShard(collection_map)) for collection_map in self.shard_collection_maps]
+        following_collection_maps = [{1: _InMemoryCollection(), 2: _InMemoryCollection()} for i in range(0, 3)]
+        following_shards = [Mock(wraps=LocalNGramShard(collection_map)) for collection_map in following_collection_maps]
+
+        leading_context_store = ShardedNGramStore(leading_shards)
+        following_context_store = ShardedNGramStore(following_shards, NGramShardKeyExtractor(target_comes_after=False))
+        for n, documents in ((1, _create_unigrams()), (2, _create_bigrams())):
+            following_context_store.insert(n, documents)
+
+        counter = ShardedTargetFormGivenContextCounter(leading_context_store, following_context_store)
+        all_shards = leading_shards + following_shards
+
+        def count_and_assert_single_shard(*args):
+            call_count = sum([shard.count.call_count for shard in all_shards])
+            counter._count_target_form_given_context(*args)
+            assert_that(sum([shard.count.call_count for shard in all_shards]), equal_to(call_count + 1), str(args))
+
+        for target_word in WORDS:
+            for context_word in WORDS:
+                target = _morpheme_container(target_word)
+                context = [_morpheme_container(context_word)]
+
+                for target_appender in (_target_surface_syn_cat_appender, _target_stem_syn_cat_appender, _target_lemma_root_syn_cat_appender):
+                    for context_appender in (_context_surface_syn_cat_appender, _context_word_appender):
+                        for target_comes_after in (True, False):
+                            count_and_assert_single_shard(target, context, target_comes_after, target_appender, context_appender)
+
+                for target_comes_after in (True, False):
+                    count_and_assert_single_shard(None, context + [target], target_comes_after, None, _context_surface_syn_cat_appender)
+                    count_and_assert_single_shard(None, context, target_comes_after, None, _context_word_appender)
+
+        leading_context_store.close()
+        following_context_store.close()
+
+
+class RemoteNGramShardTest(unittest.TestCase):
+    def setUp(self):
+        self.shard_collection_maps = [{1: _InMemoryCollection(), 2: _InMemoryCollection()} for i in range(0, 2)]
+        self.servers = [NGramShardServer(LocalNGramShard(collection_map)) for collection_map in self.shard_collection_maps]
+        for server in self.servers:
+            server.start()
+
+        self.remote_shards = [RemoteNGramShard(*server.server_address) for server in self.servers]
+
+    def tearDown(self):
+        for remote_shard in self.remote_shards:
+            remote_shard.close()
+        for server in self.servers:
+            server.stop()
+
+    def test_should_insert_and_count_through_servers(self):
+        store = ShardedNGramStore(self.remote_shards)
+        single_collection = _InMemoryCollection()
+
+        bigrams = _create_bigrams()
+        single_collection.insert(bigrams)
+        assert_that(store.insert(2, bigrams), equal_to(200))
+
+        assert_that([len(collection_map[2].documents) for collection_map in self.shard_collection_maps], only_contains(greater_than(0)))
+
+        for query in ({'item_0.word.surface.value': u'kitapçı', 'item_1.word.surface.value': u'güzel'},
+                      {'item_1.word.lemma_root.value': u'kitap'},
+                      {'item_0.word.surface.value': u'okuyucu'}):
+            assert_that(store.count(2, query), equal_to(single_collection.find(query).count()))
+
+        store.close()
+
+    def test_should_report_shard_errors(self):
+        self.assertRaises(Exception, lambda: self.remote_shards[0].count(5, {}))
+        # connection should still be usable
+        assert_that(self.remote_shards[0].count(2, {}), equal_to(0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,8 @@ The tests are there for making sure there is no run time exceptions
 """
 import logging
 import unittest
+import numpy
+from hamcrest import *
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.simplegoodturing import logger, SimpleGoodTuringSmoother
 
 K = 5
@@ -74,6 +76,35 @@ class SimpleGoodTuringSmootherTest(unittest.TestCase):
         for i in range(0, K + 5):
             logger.info("c_{} : {}, \t c*_{} : {}".format(i, i, i, smoother.smooth(i)))
 
+    def test_smooth_many_should_be_same_with_smooth(self):
+        frequencies_of_frequencies_list = [
+            {1: 10, 2: 5, 3: 3, 4: 2, 5: 1, 6: 0},
+            {1: 268, 2: 112, 3: 70, 4: 41, 5: 24, 6: 14, 7: 15, 400: 1, 1918: 1},
+            {1: 16181, 2: 2213, 3: 870, 4: 431, 5: 304, 6: 202},
+            {1: 268, 2: 0, 3: 70, 4: 0, 5: 24, 6: 14, 7: 15, 400: 1, 1918: 1}
+        ]
+
+        for frequencies_of_frequencies in frequencies_of_frequencies_list:
+            smoother = SimpleGoodTuringSmoother(K, frequencies_of_frequencies, 1000)
+            smoother.initialize()
+
+            counts = numpy.array([[0, 1, 2], [3, 4, 5], [6, 7, 1000]], dtype=float)
+            smoothed_counts = smoother.smooth_many(counts)
+
+            assert_that(smoothed_counts.shape, equal_to((3, 3)))
+            for i in range(0, 3):
+                for j in range(0, 3):
+                    assert_that(smoothed_counts[i][j], equal_to(smoother.smooth(counts[i][j])))
+
+            assert_that(smoother.smooth_many(numpy.array([2, 0, 9])).tolist(), equal_to([smoother.smooth(2), smoother.smooth(0), 9]))
+
+    def test_smooth_many_assertions(self):
+        smoother = SimpleGoodTuringSmoother(K, {1: 10, 2: 5, 3: 3, 4: 2, 5: 1, 6: 0}, 100)
+        smoother.initialize()
+
+        self.assertRaises(AssertionError, lambda : smoother.smooth_many(numpy.array([1, -1])))
+        self.assertRaises(AssertionError, lambda : smoother.smooth_many(numpy.array([1, 1.5])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+from hamcrest import *
+from mock import Mock
+from trnltk.morphology.contextful.likelihoodmetrics.contextlessdistribution.contextlessdistributionsmoother import CachedContextlessDistributionSmoother
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.smoothingtable import SmoothingTable, SmoothingTableBuilder
+from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.ngramfrequencysmoother import CachedSimpleGoodTuringNGramFrequencySmoother
+
+K = 5
+
+class SmoothingTableTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _build_table(self):
+        bigram_smoother = Mock()
+        bigram_smoother.get_ngram_types.return_value = [['surface', 'surface'], ['surface', 'lemma_root']]
+        bigram_smoother.smooth.side_effect = lambda count, ngram_type: count + len(ngram_type[1]) / 100.0
+
+        trigram_smoother = Mock()
+        trigram_smoother.get_ngram_types.return_value = [['stem', 'stem', 'lemma_root']]
+        trigram_smoother.smooth.side_effect = lambda count, ngram_type: count + 0.5
+
+        contextless_distribution_smoother = Mock()
+        contextless_distribution_smoother.smooth_parse_result_occurrence_count.side_effect = lambda count: count + 0.1
+        contextless_distribution_smoother.smooth_word_occurrence_count.side_effect = lambda count: count + 0.2
+
+        return SmoothingTableBuilder(K, [bigram_smoother, trigram_smoother], contextless_distribution_smoother).build()
+
+    def test_should_build_table(self):
+        smoothing_table = self._build_table()
+
+        assert_that(smoothing_table.smoothing_threshold, equal_to(K))
+        assert_that(smoothing_table.ngram_types, equal_to([['surface', 'surface'], ['surface', 'lemma_root'], ['stem', 'stem', 'lemma_root']]))
+        assert_that(smoothing_table.ngram_smoothed_counts.shape, equal_to((3, K + 1)))
+        assert_that(smoothing_table.get_ngram_type_id(['surface', 'lemma_root']), equal_to(1))
+        assert_that(smoothing_table.ngram_smoothed_counts[1][3], close_to(3.1, 0.0000001))
+        assert_that(smoothing_table.ngram_smoothed_counts[2][0], close_to(0.5, 0.0000001))
+        assert_that(smoothing_table.word_smoothed_counts[4], close_to(4.2, 0.0000001))
+
+    def test_should_save_and_load_table(self):
+        file_path = os.path.join(self.temp_dir, 'smoothingtables.npz')
+        self._build_table().save(file_path)
+
+        smoothing_table = SmoothingTable.load(file_path)
+
+        ngram_frequency_smoother = CachedSimpleGoodTuringNGramFrequencySmoother(smoothing_table)
+        assert_that(ngram_frequency_smoother.smooth(0, ['surface', 'surface']), close_to(0.07, 0.0000001))
+        assert_that(ngram_frequency_smoother.smooth(2.0, ['surface', 'lemma_root']), close_to(2.1, 0.0000001))
+        assert_that(ngram_frequency_smoother.smooth(5, ['stem', 'stem', 'lemma_root']), close_to(5.5, 0.0000001))
+        assert_that(ngram_frequency_smoother.smooth(6, ['stem', 'stem', 'lemma_root']), equal_to(6))
+        assert_that(ngram_frequency_smoother.smooth(3, ['surface']), equal_to(3))
+
+        contextless_distribution_smoother = CachedContextlessDistributionSmoother(smoothing_table)
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(1), close_to(1.1, 0.0000001))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(1), close_to(1.2, 0.0000001))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(10), equal_to(10))
+
+    def test_smooth_many_should_be_same_with_smooth(self):
+        ngram_frequency_smoother = CachedSimpleGoodTuringNGramFrequencySmoother()
+
+        ngram_types = [[target_type, context_type, context_type] for target_type in ('surface', 'stem', 'lemma_root') for context_type in ('surface', 'stem', 'lemma_root')]
+        counts = numpy.array([[0, 1, 2], [3, 4, 5], [6, 5, 100]], dtype=float)
+
+        smoothed_counts = ngram_frequency_smoother.smooth_many(counts, ngram_types)
+
+        assert_that(smoothed_counts.shape, equal_to((3, 3)))
+        for i in range(0, 3):
+            for j in range(0, 3):
+                assert_that(smoothed_counts[i][j], equal_to(ngram_frequency_smoother.smooth(counts[i][j], ngram_types[i * 3 + j])))
+
+        context_counts = numpy.array([0, 3, 7], dtype=float)
+        assert_that(ngram_frequency_smoother.smooth_many(context_counts, [['surface'], ['stem'], ['lemma_root']]).tolist(), equal_to([0, 3, 7]))
+
+    def test_should_load_bundled_table(self):
+        ngram_frequency_smoother = CachedSimpleGoodTuringNGramFrequencySmoother()
+        assert_that(ngram_frequency_smoother.smooth(0, ['surface', 'surface']), equal_to(0.000123425512116))
+        assert_that(ngram_frequency_smoother.smooth(5, ['lemma_root', 'stem']), equal_to(2.84911840754))
+        assert_that(ngram_frequency_smoother.smooth(1, ['stem', 'lemma_root', 'lemma_root']), equal_to(0.0567626710285))
+        self.assertRaises(KeyError, lambda: ngram_frequency_smoother.smooth(1, ['surface', 'stem', 'surface']))
+
+        contextless_distribution_smoother = CachedContextlessDistributionSmoother()
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(0), equal_to(0.008502447849533839))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(5), equal_to(4.016279163368528))
+
+    def test_should_not_smooth_counts_not_in_table(self):
+        contextless_distribution_smoother = CachedContextlessDistributionSmoother()
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(2.0), equal_to(1.1129522477195453))
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(2.5), equal_to(2.5))
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(-1), equal_to(-1))
+        assert_that(contextless_distribution_smoother.smooth_parse_result_occurrence_count(6), equal_to(6))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(0.5), equal_to(0.5))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(-5), equal_to(-5))
+        assert_that(contextless_distribution_smoother.smooth_word_occurrence_count(100), equal_to(100))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -124,6 +124,9 @@ class ContextParsingLikelihoodCalculator(BaseContextParsingLikelihoodCalculator)
         self._sequence_likelihood_calculator = sequence_likelihood_calculator
         self._target_form_given_context_counter = target_form_given_context_counter
 
+        self._context_ngram_types_cache = {}
+        self._target_context_ngram_types_cache = {}
+
     def build_indexes(self):
         self._database_index_builder.create_indexes([(_context_word_appender,)])
         for appender_matrix_row in self.APPENDER_MATRIX:
@@ -330,34 +333,39 @@ class ContextParsingLikelihoodCalculator(BaseContextParsingLikelihoodCalculator)
         return cartesian_product_list
 
     def _smooth_context_cooccurrence_counts(self, context_counts, context_parse_results):
-        smoothed_counts = numpy.zeros(3, dtype=float)
-
-        for i, count in enumerate(context_counts):
-            context_appender = self.CONTEXT_APPENDER_VECTOR[i]
-            context_ngram_type_item = context_appender.get_ngram_type_item()
-
-            context_len = len(context_parse_results)
-
-            ngram_type = context_len * [context_ngram_type_item]
-
-            smoothed_counts[i] = self._ngram_frequency_smoother.smooth(context_counts[i], ngram_type)
-
-        return smoothed_counts
+        ngram_types = self._get_context_ngram_types(len(context_parse_results))
+        return self._ngram_frequency_smoother.smooth_many(context_counts, ngram_types)
 
     def _smooth_target_context_cooccurrence_counts(self, target_form_given_context_counts, target, context_parse_results, target_comes_after):
-        smoothed_counts = numpy.zeros((3, 3), dtype=float)
-
-        for i, row in enumerate(target_form_given_context_counts):
-            for j, count in enumerate(row):
-                target_appender, context_appender = self.APPENDER_MATRIX[i][j]
-                target_ngram_type_item = target_appender.get_ngram_type_item()
+        ngram_types = self._get_target_context_ngram_types(len(context_parse_results), target_comes_after)
+        return self._ngram_frequency_smoother.smooth_many(target_form_given_context_counts, ngram_types)
+
+    def _get_context_ngram_types(self, context_len):
+        ngram_types = self._context_ngram_types_cache.get(context_len)
+        if ngram_types is None:
+            ngram_types = []
+            for context_appender in self.CONTEXT_APPENDER_VECTOR:
                 context_ngram_type_item = context_appender.get_ngram_type_item()
+                ngram_types.append(context_len * [context_ngram_type_item])
+
+            self._context_ngram_types_cache[context_len] = ngram_types
+
+        return ngram_types
 
-                context_len = len(context_parse_results)
+    def _get_target_context_ngram_types(self, context_len, target_comes_after):
+        # ngram types in the order of the flattened target form given context count matrix
+        ngram_types = self._target_context_ngram_types_cache.get((context_len, target_comes_after))
+        if ngram_types is None:
+            ngram_types = []
+            for appender_matrix_row in self.APPENDER_MATRIX:
+                for target_appender, context_appender in appender_matrix_row:
+                    target_ngram_type_item = target_appender.get_ngram_type_item()
+                    context_ngram_type_item = context_appender.get_ngram_type_item()
 
-                ngram_type = [target_ngram_type_item] + context_len * [context_ngram_type_item] if target_comes_after else context_len * [
-                    context_ngram_type_item] + [target_ngram_type_item]
+                    ngram_type = [target_ngram_type_item] + context_len * [context_ngram_type_item] if target_comes_after else context_len * [
+                        context_ngram_type_item] + [target_ngram_type_item]
+                    ngram_types.append(ngram_type)
 
-                smoothed_counts[i][j] = self._ngram_frequency_smoother.smooth(target_form_given_context_counts[i][j], ngram_type)
+            self._target_context_ngram_types_cache[(context_len, target_comes_after)] = ngram_types
 
-        return smoothed_counts
+        return ngram_types
@@ -18,8 +18,10 @@ import json
 import logging
 import operator
 import pprint
+import numpy
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.ngramtypefrequencyfinder import NgramTypeFrequencyFinder
 from trnltk.morphology.contextful.likelihoodmetrics.hidden.simplegoodturing import SimpleGoodTuringSmoother
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.smoothingtable import SmoothingTable
 
 logger = logging.getLogger('ngramfrequencysmoother')
 
@@ -32,192 +34,48 @@ class NGramFrequencySmoother(object):
     def smooth(self, count, ngram_type):
         raise NotImplementedError()
 
+    def smooth_many(self, counts, ngram_types):
+        """
+        Smooths all the counts in the given array. Results are the same with calling smooth for each count.
+
+        @param counts: array of counts
+        @type counts: numpy.ndarray
+        @param ngram_types: ngram types of the counts, in the order of the flattened counts array
+        @type ngram_types: list<list<str>>
+        @return: array of smoothed counts with the same shape with counts
+        @rtype: numpy.ndarray
+        """
+        counts = numpy.asarray(counts, dtype=float)
+        assert counts.size == len(ngram_types)
+
+        smoothed_counts = numpy.empty(counts.shape, dtype=float)
+        for i, count in enumerate(counts.flat):
+            smoothed_counts.flat[i] = self.smooth(count, ngram_types[i])
+
+        return smoothed_counts
+
 
 class CachedSimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
     """
     Since SimpleGoodTuringNGramFrequencySmoother cannot be used in real-time (too slow) and smoothed values
     don't change over time if knowledge is not changing too, smoothed values can be cached.
 
-    Uses generated values from test_simplegoodturingngramfrequencysmoother.py
+    Uses a smoothing table built by SmoothingTableBuilder from the ngram collections in use. If no table is given,
+    the bundled table which is generated from parse set 999 is used.
 
     In a production environment, a similar logic should be used. However, values must be hold in a db and
     smoothing should be done incrementally (update values considering new ngrams).
     """
 
-    def __init__(self):
+    def __init__(self, smoothing_table=None):
+        """
+        @type smoothing_table: SmoothingTable or None
+        """
         super(CachedSimpleGoodTuringNGramFrequencySmoother, self).__init__()
 
-        self._bigram_smoothed_frequencies = {
-            'surface_surface_0': 0.000123425512116,
-            'surface_surface_1': 0.108999917508,
-            'surface_surface_2': 0.7211039089,
-            'surface_surface_3': 1.80180333319,
-            'surface_surface_4': 2.90503258449,
-            'surface_surface_5': 3.43060225833,
-
-            'surface_stem_0': 0.00022860945759,
-            'surface_stem_1': 0.133121743817,
-            'surface_stem_2': 0.821048687544,
-            'surface_stem_3': 1.72898136936,
-            'surface_stem_4': 2.80142813265,
-            'surface_stem_5': 3.40034048232,
-
-            'surface_lemma_root_0': 0.000398378900614,
-            'surface_lemma_root_1': 0.145298329356,
-            'surface_lemma_root_2': 0.898302276993,
-            'surface_lemma_root_3': 1.6804091374,
-            'surface_lemma_root_4': 2.72640794743,
-            'surface_lemma_root_5': 4.18204717541,
-
-            'stem_surface_0': 0.000225091760951,
-            'stem_surface_1': 0.131174483367,
-            'stem_surface_2': 0.776106338802,
-            'stem_surface_3': 1.83209725514,
-            'stem_surface_4': 2.87394819337,
-            'stem_surface_5': 3.48336420633,
-
-            'stem_stem_0': 0.000407209734465,
-            'stem_stem_1': 0.169074407696,
-            'stem_stem_2': 0.856675152649,
-            'stem_stem_3': 1.75574822879,
-            'stem_stem_4': 2.90701020882,
-            'stem_stem_5': 3.25804752031,
-
-            'stem_lemma_root_0': 0.000693373280741,
-            'stem_lemma_root_1': 0.190889854104,
-            'stem_lemma_root_2': 0.942544322168,
-            'stem_lemma_root_3': 1.6487501381,
-            'stem_lemma_root_4': 2.94332419882,
-            'stem_lemma_root_5': 3.90563370524,
-
-            'lemma_root_surface_0': 0.00039035813432,
-            'lemma_root_surface_1': 0.142654089676,
-            'lemma_root_surface_2': 0.790363818635,
-            'lemma_root_surface_3': 2.01468100259,
-            'lemma_root_surface_4': 2.99365181917,
-            'lemma_root_surface_5': 3.03071229674,
-
-            'lemma_root_stem_0': 0.000695132297003,
-            'lemma_root_stem_1': 0.188806572288,
-            'lemma_root_stem_2': 0.889023922574,
-            'lemma_root_stem_3': 1.85882338782,
-            'lemma_root_stem_4': 2.97753621167,
-            'lemma_root_stem_5': 2.84911840754,
-
-            'lemma_root_lemma_root_0': 0.00117028598239,
-            'lemma_root_lemma_root_1': 0.216058157008,
-            'lemma_root_lemma_root_2': 0.967023392214,
-            'lemma_root_lemma_root_3': 1.78431415531,
-            'lemma_root_lemma_root_4': 2.90467308233,
-            'lemma_root_lemma_root_5': 3.53232742842,
-            }
-
-        self._trigram_smoothed_frequencies = {
-            'surface_surface_surface_0': 9.22687755635e-09,
-            'surface_surface_surface_1': 0.0286890410384,
-            'surface_surface_surface_2': 0.46959983179,
-            'surface_surface_surface_3': 1.34420357649,
-            'surface_surface_surface_4': 2.29600991759,
-            'surface_surface_surface_5': 2.115467769,
-
-            'surface_surface_stem_0': 1.83710091123e-08,
-            'surface_surface_stem_1': 0.0342590629637,
-            'surface_surface_stem_2': 0.454439768923,
-            'surface_surface_stem_3': 1.24755140979,
-            'surface_surface_stem_4': 2.8734259063,
-            'surface_surface_stem_5': 2.86658432497,
-
-            'surface_surface_lemma_root_0': 3.35868516445e-08,
-            'surface_surface_lemma_root_1': 0.0375710847479,
-            'surface_surface_lemma_root_2': 0.45842390544,
-            'surface_surface_lemma_root_3': 1.04665449463,
-            'surface_surface_lemma_root_4': 3.78345221326,
-            'surface_surface_lemma_root_5': 2.56770432396,
-
-            'stem_stem_surface_0': 3.64377596779e-08,
-            'stem_stem_surface_1': 0.0405367686527,
-            'stem_stem_surface_2': 0.530384698807,
-            'stem_stem_surface_3': 1.35378088733,
-            'stem_stem_surface_4': 1.94598215017,
-            'stem_stem_surface_5': 3.12754463348,
-
-            'stem_stem_stem_0': 7.21961950054e-08,
-            'stem_stem_stem_1': 0.0483937710988,
-            'stem_stem_stem_2': 0.533755125978,
-            'stem_stem_stem_3': 1.45812077501,
-            'stem_stem_stem_4': 2.16698963187,
-            'stem_stem_stem_5': 3.08666805263,
-
-            'stem_stem_lemma_root_0': 1.31694702881e-07,
-            'stem_stem_lemma_root_1': 0.0529987276796,
-            'stem_stem_lemma_root_2': 0.537959555351,
-            'stem_stem_lemma_root_3': 1.21802890146,
-            'stem_stem_lemma_root_4': 2.92575101378,
-            'stem_stem_lemma_root_5': 2.92137188033,
-
-            'lemma_root_lemma_root_surface_0': 1.21279094728e-07,
-            'lemma_root_lemma_root_surface_1': 0.0491118077325,
-            'lemma_root_lemma_root_surface_2': 0.53776683087,
-            'lemma_root_lemma_root_surface_3': 1.16598647503,
-            'lemma_root_lemma_root_surface_4': 2.57767890248,
-            'lemma_root_lemma_root_surface_5': 2.99582027168,
-
-            'lemma_root_lemma_root_stem_0': 2.39776948949e-07,
-            'lemma_root_lemma_root_stem_1': 0.0579459938026,
-            'lemma_root_lemma_root_stem_2': 0.55871041893,
-            'lemma_root_lemma_root_stem_3': 1.26626723082,
-            'lemma_root_lemma_root_stem_4': 2.55677128883,
-            'lemma_root_lemma_root_stem_5': 3.13743122747,
-
-            'lemma_root_lemma_root_lemma_root_0': 4.36996140548e-07,
-            'lemma_root_lemma_root_lemma_root_1': 0.0631832582214,
-            'lemma_root_lemma_root_lemma_root_2': 0.56597215725,
-            'lemma_root_lemma_root_lemma_root_3': 1.11055698449,
-            'lemma_root_lemma_root_lemma_root_4': 3.09837845226,
-            'lemma_root_lemma_root_lemma_root_5': 2.9321533977,
-
-            'surface_stem_stem_0': 3.64963450539e-08,
-            'surface_stem_stem_1': 0.0394099232386,
-            'surface_stem_stem_2': 0.518668707403,
-            'surface_stem_stem_3': 1.14636801272,
-            'surface_stem_stem_4': 2.60165262233,
-            'surface_stem_stem_5': 3.35704618551,
-
-            'surface_lemma_root_lemma_root_0': 1.21769143243e-07,
-            'surface_lemma_root_lemma_root_1': 0.0462806332683,
-            'surface_lemma_root_lemma_root_2': 0.550582741383,
-            'surface_lemma_root_lemma_root_3': 0.903313123313,
-            'surface_lemma_root_lemma_root_4': 3.29622779939,
-            'surface_lemma_root_lemma_root_5': 3.48031985225,
-
-            'stem_surface_surface_0': 1.83733426303e-08,
-            'stem_surface_surface_1': 0.0341145060813,
-            'stem_surface_surface_2': 0.512360626489,
-            'stem_surface_surface_3': 1.26584365284,
-            'stem_surface_surface_4': 2.10918996294,
-            'stem_surface_surface_5': 2.52379985859,
-
-            'stem_lemma_root_lemma_root_0': 2.40131492071e-07,
-            'stem_lemma_root_lemma_root_1': 0.0567626710285,
-            'stem_lemma_root_lemma_root_2': 0.574378576896,
-            'stem_lemma_root_lemma_root_3': 1.14378042296,
-            'stem_lemma_root_lemma_root_4': 2.86320962549,
-            'stem_lemma_root_lemma_root_5': 3.20384010593,
-
-            'lemma_root_surface_surface_0': 3.3573280622e-08,
-            'lemma_root_surface_surface_1': 0.0378749147921,
-            'lemma_root_surface_surface_2': 0.497538057059,
-            'lemma_root_surface_surface_3': 1.09560828421,
-            'lemma_root_surface_surface_4': 2.85568215016,
-            'lemma_root_surface_surface_5': 2.49680470348,
-
-            'lemma_root_stem_stem_0': 1.3152470358e-07,
-            'lemma_root_stem_stem_1': 0.0542902949509,
-            'lemma_root_stem_stem_2': 0.522993420085,
-            'lemma_root_stem_stem_3': 1.29971843048,
-            'lemma_root_stem_stem_4': 2.63171795211,
-            'lemma_root_stem_stem_5': 2.91787697511,
-            }
+        self._smoothing_table = smoothing_table or SmoothingTable.load()
+        self._smoothed_counts = self._smoothing_table.ngram_smoothed_counts
+        self._smoothing_threshold = self._smoothing_table.smoothing_threshold
 
     def initialize(self):
         # do nothing
@@ -227,21 +85,36 @@ class CachedSimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
         assert int(count) == count        # should be integer (could be int, stored in float)
         assert count >= 0
 
-        if count > 5:
+        if count > self._smoothing_threshold:
             return count
 
         if len(ngram_type) == 1:
             # We cannot determine the vocabulary size and thus N_0. So, smoothing cannot be applied for unigrams.
             return count
 
-        key = '_'.join(ngram_type) + '_' + str(int(count))
-        if len(ngram_type) == 2:
-            return self._bigram_smoothed_frequencies[key]
-        elif len(ngram_type) == 3:
-            return self._trigram_smoothed_frequencies[key]
-        else:
+        if len(ngram_type) > 3:
             raise Exception("{}-grams are not supported".format(len(ngram_type)))
 
+        return self._smoothed_counts[self._smoothing_table.get_ngram_type_id(ngram_type), int(count)]
+
+    def smooth_many(self, counts, ngram_types):
+        counts = numpy.asarray(counts, dtype=float)
+        assert counts.size == len(ngram_types)
+        assert numpy.all(counts >= 0)
+        assert numpy.all(numpy.floor(counts) == counts)
+
+        if all(len(ngram_type) == 1 for ngram_type in ngram_types):
+            # We cannot determine the vocabulary size and thus N_0. So, smoothing cannot be applied for unigrams.
+            return counts.copy()
+
+        if any(len(ngram_type) == 1 or len(ngram_type) > 3 for ngram_type in ngram_types):
+            return super(CachedSimpleGoodTuringNGramFrequencySmoother, self).smooth_many(counts, ngram_types)
+
+        ngram_type_ids = numpy.array([self._smoothing_table.get_ngram_type_id(ngram_type) for ngram_type in ngram_types]).reshape(counts.shape)
+        K = self._smoothing_threshold
+        indexes = numpy.minimum(counts, K).astype(int)
+        return numpy.where(counts > K, counts, self._smoothed_counts[ngram_type_ids, indexes])
+
 
 class SimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
     """
@@ -273,6 +146,7 @@ class SimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
         self._ngram_item_types = ['surface', 'stem', 'lemma_root']
 
         self._smoothers_for_ngram_types = {}
+        self._ngram_types = []
 
     def initialize(self):
         self._vocabulary_sizes_for_ngram_item_types = self._find_vocabulary_sizes(self._ngram_item_types)
@@ -302,6 +176,7 @@ class SimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
 
                     smoother = SimpleGoodTuringSmoother(self._smoothing_threshold, frequencies_of_frequencies_for_ngram_type, frequency_of_frequency_0)
                     self._smoothers_for_ngram_types[type_key] = smoother
+                    self._ngram_types.append(ngram_type)
 
         for ngram_type_key, smoother in self._smoothers_for_ngram_types.iteritems():
             smoother.initialize(PLOTTING_MODE)
@@ -318,6 +193,13 @@ class SimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
                 logger.debug("Loglin regression coefficient m for {}: ".format(ngram_type_key, smoother._loglinregression_m))
                 logger.debug("Loglin regression coefficient c for {}: ".format(ngram_type_key, smoother._loglinregression_c))
 
+    def get_ngram_types(self):
+        """
+        @return: Ngram types which smoothers are created for, in creation order. Available after initialization
+        @rtype: list<list<str>>
+        """
+        return self._ngram_types
+
     def _find_frequency_of_frequency(self, ngram_type, frequency):
         assert frequency > 0 and ngram_type
         logger.debug(" Finding freq of freq for freq={}, ngram_type={}".format(frequency, ngram_type))
@@ -348,6 +230,26 @@ class SimpleGoodTuringNGramFrequencySmoother(NGramFrequencySmoother):
         type_key = '_'.join(ngram_type)       # something like "surface_surface_stem"
         return self._smoothers_for_ngram_types[type_key].smooth(count)
 
+    def smooth_many(self, counts, ngram_types):
+        counts = numpy.asarray(counts, dtype=float)
+        assert counts.size == len(ngram_types)
+
+        flat_counts = counts.ravel()
+        smoothed_counts = flat_counts.copy()
+
+        # group the counts by ngram type, so that each type's counts are smoothed in one call
+        indexes_for_type_keys = {}
+        for i, ngram_type in enumerate(ngram_types):
+            if len(ngram_type) == 1:
+                # We cannot determine the vocabulary size and thus N_0. So, smoothing cannot be applied for unigrams.
+                continue
+            indexes_for_type_keys.setdefault('_'.join(ngram_type), []).append(i)
+
+        for type_key, indexes in indexes_for_type_keys.iteritems():
+            smoothed_counts[indexes] = self._smoothers_for_ngram_types[type_key].smooth_many(flat_counts[indexes])
+
+        return smoothed_counts.reshape(counts.shape)
+
     def _get_ngram_type_and_key(self, context_is_leading, context_type, target_type):
         context_ngram_type = (self._ngram_length - 1) * [context_type]
         ngram_type = (context_ngram_type + [target_type]) if context_is_leading else ([target_type] + context_ngram_type)
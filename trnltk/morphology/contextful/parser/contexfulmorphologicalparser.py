@@ -20,7 +20,7 @@ from trnltk.morphology.contextful.likelihoodmetrics.hidden.targetformgivencontex
 from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.contextparsingcalculator import ContextParsingLikelihoodCalculator
 from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.interpolatingcalculator import InterpolatingLikelihoodCalculator
 from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.ngramfrequencysmoother import CachedSimpleGoodTuringNGramFrequencySmoother
-from trnltk.morphology.contextful.parser.contextfullikelihoodcalculator import ContextfulLikelihoodCalculator
+from trnltk.morphology.contextful.parser.contextfullikelihoodcalculator import ContextfulLikelihoodCalculator, CachingContextfulLikelihoodCalculator
 from trnltk.morphology.contextful.parser.sequencelikelihoodcalculator import SequenceLikelihoodCalculator
 from trnltk.morphology.contextless.parser.parser import UpperCaseSupportingContextlessMorphologicalParser
 from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder, DigitNumeralRootFinder, TextNumeralRootFinder, ProperNounFromApostropheRootFinder, ProperNounWithoutApostropheRootFinder
@@ -44,6 +44,15 @@ class ContextfulMorphologicalParser(object):
     def build_indexes(self):
         self._contextful_likelihood_calculator.build_indexes()
 
+    def save_likelihood_cache(self):
+        """
+        Saves the cached likelihoods to the cache file, so that they are loaded by the next parser created with the same
+        file. Does nothing if the likelihoods are not cached or the cache is not persisted.
+        """
+        calculator = self._contextful_likelihood_calculator
+        if isinstance(calculator, CachingContextfulLikelihoodCalculator) and calculator.persistence_path:
+            calculator.save()
+
     def parse_with_likelihoods(self, target_surface, leading_context, following_context, calculation_context=None):
         """
         @type target_surface: str or unicode
@@ -73,10 +82,27 @@ class ContextfulMorphologicalParser(object):
 
 class ContextfulMorphologicalParserFactory(object):
     @classmethod
-    def create(cls, master_dictionary_path, ngram_collection_map):
+    def create_with_connection_provider(cls, master_dictionary_path, connection_provider, parseset_index,
+                                        likelihood_cache_size=None, likelihood_cache_path=None):
+        """
+        @type master_dictionary_path: str or unicode
+        @type connection_provider: ConnectionProvider
+        @param parseset_index: id of the parse set which the ngram collections are generated from
+        @rtype ContextfulMorphologicalParser
+        """
+        ngram_collection_map = connection_provider.get_ngram_collection_map(parseset_index)
+        return cls.create(master_dictionary_path, ngram_collection_map, likelihood_cache_size, likelihood_cache_path,
+            likelihood_cache_store_version=parseset_index)
+
+    @classmethod
+    def create(cls, master_dictionary_path, ngram_collection_map, likelihood_cache_size=None, likelihood_cache_path=None,
+               likelihood_cache_store_version=None):
         """
         @type master_dictionary_path: str or unicode
-        @param ngram_collection_map: list<Collection>
+        @param ngram_collection_map: dict<int, Collection> or LazyCollectionMap
+        @param likelihood_cache_size: max number of likelihoods to cache. likelihoods are not cached if None
+        @param likelihood_cache_path: file to persist the likelihood cache. cache is not persisted if None
+        @param likelihood_cache_store_version: version of the ngrams; persisted cache of another version is not loaded
         @rtype ContextfulMorphologicalParser
         """
         all_roots = []
@@ -122,6 +148,10 @@ class ContextfulMorphologicalParserFactory(object):
         contextful_likelihood_calculator = ContextfulLikelihoodCalculator(interpolating_collocation_metric_calculator,
             contextless_distribution_metric_calculator)
 
+        if likelihood_cache_size:
+            contextful_likelihood_calculator = CachingContextfulLikelihoodCalculator(contextful_likelihood_calculator,
+                likelihood_cache_size, likelihood_cache_path, likelihood_cache_store_version)
+
         sequence_likelihood_calculator._contextful_likelihood_calculator = contextful_likelihood_calculator
 
         contextful_morphological_parser = ContextfulMorphologicalParser(contextless_parser,
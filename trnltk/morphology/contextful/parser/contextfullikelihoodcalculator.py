@@ -13,6 +13,16 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import cPickle
+import copy
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger('contextfulLikelihoodCalculator')
+
 class ContextfulLikelihoodCalculator(object):
     _WEIGHT_CONTEXTLESS_DISTRIBUTION_METRIC_CALCULATOR = 0.01
     _WEIGHT_COLLOCATION_METRIC_CALCULATOR = 0.99
@@ -112,3 +122,165 @@ class ContextfulLikelihoodCalculator(object):
             calculation_context['contextless_distribution'] = contextless_distribution_calculation_context
 
         return total
+
+
+class CachingContextfulLikelihoodCalculator(object):
+    """
+    Decorates a ContextfulLikelihoodCalculator with a bounded cache of the calculated likelihoods.
+
+    Cache keys are the formatted parse results and surfaces of the target and the context, since the surface ngrams
+    differ for the words with same parse result like 'verir' and 'verer'. The least recently used entries
+    are evicted when there are more than max_size entries. If a calculation context is requested, it is cached along
+    with the likelihood and a copy of it is returned on a hit.
+
+    Cached likelihoods are valid as long as the ngrams they are calculated from don't change. When the ngram store
+    changes, invalidate must be called, possibly with the new store version. Cache can be saved to and loaded from a
+    file; entries of a saved cache are only loaded if the saved store version and key version are same with the
+    current ones.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+
+    # changed whenever the cache keys change, so that saved caches with the old keys are not loaded
+    KEY_VERSION = 2
+
+    def __init__(self, contextful_likelihood_calculator, max_size=DEFAULT_MAX_SIZE, persistence_path=None, store_version=None):
+        """
+        @type contextful_likelihood_calculator: ContextfulLikelihoodCalculator
+        @type max_size: int
+        @param persistence_path: file to load the cache from and save it to. cache is not persisted if None
+        @param store_version: version of the ngram store which likelihoods are calculated with
+        """
+        assert max_size > 0
+
+        self._contextful_likelihood_calculator = contextful_likelihood_calculator
+        self._max_size = max_size
+        self._persistence_path = persistence_path
+        self._store_version = store_version
+
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+        if self._persistence_path and os.path.exists(self._persistence_path):
+            self.load()
+
+    def build_indexes(self):
+        self._contextful_likelihood_calculator.build_indexes()
+
+    def calculate_likelihood_single(self, target, calculation_context=None):
+        key = ('single', self._create_item_key(target))
+        return self._get_or_calculate(key, calculation_context,
+            lambda item_calculation_context: self._contextful_likelihood_calculator.calculate_likelihood_single(target, item_calculation_context))
+
+    def calculate_likelihood(self, target, leading_context, following_context, calculation_context=None):
+        assert target
+
+        key = ('twoway', self._create_item_key(target), self._create_context_key(leading_context), self._create_context_key(following_context))
+        return self._get_or_calculate(key, calculation_context,
+            lambda item_calculation_context: self._contextful_likelihood_calculator.calculate_likelihood(target, leading_context,
+                following_context, item_calculation_context))
+
+    def calculate_oneway_likelihood(self, target, context, target_comes_after, calculation_context=None):
+        key = ('oneway', self._create_item_key(target), self._create_context_key(context), target_comes_after)
+        return self._get_or_calculate(key, calculation_context,
+            lambda item_calculation_context: self._contextful_likelihood_calculator.calculate_oneway_likelihood(target, context,
+                target_comes_after, item_calculation_context))
+
+    def _create_context_key(self, context):
+        # context items are lists of possible parse results for the context words. unparsable words have no parse results
+        return tuple([tuple([self._create_item_key(morpheme_container) for morpheme_container in context_item]) if context_item else () for context_item in context])
+
+    def _create_item_key(self, morpheme_container):
+        return morpheme_container.format(), morpheme_container.get_surface_so_far()
+
+    def _get_or_calculate(self, key, calculation_context, calculate):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (calculation_context is None or entry[1] is not None):
+                # move to the end, as the most recently used
+                del self._entries[key]
+                self._entries[key] = entry
+                self.hit_count += 1
+            else:
+                entry = None
+                self.miss_count += 1
+
+        if entry is not None:
+            likelihood, cached_calculation_context = entry
+            if calculation_context is not None:
+                calculation_context.update(copy.deepcopy(cached_calculation_context))
+            return likelihood
+
+        item_calculation_context = {} if calculation_context is not None else None
+        likelihood = calculate(item_calculation_context)
+
+        if calculation_context is not None:
+            calculation_context.update(item_calculation_context)
+            item_calculation_context = copy.deepcopy(item_calculation_context)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (likelihood, item_calculation_context)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return likelihood
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def persistence_path(self):
+        return self._persistence_path
+
+    def invalidate(self, store_version=None):
+        """
+        Clears the cache. Must be called when the ngram store changes.
+
+        @param store_version: new version of the ngram store
+        """
+        with self._lock:
+            logger.debug("Invalidating {} cached likelihoods, store version {} -> {}".format(len(self._entries), self._store_version, store_version))
+            self._entries.clear()
+            self._store_version = store_version
+
+    def save(self):
+        assert self._persistence_path
+
+        with self._lock:
+            state = {'store_version': self._store_version, 'key_version': self.KEY_VERSION, 'entries': self._entries.items()}
+
+        # temporary file is unique, so that processes saving at the same time don't write to the same file
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(self._persistence_path) + '.',
+            dir=os.path.dirname(os.path.abspath(self._persistence_path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                cPickle.dump(state, f, cPickle.HIGHEST_PROTOCOL)
+            os.rename(temp_path, self._persistence_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def load(self):
+        assert self._persistence_path
+
+        with open(self._persistence_path, 'rb') as f:
+            state = cPickle.load(f)
+
+        if state['store_version'] != self._store_version:
+            logger.info("Not loading cached likelihoods from {}, since they belong to store version {} but current version is {}".format(
+                self._persistence_path, state['store_version'], self._store_version))
+            return
+
+        if state.get('key_version') != self.KEY_VERSION:
+            logger.info("Not loading cached likelihoods from {}, since their key version is {} but current version is {}".format(
+                self._persistence_path, state.get('key_version'), self.KEY_VERSION))
+            return
+
+        with self._lock:
+            self._entries.clear()
+            for key, entry in state['entries'][-self._max_size:]:
+                self._entries[key] = entry
@@ -0,0 +1,183 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from hamcrest import *
+from mock import Mock
+from trnltk.morphology.contextful.parser.contexfulmorphologicalparser import ContextfulMorphologicalParser
+from trnltk.morphology.contextful.parser.contextfullikelihoodcalculator import CachingContextfulLikelihoodCalculator
+
+def _morpheme_container(formatted, surface=None):
+    morpheme_container = Mock()
+    morpheme_container.format.return_value = formatted
+    morpheme_container.get_surface_so_far.return_value = surface if surface is not None else formatted[:formatted.find(u'(')]
+    return morpheme_container
+
+class CachingContextfulLikelihoodCalculatorTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.wrapped = Mock()
+        self.wrapped.calculate_likelihood.side_effect = self._calculate_likelihood
+        self.wrapped.calculate_oneway_likelihood.return_value = 0.25
+
+        self.target = _morpheme_container(u'kitap(kitap)+Noun+A3sg+Pnon+Nom')
+        self.leading_context = [[_morpheme_container(u'güzel(güzel)+Adj')]]
+        self.following_context = [[_morpheme_container(u'oku(okumak)+Verb+Pos+Past+A1sg'), _morpheme_container(u'oku(okumak)+Verb+Pos+Past+A1sg+Cop')], []]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _calculate_likelihood(self, target, leading_context, following_context, calculation_context=None):
+        if calculation_context is not None:
+            calculation_context['total_likelihood'] = 0.5
+            calculation_context['collocation'] = {'leading': [1, 2]}
+        return 0.5
+
+    def test_should_cache_likelihoods(self):
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped)
+
+        for i in range(0, 3):
+            likelihood = calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+            assert_that(likelihood, equal_to(0.5))
+
+        # equal, but different instances
+        other_target = _morpheme_container(u'kitap(kitap)+Noun+A3sg+Pnon+Nom')
+        other_leading_context = [[_morpheme_container(u'güzel(güzel)+Adj')]]
+        assert_that(calculator.calculate_likelihood(other_target, other_leading_context, self.following_context), equal_to(0.5))
+
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(1))
+        assert_that(calculator.hit_count, equal_to(3))
+        assert_that(calculator.miss_count, equal_to(1))
+
+        # different context
+        calculator.calculate_likelihood(self.target, [], self.following_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(2))
+
+        # same parse results with different surfaces
+        calculator.calculate_likelihood(_morpheme_container(u'kitap(kitap)+Noun+A3sg+Pnon+Nom', u'kitab'), [], self.following_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(3))
+        calculator.calculate_likelihood(self.target, [[_morpheme_container(u'güzel(güzel)+Adj', u'gözel')]], self.following_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(4))
+
+        # oneway likelihoods are cached separately, with the direction
+        calculator.calculate_oneway_likelihood(self.target, self.leading_context, True)
+        calculator.calculate_oneway_likelihood(self.target, self.leading_context, True)
+        calculator.calculate_oneway_likelihood(self.target, self.leading_context, False)
+        assert_that(self.wrapped.calculate_oneway_likelihood.call_count, equal_to(2))
+
+    def test_should_cache_calculation_context(self):
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped)
+
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+
+        # cached entry has no calculation context
+        calculation_context = {}
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context, calculation_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(2))
+        assert_that(calculation_context, equal_to({'total_likelihood': 0.5, 'collocation': {'leading': [1, 2]}}))
+
+        # modifying the returned context should not modify the cached one
+        calculation_context['collocation']['leading'].append(3)
+
+        other_calculation_context = {}
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context, other_calculation_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(2))
+        assert_that(other_calculation_context, equal_to({'total_likelihood': 0.5, 'collocation': {'leading': [1, 2]}}))
+
+        # entry with calculation context is also used when calculation context is not requested
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(2))
+
+    def test_should_evict_least_recently_used(self):
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped, max_size=2)
+
+        targets = [_morpheme_container(u'a'), _morpheme_container(u'b'), _morpheme_container(u'c')]
+
+        calculator.calculate_likelihood(targets[0], [], [])
+        calculator.calculate_likelihood(targets[1], [], [])
+        calculator.calculate_likelihood(targets[0], [], [])
+        calculator.calculate_likelihood(targets[2], [], [])
+        assert_that(len(calculator), equal_to(2))
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(3))
+
+        # 'b' should be evicted, 'a' should still be there
+        calculator.calculate_likelihood(targets[0], [], [])
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(3))
+        calculator.calculate_likelihood(targets[1], [], [])
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(4))
+
+    def test_should_invalidate(self):
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped)
+
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+        calculator.invalidate()
+        assert_that(len(calculator), equal_to(0))
+
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(2))
+
+    def test_should_persist_cache(self):
+        persistence_path = os.path.join(self.temp_dir, 'likelihoods.cache')
+
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path, store_version='999')
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context, {})
+        calculator.calculate_oneway_likelihood(self.target, self.leading_context, True)
+        calculator.save()
+
+        loaded_calculator = CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path, store_version='999')
+        assert_that(len(loaded_calculator), equal_to(2))
+
+        calculation_context = {}
+        assert_that(loaded_calculator.calculate_likelihood(self.target, self.leading_context, self.following_context, calculation_context), equal_to(0.5))
+        assert_that(calculation_context['total_likelihood'], equal_to(0.5))
+        assert_that(self.wrapped.calculate_likelihood.call_count, equal_to(1))
+
+        # cache of another store version should not be loaded
+        other_version_calculator = CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path, store_version='1000')
+        assert_that(len(other_version_calculator), equal_to(0))
+
+        # cache with the keys of another version should not be loaded
+        original_key_version = CachingContextfulLikelihoodCalculator.KEY_VERSION
+        CachingContextfulLikelihoodCalculator.KEY_VERSION = original_key_version + 1
+        try:
+            other_key_version_calculator = CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path, store_version='999')
+            assert_that(len(other_key_version_calculator), equal_to(0))
+        finally:
+            CachingContextfulLikelihoodCalculator.KEY_VERSION = original_key_version
+
+        assert_that(os.listdir(self.temp_dir), equal_to(['likelihoods.cache']))
+
+    def test_should_save_cache_of_parser(self):
+        persistence_path = os.path.join(self.temp_dir, 'likelihoods.cache')
+
+        calculator = CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path)
+        parser = ContextfulMorphologicalParser(Mock(), calculator)
+        calculator.calculate_likelihood(self.target, self.leading_context, self.following_context)
+
+        parser.save_likelihood_cache()
+        assert_that(len(CachingContextfulLikelihoodCalculator(self.wrapped, persistence_path=persistence_path)), equal_to(1))
+
+        # not persisted or not cached
+        ContextfulMorphologicalParser(Mock(), CachingContextfulLikelihoodCalculator(self.wrapped)).save_likelihood_cache()
+        ContextfulMorphologicalParser(Mock(), self.wrapped).save_likelihood_cache()
+        assert_that(self.wrapped.save.called, equal_to(False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,9 +21,9 @@ The tests are there for making sure there is no run time exceptions
 from operator import itemgetter
 import os
 import unittest
-import pymongo
 from xml.dom.minidom import parse
 import datetime
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
 from trnltk.morphology.contextful.likelihoodmetrics.wordformcollocation.parsecontext import MockMorphemeContainerBuilder
 from trnltk.morphology.contextful.parser.contexfulmorphologicalparser import ContextfulMorphologicalParserFactory
 from trnltk.ngrams.ngramgenerator import WordNGramGenerator
@@ -34,14 +34,10 @@ class ContextfulMorphologicalParserTest(unittest.TestCase):
     def create_contextful_morphological_parser(cls, parseset_index):
         master_dictionary_path = os.path.join(os.path.dirname(__file__), '../../../../resources/master_dictionary.txt')
 
-        mongodb_connection = pymongo.Connection(host='127.0.0.1')
-        collection_map = {
-            1: mongodb_connection['trnltk']['wordUnigrams{}'.format(parseset_index)],
-            2: mongodb_connection['trnltk']['wordBigrams{}'.format(parseset_index)],
-            3: mongodb_connection['trnltk']['wordTrigrams{}'.format(parseset_index)]
-        }
+        connection_provider = ConnectionProvider(host='127.0.0.1')
 
-        contextful_morphological_parser = ContextfulMorphologicalParserFactory.create(master_dictionary_path, collection_map)
+        contextful_morphological_parser = ContextfulMorphologicalParserFactory.create_with_connection_provider(master_dictionary_path,
+            connection_provider, parseset_index)
 
         return contextful_morphological_parser
 
@@ -87,6 +87,17 @@ class BruteForceNounRootFinder(RootFinder):
 
         return roots
 
+    def get_lookahead(self, partial_input, whole_surface=None):
+        """
+        Roots depend on the first char after the partial input and the frontness of the first vowel after it.
+
+        @type partial_input: unicode
+        @type whole_surface: unicode
+        """
+        remaining_surface = whole_surface[len(partial_input):]
+        first_vowel_letter_after_partial_input = self._get_first_vowel(remaining_surface)
+        return remaining_surface[:1], first_vowel_letter_after_partial_input.frontal if first_vowel_letter_after_partial_input else None
+
     def _get_voicing_and_doubling_roots(self, partial_input, last_char, first_char_after_partial_input,
                                         no_orthographics_root):
         last_letter = TurkishAlphabet.get_letter_for_char(last_char)
@@ -264,3 +275,13 @@ class BruteForceCompoundNounRootFinder(RootFinder):
             compound_result.lexeme.attributes.add(LexemeAttribute.CompoundP3sg)
 
         return compound_results
+
+    def get_lookahead(self, partial_input, whole_surface=None):
+        """
+        Roots depend on the first char after the partial input and whether there is a char after it. Lookahead of the
+        noun roots found for the partial input without the possessive suffix is already in the partial input.
+
+        @type partial_input: unicode
+        @type whole_surface: unicode
+        """
+        return whole_surface[len(partial_input):len(partial_input) + 2]
@@ -138,6 +138,15 @@ class BruteForceVerbRootFinder(RootFinder):
 
         return generated_roots
 
+    def get_lookahead(self, partial_input, whole_surface=None):
+        """
+        Roots depend on the first 4 chars after the partial input, which is the longest suffix checked: -Iyor or -InIl.
+
+        @type partial_input: unicode
+        @type whole_surface: unicode
+        """
+        return whole_surface[len(partial_input):len(partial_input) + 4]
+
     def _get_progressive_vowel_drop_roots(self, partial_input, whole_surface, no_attr_root, last_vowel):
         # başla - +Iyor --> başlıyor
         # elle  - +Iyor --> elliyor
@@ -222,8 +231,6 @@ class BruteForceVerbRootFinder(RootFinder):
 
             generated_root.lexeme.attributes = {causative_attr} if causative_attr else set()
 
-            generated_root.lexeme.phonetic_attributes = Phonetics.calculate_phonetic_attributes(partial_input, generated_root.lexeme.attributes)
-
             causative_roots.add(generated_root)
 
         return causative_roots
@@ -255,8 +262,6 @@ class BruteForceVerbRootFinder(RootFinder):
 
             generated_root.lexeme.attributes = {passive_attr} if passive_attr else set()
 
-            generated_root.lexeme.phonetic_attributes = Phonetics.calculate_phonetic_attributes(partial_input, generated_root.lexeme.attributes)
-
             passive_roots.add(generated_root)
 
         return passive_roots
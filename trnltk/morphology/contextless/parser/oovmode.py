@@ -0,0 +1,208 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Bounded analysis of out of vocabulary words.
+
+Brute force root finders find roots for almost every prefix of an unknown word and each of those roots is traversed on
+the suffix graph. In OOV mode, the parser keeps only the most plausible brute force roots and stops traversing when a
+budget is exhausted, so that the parsing time of garbage tokens is bounded.
+"""
+from trnltk.morphology.model.graphmodel import State
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
+
+class OOVMode(object):
+    """
+    Configuration of the parser for the out of vocabulary words.
+
+    Roots found by the OOV root finders are ranked with OOVRootScorer and only the first max_root_count of them are
+    traversed. Traversing stops when max_traversal_count morpheme containers are traversed for a word.
+    """
+
+    DEFAULT_MAX_ROOT_COUNT = 10
+    DEFAULT_MAX_TRAVERSAL_COUNT = 2000
+
+    def __init__(self, root_finders, max_root_count=DEFAULT_MAX_ROOT_COUNT, max_traversal_count=DEFAULT_MAX_TRAVERSAL_COUNT):
+        """
+        @param root_finders: root finders which find roots for unknown words, like brute force root finders
+        @type root_finders: list of RootFinder
+        @type max_root_count: int
+        @type max_traversal_count: int
+        """
+        assert max_root_count > 0
+        assert max_traversal_count > 0
+
+        self.root_finders = root_finders
+        self.max_root_count = max_root_count
+        self.max_traversal_count = max_traversal_count
+
+
+class OOVReport(object):
+    """
+    Tells how much of the analysis of a word is truncated in OOV mode.
+    """
+    def __init__(self):
+        self.found_root_count = 0
+        self.dropped_root_count = 0
+        self.traversed_candidate_count = 0
+        self.dropped_candidate_count = 0
+
+    def is_truncated(self):
+        return self.dropped_root_count > 0 or self.dropped_candidate_count > 0
+
+    def add(self, other):
+        """
+        @type other: OOVReport
+        """
+        self.found_root_count += other.found_root_count
+        self.dropped_root_count += other.dropped_root_count
+        self.traversed_candidate_count += other.traversed_candidate_count
+        self.dropped_candidate_count += other.dropped_candidate_count
+
+    def __str__(self):
+        return u'found roots: {}, dropped roots: {}, traversed candidates: {}, dropped candidates: {}'.format(
+            self.found_root_count, self.dropped_root_count, self.traversed_candidate_count, self.dropped_candidate_count)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class OOVRootScorer(object):
+    """
+    Scores the roots of unknown words with cheap plausibility checks, higher is more plausible.
+
+    * Remaining surface should be reachable on the suffix graph : it should start with a char which a suffix form from
+      the root state can start with, or the root state should reach a terminal state without consuming anything.
+    * Root should be phonotactically valid : it should have a vowel, it shouldn't have letters out of the alphabet,
+      long consonant clusters or three same letters in a row.
+    * Longer roots are better, as they leave less surface to explain with suffixes.
+    """
+
+    REACHABLE_SCORE = 4
+    PHONOTACTICALLY_VALID_SCORE = 2
+
+    # uppercase chars in suffix forms are resolved by the vowel harmony
+    Harmony_Chars = {u'A': {u'a', u'e'}, u'I': {u'ı', u'i', u'u', u'ü'}, u'O': {u'o', u'ö'}}
+
+    def __init__(self, suffix_graph):
+        self._suffix_graph = suffix_graph
+        # state name -> (set of possible first chars, can reach a terminal state without consuming anything)
+        self._reachability_map = {}
+
+    def score(self, root, word):
+        """
+        @type root: Root
+        @param word: whole surface which root is found for
+        @type word: unicode
+        @rtype: float
+        """
+        score = float(len(root.str)) / len(word)
+        if self.is_phonotactically_valid(root.lexeme.root):
+            score += self.PHONOTACTICALLY_VALID_SCORE
+        if self.is_reachable(root, word[len(root.str):]):
+            score += self.REACHABLE_SCORE
+        return score
+
+    def is_reachable(self, root, remaining_surface):
+        """
+        @type root: Root
+        @type remaining_surface: unicode
+        @rtype: bool
+        """
+        state = self._suffix_graph.get_default_root_state(root)
+        reachability = self._reachability_map.get(state.name)
+        if reachability is None:
+            reachability = self._calculate_reachability(state)
+            self._reachability_map[state.name] = reachability
+
+        first_chars, can_terminate = reachability
+        if remaining_surface:
+            return remaining_surface[0] in first_chars
+        else:
+            return can_terminate
+
+    def is_phonotactically_valid(self, seq):
+        """
+        @type seq: unicode
+        @rtype: bool
+        """
+        has_vowel = False
+        consonant_count = 0
+        for i in range(len(seq)):
+            letter = TurkishAlphabet.get_letter_for_char(seq[i])
+            if letter.alphabetic_index == 99:
+                return False
+            if i >= 2 and seq[i] == seq[i - 1] == seq[i - 2]:
+                return False
+
+            if letter.vowel:
+                has_vowel = True
+                consonant_count = 0
+            else:
+                consonant_count += 1
+                if consonant_count > 3:
+                    return False
+
+        return has_vowel and consonant_count <= 2
+
+    def _calculate_reachability(self, root_state):
+        first_chars = set()
+        can_terminate = False
+
+        visited_state_names = set()
+        states_to_visit = [root_state]
+        while states_to_visit:
+            state = states_to_visit.pop()
+            if state.name in visited_state_names:
+                continue
+            visited_state_names.add(state.name)
+
+            if state.type == State.TERMINAL:
+                can_terminate = True
+
+            for suffix, to_state in state.outputs:
+                for suffix_form in suffix.suffix_forms:
+                    form_first_chars = self._get_first_chars_of_form(suffix_form.form)
+                    if None in form_first_chars:
+                        # suffix form might be applied without consuming anything
+                        form_first_chars.remove(None)
+                        states_to_visit.append(to_state)
+                    first_chars.update(form_first_chars)
+
+        return first_chars, can_terminate
+
+    def _get_first_chars_of_form(self, form_str):
+        # ci, dik, +yacak, +iyor, +ar, +yi, +im, +yla, Iyor, dAn
+        if not form_str:
+            return {None}
+
+        first_char = form_str[0]
+        if first_char == u'+':
+            return self._get_chars(form_str[1]) | self._get_first_chars_of_form(form_str[2:])
+        elif first_char == u'!':
+            return self._get_first_chars_of_form(form_str[1:])
+        else:
+            return self._get_chars(first_char)
+
+    def _get_chars(self, form_char):
+        if form_char in self.Harmony_Chars:
+            return set(self.Harmony_Chars[form_char])
+
+        devoiced_letter = TurkishAlphabet.devoice(TurkishAlphabet.get_letter_for_char(form_char))
+        if devoiced_letter:
+            return {form_char, devoiced_letter.char_value}
+        else:
+            return {form_char}
@@ -17,6 +17,7 @@ limitations under the License.
 import logging
 from trnltk.morphology.model import formatter
 from trnltk.morphology.model.lexeme import  SyntacticCategory, LexemeAttribute
+from trnltk.morphology.contextless.parser.oovmode import OOVReport, OOVRootScorer
 from trnltk.morphology.contextless.parser.suffixapplier import *
 from trnltk.morphology.model.morphemecontainer import MorphemeContainer
 from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
@@ -24,17 +25,79 @@ from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
 logger = logging.getLogger('parser')
 
 class ContextlessMorphologicalParser(object):
-    def __init__(self, suffix_graph, predefined_paths, root_finders):
+    def __init__(self, suffix_graph, predefined_paths, root_finders, lexicon=None, oov_mode=None):
+        """
+        @param lexicon: if given, lexemes can be added, removed or replaced while parsing. its root map should be the
+            one used by the root finders and the predefined paths
+        @type lexicon: ReloadableLexicon or None
+        @param oov_mode: if given, roots found by its root finders are ranked and capped, and traversing is bounded
+        @type oov_mode: OOVMode or None
+        """
         self._suffix_graph = suffix_graph
         self._predefined_paths = predefined_paths
         self._root_finders = root_finders
-
-
-    def parse(self, input):
+        self._lexicon = lexicon
+        self._oov_mode = oov_mode
+        self._oov_root_scorer = OOVRootScorer(suffix_graph) if oov_mode else None
+
+        if lexicon and predefined_paths:
+            lexicon.register_predefined_paths(predefined_paths)
+
+    def add_lexemes(self, lexemes):
+        """
+        Adds the lexemes to the lexicon of the parser. Parses started after this returns use the new lexemes.
+        @type lexemes: iterable of Lexeme
+        """
+        self._get_lexicon().update(added_lexemes=lexemes)
+
+    def remove_lexemes(self, lexemes):
+        """
+        Removes the lexemes from the lexicon of the parser. Parses started after this returns don't use them.
+        @type lexemes: iterable of Lexeme
+        """
+        self._get_lexicon().update(removed_lexemes=lexemes)
+
+    def replace_lexemes(self, old_lexemes, new_lexemes):
+        """
+        Replaces the lexemes in the lexicon of the parser at once.
+        @type old_lexemes: iterable of Lexeme
+        @type new_lexemes: iterable of Lexeme
+        """
+        self._get_lexicon().update(added_lexemes=new_lexemes, removed_lexemes=old_lexemes)
+
+    def _get_lexicon(self):
+        if not self._lexicon:
+            raise Exception('Parser is created without a lexicon, thus lexemes cannot be changed')
+        return self._lexicon
+
+    def parse(self, input, oov_report=None):
+        """
+        @param oov_report: if given and the parser is in OOV mode, how much the analysis is truncated is added to it
+        @type oov_report: OOVReport or None
+        @rtype: list of MorphemeContainer
+        """
         logger.debug('\n\n-------------Parsing word "%s"', input)
 
+        word_oov_report = OOVReport() if self._oov_mode else None
+
+        results = []
         candidates = self._find_initial_parse_morpheme_containers(input)
+        self._traverse_root_candidates(candidates, results, input)
+
+        if self._oov_mode:
+            # traversal budget is only for the OOV candidates, roots from the regular root finders are never dropped
+            oov_candidates = self._find_oov_morpheme_containers(input, word_oov_report)
+            self._traverse_root_candidates(oov_candidates, results, input, word_oov_report)
 
+        if word_oov_report:
+            if word_oov_report.is_truncated():
+                logger.debug('OOV analysis of word "%s" is truncated, %s', input, word_oov_report)
+            if oov_report is not None:
+                oov_report.add(word_oov_report)
+
+        return results
+
+    def _traverse_root_candidates(self, candidates, results, input, oov_report=None):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('Found %d candidate morpheme containers :', len(candidates))
             for c in candidates:
@@ -43,11 +106,9 @@ class ContextlessMorphologicalParser(object):
         logger.debug('Applying required _transitions to lexeme candidates')
         candidates = self._apply_required_transitions_to_lexeme_candidates(candidates, input)
 
-        results = []
-        new_candidates = self._traverse_candidates(candidates, results, input)
+        new_candidates = self._traverse_candidates(candidates, results, input, oov_report)
         if new_candidates:
             raise Exception('There are still parse morpheme containers to traverse, but traversing is finished : {}'.format(new_candidates))
-        return results
 
     def _find_initial_parse_morpheme_containers(self, input):
         candidates = []
@@ -63,8 +124,8 @@ class ContextlessMorphologicalParser(object):
                     logger.debug('\t %s', root)
 
             for root in roots_from_lexicon:
-                if self._predefined_paths and self._predefined_paths.has_paths(root):
-                    predefined_morpheme_containers = self._predefined_paths.get_paths(root)
+                predefined_morpheme_containers = self._predefined_paths.find_paths(root) if self._predefined_paths else None
+                if predefined_morpheme_containers:
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.debug('Found predefined morpheme containers for root candidate "%s" : %s', root, predefined_morpheme_containers)
                     for predefined_morpheme_container in predefined_morpheme_containers:
@@ -87,7 +148,31 @@ class ContextlessMorphologicalParser(object):
             roots.extend(root_finder.find_roots_for_partial_input(partial_input, input))
         return roots
 
-    def _traverse_candidates(self, candidates, results, word):
+    def _find_oov_morpheme_containers(self, input, oov_report):
+        roots = []
+        for i in range(1, len(input) + 1):
+            partial_input = input[:i]
+            if partial_input[-1].isupper():
+                # brute force root finders expect lower case roots, e.g. voicing of 'D' in "Bodrum_Dedikleri" breaks them
+                continue
+            for root_finder in self._oov_mode.root_finders:
+                roots.extend(root_finder.find_roots_for_partial_input(partial_input, input))
+
+        # sort is stable, so equally plausible roots are kept in the order they are found
+        scored_roots = sorted([(self._oov_root_scorer.score(root, input), root) for root in roots], key=lambda t: t[0], reverse=True)
+        kept_scored_roots = scored_roots[:self._oov_mode.max_root_count]
+
+        oov_report.found_root_count += len(roots)
+        oov_report.dropped_root_count += len(roots) - len(kept_scored_roots)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Found %d OOV root candidates, keeping %d:', len(roots), len(kept_scored_roots))
+            for score, root in kept_scored_roots:
+                logger.debug('\t %s %s', score, root)
+
+        return [MorphemeContainer(root, self._suffix_graph.get_default_root_state(root), input[len(root.str):]) for score, root in kept_scored_roots]
+
+    def _traverse_candidates(self, candidates, results, word, oov_report=None):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('Gonna traverse %d candidates:', len(candidates))
             for c in candidates:
@@ -95,6 +180,12 @@ class ContextlessMorphologicalParser(object):
 
         new_candidates = []
         for morpheme_container in candidates:
+            if oov_report:
+                if oov_report.traversed_candidate_count >= self._oov_mode.max_traversal_count:
+                    oov_report.dropped_candidate_count += 1
+                    continue
+                oov_report.traversed_candidate_count += 1
+
             logger.debug(' Traversing candidate: %s', morpheme_container)
 
             morpheme_containers_for_candidate = self._traverse_candidate(morpheme_container, word)
@@ -113,7 +204,7 @@ class ContextlessMorphologicalParser(object):
                     new_candidates.append(morpheme_container_for_candidate)
 
         if new_candidates:
-            new_candidates = self._traverse_candidates(new_candidates, results, word)
+            new_candidates = self._traverse_candidates(new_candidates, results, word, oov_report)
 
         return new_candidates
 
@@ -192,12 +283,12 @@ class ContextlessMorphologicalParser(object):
         return new_candidates
 
 class UpperCaseSupportingContextlessMorphologicalParser(ContextlessMorphologicalParser):
-    def __init__(self, suffix_graph, predefined_paths, root_finders):
-        super(UpperCaseSupportingContextlessMorphologicalParser, self).__init__(suffix_graph, predefined_paths, root_finders)
+    def __init__(self, suffix_graph, predefined_paths, root_finders, lexicon=None, oov_mode=None):
+        super(UpperCaseSupportingContextlessMorphologicalParser, self).__init__(suffix_graph, predefined_paths, root_finders, lexicon, oov_mode)
 
-    def parse(self, input):
-        parse_results = super(UpperCaseSupportingContextlessMorphologicalParser, self).parse(input)
+    def parse(self, input, oov_report=None):
+        parse_results = super(UpperCaseSupportingContextlessMorphologicalParser, self).parse(input, oov_report)
         if input[0].isupper():
-            parse_results += super(UpperCaseSupportingContextlessMorphologicalParser, self).parse(TurkishAlphabet.lower(input[0]) + input[1:])
+            parse_results += super(UpperCaseSupportingContextlessMorphologicalParser, self).parse(TurkishAlphabet.lower(input[0]) + input[1:], oov_report)
 
         return parse_results
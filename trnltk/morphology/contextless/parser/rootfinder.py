@@ -26,6 +26,17 @@ class RootFinder(object):
         """
         raise NotImplementedError()
 
+    def get_lookahead(self, partial_input, whole_surface=None):
+        """
+        Returns the part of the whole surface after the partial input that found roots depend on.
+
+        Roots found for the same partial input and lookahead are the same. By default, it is the whole remaining surface.
+
+        @type partial_input: unicode
+        @type whole_surface: unicode or None
+        """
+        return whole_surface[len(partial_input):] if whole_surface else None
+
 
 class WordRootFinder(RootFinder):
     def __init__(self, lexeme_map):
@@ -37,8 +48,9 @@ class WordRootFinder(RootFinder):
         @type whole_surface: unicode or None
         @rtype: list of Root
         """
-        if self.lexeme_map.has_key(partial_input):
-            roots = self.lexeme_map[partial_input][:]
+        # single lookup, since lexeme map might be changed by another thread. see ReloadableLexicon
+        roots = self.lexeme_map.get(partial_input)
+        if roots:
             return filter(lambda root: root.lexeme.syntactic_category != SyntacticCategory.NUMERAL, roots)
         else:
             return []
@@ -54,28 +66,94 @@ class TextNumeralRootFinder(RootFinder):
         @type whole_surface: unicode or None
         @rtype: list of Root
         """
-        if self.lexeme_map.has_key(partial_input):
-            roots = self.lexeme_map[partial_input][:]
+        # single lookup, since lexeme map might be changed by another thread. see ReloadableLexicon
+        roots = self.lexeme_map.get(partial_input)
+        if roots:
             return filter(lambda root: root.lexeme.syntactic_category == SyntacticCategory.NUMERAL, roots)
         else:
             return []
 
 
 class DigitNumeralRootFinder(RootFinder):
+    """
+    Finds the numbers written in digits, like '3', '-3,5' or '1.250.000'.
+
+    Instead of matching a regex against every prefix of the surface, the whole surface is scanned once and the lengths
+    of the prefixes which are numbers are kept for the following prefixes of the same surface.
+    """
     NUMBER_REGEXES = [re.compile(u'^[-+]?\d+(,\d)?\d*$'), re.compile(u'^[-+]?(\d{1,3}\.)+\d{3}(,\d)?\d*$')]
 
+    DIGITS = frozenset(u'0123456789')
+
+    def __init__(self):
+        # (surface, lengths of the number prefixes of it) as a single value, since root finder might be used by
+        # multiple threads
+        self._last_scanned_surface = (None, frozenset())
+
     def find_roots_for_partial_input(self, partial_input, whole_surface=None):
         """
         @type partial_input: unicode
         @type whole_surface: unicode or None
         @rtype: list of Root
         """
-        for regex in self.NUMBER_REGEXES:
-            if regex.match(partial_input):
-                return [NumeralRoot(partial_input)]
+        if partial_input[0] not in self.DIGITS and partial_input[0] != u'-' and partial_input[0] != u'+':
+            return []
+
+        surface = whole_surface or partial_input
+
+        scanned_surface, number_prefix_lengths = self._last_scanned_surface
+        if scanned_surface != surface:
+            number_prefix_lengths = self.find_number_prefix_lengths(surface)
+            self._last_scanned_surface = (surface, number_prefix_lengths)
+
+        if len(partial_input) in number_prefix_lengths:
+            return [NumeralRoot(partial_input)]
 
         return []
 
+    @classmethod
+    def find_number_prefix_lengths(cls, surface):
+        """
+        Finds the prefixes of the surface which match one of NUMBER_REGEXES, in a single pass.
+
+        @type surface: unicode
+        @return: lengths of the prefixes
+        @rtype: frozenset of int
+        """
+        lengths = []
+
+        i = 1 if surface[:1] == u'-' or surface[:1] == u'+' else 0
+
+        # length of the current digit group. groups before a '.' have 1 to 3 digits. the last group has at least 3
+        # digits, exactly 3 if it is followed by a ','.
+        group_length = 0
+        grouped = False
+        while i < len(surface):
+            c = surface[i]
+            if c in cls.DIGITS:
+                i += 1
+                group_length += 1
+                if not grouped or group_length >= 3:
+                    lengths.append(i)
+            elif c == u'.':
+                if not 0 < group_length <= 3:
+                    break
+                grouped = True
+                group_length = 0
+                i += 1
+            elif c == u',':
+                if not group_length or (grouped and group_length != 3):
+                    break
+                i += 1
+                while i < len(surface) and surface[i] in cls.DIGITS:
+                    i += 1
+                    lengths.append(i)
+                break
+            else:
+                break
+
+        return frozenset(lengths)
+
 
 class ProperNounFromApostropheRootFinder(RootFinder):
     APOSTROPHE = u"'"
@@ -122,4 +200,72 @@ class ProperNounWithoutApostropheRootFinder(RootFinder):
         # 2: P3sg doesn't apply to these words: onun Kusadasi, onun Eminonu
         # 3. Possessions are applied to 'root' : benim Kusadam etc. SKIP this case!
 
-        return [ProperNounRoot(partial_input)]
\ No newline at end of file
+        return [ProperNounRoot(partial_input)]
+
+
+class CachingRootFinder(RootFinder):
+    """
+    Decorates a RootFinder with a bounded cache of the found roots.
+
+    Meant for the root finders which create the roots on the fly, like brute force root finders. Cache keys are the
+    partial input and the lookahead of the decorated root finder; see RootFinder.get_lookahead.
+
+    Cache is cleared when it has max_size entries, like the pattern cache of the re module. Keeping the entries in the
+    least recently used order costs about as much as finding the roots by brute force.
+
+    Cached roots are never returned, their deep clones are returned instead. Thus callers can modify the returned roots,
+    just like the roots returned by the decorated root finder.
+    """
+
+    DEFAULT_MAX_SIZE = 100000
+
+    def __init__(self, root_finder, max_size=DEFAULT_MAX_SIZE):
+        """
+        @type root_finder: RootFinder
+        @type max_size: int
+        """
+        assert max_size > 0
+
+        self._root_finder = root_finder
+        self._max_size = max_size
+
+        self._entries = {}
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def find_roots_for_partial_input(self, partial_input, whole_surface=None):
+        """
+        @type partial_input: unicode
+        @type whole_surface: unicode or None
+        @rtype: list of Root
+        """
+        key = (partial_input, self._root_finder.get_lookahead(partial_input, whole_surface))
+
+        # single lookup and single assignment, since the cache might be used by another thread
+        cached_roots = self._entries.get(key)
+        if cached_roots is not None:
+            self.hit_count += 1
+            return [root._clone(True) for root in cached_roots]
+
+        self.miss_count += 1
+
+        roots = self._root_finder.find_roots_for_partial_input(partial_input, whole_surface)
+
+        if len(self._entries) >= self._max_size:
+            self._entries.clear()
+        self._entries[key] = tuple([root._clone(True) for root in roots])
+
+        return roots
+
+    def get_lookahead(self, partial_input, whole_surface=None):
+        return self._root_finder.get_lookahead(partial_input, whole_surface)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def invalidate(self):
+        """
+        Clears the cache.
+        """
+        self._entries.clear()
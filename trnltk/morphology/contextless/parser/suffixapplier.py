@@ -54,8 +54,6 @@ def transition_allowed_for_suffix(morpheme_container, suffix):
     return True
 
 def try_suffix_form(morpheme_container, suffix_form, to_state, word):
-    state_before_suffix_form_application = morpheme_container.get_last_state()
-
     if not transition_allowed_for_suffix_form(morpheme_container, suffix_form):
         return None
 
@@ -72,27 +70,44 @@ def try_suffix_form(morpheme_container, suffix_form, to_state, word):
         clone = morpheme_container.clone()
         clone.add_transition(SuffixFormApplication(suffix_form, actual_suffix_form_str, fitting_suffix_form), to_state)
 
-        if morpheme_container.has_transitions() and morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition and not morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition.is_satisfied_by(clone):
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug('      Suffix does not satisfy the postcondition "%s" of last transition suffix form "%s", skipping.', morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition, formatter.format_transition(clone.get_last_transition()))
+        if not transition_allowed_after_suffix_form_application(morpheme_container, clone):
             return None
 
-        if morpheme_container.has_transitions() and state_before_suffix_form_application.type==State.DERIVATIONAL:
-            logger.debug('      Suffix is derivative, checking the post derivation conditions of suffixes from previous derivation.')
-            for transition in morpheme_container.get_transitions_from_derivation_suffix():
-                application_suffix_form = transition.suffix_form_application.suffix_form
-                if application_suffix_form.post_derivation_condition:
-                    matches = application_suffix_form.post_derivation_condition.is_satisfied_by(clone)
-                    if not matches:
-                        logger.debug('      Post derivation condition "%s" of suffix "%s" is not satisfied, skipping.', application_suffix_form.post_derivation_condition, application_suffix_form.suffix)
-                        return None
-
         return clone
 
     else:
         logger.debug('      Word "%s" does not start with applied str "%s" (%s), skipping', word, applied_str, applied_str)
         return None
 
+def transition_allowed_after_suffix_form_application(morpheme_container, clone):
+    """
+    Checks the postcondition of the last transition and the post derivation conditions of the suffixes from the
+    previous derivation, once the suffix form is applied.
+    @param morpheme_container: morpheme container before the suffix form application
+    @type morpheme_container: MorphemeContainer
+    @param clone: morpheme container after the suffix form application
+    @type clone: MorphemeContainer
+    @rtype: bool
+    """
+    state_before_suffix_form_application = morpheme_container.get_last_state()
+
+    if morpheme_container.has_transitions() and morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition and not morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition.is_satisfied_by(clone):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('      Suffix does not satisfy the postcondition "%s" of last transition suffix form "%s", skipping.', morpheme_container.get_last_transition().suffix_form_application.suffix_form.postcondition, formatter.format_transition(clone.get_last_transition()))
+        return False
+
+    if morpheme_container.has_transitions() and state_before_suffix_form_application.type==State.DERIVATIONAL:
+        logger.debug('      Suffix is derivative, checking the post derivation conditions of suffixes from previous derivation.')
+        for transition in morpheme_container.get_transitions_from_derivation_suffix():
+            application_suffix_form = transition.suffix_form_application.suffix_form
+            if application_suffix_form.post_derivation_condition:
+                matches = application_suffix_form.post_derivation_condition.is_satisfied_by(clone)
+                if not matches:
+                    logger.debug('      Post derivation condition "%s" of suffix "%s" is not satisfied, skipping.', application_suffix_form.post_derivation_condition, application_suffix_form.suffix)
+                    return False
+
+    return True
+
 def transition_allowed_for_suffix_form(morpheme_container, suffix_form):
     if suffix_form.precondition and not suffix_form.precondition.is_satisfied_by(morpheme_container):
         if logger.isEnabledFor(logging.DEBUG):
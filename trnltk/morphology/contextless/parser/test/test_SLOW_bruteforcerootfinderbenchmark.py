@@ -0,0 +1,108 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures finding roots by brute force for the words of the bundled simple parsesets, with and without CachingRootFinder.
+
+Brute force root finders don't use a lexicon, so every word is an out of vocabulary word for them.
+"""
+import os
+import time
+import unittest
+from trnltk.morphology.contextless.parser.bruteforcenounrootfinders import BruteForceNounRootFinder, BruteForceCompoundNounRootFinder
+from trnltk.morphology.contextless.parser.bruteforceverbrootfinder import BruteForceVerbRootFinder
+from trnltk.morphology.contextless.parser.parser import ContextlessMorphologicalParser
+from trnltk.morphology.contextless.parser.rootfinder import CachingRootFinder
+from trnltk.morphology.model import formatter
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+
+SIMPLE_PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../../../testresources/simpleparsesets')
+
+PARSED_WORD_COUNT = 500
+
+def _create_root_finders():
+    return [BruteForceNounRootFinder(), BruteForceCompoundNounRootFinder(), BruteForceVerbRootFinder()]
+
+def _find_roots(root_finders, words):
+    root_count = 0
+    for word in words:
+        for i in range(1, len(word) + 1):
+            for root_finder in root_finders:
+                root_count += len(root_finder.find_roots_for_partial_input(word[:i], word))
+    return root_count
+
+def _parse(parser, words):
+    return [[formatter.format_morpheme_container_for_tests(r) for r in parser.parse(word)] for word in words]
+
+def _measure(function, *args):
+    start = time.time()
+    result = function(*args)
+    return result, time.time() - start
+
+class BruteForceRootFinderBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(BruteForceRootFinderBenchmark, cls).setUpClass()
+
+        cls.words = []
+        for file_name in sorted(os.listdir(SIMPLE_PARSESETS_FOLDER)):
+            for surface, parse_result in SimpleParseSetReader(os.path.join(SIMPLE_PARSESETS_FOLDER, file_name)).iter_words():
+                if surface.isalpha():
+                    cls.words.append(TurkishAlphabet.lower(surface))
+
+    def test_benchmark_root_finding(self):
+        caching_root_finders = [CachingRootFinder(root_finder) for root_finder in _create_root_finders()]
+
+        root_count, seconds = _measure(_find_roots, _create_root_finders(), self.words)
+        cached_root_count, cached_seconds = _measure(_find_roots, caching_root_finders, self.words)
+        # words are seen again, like in a bigger corpus
+        warm_cached_root_count, warm_cached_seconds = _measure(_find_roots, caching_root_finders, self.words)
+
+        print u'{} words ({} unique), {} roots'.format(len(self.words), len(set(self.words)), root_count)
+        print u'    brute force               : {:>7.1f} ms'.format(seconds * 1000)
+        print u'    cached brute force        : {:>7.1f} ms, {:>5.1f}x'.format(cached_seconds * 1000, seconds / cached_seconds)
+        print u'    warm cached brute force   : {:>7.1f} ms, {:>5.1f}x'.format(warm_cached_seconds * 1000, seconds / warm_cached_seconds)
+        for caching_root_finder in caching_root_finders:
+            print u'        {:<34}: {:>6} entries, {:>7} hits, {:>6} misses'.format(caching_root_finder._root_finder.__class__.__name__,
+                len(caching_root_finder), caching_root_finder.hit_count, caching_root_finder.miss_count)
+
+        self.assertEqual(cached_root_count, root_count)
+        self.assertEqual(warm_cached_root_count, root_count)
+        self.assertLess(warm_cached_seconds, seconds)
+
+    def test_benchmark_parsing(self):
+        suffix_graph = BasicSuffixGraph()
+        suffix_graph.initialize()
+
+        words = self.words[:PARSED_WORD_COUNT]
+
+        parser = ContextlessMorphologicalParser(suffix_graph, None, _create_root_finders())
+        caching_parser = ContextlessMorphologicalParser(suffix_graph, None, [CachingRootFinder(root_finder) for root_finder in _create_root_finders()])
+
+        results, seconds = _measure(_parse, parser, words)
+        cached_results, cached_seconds = _measure(_parse, caching_parser, words)
+
+        # most of the time is spent on traversing the suffix graph, not on finding the roots
+        print u'{} words parsed'.format(len(words))
+        print u'    brute force               : {:>7.1f} ms'.format(seconds * 1000)
+        print u'    cached brute force        : {:>7.1f} ms, {:>5.1f}x'.format(cached_seconds * 1000, seconds / cached_seconds)
+
+        self.assertEqual(cached_results, results)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures recognizing the numbers in digits and converting them to words on a token list like the one of a financial or
+sports text, and compares them to the original implementations which are reproduced here.
+"""
+import os
+import random
+import time
+import unittest
+from trnltk.morphology.contextless.parser.rootfinder import DigitNumeralRootFinder
+from trnltk.morphology.numbers.digitconverter import DigitsToNumberConverter
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+
+SIMPLE_PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../../../testresources/simpleparsesets')
+
+NUMBER_COUNT = 20000
+REPEAT = 3
+
+def _original_find_number_prefix_lengths(surface):
+    lengths = []
+    for i in range(1, len(surface) + 1):
+        for regex in DigitNumeralRootFinder.NUMBER_REGEXES:
+            if regex.match(surface[:i]):
+                lengths.append(i)
+                break
+    return frozenset(lengths)
+
+class _OriginalDigitsToNumberConverter(DigitsToNumberConverter):
+    @classmethod
+    def convert_digits_to_words(cls, digits):
+        digits = unicode(digits)
+        digits = digits.replace(cls.GROUPING_SEPARATOR, '')
+
+        if not cls.TURKISH_NUMBER_REGEX.match(digits):
+            raise Exception(u'{} is not a valid number. The allowed pattern is : {}'.format(digits, str(cls.TURKISH_NUMBER_PATTERN)))
+
+        if cls.FRACTION_SEPARATOR in digits:
+            integer_str = digits[:digits.find(cls.FRACTION_SEPARATOR)]
+            fraction_str = digits[digits.find(cls.FRACTION_SEPARATOR) + 1:]
+        else:
+            integer_str = digits
+            fraction_str = None
+
+        integer_part = int(integer_str)
+        fraction_part = int(fraction_str) if fraction_str else 0
+
+        word_integer_part = cls._convert_natural_number_to_words(abs(integer_part))
+        word_fraction_part = cls._convert_natural_number_to_words(fraction_part)
+
+        word_integer_part = cls._add_text_for_leading_zeros(integer_str, word_integer_part)
+        word_fraction_part = cls._add_text_for_leading_zeros(fraction_str, word_fraction_part) if fraction_str else word_fraction_part
+
+        if integer_part < 0:
+            word_integer_part = cls.MINUS_NAME + u' ' + word_integer_part
+
+        if cls.FRACTION_SEPARATOR in digits:
+            return u'{} {} {}'.format(word_integer_part, cls.COMMA_NAME, word_fraction_part)
+        else:
+            return word_integer_part
+
+    @classmethod
+    def _add_text_for_leading_zeros(cls, integer_str, word):
+        if integer_str.startswith(cls.NEGATIVE_SIGN) or integer_str.startswith(cls.POSITIVE_SIGN):
+            integer_str = integer_str[1:]
+        number_of_leading_zeros = len(integer_str) - len(str(int(integer_str)))
+        for i in range(0, number_of_leading_zeros):
+            word = cls.ZERO_NAME + u' ' + word
+        return word
+
+    @classmethod
+    def _convert_natural_number_to_words(cls, integer_nr):
+        result = u''
+
+        if integer_nr < 10:
+            result = cls.NUMERAL_SYMBOL_NAMES[integer_nr]
+        elif integer_nr < 100:
+            tens_digit = integer_nr / 10
+            ones_digit = integer_nr % 10
+            result = u'{} {}'.format(cls.TENS_MULTIPLES_NAMES[tens_digit], cls._convert_natural_number_to_words(ones_digit) if ones_digit > 0 else u'')
+        elif integer_nr < 1000:
+            hundreds_digit = integer_nr / 100
+            rest = integer_nr % 100
+            rest_str = cls._convert_natural_number_to_words(rest) if rest > 0 else u''
+            if hundreds_digit == 1:
+                result = u'{} {}'.format(cls.HUNDRED_NAME, rest_str)
+            else:
+                result = u'{} {} {}'.format(cls._convert_natural_number_to_words(hundreds_digit), cls.HUNDRED_NAME, rest_str)
+        else:
+            i = cls.MAX_GROUP_BASE / 3
+            while pow(10, i * 3) > integer_nr:
+                i -= 1
+            for i in range(i, 0, -1):
+                group_nr = integer_nr / pow(1000, i) % 1000
+                if group_nr == 0:
+                    pass
+                elif group_nr == 1 and i == 1:
+                    result += u' {}'.format(cls.THOUSAND_NAME)
+                else:
+                    group_nr_str = cls._convert_natural_number_to_words(group_nr)
+                    result += u' {} {} '.format(group_nr_str, cls.THOUSAND_POWER_NAMES[i])
+
+                result = result.strip()
+
+            last_group_nr = integer_nr % 1000
+            if last_group_nr > 0:
+                result += u' ' + cls._convert_natural_number_to_words(last_group_nr)
+
+        return result.strip()
+
+def _create_number(random_generator):
+    kind = random_generator.randint(0, 4)
+    if kind == 0:       # score, minute, rank
+        return unicode(random_generator.randint(0, 120))
+    elif kind == 1:     # amount
+        return u'{:,}'.format(random_generator.randint(1000, 10 ** random_generator.randint(4, 13))).replace(u',', u'.')
+    elif kind == 2:     # amount with kuruş
+        return u'{:,}'.format(random_generator.randint(0, 10 ** 7)).replace(u',', u'.') + u',' + u'{:02d}'.format(random_generator.randint(0, 99))
+    elif kind == 3:     # ratio
+        return random_generator.choice([u'-', u'+', u'']) + unicode(random_generator.randint(0, 99)) + u',' + unicode(random_generator.randint(0, 99))
+    else:               # year
+        return unicode(random_generator.randint(1900, 2020))
+
+def _measure(function, items):
+    seconds = []
+    for i in range(REPEAT):
+        start = time.time()
+        results = [function(item) for item in items]
+        seconds.append(time.time() - start)
+    return results, min(seconds)
+
+class DigitNumeralBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(DigitNumeralBenchmark, cls).setUpClass()
+
+        random_generator = random.Random(1)
+        cls.numbers = [_create_number(random_generator) for i in range(NUMBER_COUNT)]
+
+        words = []
+        for file_name in sorted(os.listdir(SIMPLE_PARSESETS_FOLDER)):
+            for surface, parse_result in SimpleParseSetReader(os.path.join(SIMPLE_PARSESETS_FOLDER, file_name)).iter_words():
+                words.append(surface)
+
+        # numbers with and without suffixes, between the words
+        cls.tokens = list(words)
+        for number in cls.numbers:
+            cls.tokens.insert(random_generator.randint(0, len(cls.tokens)), number + random_generator.choice([u'', u'', u"'de", u"'lik", u"'ten"]))
+
+    def test_benchmark_number_recognition(self):
+        original_results, original_seconds = _measure(_original_find_number_prefix_lengths, self.tokens)
+        results, seconds = _measure(DigitNumeralRootFinder.find_number_prefix_lengths, self.tokens)
+
+        print u'{} tokens, {} numbers, {} number prefixes'.format(len(self.tokens), len(self.numbers), sum([len(r) for r in results]))
+        print u'    regexes for each prefix : {:>7.1f} ms'.format(original_seconds * 1000)
+        print u'    single pass             : {:>7.1f} ms, {:>5.1f}x'.format(seconds * 1000, original_seconds / seconds)
+
+        self.assertEqual(results, original_results)
+        self.assertLess(seconds, original_seconds)
+
+    def test_benchmark_conversion(self):
+        original_results, original_seconds = _measure(_OriginalDigitsToNumberConverter.convert_digits_to_words, self.numbers)
+        results, seconds = _measure(DigitsToNumberConverter.convert_digits_to_words, self.numbers)
+
+        print u'{} numbers'.format(len(self.numbers))
+        print u'    big integer arithmetic  : {:>7.1f} ms'.format(original_seconds * 1000)
+        print u'    3 digit group names     : {:>7.1f} ms, {:>5.1f}x'.format(seconds * 1000, original_seconds / seconds)
+
+        self.assertEqual(results, original_results)
+        self.assertLess(seconds, original_seconds)
+
+if __name__ == '__main__':
+    unittest.main()
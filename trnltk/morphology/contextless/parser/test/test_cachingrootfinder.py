@@ -0,0 +1,123 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import unittest
+from hamcrest import *
+from trnltk.morphology.contextless.parser.bruteforcenounrootfinders import BruteForceNounRootFinder, BruteForceCompoundNounRootFinder
+from trnltk.morphology.contextless.parser.bruteforceverbrootfinder import BruteForceVerbRootFinder
+from trnltk.morphology.contextless.parser.rootfinder import CachingRootFinder
+from trnltk.morphology.model.lexeme import LexemeAttribute
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../../../testresources/parsesets/parseset001.xml')
+
+WORDS = [u'suborusuna', u'bacakkalemini', u'adamotunu', u'kitabı', u'kitaba', u'kitapta', u'hakkı', u'hakka', u'saati',
+         u'saate', u'gidiyor', u'gideri', u'gider', u'başlıyor', u'elliyor', u'söylüyor', u'kazıyor', u'yapılıyor',
+         u'ettirdi', u'yıkandı', u'yıkanıldı', u'güldürdü', u'pişirdi', u'ürktü', u'Ali', u'aLi', u'ağaçlar', u'a', u'ab']
+
+def _to_comparable(roots):
+    return sorted([(root.__class__.__name__, root.str, root.lexeme.lemma, root.lexeme.root, root.lexeme.syntactic_category,
+                    root.lexeme.secondary_syntactic_category, tuple(sorted(root.lexeme.attributes)),
+                    tuple(sorted(root.phonetic_attributes or [])), tuple(sorted(root.phonetic_expectations or []))) for root in roots])
+
+class CachingRootFinderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(CachingRootFinderTest, cls).setUpClass()
+
+        cls.words = list(WORDS)
+        for word in StreamingParseSetReader(PARSESET_PATH).iter_words():
+            if len(cls.words) >= 500:
+                break
+            if word.str.isalpha():
+                cls.words.append(TurkishAlphabet.lower(word.str))
+
+    def _assert_same_roots(self, root_finder_class):
+        root_finder = root_finder_class()
+        caching_root_finder = CachingRootFinder(root_finder_class())
+
+        # second pass finds everything in the cache
+        for i in range(2):
+            for word in self.words:
+                for j in range(1, len(word) + 1):
+                    partial_input = word[:j]
+                    expected = _to_comparable(root_finder.find_roots_for_partial_input(partial_input, word))
+                    actual = _to_comparable(caching_root_finder.find_roots_for_partial_input(partial_input, word))
+                    assert_that(actual, equal_to(expected), u'{} {}'.format(partial_input, word))
+
+        assert_that(caching_root_finder.hit_count, greater_than(caching_root_finder.miss_count))
+
+    def test_should_find_same_noun_roots(self):
+        self._assert_same_roots(BruteForceNounRootFinder)
+
+    def test_should_find_same_compound_noun_roots(self):
+        self._assert_same_roots(BruteForceCompoundNounRootFinder)
+
+    def test_should_find_same_verb_roots(self):
+        self._assert_same_roots(BruteForceVerbRootFinder)
+
+    def test_should_use_lookahead_as_key(self):
+        caching_root_finder = CachingRootFinder(BruteForceVerbRootFinder())
+
+        caching_root_finder.find_roots_for_partial_input(u'gel', u'geliyor')
+        caching_root_finder.find_roots_for_partial_input(u'gel', u'geliyordu')
+        caching_root_finder.find_roots_for_partial_input(u'gel', u'geliyorum')
+        assert_that(caching_root_finder.miss_count, equal_to(1))
+        assert_that(caching_root_finder.hit_count, equal_to(2))
+
+        caching_root_finder.find_roots_for_partial_input(u'gel', u'gelir')
+        assert_that(caching_root_finder.miss_count, equal_to(2))
+        assert_that(caching_root_finder, has_length(2))
+
+    def test_should_return_clones(self):
+        caching_root_finder = CachingRootFinder(BruteForceNounRootFinder())
+
+        roots = caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')
+        expected = _to_comparable(roots)
+        for root in roots:
+            root.lexeme.attributes.add(LexemeAttribute.CompoundP3sg)
+            root.str = u'modified'
+
+        roots = caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')
+        assert_that(_to_comparable(roots), equal_to(expected))
+
+        for root in roots:
+            root.lexeme.root = u'modified'
+        assert_that(_to_comparable(caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')), equal_to(expected))
+
+    def test_should_clear_when_full(self):
+        caching_root_finder = CachingRootFinder(BruteForceNounRootFinder(), max_size=2)
+
+        caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')
+        caching_root_finder.find_roots_for_partial_input(u'kalem', u'kalemi')
+        caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')
+        assert_that(caching_root_finder, has_length(2))
+        assert_that(caching_root_finder.hit_count, equal_to(1))
+
+        caching_root_finder.find_roots_for_partial_input(u'defter', u'defteri')
+        assert_that(caching_root_finder, has_length(1))
+
+        caching_root_finder.find_roots_for_partial_input(u'kitab', u'kitabı')
+        assert_that(caching_root_finder.miss_count, equal_to(4))
+
+        caching_root_finder.invalidate()
+        assert_that(caching_root_finder, has_length(0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from hamcrest import *
+from trnltk.morphology.contextless.parser.bruteforcenounrootfinders import BruteForceNounRootFinder
+from trnltk.morphology.contextless.parser.bruteforceverbrootfinder import BruteForceVerbRootFinder
+from trnltk.morphology.contextless.parser.oovmode import OOVRootScorer, OOVReport
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+
+class OOVRootScorerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(OOVRootScorerTest, cls).setUpClass()
+
+        suffix_graph = BasicSuffixGraph()
+        suffix_graph.initialize()
+
+        cls.scorer = OOVRootScorer(suffix_graph)
+
+    def _noun_root(self, partial_input, word):
+        return BruteForceNounRootFinder().find_roots_for_partial_input(partial_input, word)[0]
+
+    def test_should_check_phonotactic_validity(self):
+        assert_that(self.scorer.is_phonotactically_valid(u'kitap'), equal_to(True))
+        assert_that(self.scorer.is_phonotactically_valid(u'kontrol'), equal_to(True))
+        assert_that(self.scorer.is_phonotactically_valid(u'türk'), equal_to(True))
+
+        assert_that(self.scorer.is_phonotactically_valid(u'xkcd'), equal_to(False))
+        assert_that(self.scorer.is_phonotactically_valid(u'kitapst'), equal_to(False))
+        assert_that(self.scorer.is_phonotactically_valid(u'ayyyy'), equal_to(False))
+        assert_that(self.scorer.is_phonotactically_valid(u'akstrp'), equal_to(False))
+        assert_that(self.scorer.is_phonotactically_valid(u'ki3ap'), equal_to(False))
+
+    def test_should_check_reachability(self):
+        assert_that(self.scorer.is_reachable(self._noun_root(u'kitab', u'kitabı'), u'ı'), equal_to(True))
+        assert_that(self.scorer.is_reachable(self._noun_root(u'kitap', u'kitaptan'), u'tan'), equal_to(True))
+        assert_that(self.scorer.is_reachable(self._noun_root(u'kitap', u'kitap'), u''), equal_to(True))
+        assert_that(self.scorer.is_reachable(self._noun_root(u'kitap', u'kitapğ'), u'ğ'), equal_to(False))
+        assert_that(self.scorer.is_reachable(self._noun_root(u'kitap', u'kitapx'), u'x'), equal_to(False))
+
+        verb_roots = BruteForceVerbRootFinder().find_roots_for_partial_input(u'gel', u'geliyor')
+        assert_that(self.scorer.is_reachable(verb_roots[0], u'iyor'), equal_to(True))
+
+    def test_should_score_plausible_roots_higher(self):
+        assert_that(self.scorer.score(self._noun_root(u'kitab', u'kitabı'), u'kitabı'),
+            greater_than(self.scorer.score(self._noun_root(u'kit', u'kitabı'), u'kitabı')))
+        assert_that(self.scorer.score(self._noun_root(u'kitab', u'kitabı'), u'kitabı'),
+            greater_than(self.scorer.score(self._noun_root(u'kita', u'kitabı'), u'kitabı')))
+        assert_that(self.scorer.score(self._noun_root(u'ay', u'ayyyyı'), u'ayyyyı'),
+            greater_than(self.scorer.score(self._noun_root(u'ayyyy', u'ayyyyı'), u'ayyyyı')))
+
+
+class OOVReportTest(unittest.TestCase):
+    def test_should_add_reports(self):
+        report = OOVReport()
+        assert_that(report.is_truncated(), equal_to(False))
+
+        other = OOVReport()
+        other.found_root_count = 10
+        other.dropped_root_count = 2
+        other.traversed_candidate_count = 30
+        report.add(other)
+        report.add(other)
+
+        assert_that(report.found_root_count, equal_to(20))
+        assert_that(report.dropped_root_count, equal_to(4))
+        assert_that(report.traversed_candidate_count, equal_to(60))
+        assert_that(report.dropped_candidate_count, equal_to(0))
+        assert_that(report.is_truncated(), equal_to(True))
+
+if __name__ == '__main__':
+    unittest.main()
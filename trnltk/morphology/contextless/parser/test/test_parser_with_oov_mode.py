@@ -0,0 +1,142 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from hamcrest import *
+from trnltk.morphology.contextless.parser.bruteforcenounrootfinders import BruteForceNounRootFinder, BruteForceCompoundNounRootFinder
+from trnltk.morphology.contextless.parser.bruteforceverbrootfinder import BruteForceVerbRootFinder
+from trnltk.morphology.contextless.parser.oovmode import OOVMode, OOVReport
+from trnltk.morphology.contextless.parser.test.parser_test import ParserTest
+from trnltk.morphology.contextless.parser.parser import ContextlessMorphologicalParser, UpperCaseSupportingContextlessMorphologicalParser
+from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.rootgenerator import RootGenerator, RootMapGenerator
+from trnltk.morphology.model import formatter
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+
+def _create_brute_force_root_finders():
+    return [BruteForceNounRootFinder(), BruteForceCompoundNounRootFinder(), BruteForceVerbRootFinder()]
+
+class ParserTestWithOOVMode(ParserTest):
+
+    @classmethod
+    def setUpClass(cls):
+        super(ParserTestWithOOVMode, cls).setUpClass()
+
+        cls.suffix_graph = BasicSuffixGraph()
+        cls.suffix_graph.initialize()
+
+    def setUp(self):
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, None, [], oov_mode=OOVMode(_create_brute_force_root_finders()))
+        self.unbounded_parser = ContextlessMorphologicalParser(self.suffix_graph, None, _create_brute_force_root_finders())
+
+    def _format(self, parse_results):
+        return [formatter.format_morpheme_container_for_tests(r) for r in parse_results]
+
+    def test_should_parse_with_capped_roots(self):
+        self.assert_parse_exists(u'kitabı', u'kitab(kitap)+Noun+A3sg+Pnon+Acc(+yI[ı])')
+        self.assert_parse_exists(u'gidiyordum', u'gidiyor(gidiyormak)+Verb+Pos+Past(dI[du])+A1sg(+Im[m])')
+
+        oov_report = OOVReport()
+        parse_results = self._format(self.parser.parse(u'kelebeklerimizdekilerden', oov_report))
+
+        assert_that(parse_results, is_not(empty()))
+        assert_that(self._format(self.unbounded_parser.parse(u'kelebeklerimizdekilerden')), has_items(*parse_results))
+
+        assert_that(oov_report.found_root_count, greater_than(OOVMode.DEFAULT_MAX_ROOT_COUNT))
+        assert_that(oov_report.dropped_root_count, equal_to(oov_report.found_root_count - OOVMode.DEFAULT_MAX_ROOT_COUNT))
+        assert_that(oov_report.dropped_candidate_count, equal_to(0))
+        assert_that(oov_report.is_truncated(), equal_to(True))
+
+    def test_should_keep_plausible_roots(self):
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, None, [], oov_mode=OOVMode(_create_brute_force_root_finders(), max_root_count=1))
+
+        # whole surface is reachable and valid, but "xxxx" is not phonotactically valid
+        self.assert_parse_correct(u'xxxxa', u'xxxxa(xxxxa)+Noun+A3sg+Pnon+Nom')
+        self.assert_parse_correct(u'masaya', u'masaya(masaya)+Noun+A3sg+Pnon+Nom')
+
+    def test_should_not_truncate_short_words(self):
+        oov_report = OOVReport()
+        self.parser.parse(u'ev', oov_report)
+
+        assert_that(oov_report.is_truncated(), equal_to(False))
+        assert_that(self._format(self.parser.parse(u'ev')), equal_to(self._format(self.unbounded_parser.parse(u'ev'))))
+
+    def test_should_stop_when_traversal_budget_is_exhausted(self):
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, None, [], oov_mode=OOVMode(_create_brute_force_root_finders(), max_traversal_count=5))
+
+        oov_report = OOVReport()
+        self.parser.parse(u'kelebeklerimizdekilerden', oov_report)
+
+        assert_that(oov_report.traversed_candidate_count, equal_to(5))
+        assert_that(oov_report.dropped_candidate_count, greater_than(0))
+        assert_that(oov_report.is_truncated(), equal_to(True))
+
+    def test_should_bound_traversal_for_garbage_tokens(self):
+        garbage = u'asdfghjklqwertyuıopğüşizxcvbnmöç' * 4
+
+        oov_report = OOVReport()
+        self.parser.parse(garbage, oov_report)
+
+        assert_that(oov_report.found_root_count, greater_than(oov_report.traversed_candidate_count))
+        assert_that(oov_report.traversed_candidate_count, less_than_or_equal_to(OOVMode.DEFAULT_MAX_TRAVERSAL_COUNT))
+
+    def test_should_not_drop_roots_from_lexicon(self):
+        lexemes = LexiconLoader.load_from_lines([u'kitap', u'kelebek'])
+        root_map = RootMapGenerator().generate([root for lexeme in lexemes for root in RootGenerator.generate(lexeme)])
+
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, None, [WordRootFinder(root_map)],
+            oov_mode=OOVMode(_create_brute_force_root_finders(), max_root_count=1))
+
+        self.assert_parse_exists(u'kelebeklerimizdekilerden', u'kelebek(kelebek)+Noun+A3pl(lAr[ler])+P1pl(+ImIz[imiz])+Loc(dA[de])+Adj+PointQual(ki[ki])+Noun+Zero+A3pl(lAr[ler])+Pnon+Abl(dAn[den])')
+        self.assert_parse_exists(u'kitabı', u'kitab(kitap)+Noun+A3sg+Pnon+Acc(+yI[ı])')
+
+    def test_should_not_change_parses_of_known_words(self):
+        lexemes = LexiconLoader.load_from_lines([u'benzer [P:Adj]', u'benzemek'])
+        root_map = RootMapGenerator().generate([root for lexeme in lexemes for root in RootGenerator.generate(lexeme)])
+
+        parser_without_oov_mode = ContextlessMorphologicalParser(self.suffix_graph, None, [WordRootFinder(root_map)])
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, None, [WordRootFinder(root_map)],
+            oov_mode=OOVMode(_create_brute_force_root_finders(), max_traversal_count=5))
+
+        parse_results = self._format(parser_without_oov_mode.parse(u'benzerliğine'))
+
+        oov_report = OOVReport()
+        assert_that(parse_results, is_not(empty()))
+        assert_that(self._format(self.parser.parse(u'benzerliğine', oov_report)), equal_to(parse_results))
+        assert_that(oov_report.dropped_candidate_count, greater_than(0))
+
+    def test_should_skip_partial_inputs_ending_with_upper_case(self):
+        oov_report = OOVReport()
+        parse_results = self._format(self.parser.parse(u'Bodrum_Bodrum_Dedikleri', oov_report))
+
+        assert_that(parse_results, is_not(empty()))
+        assert_that(oov_report.found_root_count, greater_than(0))
+        self.parser.parse(u'Bilimsel_Devrim')
+
+    def test_should_add_reports_of_upper_case_parses(self):
+        parser = UpperCaseSupportingContextlessMorphologicalParser(self.suffix_graph, None, [], oov_mode=OOVMode(_create_brute_force_root_finders()))
+
+        lower_case_oov_report = OOVReport()
+        parser.parse(u'kelebeklerimizdekilerden', lower_case_oov_report)
+
+        oov_report = OOVReport()
+        parser.parse(u'Kelebeklerimizdekilerden', oov_report)
+
+        assert_that(oov_report.found_root_count, greater_than(lower_case_oov_report.found_root_count))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import unittest
+from hamcrest import *
+from trnltk.morphology.contextless.parser.test.parser_test import ParserTest
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.reloadablelexicon import ReloadableLexicon
+from trnltk.morphology.contextless.parser.parser import ContextlessMorphologicalParser
+from trnltk.morphology.contextless.parser.rootfinder import  WordRootFinder
+from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+
+class ParserTestWithReloadableLexicon(ParserTest):
+
+    @classmethod
+    def setUpClass(cls):
+        super(ParserTestWithReloadableLexicon, cls).setUpClass()
+        cls.lexemes = LexiconLoader.load_from_file(os.path.join(os.path.dirname(__file__), '../../../../resources/master_dictionary.txt'))
+
+        cls.suffix_graph = BasicSuffixGraph()
+        cls.suffix_graph.initialize()
+
+    def setUp(self):
+        lexicon = ReloadableLexicon(self.lexemes)
+
+        predefined_paths = PredefinedPaths(lexicon.root_map, self.suffix_graph)
+        predefined_paths.create_predefined_paths()
+
+        self.parser = ContextlessMorphologicalParser(self.suffix_graph, predefined_paths, [WordRootFinder(lexicon.root_map)], lexicon)
+
+    def test_should_parse_with_added_lexemes(self):
+        self.assert_not_parsable(u'zırzoplara')
+
+        self.parser.add_lexemes(LexiconLoader.load_from_lines([u'zırzop [P:Noun]']))
+
+        self.assert_parse_correct(u'zırzoplara', u'zırzop(zırzop)+Noun+A3pl(lAr[lar])+Pnon+Dat(+yA[a])')
+
+    def test_should_not_parse_with_removed_lexemes(self):
+        self.assert_parse_correct(u'kitaba', u'kitab(kitap)+Noun+A3sg+Pnon+Dat(+yA[a])')
+
+        self.parser.remove_lexemes(LexiconLoader.load_from_lines([u'kitap']))
+
+        self.assert_not_parsable(u'kitaba')
+
+    def test_should_parse_with_replaced_lexemes(self):
+        self.parser.replace_lexemes(LexiconLoader.load_from_lines([u'kitap']), LexiconLoader.load_from_lines([u'kitap [A:NoVoicing]']))
+
+        self.assert_not_parsable(u'kitaba')
+        self.assert_parse_correct(u'kitapa', u'kitap(kitap)+Noun+A3sg+Pnon+Dat(+yA[a])')
+
+    def test_should_parse_with_refreshed_predefined_paths(self):
+        ben_pron = LexiconLoader.load_from_lines([u'ben [P:Pron, Pers; A:RootChange]'])
+
+        self.parser.remove_lexemes(ben_pron)
+        self.assert_parse_doesnt_exist(u'bana', u'ban(ben)+Pron+Pers+A1sg+Pnon+Dat(a[a])')
+
+        self.parser.add_lexemes(ben_pron)
+        self.assert_parse_exists(u'bana', u'ban(ben)+Pron+Pers+A1sg+Pnon+Dat(a[a])')
+
+    def test_should_not_change_lexemes_without_lexicon(self):
+        parser = ContextlessMorphologicalParser(self.suffix_graph, None, [])
+
+        self.assertRaises(Exception, parser.add_lexemes, LexiconLoader.load_from_lines([u'zırzop']))
+
+if __name__ == '__main__':
+    unittest.main()
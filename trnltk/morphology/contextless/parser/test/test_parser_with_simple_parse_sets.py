@@ -16,7 +16,6 @@ limitations under the License.
 """
 from __future__ import unicode_literals
 from __future__ import division
-import codecs
 import logging
 import os
 import unittest
@@ -33,6 +32,7 @@ from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder, Digi
 from trnltk.morphology.contextless.parser.suffixapplier import logger as suffix_applier_logger
 from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
 from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+from trnltk.parseset.simpleparseset import SimpleParseSetReader, normalize_treebank_parse_result
 
 #TODO
 from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
@@ -235,66 +235,37 @@ class ParserTestWithSimpleParseSets(ParserTest):
         logger.info("Parsing simple parse set {}".format(path))
         skipped = 0
         unparsable = 0
-        comment = 0
-        with codecs.open(path, 'r', 'utf-8-sig') as parse_set_file:
-            index = 0
-            for line in parse_set_file:
-                if start_index>index:
-                    index +=1
-                    continue
-
-                if line.startswith('#'):
-                    comment +=1
-                    index +=1
-                    continue
-
-                line = line.strip()
-                (word, parse_result) = line.split('=')
-                if any([case_to_skip in parse_result for case_to_skip in cases_to_skip]) or word in words_to_skip:
-                    if self.LOG_SKIPPED:
-                        logger.info(u'Skipped : {} {} {}'.format(index, word, parse_result))
-                    skipped +=1
-                    index +=1
-                    continue
-
-                #TODO
-                parse_result = parse_result.replace('Prog1', 'Prog')
-                parse_result = parse_result.replace('Prog2', 'Prog')
-                parse_result = parse_result.replace('Inf1', 'Inf')
-                parse_result = parse_result.replace('Inf2', 'Inf')
-                parse_result = parse_result.replace('Inf3', 'Inf')
-                parse_result = parse_result.replace('WithoutHavingDoneSo1', 'WithoutHavingDoneSo')
-                parse_result = parse_result.replace('WithoutHavingDoneSo2', 'WithoutHavingDoneSo')
-
-
-                #TODO
-                parse_result = parse_result.replace('Hastily', 'Hastily+Pos')
-
-                parse_result = parse_result.replace('Postp+PCNom', 'Part')
-                parse_result = parse_result.replace('Postp+PCDat', 'Postp')
-                parse_result = parse_result.replace('Postp+PCAcc', 'Postp')
-                parse_result = parse_result.replace('Postp+PCLoc', 'Postp')
-                parse_result = parse_result.replace('Postp+PCAbl', 'Postp')
-                parse_result = parse_result.replace('Postp+PCIns', 'Postp')
-                parse_result = parse_result.replace('Postp+PCGen', 'Postp')
-
-                if self.STATS_MODE:
-                    try:
-                        self.assert_parse_correct(word, index, parse_result)
-                    except Exception:
-                        unparsable +=1
-                        logger.info(u'Unparsable : {} {} {}'.format(index, word, parse_result))
-                else:
-                    self.assert_parse_correct(TurkishAlphabet.lower(word), index, parse_result)
-
-                index += 1
+        index = 0
+        for word, parse_result in SimpleParseSetReader(path).iter_words():
+            if start_index>index:
+                index +=1
+                continue
+
+            if any([case_to_skip in parse_result for case_to_skip in cases_to_skip]) or word in words_to_skip:
+                if self.LOG_SKIPPED:
+                    logger.info(u'Skipped : {} {} {}'.format(index, word, parse_result))
+                skipped +=1
+                index +=1
+                continue
+
+            parse_result = normalize_treebank_parse_result(parse_result)
+
+            if self.STATS_MODE:
+                try:
+                    self.assert_parse_correct(word, index, parse_result)
+                except Exception:
+                    unparsable +=1
+                    logger.info(u'Unparsable : {} {} {}'.format(index, word, parse_result))
+            else:
+                self.assert_parse_correct(TurkishAlphabet.lower(word), index, parse_result)
+
+            index += 1
 
         if self.STATS_MODE:
             logger.info("Finished simple parse set {}".format(path))
-            logger.info("Found {} lines, with {} lines of comments".format(index, comment))
+            logger.info("Found {} words".format(index))
             logger.info("Skipped {}, unparsable {}".format(skipped, unparsable))
-            logger.info("Words that should be parsable : {}".format(index-comment))
-            logger.info("Parse success rate : {}".format(float(index-comment-skipped-unparsable)/float(index-comment)))
+            logger.info("Parse success rate : {}".format(float(index-skipped-unparsable)/float(index)))
 
     def assert_parse_correct(self, word_to_parse, index, *args):
         parse_result = self.parse_result(word_to_parse)
@@ -125,6 +125,22 @@ class DigitNumeralRootFinderTest(unittest.TestCase):
         roots = self.root_finder.find_roots_for_partial_input(u'+2.999.999.999.999,12345678901')
         assert_that(roots[0].str, equal_to(u'+2.999.999.999.999,12345678901'))
 
+    def test_should_recognize_number_roots_of_prefixes(self):
+        surface = u"1.250.000,75'lik"
+        roots = [root for i in range(1, len(surface) + 1) for root in self.root_finder.find_roots_for_partial_input(surface[:i], surface)]
+        assert_that([root.str for root in roots], equal_to([u'1', u'1.250', u'1.250.000', u'1.250.000,7', u'1.250.000,75']))
+
+        assert_that(self.root_finder.find_roots_for_partial_input(u'-', u'-3'), has_length(0))
+        assert_that(self.root_finder.find_roots_for_partial_input(u'-3', u'-3'), has_length(1))
+        assert_that(self.root_finder.find_roots_for_partial_input(u'a', u'a3'), has_length(0))
+
+    def test_should_find_same_prefixes_with_regexes(self):
+        surfaces = [u'3', u'-3', u'+3,5', u'3,', u'3,,5', u'1.234', u'1.23', u'1.2345', u'1234.567', u'12.345.678,9',
+                    u'1.22.333', u'22.751041,366', u"3'te", u'3.5', u'-.5', u'++3', u'1.234.567,89%', u'3-2', u'0,000']
+        for surface in surfaces:
+            expected = frozenset([i for i in range(1, len(surface) + 1) if any([regex.match(surface[:i]) for regex in DigitNumeralRootFinder.NUMBER_REGEXES])])
+            assert_that(DigitNumeralRootFinder.find_number_prefix_lengths(surface), equal_to(expected), surface)
+
 class ProperNounFromApostropheRootFinderTest(unittest.TestCase):
 
     def setUp(self):
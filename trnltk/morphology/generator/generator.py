@@ -0,0 +1,418 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Generation of surfaces from parse results like 'kitap+Noun+A3sg+Pnon+Dat'.
+
+The generator walks the suffix graph forward from the roots of the lemma and applies the suffix forms with the same
+conditions and phonetics the parser uses. Outputs of the states are indexed by the tags they produce, so each tag of a
+parse result is resolved with a lookup instead of trying every output of the state.
+
+Roots which the suffix graph cannot tell apart, like 'kitap' and 'kasap' which end with the same letter and have the same
+lexeme attributes, get the same suffix forms applied. Thus the surfaces generated after a root are kept without the
+part before the last letter of the root, and reused for the other roots with the same tags. The walk happens only once
+for each kind of root and tag sequence during the lifetime of the generator.
+
+The suffix graph is made for parsing, where the surface decides among the suffix forms. Thus a parse result may have
+more than one surface generated, like 'verir' and 'verer' for 'ver+Verb+Pos+Aor+A3sg'.
+"""
+import logging
+from trnltk.morphology.contextless.parser.suffixapplier import transition_allowed_for_suffix, transition_allowed_for_suffix_form, transition_allowed_after_suffix_form_application
+from trnltk.morphology.model import formatter
+from trnltk.morphology.model.graphmodel import State
+from trnltk.morphology.model.lexeme import SyntacticCategory, LexemeAttribute
+from trnltk.morphology.model.morpheme import FreeTransitionSuffix, SuffixFormApplication
+from trnltk.morphology.model.morphemecontainer import MorphemeContainer
+from trnltk.morphology.morphotactics.suffixconditions import find_root_strs
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
+from trnltk.morphology.phonetics.phonetics import Phonetics, PhoneticExpectation
+
+logger = logging.getLogger('generator')
+
+class _TagNode(object):
+    """
+    Node of the trie of the tags of the parse results which are generated together.
+    """
+    __slots__ = ('children', 'result_indexes')
+
+    def __init__(self):
+        self.children = {}
+        self.result_indexes = []
+
+class _Start(object):
+    """
+    Initial morpheme container of a root with the beginning of the parse results generated after it.
+    """
+    __slots__ = ('morpheme_container', 'parse_result', 'parse_result_with_separator', 'surface_prefix', 'key')
+
+    def __init__(self, morpheme_container, surface_prefix, key):
+        """
+        @type morpheme_container: MorphemeContainer
+        @param surface_prefix: beginning of the surfaces which is not included in the generated surface tails
+        @type surface_prefix: unicode
+        @param key: key of the generated surface tails
+        """
+        self.morpheme_container = morpheme_container
+        self.parse_result = formatter.format_morpheme_container_for_parseset(morpheme_container)
+        self.parse_result_with_separator = self.parse_result + u'+'
+        self.surface_prefix = surface_prefix
+        self.key = key
+
+class _Candidate(object):
+    """
+    Morpheme container being generated with its surface. Attributes needed to apply the suffix forms are calculated
+    once for all the suffix forms tried after the container, and only if a suffix form is not empty.
+    """
+    __slots__ = ('morpheme_container', 'surface', 'surface_so_far', 'suffixes_since_derivation', '_phonetic_attributes', '_lexeme_attributes')
+
+    def __init__(self, morpheme_container, surface):
+        """
+        @type morpheme_container: MorphemeContainer
+        @type surface: unicode
+        """
+        self.morpheme_container = morpheme_container
+        self.surface = surface
+        self.surface_so_far = morpheme_container.get_surface_so_far()
+        self.suffixes_since_derivation = morpheme_container.get_suffixes_since_derivation_suffix()
+        self._phonetic_attributes = None
+        self._lexeme_attributes = None
+
+    def get_phonetic_attributes(self):
+        if self._phonetic_attributes is None:
+            self._phonetic_attributes = self.morpheme_container.get_phonetic_attributes()
+        return self._phonetic_attributes
+
+    def get_lexeme_attributes(self):
+        if self._lexeme_attributes is None:
+            self._lexeme_attributes = self.morpheme_container.get_lexeme_attributes() or set()
+        return self._lexeme_attributes
+
+class MorphologicalGenerator(object):
+    def __init__(self, suffix_graph, predefined_paths, root_map):
+        """
+        @type suffix_graph: SuffixGraph
+        @param predefined_paths: if given, roots which have predefined paths are generated only through their paths, like
+            it is done while parsing
+        @type predefined_paths: PredefinedPaths or None
+        @param root_map: roots by root strs, the one used by the root finders of the parser
+        @type root_map: dict
+        """
+        self._suffix_graph = suffix_graph
+        self._predefined_paths = predefined_paths
+
+        self._roots_by_lemma_root = {}
+        for roots in root_map.itervalues():
+            for root in roots:
+                self._roots_by_lemma_root.setdefault(root.lexeme.root, []).append(root)
+
+        # (state, tag) -> list of (suffix, to_state, suffix tag) where suffix tag is None for inflectional transitions
+        self._outputs_by_tag = {}
+        # state -> list of (suffix, to_state) which don't produce a tag
+        self._free_outputs = {}
+
+        for state in suffix_graph.get_all_states():
+            for (suffix, to_state) in state.outputs:
+                if isinstance(suffix, FreeTransitionSuffix):
+                    self._free_outputs.setdefault(state, []).append((suffix, to_state))
+                elif state.type == State.DERIVATIONAL:
+                    # derivations are formatted as 'Noun+Agt'
+                    self._outputs_by_tag.setdefault((state, to_state.pretty_name), []).append((suffix, to_state, suffix.pretty_name))
+                else:
+                    self._outputs_by_tag.setdefault((state, suffix.pretty_name), []).append((suffix, to_state, None))
+
+        # free transitions are tried only if they lead to a terminal state or to a state which produces a wanted tag
+        self._tags_after_free_transitions = {}
+        self._terminal_after_free_transitions = {}
+        for state in suffix_graph.get_all_states():
+            states_after_free_transitions = self._find_states_after_free_transitions(state, set())
+            self._tags_after_free_transitions[state] = set([tag for (from_state, tag) in self._outputs_by_tag.iterkeys() if from_state in states_after_free_transitions])
+            self._terminal_after_free_transitions[state] = any(s.type == State.TERMINAL for s in states_after_free_transitions)
+
+        self._root_strs_of_conditions = set()
+        for state in suffix_graph.get_all_states():
+            for (suffix, to_state) in state.outputs:
+                for suffix_form in suffix.suffix_forms:
+                    for condition in (suffix_form.precondition, suffix_form.postcondition, suffix_form.post_derivation_condition):
+                        self._root_strs_of_conditions.update(find_root_strs(condition))
+
+        # root -> list of _Start
+        self._starts_by_root = {}
+        # (start key, tags) -> surfaces generated after the start key, without the surface prefix of the start
+        self._surface_tails = {}
+
+    def _find_states_after_free_transitions(self, state, found_states):
+        found_states.add(state)
+        for (suffix, to_state) in self._free_outputs.get(state, []):
+            if to_state not in found_states:
+                self._find_states_after_free_transitions(to_state, found_states)
+        return found_states
+
+    def generate(self, parse_result):
+        """
+        Generates the surfaces of a parse result.
+
+            >>> generator.generate(u'kitap+Noun+A3sg+Pnon+Dat')
+            [u'kitaba']
+
+        @param parse_result: parse result in the format of the parse sets, like 'kitap+Noun+A3sg+Pnon+Dat'
+        @type parse_result: unicode
+        @return: generated surfaces, empty if the parse result cannot be generated
+        @rtype: list of unicode
+        """
+        return self.generate_all([parse_result])[0]
+
+    def generate_all(self, parse_results):
+        """
+        Generates the surfaces of many parse results at once, like the whole paradigm of a lemma. Common beginnings of
+        the parse results are generated only once.
+        @type parse_results: list of unicode
+        @return: generated surfaces for each parse result, in the same order
+        @rtype: list of list of unicode
+        """
+        results = [[] for i in range(len(parse_results))]
+
+        # (result index, start, tags) for each start a parse result begins with
+        matches = []
+        # start key -> (start, tag trie, tags) of the tags which are not generated after the start key before
+        walks = {}
+
+        for index, parse_result in enumerate(parse_results):
+            lemma_root = parse_result.split(u'+', 1)[0]
+            roots = self._roots_by_lemma_root.get(lemma_root)
+            if not roots:
+                logger.debug('No roots found for lemma root "%s"', lemma_root)
+                continue
+
+            for root in roots:
+                for start in self._get_starts(root):
+                    if parse_result == start.parse_result:
+                        tags = u''
+                    elif parse_result.startswith(start.parse_result_with_separator):
+                        tags = parse_result[len(start.parse_result_with_separator):]
+                    else:
+                        continue
+
+                    matches.append((index, start, tags))
+                    if (start.key, tags) not in self._surface_tails:
+                        self._add_to_walk(walks, start, tags)
+
+        for (start, tag_trie, tags_list) in walks.itervalues():
+            surfaces_list = [[] for i in range(len(tags_list))]
+            self._generate(start.morpheme_container, start.morpheme_container.get_surface_so_far(), tag_trie, surfaces_list)
+            for tags, surfaces in zip(tags_list, surfaces_list):
+                self._surface_tails[(start.key, tags)] = [surface[len(start.surface_prefix):] for surface in surfaces]
+
+        for (index, start, tags) in matches:
+            for tail in self._surface_tails[(start.key, tags)]:
+                surface = start.surface_prefix + tail
+                if surface not in results[index]:
+                    results[index].append(surface)
+
+        return results
+
+    def _add_to_walk(self, walks, start, tags):
+        walk = walks.get(start.key)
+        if walk is None:
+            walk = walks[start.key] = (start, _TagNode(), [])
+
+        (tag_trie, tags_list) = walk[1:]
+        node = tag_trie
+        if tags:
+            for tag in tags.split(u'+'):
+                child = node.children.get(tag)
+                if child is None:
+                    child = node.children[tag] = _TagNode()
+                node = child
+
+        if not node.result_indexes:
+            node.result_indexes.append(len(tags_list))
+            tags_list.append(tags)
+
+    def generate_paradigm(self, lemma_parse_result, tag_sequences):
+        """
+        Generates the surfaces of a lemma with many tag sequences.
+
+            >>> generator.generate_paradigm(u'kitap+Noun', [u'A3sg+Pnon+Nom', u'A3sg+Pnon+Dat', u'A3pl+Pnon+Dat'])
+            [[u'kitap'], [u'kitaba'], [u'kitaplara']]
+
+        @param lemma_parse_result: lemma root with its syntactic categories, like 'kitap+Noun' or 'Ali+Noun+Prop'
+        @type lemma_parse_result: unicode
+        @type tag_sequences: list of unicode
+        @return: generated surfaces for each tag sequence, in the same order
+        @rtype: list of list of unicode
+        """
+        return self.generate_all([lemma_parse_result + u'+' + tag_sequence for tag_sequence in tag_sequences])
+
+    def _get_starts(self, root):
+        starts = self._starts_by_root.get(root)
+        if starts is None:
+            predefined_morpheme_containers = self._predefined_paths.find_paths(root) if self._predefined_paths else None
+            if predefined_morpheme_containers:
+                # surfaces of the predefined paths are not made by applying the suffix forms, thus they are not shared
+                starts = [_Start(morpheme_container, u'', morpheme_container) for morpheme_container in predefined_morpheme_containers]
+            else:
+                starts = [_Start(morpheme_container, root.str[:-1], self._get_start_key(morpheme_container))
+                          for morpheme_container in self._create_initial_morpheme_containers(root)]
+            self._starts_by_root[root] = starts
+
+        return starts
+
+    def _get_start_key(self, morpheme_container):
+        """
+        Creates a key of everything the suffix graph can tell about the root of a morpheme container: the conditions of
+        the suffix forms check the lexeme and a few roots, and the phonetics only see the last vowel and the last letter
+        of the root. Surfaces generated after the containers with the same key differ only before the last letter of
+        the root.
+        """
+        root = morpheme_container.get_root()
+        lexeme = root.lexeme
+        transitions = tuple((transition.suffix_form_application.suffix_form, transition.to_state) for transition in morpheme_container.get_transitions())
+        return (morpheme_container.get_root_state(), transitions,
+                root.str if root.str in self._root_strs_of_conditions else root.str[-1],
+                frozenset(root.phonetic_attributes), frozenset(Phonetics.calculate_phonetic_attributes_of_plain_sequence(root.str)),
+                frozenset(root.phonetic_expectations or []), frozenset(lexeme.attributes or []),
+                lexeme.syntactic_category, lexeme.secondary_syntactic_category)
+
+    def _create_initial_morpheme_containers(self, root):
+        morpheme_container = MorphemeContainer(root, self._suffix_graph.get_default_root_state(root), u'')
+
+        lexeme = root.lexeme
+        if lexeme.syntactic_category == SyntacticCategory.VERB and LexemeAttribute.ProgressiveVowelDrop in lexeme.attributes and len(root.str) == len(lexeme.root) - 1:
+            # like the parser does, roots with the progressive vowel drop must be followed by Positive + Progressive 'Iyor'
+            morpheme_container = self._apply_required_suffix_form(morpheme_container, u'Pos', u'', u'VERB_WITH_POLARITY')
+            if morpheme_container:
+                morpheme_container = self._apply_required_suffix_form(morpheme_container, u'Prog', u'Iyor', u'VERB_WITH_TENSE')
+            if not morpheme_container:
+                return []
+
+        return [morpheme_container]
+
+    def _apply_required_suffix_form(self, morpheme_container, suffix_name, suffix_form_str, to_state_name):
+        suffix = self._suffix_graph.get_suffix(suffix_name)
+        if not transition_allowed_for_suffix(morpheme_container, suffix):
+            return None
+
+        candidate = _Candidate(morpheme_container, morpheme_container.get_surface_so_far())
+        new_morpheme_container, surface = self._try_suffix_form(candidate, suffix.get_suffix_form(suffix_form_str), self._suffix_graph.get_state(to_state_name))
+        return new_morpheme_container
+
+    def _generate(self, morpheme_container, surface, node, results):
+        state = morpheme_container.get_last_state()
+        if state.type == State.TERMINAL:
+            phonetic_expectations = morpheme_container.get_phonetic_expectations()
+            if phonetic_expectations and PhoneticExpectation.VowelStart in phonetic_expectations:
+                # like 'kitab' of 'kitap', the root needs a suffix starting with a vowel
+                return
+            for index in node.result_indexes:
+                if surface not in results[index]:
+                    results[index].append(surface)
+            # like the parser, nothing is applied after a terminal state
+            return
+
+        transitions = []
+
+        for (suffix, to_state) in self._free_outputs.get(state, []):
+            if (node.result_indexes and self._terminal_after_free_transitions[to_state]) or\
+               any(tag in self._tags_after_free_transitions[to_state] for tag in node.children):
+                transitions.append((suffix, to_state, node))
+
+        for tag, child_node in node.children.iteritems():
+            for (suffix, to_state, suffix_tag) in self._outputs_by_tag.get((state, tag), []):
+                if suffix_tag is None:
+                    transitions.append((suffix, to_state, child_node))
+                elif suffix_tag in child_node.children:
+                    transitions.append((suffix, to_state, child_node.children[suffix_tag]))
+
+        if not transitions:
+            return
+
+        candidate = _Candidate(morpheme_container, surface)
+        for (suffix, to_state, next_node) in transitions:
+            if suffix in candidate.suffixes_since_derivation or not transition_allowed_for_suffix(morpheme_container, suffix):
+                continue
+
+            for suffix_form in suffix.suffix_forms:
+                new_morpheme_container, new_surface = self._try_suffix_form(candidate, suffix_form, to_state)
+                if new_morpheme_container:
+                    self._generate(new_morpheme_container, new_surface, next_node, results)
+
+    def _try_suffix_form(self, candidate, suffix_form, to_state):
+        """
+        Applies the suffix form like L{try_suffix_form} of the parser, but without a surface to match.
+
+        The suffix graph relies on the surface to choose among the suffix forms, e.g. 'dI' and 'ydI' of Past, thus
+        forms which make an impossible boundary are dropped here. See L{_is_valid_boundary}.
+
+        Surface so far of the morpheme container is never voiced, just like it is when the parser matches the voiced
+        letter of a surface. Thus the surface generated so far is tracked separately and only its last letter is replaced
+        when the next suffix form voices it.
+        @type candidate: _Candidate
+        @return: tuple (new morpheme container, new surface) or (None, None) if the suffix form cannot be applied
+        """
+        morpheme_container = candidate.morpheme_container
+        if not transition_allowed_for_suffix_form(morpheme_container, suffix_form):
+            return None, None
+
+        so_far = candidate.surface_so_far
+        surface = candidate.surface
+        if not suffix_form.form:
+            modified_word, fitting_suffix_form = so_far, u''
+        else:
+            modified_word, fitting_suffix_form = Phonetics.apply(so_far, candidate.get_phonetic_attributes(), suffix_form.form, candidate.get_lexeme_attributes())
+
+        if modified_word != so_far:
+            surface = surface[:-1] + modified_word[-1]
+        elif fitting_suffix_form and TurkishAlphabet.is_vowel(fitting_suffix_form[0]):
+            surface = self._voice_last_letter_of_suffix(morpheme_container, surface)
+
+        if fitting_suffix_form and not self._is_valid_boundary(surface[-1], fitting_suffix_form[0]):
+            return None, None
+
+        clone = morpheme_container.clone()
+        clone.add_transition(SuffixFormApplication(suffix_form, fitting_suffix_form, fitting_suffix_form), to_state)
+
+        if not transition_allowed_after_suffix_form_application(morpheme_container, clone):
+            return None, None
+
+        return clone, surface + fitting_suffix_form
+
+    def _voice_last_letter_of_suffix(self, morpheme_container, surface):
+        """
+        Voices the last letter of the last suffix, like 'gidecek' in 'gideceğim'.
+
+        Phonetics doesn't voice after verb derivations, since the parser lets the last letter of any application be voiced
+        while matching the surface, unless the application goes to a verb root.
+        """
+        last_non_blank_transition = morpheme_container.get_last_non_blank_transition()
+        if not last_non_blank_transition or last_non_blank_transition.to_state.name == u'VERB_ROOT':
+            return surface
+
+        voiced_letter = TurkishAlphabet.voice(TurkishAlphabet.get_letter_for_char(surface[-1]))
+        if voiced_letter:
+            return surface[:-1] + voiced_letter.char_value
+        else:
+            return surface
+
+    def _is_valid_boundary(self, last_char, first_char_of_suffix_form):
+        """
+        Buffer letter 'y' comes only after a vowel and two vowels never come together at a suffix boundary.
+        """
+        if TurkishAlphabet.is_vowel(last_char):
+            return not TurkishAlphabet.is_vowel(first_char_of_suffix_form)
+        elif first_char_of_suffix_form == u'y':
+            return not last_char.isalpha()
+        else:
+            return True
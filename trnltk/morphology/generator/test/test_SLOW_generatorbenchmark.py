@@ -0,0 +1,104 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures generating the whole paradigms of nouns and verbs, one parse result at a time and in batches.
+"""
+import os
+import time
+import unittest
+from trnltk.morphology.generator.generator import MorphologicalGenerator
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.rootgenerator import CircumflexConvertingRootGenerator, RootMapGenerator
+from trnltk.morphology.model.lexeme import SyntacticCategory
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+from trnltk.morphology.morphotactics.copulasuffixgraph import CopulaSuffixGraph
+from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
+from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
+
+LEXEME_COUNT = 200
+
+NOUN_TAG_SEQUENCES = [u'{}+{}+{}'.format(agreement, possession, case)
+                      for agreement in (u'A3sg', u'A3pl')
+                      for possession in (u'Pnon', u'P1sg', u'P2sg', u'P3sg', u'P1pl', u'P2pl', u'P3pl')
+                      for case in (u'Nom', u'Acc', u'Dat', u'Loc', u'Abl', u'Gen', u'Ins')]
+
+VERB_TAG_SEQUENCES = [u'{}+{}+{}'.format(polarity, tense, agreement)
+                      for polarity in (u'Pos', u'Neg')
+                      for tense in (u'Past', u'Narr', u'Fut', u'Aor', u'Prog')
+                      for agreement in (u'A1sg', u'A2sg', u'A3sg', u'A1pl', u'A2pl', u'A3pl')]
+
+class GeneratorBenchmark(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(GeneratorBenchmark, cls).setUpClass()
+        all_roots = []
+
+        lexemes = LexiconLoader.load_from_file(os.path.join(os.path.dirname(__file__), '../../../resources/master_dictionary.txt'))
+        for di in lexemes:
+            all_roots.extend(CircumflexConvertingRootGenerator.generate(di))
+
+        root_map_generator = RootMapGenerator()
+        root_map = root_map_generator.generate(all_roots)
+
+        suffix_graph = CopulaSuffixGraph(NumeralSuffixGraph(ProperNounSuffixGraph(BasicSuffixGraph())))
+        suffix_graph.initialize()
+
+        predefined_paths = PredefinedPaths(root_map, suffix_graph)
+        predefined_paths.create_predefined_paths()
+
+        cls.suffix_graph = suffix_graph
+        cls.predefined_paths = predefined_paths
+        cls.root_map = root_map
+
+        cls.nouns = sorted(set([lexeme.root for lexeme in lexemes if lexeme.syntactic_category == SyntacticCategory.NOUN and not lexeme.secondary_syntactic_category]))[:LEXEME_COUNT]
+        cls.verbs = sorted(set([lexeme.root for lexeme in lexemes if lexeme.syntactic_category == SyntacticCategory.VERB]))[:LEXEME_COUNT]
+
+    def test_benchmark_noun_paradigms(self):
+        self._benchmark(u'nouns', [noun + u'+Noun' for noun in self.nouns], NOUN_TAG_SEQUENCES)
+
+    def test_benchmark_verb_paradigms(self):
+        self._benchmark(u'verbs', [verb + u'+Verb' for verb in self.verbs], VERB_TAG_SEQUENCES)
+
+    def _benchmark(self, name, lemma_parse_results, tag_sequences):
+        parse_results = [lemma_parse_result + u'+' + tag_sequence for lemma_parse_result in lemma_parse_results for tag_sequence in tag_sequences]
+
+        # generators keep the surfaces generated, thus each measurement starts with a new one
+        generator = MorphologicalGenerator(self.suffix_graph, self.predefined_paths, self.root_map)
+        start = time.time()
+        single_surfaces = [generator.generate(parse_result) for parse_result in parse_results]
+        single_time = time.time() - start
+
+        generator = MorphologicalGenerator(self.suffix_graph, self.predefined_paths, self.root_map)
+        start = time.time()
+        paradigm_surfaces = []
+        for lemma_parse_result in lemma_parse_results:
+            paradigm_surfaces.extend(generator.generate_paradigm(lemma_parse_result, tag_sequences))
+        paradigm_time = time.time() - start
+
+        generated_count = len([surfaces for surfaces in paradigm_surfaces if surfaces])
+
+        print u'{} paradigms of {} {}, {} parse results, {} generated'.format(len(lemma_parse_results), len(tag_sequences), name, len(parse_results), generated_count)
+        print u'    one by one : {:.3f}s, {:>8.0f} parse results/s'.format(single_time, len(parse_results) / single_time)
+        print u'    paradigms  : {:.3f}s, {:>8.0f} parse results/s'.format(paradigm_time, len(parse_results) / paradigm_time)
+
+        self.assertEqual(single_surfaces, paradigm_surfaces)
+        self.assertLess(paradigm_time, single_time)
+
+if __name__ == '__main__':
+    unittest.main()
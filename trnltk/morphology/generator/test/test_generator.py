@@ -0,0 +1,129 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import unittest
+from hamcrest import *
+from trnltk.morphology.contextless.parser.parser import ContextlessMorphologicalParser
+from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder
+from trnltk.morphology.generator.generator import MorphologicalGenerator
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.rootgenerator import CircumflexConvertingRootGenerator, RootMapGenerator
+from trnltk.morphology.model import formatter
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+from trnltk.morphology.morphotactics.copulasuffixgraph import CopulaSuffixGraph
+from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
+from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../../testresources/parsesets/parseset001.xml')
+
+class MorphologicalGeneratorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(MorphologicalGeneratorTest, cls).setUpClass()
+        all_roots = []
+
+        lexemes = LexiconLoader.load_from_file(os.path.join(os.path.dirname(__file__), '../../../resources/master_dictionary.txt'))
+        for di in lexemes:
+            all_roots.extend(CircumflexConvertingRootGenerator.generate(di))
+
+        root_map_generator = RootMapGenerator()
+        root_map = root_map_generator.generate(all_roots)
+
+        suffix_graph = CopulaSuffixGraph(NumeralSuffixGraph(ProperNounSuffixGraph(BasicSuffixGraph())))
+        suffix_graph.initialize()
+
+        predefined_paths = PredefinedPaths(root_map, suffix_graph)
+        predefined_paths.create_predefined_paths()
+
+        cls.parser = ContextlessMorphologicalParser(suffix_graph, predefined_paths, [WordRootFinder(root_map)])
+        cls.generator = MorphologicalGenerator(suffix_graph, predefined_paths, root_map)
+
+    def test_should_generate_nouns(self):
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Nom'), equal_to([u'kitap']))
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Dat'), equal_to([u'kitaba']))
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Loc'), equal_to([u'kitapta']))
+        assert_that(self.generator.generate(u'kitap+Noun+A3pl+P1sg+Abl'), equal_to([u'kitaplarımdan']))
+        assert_that(self.generator.generate(u'masa+Noun+A3sg+P3sg+Acc'), equal_to([u'masasını']))
+        assert_that(self.generator.generate(u'oğul+Noun+A3sg+P1sg+Nom'), has_item(u'oğlum'))
+
+    def test_should_generate_derivations(self):
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Nom+Noun+Dim+A3sg+Pnon+Dat'), equal_to([u'kitapçığa']))
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Nom+Adj+Agt+Noun+Zero+A3sg+Pnon+Dat'), equal_to([u'kitapçıya']))
+
+    def test_should_generate_verbs(self):
+        assert_that(self.generator.generate(u'sor+Verb+Pos+Past+A3sg'), equal_to([u'sordu']))
+        assert_that(self.generator.generate(u'git+Verb+Pos+Fut+A1sg'), equal_to([u'gideceğim']))
+        assert_that(self.generator.generate(u'git+Verb+Pos+Prog+A1sg'), has_item(u'gidiyorum'))
+
+    def test_should_generate_progressive_vowel_drop(self):
+        assert_that(self.generator.generate(u'ara+Verb+Pos+Prog+A1sg'), has_item(u'arıyorum'))
+        assert_that(self.generator.generate(u'ara+Verb+Pos+Prog+A1sg'), is_not(has_item(u'araıyorum')))
+        assert_that(self.generator.generate(u'ara+Verb+Pos+Past+A1sg'), has_item(u'aradım'))
+        assert_that(self.generator.generate(u'ara+Verb+Pos+Past+A1sg'), is_not(has_item(u'ardım')))
+
+    def test_should_generate_predefined_paths(self):
+        assert_that(self.generator.generate(u'ben+Pron+Pers+A1sg+Pnon+Dat'), equal_to([u'bana']))
+        assert_that(self.generator.generate(u'ben+Pron+Pers+A1sg+Pnon+Nom'), equal_to([u'ben']))
+
+    def test_should_not_generate_unknown(self):
+        assert_that(self.generator.generate(u'zırzop+Noun+A3sg+Pnon+Dat'), equal_to([]))
+        assert_that(self.generator.generate(u'kitap+Verb+Pos+Past+A3sg'), equal_to([]))
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg+Pnon+Dat+Acc'), equal_to([]))
+        assert_that(self.generator.generate(u'kitap+Noun+A3sg'), equal_to([]))
+
+    def test_should_generate_all_in_order(self):
+        parse_results = [u'kitap+Noun+A3sg+Pnon+Dat', u'zırzop+Noun+A3sg+Pnon+Dat', u'sor+Verb+Pos+Past+A3sg', u'kitap+Noun+A3sg+Pnon+Dat']
+        assert_that(self.generator.generate_all(parse_results), equal_to([[u'kitaba'], [], [u'sordu'], [u'kitaba']]))
+
+    def test_should_generate_paradigm(self):
+        tag_sequences = [u'A3sg+Pnon+Nom', u'A3sg+Pnon+Acc', u'A3sg+Pnon+Dat', u'A3pl+Pnon+Dat', u'A3sg+P2pl+Ins']
+        assert_that(self.generator.generate_paradigm(u'kitap+Noun', tag_sequences),
+            equal_to([[u'kitap'], [u'kitabı'], [u'kitaba'], [u'kitaplara'], [u'kitabınızla']]))
+
+    def test_should_generate_roots_with_same_suffixes(self):
+        assert_that(self.generator.generate_all([u'kitap+Noun+A3sg+Pnon+Dat', u'kasap+Noun+A3sg+Pnon+Dat', u'sepet+Noun+A3sg+Pnon+Dat']),
+            equal_to([[u'kitaba'], [u'kasaba'], [u'sepete']]))
+        assert_that(self.generator.generate(u'çorap+Noun+A3pl+P1sg+Abl'), equal_to([u'çoraplarımdan']))
+
+        # 'kü' of PointQual applies only to a few roots like 'dün'
+        assert_that(self.generator.generate_all([u'dün+Adv+Adj+PointQual', u'düzgün+Adv+Adj+PointQual']), equal_to([[u'dünkü'], [u'düzgünki']]))
+        assert_that(self.generator.generate(u'düzgün+Adv+Adj+PointQual'), equal_to([u'düzgünki']))
+        assert_that(self.generator.generate(u'dün+Adv+Adj+PointQual'), equal_to([u'dünkü']))
+
+    def test_should_generate_parsed_words(self):
+        words = set()
+        for sentence in StreamingParseSetReader(PARSESET_PATH):
+            for word in sentence.words:
+                if hasattr(word, 'parse_result') and not word.str[0].isupper():
+                    words.add(word.str)
+
+        words_and_parse_results = []
+        for word in sorted(words):
+            for morpheme_container in self.parser.parse(word):
+                words_and_parse_results.append((word, formatter.format_morpheme_container_for_parseset(morpheme_container)))
+
+        assert_that(len(words_and_parse_results), greater_than(500))
+
+        surfaces = self.generator.generate_all([parse_result for (word, parse_result) in words_and_parse_results])
+        for (word, parse_result), surfaces_of_parse_result in zip(words_and_parse_results, surfaces):
+            assert_that(surfaces_of_parse_result, has_item(word), parse_result)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,11 +16,22 @@ limitations under the License.
 import pymongo
 
 class DbManager(object):
-    def __init__(self, connection):
-        db = connection['trnltk']
+    CORPUS_COLLECTION_NAME = 'corpora'
+    WORD_COLLECTION_NAME = 'words'
 
-        self.corpus_collection = db['corpora']
-        self.word_collection = db['words']
+    def __init__(self, connection_provider):
+        """
+        @type connection_provider: ConnectionProvider
+        """
+        self._connection_provider = connection_provider
+
+    @property
+    def corpus_collection(self):
+        return self._connection_provider.get_collection(self.CORPUS_COLLECTION_NAME)
+
+    @property
+    def word_collection(self):
+        return self._connection_provider.get_collection(self.WORD_COLLECTION_NAME)
 
     def build_indexes(self):
         self.corpus_collection.ensure_index([('name', pymongo.ASCENDING)], unique=True)
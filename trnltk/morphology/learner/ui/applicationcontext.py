@@ -15,7 +15,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
-import pymongo
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
 from trnltk.morphology.contextful.parser.contexfulmorphologicalparser import ContextfulMorphologicalParserFactory
 from trnltk.morphology.learner.controller.learnercontroller import ParseContextCreator
 from trnltk.morphology.learner.dbmanager.dbmanager import DbManager
@@ -24,21 +24,19 @@ class ApplicationContext(object):
     # some parameters
     PARSESET_INDEX = "999"      # this is the id of the knowledge ngrams collections
     DB_HOST = '127.0.0.1'
+    DB_MAX_POOL_SIZE = 20
+    LIKELIHOOD_CACHE_SIZE = 50000
 
     def __init__(self):
         master_dictionary_path = os.path.join(os.path.dirname(__file__), '../../../resources/master_dictionary.txt')
 
-        mongodb_connection = pymongo.Connection(host=ApplicationContext.DB_HOST)
-        ngram_collection_map = {
-            1: mongodb_connection['trnltk']['wordUnigrams{}'.format(ApplicationContext.PARSESET_INDEX)],
-            2: mongodb_connection['trnltk']['wordBigrams{}'.format(ApplicationContext.PARSESET_INDEX)],
-            3: mongodb_connection['trnltk']['wordTrigrams{}'.format(ApplicationContext.PARSESET_INDEX)]
-        }
+        self.connection_provider = ConnectionProvider(host=ApplicationContext.DB_HOST, max_pool_size=ApplicationContext.DB_MAX_POOL_SIZE)
 
-        self.contextful_morphological_parser = ContextfulMorphologicalParserFactory.create(master_dictionary_path, ngram_collection_map)
+        self.contextful_morphological_parser = ContextfulMorphologicalParserFactory.create_with_connection_provider(master_dictionary_path,
+            self.connection_provider, ApplicationContext.PARSESET_INDEX, likelihood_cache_size=ApplicationContext.LIKELIHOOD_CACHE_SIZE)
         self.contextful_morphological_parser.build_indexes()
 
-        self.dbmanager = DbManager(mongodb_connection)
+        self.dbmanager = DbManager(self.connection_provider)
         self.dbmanager.build_indexes()
 
         self.parse_context_creator = ParseContextCreator(self.contextful_morphological_parser._contextless_parser)
@@ -0,0 +1,209 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Compiled form of the lexicon text files.
+
+Lexemes are compiled with their categories set and their morphemic attributes inferred, thus loading a compiled
+lexicon only creates the lexemes. The file starts with a header line which has the format name and version and a line of
+JSON which lists the text files it is compiled from, with their sizes and modification times. Then comes the marshalled
+content: a table of the category names, a table of the distinct attribute sets and a tuple for each lexeme which refers
+to these tables.
+
+Marshal format is specific to the Python version; a compiled lexicon is recompiled from the text files when it can't be
+loaded. It is recompiled also when it is compiled from other text files, or from other versions of them.
+"""
+import gc
+import json
+import logging
+import marshal
+import os
+import tempfile
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.model.lexeme import Lexeme
+
+logger = logging.getLogger('compiledlexicon')
+
+FORMAT_NAME = 'trnltk-compiled-lexicon'
+FORMAT_VERSION = 2
+
+class CompiledLexiconException(Exception):
+    pass
+
+class LexiconCompiler(object):
+
+    @classmethod
+    def compile_files(cls, source_file_paths, compiled_file_path):
+        """
+        Loads the lexemes in the lexicon text files and writes them to a compiled lexicon file.
+        @type source_file_paths: list of str
+        @type compiled_file_path: str
+        @return: compiled lexemes
+        @rtype: set of Lexeme
+        """
+        # sources are read before loading, so that a file changed while compiling is compiled again next time
+        sources = cls.get_sources(source_file_paths)
+        lexemes = LexiconLoader.load_from_files(source_file_paths)
+        cls.compile(lexemes, compiled_file_path, sources)
+        return lexemes
+
+    @classmethod
+    def get_sources(cls, source_file_paths):
+        """
+        @type source_file_paths: list of str
+        @return: sorted list of [absolute path, size, modification time] of the text files
+        @rtype: list of list
+        """
+        sources = []
+        for source_file_path in source_file_paths:
+            stat = os.stat(source_file_path)
+            sources.append([os.path.abspath(source_file_path), stat.st_size, stat.st_mtime])
+        return sorted(sources)
+
+    @classmethod
+    def compile(cls, lexemes, compiled_file_path, sources=None):
+        """
+        Writes the lexemes to a compiled lexicon file. File is written to a temporary file first and then renamed, so
+        that readers never see a partially written file.
+        @type lexemes: iterable of Lexeme
+        @type compiled_file_path: str
+        @param sources: text files the lexemes are loaded from, as returned by get_sources
+        @type sources: list of list or None
+        """
+        category_names = [None]
+        category_indices = {None: 0}
+        attribute_sets = []
+        attribute_set_indices = {}
+
+        def index(table, indices, item):
+            if item not in indices:
+                indices[item] = len(table)
+                table.append(item)
+            return indices[item]
+
+        records = []
+        for lexeme in sorted(lexemes, key=lambda l: (l.root, l.lemma, l.syntactic_category, l.secondary_syntactic_category)):
+            records.append((lexeme.lemma, lexeme.root,
+                            index(category_names, category_indices, lexeme.syntactic_category),
+                            index(category_names, category_indices, lexeme.secondary_syntactic_category),
+                            index(attribute_sets, attribute_set_indices, tuple(sorted(lexeme.attributes)))))
+
+        # temporary file is unique, so that processes compiling at the same time don't write to the same file
+        fd, temp_file_path = tempfile.mkstemp(prefix=os.path.basename(compiled_file_path) + '.',
+            dir=os.path.dirname(os.path.abspath(compiled_file_path)))
+        try:
+            # mkstemp creates the file readable only by the owner, give it the permissions of a normally created file
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file_path, 0666 & ~umask)
+
+            with os.fdopen(fd, 'wb') as f:
+                f.write('{} {}\n'.format(FORMAT_NAME, FORMAT_VERSION))
+                f.write(json.dumps(sources or []) + '\n')
+                marshal.dump((tuple(category_names), tuple(attribute_sets), tuple(records)), f, 2)
+
+            os.rename(temp_file_path, compiled_file_path)
+        finally:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
+class CompiledLexiconLoader(object):
+
+    @classmethod
+    def load_from_file(cls, compiled_file_path):
+        """
+        @type compiled_file_path: str
+        @rtype: set of Lexeme
+        @raise IOError: if the file can't be read
+        @raise CompiledLexiconException: if the file is not a compiled lexicon, is compiled with another format version or
+            its content is broken
+        """
+        with open(compiled_file_path, 'rb') as f:
+            cls._read_header(f, compiled_file_path)
+            content = f.read()
+
+        # none of the created objects are garbage; collecting while creating them just slows the loading down
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            try:
+                category_names, attribute_sets, records = marshal.loads(content)
+            except (EOFError, ValueError, TypeError) as e:
+                # e.g. a truncated file or a file marshalled by another version of Python
+                raise CompiledLexiconException('Unable to read the compiled lexicon {}: {}'.format(compiled_file_path, e))
+
+            return set([Lexeme(lemma, root, category_names[category_index], category_names[secondary_category_index],
+                               set(attribute_sets[attribute_set_index]))
+                        for lemma, root, category_index, secondary_category_index, attribute_set_index in records])
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    @classmethod
+    def read_sources(cls, compiled_file_path):
+        """
+        @return: text files the compiled lexicon is compiled from, as returned by LexiconCompiler.get_sources
+        @rtype: list of list
+        @raise IOError: if the file can't be read
+        @raise CompiledLexiconException: if the file is not a compiled lexicon or is compiled with another format version
+        """
+        with open(compiled_file_path, 'rb') as f:
+            return cls._read_header(f, compiled_file_path)
+
+    @classmethod
+    def _read_header(cls, f, compiled_file_path):
+        header = f.readline().split()
+        if len(header) != 2 or header[0] != FORMAT_NAME:
+            raise CompiledLexiconException('Not a compiled lexicon: {}'.format(compiled_file_path))
+        if header[1] != str(FORMAT_VERSION):
+            raise CompiledLexiconException('Unsupported compiled lexicon version {} in {}'.format(header[1], compiled_file_path))
+
+        try:
+            return json.loads(f.readline())
+        except ValueError as e:
+            raise CompiledLexiconException('Unable to read the sources of the compiled lexicon {}: {}'.format(compiled_file_path, e))
+
+    @classmethod
+    def load(cls, source_file_paths, compiled_file_path):
+        """
+        Loads the lexicon from the compiled file. If the compiled file doesn't exist, is compiled from other text files
+        or other versions of them, or can't be read, text files are loaded and compiled again.
+        @type source_file_paths: list of str
+        @type compiled_file_path: str
+        @rtype: set of Lexeme
+        """
+        if cls.is_up_to_date(source_file_paths, compiled_file_path):
+            try:
+                return cls.load_from_file(compiled_file_path)
+            except (IOError, CompiledLexiconException) as e:
+                logger.warning('Compiling the lexicon again, since the compiled lexicon cannot be loaded: %s', e)
+
+        return LexiconCompiler.compile_files(source_file_paths, compiled_file_path)
+
+    @classmethod
+    def is_up_to_date(cls, source_file_paths, compiled_file_path):
+        """
+        @rtype: bool
+        """
+        if not os.path.exists(compiled_file_path):
+            return False
+
+        try:
+            compiled_sources = cls.read_sources(compiled_file_path)
+        except (IOError, CompiledLexiconException) as e:
+            logger.warning('Compiling the lexicon again, since the compiled lexicon cannot be loaded: %s', e)
+            return False
+
+        return compiled_sources == LexiconCompiler.get_sources(source_file_paths)
@@ -14,9 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import codecs
+import logging
 from trnltk.morphology.phonetics.alphabet import TurkishAlphabet
 from trnltk.morphology.model.lexeme import Lexeme, SyntacticCategory, SecondarySyntacticCategory, LexemeAttribute
 
+logger = logging.getLogger('lexiconLoader')
+
 class LexiconLoader(object):
 
     @classmethod
@@ -28,6 +31,19 @@ class LexiconLoader(object):
 
         return lexemes
 
+    @classmethod
+    def load_from_files(cls, file_paths):
+        """
+        @type file_paths: list of str
+        @rtype: set of Lexeme
+        """
+        lexemes = set()
+
+        for file_path in file_paths:
+            lexemes.update(cls.load_from_file(file_path))
+
+        return lexemes
+
     @classmethod
     def load_from_lines(cls, lines):
         lexemes = set()
@@ -43,8 +59,8 @@ class LexiconLoader(object):
                 cls._infer_morphemic_attributes(lexeme)
                 if lexeme.attributes:
                     lexeme.attributes = set(lexeme.attributes)
-            except:
-                print 'Error in line: ', line
+            except Exception:
+                logger.error(u'Error in line: %s', line)
                 raise
             lexemes.add(lexeme)
 
@@ -168,7 +184,7 @@ class LexiconLoader(object):
     def _vowel_count(cls, seq):
         vowel_count = 0
         for c in seq:
-            if TurkishAlphabet.get_letter_for_char(c).vowel:
+            if TurkishAlphabet.is_vowel(c):
                 vowel_count += 1
 
         return vowel_count
@@ -0,0 +1,126 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Lexicon whose lexemes can be changed while parsers are using it.
+
+Root map of the lexicon is updated in place: lists of roots in the map are never modified, but replaced with new lists
+for changed root strs. Readers that look up a root str only once, like the root finders, see either the old roots or
+the new ones. Predefined paths which use the changed roots are refreshed too. Updates are serialized with a lock.
+"""
+import threading
+from trnltk.morphology.lexicon.rootgenerator import RootGenerator, RootMapGenerator
+
+class ReloadableLexicon(object):
+    def __init__(self, lexemes, root_generator=RootGenerator):
+        """
+        @type lexemes: iterable of Lexeme
+        @param root_generator: generates roots of a lexeme, e.g. RootGenerator or CircumflexConvertingRootGenerator
+        """
+        self._root_generator = root_generator
+        self._lock = threading.RLock()
+        self._roots_of_lexemes = {}
+        self._predefined_paths_list = []
+
+        all_roots = []
+        for lexeme in lexemes:
+            roots = self._generate_roots(lexeme)
+            self._roots_of_lexemes[lexeme] = roots
+            all_roots.extend(roots)
+
+        self.root_map = RootMapGenerator().generate(all_roots)
+
+    @property
+    def lexemes(self):
+        """
+        @rtype: set of Lexeme
+        """
+        with self._lock:
+            return set(self._roots_of_lexemes.keys())
+
+    def register_predefined_paths(self, predefined_paths):
+        """
+        Registers predefined paths created with the root map of this lexicon, to be refreshed on updates.
+        @type predefined_paths: PredefinedPaths
+        """
+        with self._lock:
+            if predefined_paths not in self._predefined_paths_list:
+                self._predefined_paths_list.append(predefined_paths)
+
+    def update(self, added_lexemes=(), removed_lexemes=()):
+        """
+        Removes and adds lexemes at once. Only the roots of these lexemes are generated and only the predefined paths
+        using the changed root strs are created again.
+        @type added_lexemes: iterable of Lexeme
+        @type removed_lexemes: iterable of Lexeme
+        @return: root strs whose roots are changed
+        @rtype: set of unicode
+        """
+        added_lexemes = set(added_lexemes)
+        removed_lexemes = set(removed_lexemes)
+
+        with self._lock:
+            for lexeme in removed_lexemes:
+                if lexeme not in self._roots_of_lexemes:
+                    raise Exception(u'Lexeme is not in the lexicon : {}'.format(lexeme))
+            for lexeme in added_lexemes:
+                if lexeme in self._roots_of_lexemes and lexeme not in removed_lexemes:
+                    raise Exception(u'Lexeme is already in the lexicon : {}'.format(lexeme))
+
+            # generate all roots before changing anything, in case generating fails
+            roots_of_added_lexemes = [(lexeme, self._generate_roots(lexeme)) for lexeme in added_lexemes]
+
+            removed_root_ids = set()
+            added_roots_by_str = {}
+            for lexeme in removed_lexemes:
+                for root in self._roots_of_lexemes.pop(lexeme):
+                    removed_root_ids.add(id(root))
+                    added_roots_by_str.setdefault(root.str, [])
+            for lexeme, roots in roots_of_added_lexemes:
+                self._roots_of_lexemes[lexeme] = roots
+                for root in roots:
+                    added_roots_by_str.setdefault(root.str, []).append(root)
+
+            for root_str, added_roots in added_roots_by_str.iteritems():
+                roots = [root for root in self.root_map.get(root_str, []) if id(root) not in removed_root_ids]
+                roots.extend(added_roots)
+                if roots:
+                    self.root_map[root_str] = roots
+                else:
+                    self.root_map.pop(root_str, None)
+
+            changed_root_strs = set(added_roots_by_str.keys())
+            for predefined_paths in self._predefined_paths_list:
+                predefined_paths.refresh_paths(changed_root_strs)
+
+            return changed_root_strs
+
+    def reload(self, lexemes):
+        """
+        Updates the lexicon to have the given lexemes, e.g. the ones loaded again from the edited dictionary files. Only
+        the lexemes that are not in both are removed or added.
+        @type lexemes: iterable of Lexeme
+        @return: root strs whose roots are changed
+        @rtype: set of unicode
+        """
+        lexemes = set(lexemes)
+        with self._lock:
+            current_lexemes = set(self._roots_of_lexemes.keys())
+            return self.update(added_lexemes=lexemes - current_lexemes, removed_lexemes=current_lexemes - lexemes)
+
+    def _generate_roots(self, lexeme):
+        # generator might modify the lexeme, e.g. removes the RootChange attribute; lexeme should still be found
+        # when it is removed later
+        return self._root_generator.generate(lexeme.clone())
@@ -0,0 +1,64 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures loading the master dictionary and the proper nouns from the text files and from the compiled lexicon.
+"""
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from trnltk.morphology.lexicon.compiledlexicon import LexiconCompiler, CompiledLexiconLoader
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+
+RESOURCES_FOLDER = os.path.join(os.path.dirname(__file__), '../../../resources')
+SOURCE_FILE_PATHS = [os.path.join(RESOURCES_FOLDER, 'master_dictionary.txt'),
+                     os.path.join(RESOURCES_FOLDER, 'proper_nouns_extracted_from_dic.txt')]
+
+REPEAT = 5
+
+def _measure(function, *args):
+    seconds = []
+    for i in range(REPEAT):
+        start = time.time()
+        result = function(*args)
+        seconds.append(time.time() - start)
+    return result, min(seconds)
+
+class LexiconLoaderBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.compiled_file_path = os.path.join(self.temp_dir, 'lexicon.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_benchmark_load(self):
+        lexemes, text_seconds = _measure(LexiconLoader.load_from_files, SOURCE_FILE_PATHS)
+        compiled, compile_seconds = _measure(LexiconCompiler.compile, lexemes, self.compiled_file_path)
+        compiled_lexemes, compiled_seconds = _measure(CompiledLexiconLoader.load_from_file, self.compiled_file_path)
+
+        print u'{} lexemes, compiled file is {} bytes'.format(len(lexemes), os.path.getsize(self.compiled_file_path))
+        print u'    text files    : {:>7.1f} ms'.format(text_seconds * 1000)
+        print u'    compiling     : {:>7.1f} ms'.format(compile_seconds * 1000)
+        print u'    compiled file : {:>7.1f} ms, {:>5.1f}x'.format(compiled_seconds * 1000, text_seconds / compiled_seconds)
+
+        self.assertEqual(compiled_lexemes, lexemes)
+        self.assertLess(compiled_seconds, text_seconds)
+
+if __name__ == '__main__':
+    unittest.main()
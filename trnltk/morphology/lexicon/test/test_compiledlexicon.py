@@ -0,0 +1,152 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import marshal
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from hamcrest import *
+from trnltk.morphology.lexicon.compiledlexicon import LexiconCompiler, CompiledLexiconLoader, CompiledLexiconException
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.model.lexeme import Lexeme, SyntacticCategory, LexemeAttribute
+
+RESOURCES_FOLDER = os.path.join(os.path.dirname(__file__), '../../../resources')
+SOURCE_FILE_PATHS = [os.path.join(RESOURCES_FOLDER, 'master_dictionary.txt'),
+                     os.path.join(RESOURCES_FOLDER, 'proper_nouns_extracted_from_dic.txt')]
+
+class CompiledLexiconTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.compiled_file_path = os.path.join(self.temp_dir, 'lexicon.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_dictionary(self, file_name, lines, mtime):
+        file_path = os.path.join(self.temp_dir, file_name)
+        with open(file_path, 'w') as f:
+            f.write(u'\n'.join(lines).encode('utf-8'))
+        os.utime(file_path, (mtime, mtime))
+        return file_path
+
+    def test_should_load_same_lexemes_as_text_files(self):
+        lexemes = LexiconLoader.load_from_files(SOURCE_FILE_PATHS)
+        LexiconCompiler.compile(lexemes, self.compiled_file_path)
+
+        compiled_lexemes = CompiledLexiconLoader.load_from_file(self.compiled_file_path)
+
+        assert_that(compiled_lexemes, has_length(len(lexemes)))
+        assert_that(compiled_lexemes, equal_to(lexemes))
+
+    def test_should_compile_and_load_lexemes(self):
+        lexemes = LexiconLoader.load_from_lines([u'a [P:Interj]', u'abuk [P:Adj, Dup;A:NoVoicing, NoSuffix]', u'Abdal',
+                                                 u'yemek', u'yemek [P:Noun]', u'açık [P:Adj]'])
+
+        LexiconCompiler.compile(lexemes, self.compiled_file_path)
+        compiled_lexemes = CompiledLexiconLoader.load_from_file(self.compiled_file_path)
+
+        assert_that(compiled_lexemes, equal_to(lexemes))
+        assert_that(compiled_lexemes, has_item(Lexeme(u'a', u'a', SyntacticCategory.INTERJECTION, None, None)))
+        assert_that(compiled_lexemes, has_item(Lexeme(u'açık', u'açık', SyntacticCategory.ADJECTIVE, None, {LexemeAttribute.Voicing})))
+        assert_that(os.listdir(self.temp_dir), equal_to(['lexicon.bin']))
+
+        # lexemes should not share the attribute sets
+        for lexeme in compiled_lexemes:
+            lexeme.attributes.add(LexemeAttribute.NoSuffix)
+        assert_that(CompiledLexiconLoader.load_from_file(self.compiled_file_path), equal_to(lexemes))
+
+    def test_should_not_load_other_files(self):
+        with open(self.compiled_file_path, 'w') as f:
+            f.write('a [P:Interj]\n')
+        self.assertRaises(CompiledLexiconException, CompiledLexiconLoader.load_from_file, self.compiled_file_path)
+
+        with open(self.compiled_file_path, 'w') as f:
+            f.write('trnltk-compiled-lexicon 999\n')
+        self.assertRaises(CompiledLexiconException, CompiledLexiconLoader.load_from_file, self.compiled_file_path)
+
+        with open(self.compiled_file_path, 'w') as f:
+            f.write('trnltk-compiled-lexicon 2\nbroken')
+        self.assertRaises(CompiledLexiconException, CompiledLexiconLoader.load_from_file, self.compiled_file_path)
+
+        with open(self.compiled_file_path, 'w') as f:
+            f.write('trnltk-compiled-lexicon 2\n[]\nbroken')
+        self.assertRaises(CompiledLexiconException, CompiledLexiconLoader.load_from_file, self.compiled_file_path)
+
+    def test_should_compile_again_when_source_files_change(self):
+        now = time.time()
+        source_file_paths = [self._write_dictionary('dictionary.txt', [u'kitap', u'okumak'], now - 100),
+                             self._write_dictionary('proper_nouns.txt', [u'Ankara'], now - 100)]
+
+        assert_that(CompiledLexiconLoader.is_up_to_date(source_file_paths, self.compiled_file_path), equal_to(False))
+        lexemes = CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path)
+        assert_that(lexemes, equal_to(LexiconLoader.load_from_files(source_file_paths)))
+        assert_that(CompiledLexiconLoader.is_up_to_date(source_file_paths, self.compiled_file_path), equal_to(True))
+        assert_that(CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path), equal_to(lexemes))
+
+        source_file_paths[1] = self._write_dictionary('proper_nouns.txt', [u'Ankara', u'İzmir'], now + 100)
+        assert_that(CompiledLexiconLoader.is_up_to_date(source_file_paths, self.compiled_file_path), equal_to(False))
+        lexemes = CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path)
+        assert_that(lexemes, has_length(4))
+        assert_that(lexemes, equal_to(LexiconLoader.load_from_files(source_file_paths)))
+
+    def test_should_compile_again_when_source_files_are_added_or_removed(self):
+        now = time.time()
+        dictionary_file_path = self._write_dictionary('dictionary.txt', [u'kitap', u'okumak'], now - 100)
+        proper_nouns_file_path = self._write_dictionary('proper_nouns.txt', [u'Ankara'], now - 100)
+
+        assert_that(CompiledLexiconLoader.load([dictionary_file_path], self.compiled_file_path), has_length(2))
+        assert_that(CompiledLexiconLoader.is_up_to_date([dictionary_file_path, proper_nouns_file_path], self.compiled_file_path), equal_to(False))
+
+        lexemes = CompiledLexiconLoader.load([dictionary_file_path, proper_nouns_file_path], self.compiled_file_path)
+        assert_that(lexemes, has_length(3))
+        assert_that(lexemes, equal_to(LexiconLoader.load_from_files([dictionary_file_path, proper_nouns_file_path])))
+        assert_that(CompiledLexiconLoader.is_up_to_date([proper_nouns_file_path, dictionary_file_path], self.compiled_file_path), equal_to(True))
+
+        assert_that(CompiledLexiconLoader.load([dictionary_file_path], self.compiled_file_path), has_length(2))
+
+    def test_should_compile_again_when_source_file_is_replaced_with_an_older_one(self):
+        now = time.time()
+        source_file_paths = [self._write_dictionary('dictionary.txt', [u'kitap', u'okumak'], now - 100)]
+        CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path)
+
+        self._write_dictionary('dictionary.txt', [u'kitap', u'okumak', u'yazmak'], now - 200)
+
+        assert_that(CompiledLexiconLoader.is_up_to_date(source_file_paths, self.compiled_file_path), equal_to(False))
+        assert_that(CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path), has_length(3))
+
+    def test_should_compile_again_when_compiled_file_is_broken(self):
+        source_file_paths = [self._write_dictionary('dictionary.txt', [u'kitap', u'okumak'], time.time() - 100)]
+        with open(self.compiled_file_path, 'w') as f:
+            f.write('trnltk-compiled-lexicon 2\n{}\nbroken'.format(json.dumps(LexiconCompiler.get_sources(source_file_paths))))
+
+        lexemes = CompiledLexiconLoader.load(source_file_paths, self.compiled_file_path)
+
+        assert_that(lexemes, equal_to(LexiconLoader.load_from_files(source_file_paths)))
+        assert_that(CompiledLexiconLoader.load_from_file(self.compiled_file_path), equal_to(lexemes))
+
+    def test_should_not_hide_unexpected_errors(self):
+        source_file_paths = [self._write_dictionary('dictionary.txt', [u'kitap', u'okumak'], time.time() - 100)]
+        with open(self.compiled_file_path, 'wb') as f:
+            f.write('trnltk-compiled-lexicon 2\n{}\n'.format(json.dumps(LexiconCompiler.get_sources(source_file_paths))))
+            marshal.dump(((None,), ((),), ((u'kitap', u'kitap', 5, 0, 0),)), f, 2)
+
+        self.assertRaises(IndexError, CompiledLexiconLoader.load, source_file_paths, self.compiled_file_path)
+
+if __name__ == '__main__':
+    unittest.main()
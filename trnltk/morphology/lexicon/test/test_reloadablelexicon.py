@@ -0,0 +1,169 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import threading
+import unittest
+from hamcrest import *
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.reloadablelexicon import ReloadableLexicon
+from trnltk.morphology.lexicon.rootgenerator import RootGenerator, RootMapGenerator
+from trnltk.morphology.model.lexeme import Lexeme, SyntacticCategory, LexemeAttribute
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+
+MASTER_DICTIONARY_PATH = os.path.join(os.path.dirname(__file__), '../../../resources/master_dictionary.txt')
+
+def _root_sets(root_map):
+    return dict((root_str, set(roots)) for root_str, roots in root_map.iteritems())
+
+class ReloadableLexiconTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(ReloadableLexiconTest, cls).setUpClass()
+        cls.lexemes = LexiconLoader.load_from_file(MASTER_DICTIONARY_PATH)
+
+        cls.suffix_graph = BasicSuffixGraph()
+        cls.suffix_graph.initialize()
+
+    def _generate_root_map(self, lexemes):
+        all_roots = []
+        for lexeme in lexemes:
+            all_roots.extend(RootGenerator.generate(lexeme.clone()))
+        return RootMapGenerator().generate(all_roots)
+
+    def _create_predefined_paths(self, root_map):
+        predefined_paths = PredefinedPaths(root_map, self.suffix_graph)
+        predefined_paths.create_predefined_paths()
+        return predefined_paths
+
+    def test_should_generate_same_root_map(self):
+        lexicon = ReloadableLexicon(self.lexemes)
+
+        assert_that(lexicon.lexemes, equal_to(self.lexemes))
+        assert_that(_root_sets(lexicon.root_map), equal_to(_root_sets(self._generate_root_map(self.lexemes))))
+
+    def test_should_add_remove_and_replace_lexemes(self):
+        lexicon = ReloadableLexicon(LexiconLoader.load_from_lines([u'kitap', u'kitapçı', u'elma']))
+        kitap, kitapci, elma = [LexiconLoader.load_from_lines([line]).pop() for line in [u'kitap', u'kitapçı', u'elma']]
+        kitap_roots = lexicon.root_map[u'kitap']
+
+        changed_root_strs = lexicon.update(added_lexemes=LexiconLoader.load_from_lines([u'kitaplık', u'armut']))
+        assert_that(changed_root_strs, equal_to({u'kitaplık', u'kitaplığ', u'armut', u'armud'}))
+        assert_that(lexicon.root_map, has_key(u'armud'))
+        assert_that(lexicon.root_map[u'kitap'], same_instance(kitap_roots))
+
+        lexicon.update(removed_lexemes=[kitapci, elma])
+        assert_that(lexicon.root_map, is_not(has_key(u'kitapçı')))
+        assert_that(lexicon.root_map, is_not(has_key(u'elma')))
+
+        armut_noun = LexiconLoader.load_from_lines([u'armut']).pop()
+        armut_adj = LexiconLoader.load_from_lines([u'armut [P:Adj]']).pop()
+        lexicon.update(added_lexemes=[armut_adj], removed_lexemes=[armut_noun])
+        assert_that([root.lexeme.syntactic_category for root in lexicon.root_map[u'armut']], equal_to([SyntacticCategory.ADJECTIVE]))
+
+        expected_lexemes = LexiconLoader.load_from_lines([u'kitap', u'kitaplık', u'armut [P:Adj]'])
+        assert_that(lexicon.lexemes, equal_to(expected_lexemes))
+        assert_that(_root_sets(lexicon.root_map), equal_to(_root_sets(self._generate_root_map(expected_lexemes))))
+
+    def test_should_not_update_for_unknown_or_existing_lexemes(self):
+        lexicon = ReloadableLexicon(LexiconLoader.load_from_lines([u'kitap']))
+
+        self.assertRaises(Exception, lexicon.update, removed_lexemes=LexiconLoader.load_from_lines([u'elma']))
+        self.assertRaises(Exception, lexicon.update, added_lexemes=LexiconLoader.load_from_lines([u'kitap', u'elma']))
+
+        assert_that(lexicon.lexemes, equal_to(LexiconLoader.load_from_lines([u'kitap'])))
+        assert_that(sorted(lexicon.root_map.keys()), equal_to([u'kitab', u'kitap']))
+
+    def test_should_remove_lexemes_with_root_change(self):
+        lexicon = ReloadableLexicon(LexiconLoader.load_from_lines([u'ben [P:Pron, Pers; A:RootChange]', u'ben']))
+        assert_that(lexicon.root_map, has_key(u'ban'))
+
+        lexicon.update(removed_lexemes=LexiconLoader.load_from_lines([u'ben [P:Pron, Pers; A:RootChange]']))
+
+        assert_that(lexicon.root_map, is_not(has_key(u'ban')))
+        assert_that(lexicon.root_map[u'ben'], has_length(1))
+
+    def test_should_reload(self):
+        lexicon = ReloadableLexicon(LexiconLoader.load_from_lines([u'kitap', u'elma', u'armut']))
+
+        changed_root_strs = lexicon.reload(LexiconLoader.load_from_lines([u'kitap', u'elma [P:Adj]', u'ayva']))
+
+        assert_that(changed_root_strs, equal_to({u'elma', u'armut', u'armud', u'ayva'}))
+        assert_that(lexicon.lexemes, equal_to(LexiconLoader.load_from_lines([u'kitap', u'elma [P:Adj]', u'ayva'])))
+
+    def test_should_refresh_predefined_paths(self):
+        lexicon = ReloadableLexicon(self.lexemes)
+        predefined_paths = self._create_predefined_paths(lexicon.root_map)
+        lexicon.register_predefined_paths(predefined_paths)
+
+        ben_pron = LexiconLoader.load_from_lines([u'ben [P:Pron, Pers; A:RootChange]']).pop()
+        ben_roots = [root for root in lexicon.root_map[u'ben'] if root.lexeme.syntactic_category == SyntacticCategory.PRONOUN]
+        assert_that(predefined_paths.find_paths(ben_roots[0]), is_not(none()))
+        o_path_ids = dict((root, map(id, predefined_paths.find_paths(root) or [])) for root in lexicon.root_map[u'o'])
+
+        lexicon.update(removed_lexemes=[ben_pron])
+        assert_that(predefined_paths.find_paths(ben_roots[0]), none())
+        # paths of other roots are not created again
+        for root, path_ids in o_path_ids.iteritems():
+            assert_that(map(id, predefined_paths.find_paths(root) or []), equal_to(path_ids))
+
+        lexicon.update(added_lexemes=[ben_pron])
+        assert_that(predefined_paths.find_paths(ben_roots[0]), is_not(none()))
+
+        created_again = self._create_predefined_paths(lexicon.root_map)
+        assert_that(predefined_paths._morpheme_container_map.keys(), contains_inanyorder(*created_again._morpheme_container_map.keys()))
+        for root, morpheme_containers in created_again._morpheme_container_map.iteritems():
+            assert_that([str(m) for m in predefined_paths.find_paths(root)], equal_to([str(m) for m in morpheme_containers]))
+
+    def test_should_update_while_reading(self):
+        lexicon = ReloadableLexicon(self.lexemes)
+        predefined_paths = self._create_predefined_paths(lexicon.root_map)
+        lexicon.register_predefined_paths(predefined_paths)
+
+        lexemes = sorted(self.lexemes, key=lambda l: (l.root, l.lemma, l.syntactic_category))[:200]
+        root_strs = set([root_str for root_str in lexicon.root_map.keys() if root_str[0] in u'ab'] + [u'ben', u'ban'])
+        errors = []
+        stopped = threading.Event()
+
+        def read():
+            try:
+                while not stopped.is_set():
+                    for root_str in root_strs:
+                        for root in lexicon.root_map.get(root_str) or []:
+                            predefined_paths.find_paths(root)
+            except Exception, e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for i in range(2)]
+        for reader in readers:
+            reader.start()
+
+        try:
+            ben_pron = LexiconLoader.load_from_lines([u'ben [P:Pron, Pers; A:RootChange]']).pop()
+            for i in range(3):
+                lexicon.update(removed_lexemes=lexemes + [ben_pron])
+                lexicon.update(added_lexemes=lexemes + [ben_pron])
+        finally:
+            stopped.set()
+            for reader in readers:
+                reader.join()
+
+        assert_that(errors, equal_to([]))
+        assert_that(lexicon.lexemes, equal_to(self.lexemes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -94,6 +94,8 @@ class LexemeAttribute(object):
 
 class Lexeme(object):
     #TODO: make this and similar classes immutable
+    __slots__ = ('lemma', 'root', 'syntactic_category', 'secondary_syntactic_category', 'attributes')
+
     def __init__(self, lemma, root, syntactic_category, secondary_syntactic_category, attributes):
         """
         @type lemma: unicode
@@ -135,5 +137,7 @@ class Lexeme(object):
 
 
 class DynamicLexeme(Lexeme):
+    __slots__ = ()
+
     def __init__(self, lemma, root, syntactic_category, secondary_syntactic_category, attributes):
         Lexeme.__init__(self, lemma, root, syntactic_category, secondary_syntactic_category, attributes)
\ No newline at end of file
@@ -108,6 +108,8 @@ class SuffixForm(object):
 
 
 class SuffixFormApplication(object):
+    __slots__ = ('suffix_form', 'actual_suffix_form', 'fitting_suffix_form')
+
     def __init__(self, suffix_form, actual_suffix_form, fitting_suffix_form):
         """
         @type suffix_form: SuffixForm
@@ -119,6 +121,8 @@ class SuffixFormApplication(object):
         self.fitting_suffix_form = fitting_suffix_form
 
 class Transition(object):
+    __slots__ = ('from_state', 'suffix_form_application', 'to_state')
+
     def __init__(self, from_state, suffix_form_application, to_state):
         """
         @type from_state: State
@@ -23,6 +23,8 @@ from trnltk.morphology.model.root import NumeralRoot
 from trnltk.morphology.phonetics.phonetics import Phonetics
 
 class MorphemeContainer(object):
+    __slots__ = ('_root', '_root_state', '_surface_so_far', '_remaining_surface', '_transitions', '_phonetic_expectations')
+
     def __init__(self, root, root_state, remaining_surface):
         """
         @type root: Root
@@ -279,6 +281,8 @@ class MorphemeContainer(object):
 
 
 class NumeralMorphemeContainer(MorphemeContainer):
+    __slots__ = ()
+
     def __init__(self, root, root_state, remaining_surface):
         if not isinstance(root, NumeralRoot):
             raise Exception("NumeralMorphemeContainer can be initialized with a NumeralRoot. " + root)
@@ -20,6 +20,8 @@ from trnltk.morphology.phonetics.phonetics import Phonetics
 from trnltk.morphology.model.lexeme import DynamicLexeme, SyntacticCategory, SecondarySyntacticCategory
 
 class Root(object):
+    __slots__ = ('str', 'lexeme', 'phonetic_expectations', 'phonetic_attributes')
+
     def __init__(self, root, lexeme, phonetic_expectations, phonetic_attributes):
         """
         @type root: unicode
@@ -57,6 +59,8 @@ class Root(object):
             copy.copy(self.phonetic_attributes) if self.phonetic_attributes else None)
 
 class DynamicRoot(Root):
+    __slots__ = ()
+
     def __init__(self, root, lexeme, phonetic_expectations, phonetic_attributes):
         """
         @type root: unicode
@@ -74,6 +78,8 @@ class DynamicRoot(Root):
             copy.copy(self.phonetic_attributes) if self.phonetic_attributes else None)
 
 class NumeralRoot(DynamicRoot):
+    __slots__ = ()
+
     def __init__(self, numeral):
         root = numeral
         lexeme = DynamicLexeme(numeral, numeral, SyntacticCategory.NUMERAL, SecondarySyntacticCategory.DIGITS, None)
@@ -85,6 +91,8 @@ class NumeralRoot(DynamicRoot):
         return NumeralRoot(self.str)
 
 class AbbreviationRoot(DynamicRoot):
+    __slots__ = ()
+
     def __init__(self, abbr):
         root = abbr
         lexeme = DynamicLexeme(abbr, abbr, SyntacticCategory.NOUN, SecondarySyntacticCategory.ABBREVIATION, None)
@@ -103,6 +111,8 @@ class AbbreviationRoot(DynamicRoot):
         return AbbreviationRoot(self.str)
 
 class ProperNounRoot(DynamicRoot):
+    __slots__ = ()
+
     def __init__(self, noun):
         root = noun
         lexeme = DynamicLexeme(noun, noun, SyntacticCategory.NOUN, SecondarySyntacticCategory.PROPER_NOUN, None)
@@ -14,18 +14,33 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import logging
 from trnltk.morphology.model.lexeme import SecondarySyntacticCategory, SyntacticCategory
 from trnltk.morphology.contextless.parser.suffixapplier import *
 from trnltk.morphology.model.morpheme import SuffixForm
 from trnltk.morphology.model.morphemecontainer import MorphemeContainer
 
+logger = logging.getLogger('predefinedPaths')
+
 class PredefinedPaths(object):
     def __init__(self, root_map, suffix_graph):
         self._root_map = root_map
         self._suffix_graph = suffix_graph
         self._morpheme_container_map = {}
 
+        # root strs looked up and morpheme containers created by each path creator, so that only the paths of changed
+        # roots are created again
+        self._root_strs_of_path_creators = {}
+        self._morpheme_container_maps_of_path_creators = {}
+
+        # set while a path creator is run by _run_path_creator
+        self._collected_root_strs = None
+        self._collected_morpheme_container_map = None
+
     def _find_root(self, root_str, syntactic_category, secondary_syntactic_category):
+        if self._collected_root_strs is not None:
+            self._collected_root_strs.add(root_str)
+
         if self._root_map.has_key(root_str):
             roots_for_root_str = self._root_map[root_str]
             for root in roots_for_root_str:
@@ -100,10 +115,15 @@ class PredefinedPaths(object):
     def _add_morpheme_container(self, root, path_tuples):
         morpheme_container = self._follow_path(root, path_tuples)
 
-        if not self._morpheme_container_map.has_key(root):
-            self._morpheme_container_map[root] = []
+        if self._collected_morpheme_container_map is not None:
+            morpheme_container_map = self._collected_morpheme_container_map
+        else:
+            morpheme_container_map = self._morpheme_container_map
 
-        self._morpheme_container_map[root].append(morpheme_container)
+        if not morpheme_container_map.has_key(root):
+            morpheme_container_map[root] = []
+
+        morpheme_container_map[root].append(morpheme_container)
 
     def has_paths(self, lexeme):
         if not self._morpheme_container_map:
@@ -117,44 +137,111 @@ class PredefinedPaths(object):
 
         return self._morpheme_container_map[lexeme]
 
+    def find_paths(self, root):
+        """
+        Returns the predefined morpheme containers of the root, or None if there are none. Unlike calling L{has_paths}
+        and L{get_paths}, this is safe while the paths are refreshed in another thread.
+        @type root: Root
+        @rtype: list of MorphemeContainer or None
+        """
+        morpheme_container_map = self._morpheme_container_map
+        if not morpheme_container_map:
+            raise Exception("Predefined paths are not yet created. Maybe you forgot to run 'create_predefined_paths' ?")
+
+        return morpheme_container_map.get(root)
+
     def create_predefined_paths(self):
-        self._create_predefined_path_of_di()
-        self._create_predefined_path_of_yi()
-
-        self._create_predefined_path_of_ben()
-        self._create_predefined_path_of_sen()
-        self._create_predefined_path_of_o_pron_pers()
-        self._create_predefined_path_of_biz()
-        self._create_predefined_path_of_siz()
-        self._create_predefined_path_of_onlar_pron_pers()
-
-        self._create_predefined_path_of_bu_pron_demons()
-        self._create_predefined_path_of_su_pron_demons()
-        self._create_predefined_path_of_o_pron_demons()
-        self._create_predefined_path_of_bunlar_pron_demons()
-        self._create_predefined_path_of_sunlar_pron_demons()
-        self._create_predefined_path_of_onlar_pron_demons()
-
-        self._create_predefined_path_of_kendi()
-        self._create_predefined_path_of_hepsi()
-        self._create_predefined_path_of_herkes()
-
-        self._create_predefined_path_of_question_particles()
-        self._create_predefined_path_of_ne()
-
-        self._create_predefined_path_of_ora_bura_sura_nere()
-
-        self._create_predefined_path_of_iceri_disari()
-
-        self._create_predefined_path_of_bazilari_bazisi()
-        self._create_predefined_path_of_kimileri_kimisi_kimi()
-        self._create_predefined_path_of_birileri_birisi_biri()
-        self._create_predefined_path_of_hicbirisi_hicbiri()
-        self._create_predefined_path_of_birbiri()
-        self._create_predefined_path_of_cogu_bircogu_coklari_bircoklari()
-        self._create_predefined_path_of_birkaci()
-        self._create_predefined_path_of_cumlesi()
-        self._create_predefined_path_of_digeri_digerleri()
+        for path_creator in self._get_path_creators():
+            self._run_path_creator(path_creator)
+
+        self._morpheme_container_map = self._merge_morpheme_container_maps_of_path_creators()
+
+    def refresh_paths(self, root_strs):
+        """
+        Creates the paths which use any of the given root strs again, e.g. after the roots of these strs are changed in
+        the root map. Paths whose roots are not in the root map anymore are removed.
+
+        Paths are created into a new map, which replaces the current one when all is done; thus readers using
+        L{find_paths} either see the old paths or the new ones.
+        @type root_strs: iterable of unicode
+        """
+        root_strs = set(root_strs)
+
+        for path_creator in self._get_path_creators():
+            if not self._root_strs_of_path_creators.get(path_creator.__name__, set()) & root_strs:
+                continue
+
+            try:
+                self._run_path_creator(path_creator)
+            except Exception, e:
+                logger.warning(u'Removing predefined paths of %s : %s', path_creator.__name__, e)
+                self._morpheme_container_maps_of_path_creators[path_creator.__name__] = {}
+
+        self._morpheme_container_map = self._merge_morpheme_container_maps_of_path_creators()
+
+    def _run_path_creator(self, path_creator):
+        self._collected_root_strs = set()
+        self._collected_morpheme_container_map = {}
+        try:
+            path_creator()
+            self._morpheme_container_maps_of_path_creators[path_creator.__name__] = self._collected_morpheme_container_map
+        finally:
+            # recorded even if the path creator fails, so that it is tried again when a missing root is added
+            self._root_strs_of_path_creators[path_creator.__name__] = self._collected_root_strs
+            self._collected_root_strs = None
+            self._collected_morpheme_container_map = None
+
+    def _merge_morpheme_container_maps_of_path_creators(self):
+        morpheme_container_map = {}
+        for path_creator in self._get_path_creators():
+            path_creator_map = self._morpheme_container_maps_of_path_creators.get(path_creator.__name__, {})
+            for root, morpheme_containers in path_creator_map.iteritems():
+                if not morpheme_container_map.has_key(root):
+                    morpheme_container_map[root] = []
+                morpheme_container_map[root].extend(morpheme_containers)
+
+        return morpheme_container_map
+
+    def _get_path_creators(self):
+        return [
+            self._create_predefined_path_of_di,
+            self._create_predefined_path_of_yi,
+
+            self._create_predefined_path_of_ben,
+            self._create_predefined_path_of_sen,
+            self._create_predefined_path_of_o_pron_pers,
+            self._create_predefined_path_of_biz,
+            self._create_predefined_path_of_siz,
+            self._create_predefined_path_of_onlar_pron_pers,
+
+            self._create_predefined_path_of_bu_pron_demons,
+            self._create_predefined_path_of_su_pron_demons,
+            self._create_predefined_path_of_o_pron_demons,
+            self._create_predefined_path_of_bunlar_pron_demons,
+            self._create_predefined_path_of_sunlar_pron_demons,
+            self._create_predefined_path_of_onlar_pron_demons,
+
+            self._create_predefined_path_of_kendi,
+            self._create_predefined_path_of_hepsi,
+            self._create_predefined_path_of_herkes,
+
+            self._create_predefined_path_of_question_particles,
+            self._create_predefined_path_of_ne,
+
+            self._create_predefined_path_of_ora_bura_sura_nere,
+
+            self._create_predefined_path_of_iceri_disari,
+
+            self._create_predefined_path_of_bazilari_bazisi,
+            self._create_predefined_path_of_kimileri_kimisi_kimi,
+            self._create_predefined_path_of_birileri_birisi_biri,
+            self._create_predefined_path_of_hicbirisi_hicbiri,
+            self._create_predefined_path_of_birbiri,
+            self._create_predefined_path_of_cogu_bircogu_coklari_bircoklari,
+            self._create_predefined_path_of_birkaci,
+            self._create_predefined_path_of_cumlesi,
+            self._create_predefined_path_of_digeri_digerleri
+        ]
 
     def _create_predefined_path_of_di(self):
         root_di = self._find_root(u'di', SyntacticCategory.VERB, None)
@@ -365,4 +365,22 @@ def followed_by_derivation(suffix, form_str=None):
     return HasSuffixFormAsLastDerivation(suffix, form_str)
 
 def followed_by_suffix_goes_to(state_type):
-    return LastSuffixGoesToState(state_type)
\ No newline at end of file
+    return LastSuffixGoesToState(state_type)
+########### inspection
+def find_root_strs(condition):
+    """
+    Finds the root strs a condition checks with L{applies_to_root}.
+    @type condition: Specification or None
+    @rtype: set of unicode
+    """
+    if isinstance(condition, AppliesToRoot):
+        return {condition._root_str}
+    elif isinstance(condition, (AndSpecification, OrSpecification)):
+        root_strs = set()
+        for specification in condition._specifications:
+            root_strs.update(find_root_strs(specification))
+        return root_strs
+    elif isinstance(condition, NotSpecification):
+        return find_root_strs(condition._wrapped)
+    else:
+        return set()
@@ -19,7 +19,7 @@ from hamcrest import *
 from mock import Mock
 from trnltk.morphology.model.lexeme import LexemeAttribute
 from trnltk.morphology.contextless.parser.parser import SuffixFormApplication
-from trnltk.morphology.morphotactics.suffixconditions import comes_after, has_lexeme_attributes
+from trnltk.morphology.morphotactics.suffixconditions import comes_after, has_lexeme_attributes, applies_to_root, doesnt, find_root_strs
 from trnltk.morphology.morphotactics.basicsuffixgraph import Suffix
 from trnltk.morphology.model.morpheme import SuffixForm, Transition
 
@@ -111,6 +111,14 @@ class SuffixConditionsTest(unittest.TestCase):
         self.assert_lexeme_attr_matches    (~has_lexeme_attributes([C_T, C_AR]), [C_T])
         self.assert_lexeme_attr_matches_not(~has_lexeme_attributes([C_T, C_AR]), [C_T, C_AR])
 
+    def test_find_root_strs(self):
+        s1 = Suffix("S-1")
+
+        assert_that(find_root_strs(None), equal_to(set()))
+        assert_that(find_root_strs(comes_after(s1)), equal_to(set()))
+        assert_that(find_root_strs(applies_to_root(u'bu')), equal_to({u'bu'}))
+        assert_that(find_root_strs(comes_after(s1) & (applies_to_root(u'bu') | applies_to_root(u'şu'))), equal_to({u'bu', u'şu'}))
+        assert_that(find_root_strs(doesnt(comes_after(s1) & applies_to_root(u'o'))), equal_to({u'o'}))
 
     def assert_suffixes_matches(self, condition, suffix_form_tuples):
         self.do_assert_suffixes_matches(condition, suffix_form_tuples, True)
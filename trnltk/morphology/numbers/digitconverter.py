@@ -86,12 +86,8 @@ class DigitsToNumberConverter(object):
         21: u'vigintilyon'
     }
 
-    @classmethod
-    def _add_text_for_leading_zeros(cls, integer_str, word):
-        number_of_leading_zeros = cls._get_number_of_leading_zeros(integer_str)
-        for i in range(0, number_of_leading_zeros):
-            word = cls.ZERO_NAME + u' ' + word
-        return word
+    # names of the numbers from 0 to 999, which are the 3 digit groups of a number
+    Three_Digit_Group_Names = None
 
     @classmethod
     def convert_digits_to_words(cls, digits):
@@ -116,100 +112,75 @@ class DigitsToNumberConverter(object):
         if not cls.TURKISH_NUMBER_REGEX.match(digits):
             raise Exception(u'{} is not a valid number. The allowed pattern is : {}'.format(digits, str(cls.TURKISH_NUMBER_PATTERN)))
 
-        integer_str = None
-        fraction_str = None
-
-        if cls.FRACTION_SEPARATOR in digits:
-            integer_str = digits[:digits.find(cls.FRACTION_SEPARATOR)]
-            fraction_str = digits[digits.find(cls.FRACTION_SEPARATOR) + 1:]
-        else:
-            integer_str = digits
-            fraction_str = None
+        negative = digits[0] == cls.NEGATIVE_SIGN
+        if digits[0] == cls.NEGATIVE_SIGN or digits[0] == cls.POSITIVE_SIGN:
+            digits = digits[1:]
 
-        integer_part = int(integer_str)
-        fraction_part = int(fraction_str) if fraction_str else 0
+        integer_str, fraction_separator, fraction_str = digits.partition(cls.FRACTION_SEPARATOR)
 
-        word_integer_part = cls._convert_natural_number_to_words(abs(integer_part))
-        word_fraction_part = cls._convert_natural_number_to_words(fraction_part)
+        word_integer_part = cls._convert_digit_str_to_words(integer_str)
 
-        word_integer_part = cls._add_text_for_leading_zeros(integer_str, word_integer_part)
-        word_fraction_part = cls._add_text_for_leading_zeros(fraction_str, word_fraction_part) if fraction_str else word_fraction_part
-
-        if integer_part < 0:
+        # no 'eksi' for the negative zero
+        if negative and integer_str.strip(u'0'):
             word_integer_part = cls.MINUS_NAME + u' ' + word_integer_part
 
-        if cls.FRACTION_SEPARATOR in digits:
-            return u'{} {} {}'.format(word_integer_part, cls.COMMA_NAME, word_fraction_part)
+        if fraction_separator:
+            return u'{} {} {}'.format(word_integer_part, cls.COMMA_NAME, cls._convert_digit_str_to_words(fraction_str))
         else:
             return word_integer_part
 
     @classmethod
-    def _convert_natural_number_to_words(cls, integer_nr):
-        if integer_nr < 0:
-            raise Exception('Argument is negative : {}'.format(integer_nr))
-
-        if integer_nr > cls.MAX_NATURAL_NUMBER_SUPPORTED:
+    def _convert_digit_str_to_words(cls, digit_str):
+        # works on 3 digit groups of the string, instead of big integer arithmetic
+        significant_digit_str = digit_str.lstrip(u'0')
+        if not significant_digit_str:
+            # a zero is written for each leading zero, as well as the number zero itself
+            return u' '.join([cls.ZERO_NAME] * len(digit_str))
+
+        if len(significant_digit_str) > cls.MAX_GROUP_BASE + 3:
             raise Exception(
-                'Fraction {} of the given number is larger than the maximum supported natural number: {}'.format(integer_nr, cls.MAX_NATURAL_NUMBER_SUPPORTED))
-
-        result = u''
-
-        integer_nr = abs(integer_nr)
-
-        # do it manually for words below 1000
-        if integer_nr < 10:
-            result = cls.NUMERAL_SYMBOL_NAMES[integer_nr]
-        elif integer_nr < 100:
-            tens_digit = integer_nr / 10
-            ones_digit = integer_nr % 10
-            result = u'{} {}'.format(cls.TENS_MULTIPLES_NAMES[tens_digit], cls._convert_natural_number_to_words(ones_digit) if ones_digit > 0 else u'')
-        elif integer_nr < 1000:
-            hundreds_digit = integer_nr / 100
-            rest = integer_nr % 100
-            rest_str = cls._convert_natural_number_to_words(rest) if rest > 0 else u''
-            if hundreds_digit == 0:
-                result = rest_str
-            elif hundreds_digit == 1:
-                result = u'{} {}'.format(cls.HUNDRED_NAME, rest_str)
+                'Fraction {} of the given number is larger than the maximum supported natural number: {}'.format(significant_digit_str, cls.MAX_NATURAL_NUMBER_SUPPORTED))
+
+        words = [cls.ZERO_NAME] * (len(digit_str) - len(significant_digit_str))
+
+        first_group_length = len(significant_digit_str) % 3 or 3
+        group_strs = [significant_digit_str[:first_group_length]] + \
+                     [significant_digit_str[i:i + 3] for i in range(first_group_length, len(significant_digit_str), 3)]
+
+        for power, group_str in zip(range(len(group_strs) - 1, -1, -1), group_strs):
+            group_nr = int(group_str)
+            if group_nr == 0:       # don't write 'sifir milyon'
+                continue
+            elif power == 0:
+                words.append(cls.Three_Digit_Group_Names[group_nr])
+            elif group_nr == 1 and power == 1:      # don't write 'bir bin', but write 'bir milyon'
+                words.append(cls.THOUSAND_NAME)
             else:
-                result = u'{} {} {}'.format(cls._convert_natural_number_to_words(hundreds_digit), cls.HUNDRED_NAME, rest_str)
-        else:
-            most_significant_group_base = cls._find_most_significant_group_base(integer_nr)
-            for i in range(most_significant_group_base / 3, 0, -1):
-                group_nr = cls._get_nth_group_nr(integer_nr, i)
-                if group_nr == 0:       # don't write 'sifir milyon'
-                    pass
-                elif group_nr == 1 and i == 1:      # don't write 'bir bin', but write 'bir milyon'(below)
-                    result += u' {}'.format(cls.THOUSAND_NAME)
-                else:
-                    group_nr_str = cls._convert_natural_number_to_words(group_nr)
-                    result += u' {} {} '.format(group_nr_str, cls.THOUSAND_POWER_NAMES[i])
-
-                result = result.strip()
-
-            last_group_nr = integer_nr % 1000
-            if last_group_nr > 0:
-                result += u' ' + cls._convert_natural_number_to_words(last_group_nr)
+                words.append(cls.Three_Digit_Group_Names[group_nr])
+                words.append(cls.THOUSAND_POWER_NAMES[power])
 
-        return result.strip()
+        return u' '.join(words)
 
     @classmethod
-    def _find_most_significant_group_base(cls, integer_nr):
-        i = cls.MAX_GROUP_BASE / 3
-        while pow(10, i * 3) > integer_nr:
-            i -= 1
-
-        return i * 3
+    def _create_three_digit_group_name(cls, group_nr):
+        hundreds_digit = group_nr / 100
+        tens_digit = group_nr / 10 % 10
+        ones_digit = group_nr % 10
+
+        words = []
+        if hundreds_digit > 1:
+            words.append(cls.NUMERAL_SYMBOL_NAMES[hundreds_digit])
+        if hundreds_digit > 0:
+            words.append(cls.HUNDRED_NAME)
+        if tens_digit > 0:
+            words.append(cls.TENS_MULTIPLES_NAMES[tens_digit])
+        if ones_digit > 0 or group_nr == 0:
+            words.append(cls.NUMERAL_SYMBOL_NAMES[ones_digit])
+
+        return u' '.join(words)
 
     @classmethod
-    def _get_nth_group_nr(cls, integer_nr, n):
-        integer_nr /= pow(1000, n)
-        integer_nr %= 1000
-        return integer_nr
+    def _initialize(cls):
+        cls.Three_Digit_Group_Names = [cls._create_three_digit_group_name(group_nr) for group_nr in range(1000)]
 
-    @classmethod
-    def _get_number_of_leading_zeros(cls, integer_str):
-        if integer_str.startswith(cls.NEGATIVE_SIGN) or integer_str.startswith(cls.POSITIVE_SIGN):
-            integer_str = integer_str[1:]
-        integer_str_wo_leading_zeros = str(int(integer_str))
-        return len(integer_str) - len(integer_str_wo_leading_zeros)
\ No newline at end of file
+DigitsToNumberConverter._initialize()
@@ -87,6 +87,11 @@ class DigitsToNumberConverterTest(unittest.TestCase):
         assert_that(cdtw(u'-000200'), equal_to(u'eksi sıfır sıfır sıfır iki yüz'))
         assert_that(cdtw(u'+000200'), equal_to(u'sıfır sıfır sıfır iki yüz'))
 
+        assert_that(cdtw(u'1001000'), equal_to(u'bir milyon bin'))
+        assert_that(cdtw(u'1000001'), equal_to(u'bir milyon bir'))
+        assert_that(cdtw(u'2000000000'), equal_to(u'iki milyar'))
+        assert_that(cdtw(u'1.250.000,75'), equal_to(u'bir milyon iki yüz elli bin virgül yetmiş beş'))
+
         assert_that(cdtw(u'5,0'), equal_to(u'beş virgül sıfır'))
         assert_that(cdtw(u'-5,000'), equal_to(u'eksi beş virgül sıfır sıfır sıfır'))
         assert_that(cdtw(u'+5,000'), equal_to(u'beş virgül sıfır sıfır sıfır'))
@@ -115,25 +115,61 @@ class TurkishAlphabet(object):
 
     Inverse_Voicing_Map = {L_b: {L_p}, L_c: {L_cc}, L_d: {L_t}, L_g: {L_k}, L_gg : {L_g, L_k}}
 
+    Flag_Vowel = 1
+    Flag_Frontal = 2
+    Flag_Rounded = 4
+    Flag_Voiceless = 8
+    Flag_Continuant = 16
+
     Lower_Case_Letter_Map = None
     Upper_Case_Letter_Map = None
 
+    # lower and upper case chars to letters, extended with sentinel letters for unknown chars as they are seen
+    Letter_Map = None
+    # letter feature flags, indexed by code point
+    Letter_Flags = None
+
+    Lower_Case_Translation_Table = None
+    Upper_Case_Translation_Table = None
+
     @classmethod
     def get_letter_for_char(cls, char):
         """
+        Returns the letter for the char. For chars not in the alphabet, a letter without any features is returned,
+        which is created once per char and reused afterwards.
         @type char: str or unicode
         @rtype: TurkishLetter
         """
+        letter = TurkishAlphabet.Letter_Map.get(char)
+        if letter is not None:
+            return letter
 
         assert char and len(char)==1
 
-        if TurkishAlphabet.Lower_Case_Letter_Map.has_key(char):
-            return TurkishAlphabet.Lower_Case_Letter_Map[char]
+        letter = TurkishLetter(char, char.upper(), 99)
+        TurkishAlphabet.Letter_Map[char] = letter
+        return letter
 
-        elif TurkishAlphabet.Upper_Case_Letter_Map.has_key(char):
-            return TurkishAlphabet.Upper_Case_Letter_Map[char]
+    @classmethod
+    def get_flags_for_char(cls, char):
+        """
+        Returns the feature flags of the letter for the char, as a combination of C{Flag_*} bits.
+        Chars not in the alphabet have no flags.
+        @type char: str or unicode
+        @rtype: int
+        """
+        code_point = ord(char)
+        if code_point < len(TurkishAlphabet.Letter_Flags):
+            return TurkishAlphabet.Letter_Flags[code_point]
+        return 0
 
-        return TurkishLetter(char, char.upper(), 99)
+    @classmethod
+    def is_vowel(cls, char):
+        """
+        @type char: str or unicode
+        @rtype: bool
+        """
+        return bool(cls.get_flags_for_char(char) & TurkishAlphabet.Flag_Vowel)
 
     @classmethod
     def get_letter_for_upper_case_char(cls, char):
@@ -165,20 +201,27 @@ class TurkishAlphabet(object):
 
     @classmethod
     def lower(cls, word):
+        """
+        Lower cases the word considering Turkish letters, e.g. 'I' becomes 'ı' and 'İ' becomes 'i'.
+        Other chars are lower cased as usual.
+        @type word: unicode
+        @rtype: unicode
+        """
+        if not word:
+            return word
+        return unicode(word).translate(TurkishAlphabet.Lower_Case_Translation_Table).lower()
+
+    @classmethod
+    def upper(cls, word):
+        """
+        Upper cases the word considering Turkish letters, e.g. 'ı' becomes 'I' and 'i' becomes 'İ'.
+        Other chars are upper cased as usual.
+        @type word: unicode
+        @rtype: unicode
+        """
         if not word:
             return word
-        lower_word = u''
-        for c in word:
-            if c.isupper():
-                letter_for_upper_char = cls.get_letter_for_upper_case_char(c)
-                if letter_for_upper_char:
-                    lower_word += letter_for_upper_char.char_value
-                else:
-                    lower_word += letter_for_upper_char.lower()
-            else:
-                lower_word += c.lower()
-
-        return lower_word
+        return unicode(word).translate(TurkishAlphabet.Upper_Case_Translation_Table).upper()
 
     @classmethod
     def _initialize(cls):
@@ -190,5 +233,33 @@ class TurkishAlphabet(object):
                 TurkishAlphabet.Lower_Case_Letter_Map[letter.char_value] = letter
                 TurkishAlphabet.Upper_Case_Letter_Map[letter.upper_case_char_value] = letter
 
+            TurkishAlphabet.Letter_Map = dict(TurkishAlphabet.Upper_Case_Letter_Map)
+            TurkishAlphabet.Letter_Map.update(TurkishAlphabet.Lower_Case_Letter_Map)
+
+            max_code_point = max([ord(char) for char in TurkishAlphabet.Letter_Map.keys()])
+            TurkishAlphabet.Letter_Flags = [0] * (max_code_point + 1)
+            for char, letter in TurkishAlphabet.Letter_Map.iteritems():
+                TurkishAlphabet.Letter_Flags[ord(char)] = cls._calculate_flags(letter)
+
+            TurkishAlphabet.Lower_Case_Translation_Table = dict(
+                [(ord(letter.upper_case_char_value), letter.char_value) for letter in TurkishAlphabet.Turkish_Letters])
+            TurkishAlphabet.Upper_Case_Translation_Table = dict(
+                [(ord(letter.char_value), letter.upper_case_char_value) for letter in TurkishAlphabet.Turkish_Letters])
+
+    @classmethod
+    def _calculate_flags(cls, letter):
+        flags = 0
+        if letter.vowel:
+            flags |= TurkishAlphabet.Flag_Vowel
+        if letter.frontal:
+            flags |= TurkishAlphabet.Flag_Frontal
+        if letter.rounded:
+            flags |= TurkishAlphabet.Flag_Rounded
+        if letter.voiceless:
+            flags |= TurkishAlphabet.Flag_Voiceless
+        if letter.continuant:
+            flags |= TurkishAlphabet.Flag_Continuant
+        return flags
+
 
 TurkishAlphabet._initialize()
\ No newline at end of file
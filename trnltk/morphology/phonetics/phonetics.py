@@ -63,7 +63,8 @@ class Phonetics(object):
         word = word.strip()
         form_str = form_str.strip()
 
-        phonetic_attributes = cls.calculate_phonetic_attributes_of_plain_sequence(word)
+        # only the last letter matters, no need to calculate all phonetic attributes of the word
+        last_letter_vowel = TurkishAlphabet.is_vowel(word[-1])
 
         # ci, dik, +yacak, +iyor, +ar, +yi, +im, +yla
 
@@ -74,7 +75,7 @@ class Phonetics(object):
             optional_letter = TurkishAlphabet.get_letter_for_char(form_str[1])
             if optional_letter.vowel:
                 #+iyor, +ar, +im
-                if PhoneticAttributes.LastLetterVowel in phonetic_attributes:
+                if last_letter_vowel:
                     # ata, dana
                     return cls.is_suffix_form_applicable(word, form_str[2:])
                 else:
@@ -83,7 +84,7 @@ class Phonetics(object):
 
             else:
                 # +yacak, +yi, +yla
-                if PhoneticAttributes.LastLetterVowel in phonetic_attributes:
+                if last_letter_vowel:
                     #ata, dana
                     return True
                 else:
@@ -92,7 +93,7 @@ class Phonetics(object):
 
         else:
             if first_form_letter.vowel:
-                return PhoneticAttributes.LastLetterVowel not in phonetic_attributes
+                return not last_letter_vowel
             else:
                 return True
 
@@ -233,7 +234,7 @@ class Phonetics(object):
                 return cls._expectation_satisfied(phonetic_expectation, form_str[1:]) or cls._expectation_satisfied(
                     phonetic_expectation, form_str[2:])
             else:
-                return TurkishAlphabet.get_letter_for_char(first_char).vowel
+                return TurkishAlphabet.is_vowel(first_char)
 
         elif phonetic_expectation == PhoneticExpectation.ConsonantStart:
             first_char = form_str[0]
@@ -241,7 +242,7 @@ class Phonetics(object):
                 return cls._expectation_satisfied(phonetic_expectation, form_str[1:]) or cls._expectation_satisfied(
                     phonetic_expectation, form_str[2:])
             else:
-                return not TurkishAlphabet.get_letter_for_char(first_char).vowel
+                return not TurkishAlphabet.is_vowel(first_char)
 
         else:
             raise Exception('Unknown phonetic_expectation', phonetic_expectation)
@@ -276,46 +277,56 @@ class Phonetics(object):
         """
         attrs = []
 
-        last_vowel = cls.get_last_vowel(seq)
-        last_letter = TurkishAlphabet.get_letter_for_char(seq[-1])
-        if last_vowel:
-            if last_vowel.rounded:
+        last_vowel_flags = cls._get_last_vowel_flags(seq)
+        last_letter_flags = TurkishAlphabet.get_flags_for_char(seq[-1])
+        if last_vowel_flags:
+            if last_vowel_flags & TurkishAlphabet.Flag_Rounded:
                 attrs.append(PhoneticAttributes.LastVowelRounded)
             else:
                 attrs.append(PhoneticAttributes.LastVowelUnrounded)
 
-            if last_vowel.frontal:
+            if last_vowel_flags & TurkishAlphabet.Flag_Frontal:
                 attrs.append(PhoneticAttributes.LastVowelFrontal)
             else:
                 attrs.append(PhoneticAttributes.LastVowelBack)
 
-        if last_letter.vowel:
+        vowel = last_letter_flags & TurkishAlphabet.Flag_Vowel
+        continuant = last_letter_flags & TurkishAlphabet.Flag_Continuant
+
+        if vowel:
             attrs.append(PhoneticAttributes.LastLetterVowel)
         else:
             attrs.append(PhoneticAttributes.LastLetterConsonant)
 
-        if last_letter.voiceless:
+        if last_letter_flags & TurkishAlphabet.Flag_Voiceless:
             attrs.append(PhoneticAttributes.LastLetterVoiceless)
-            if not last_letter.continuant:
+            if not continuant:
                 attrs.append(PhoneticAttributes.LastLetterVoicelessStop)
         else:
             attrs.append(PhoneticAttributes.LastLetterNotVoiceless)
-            if not last_letter.continuant and not last_letter.vowel:
+            if not continuant and not vowel:
                 attrs.append(PhoneticAttributes.LastLetterVoicedStop)
 
-        if last_letter.continuant:
+        if continuant:
             attrs.append(PhoneticAttributes.LastLetterContinuant)
         else:
             attrs.append(PhoneticAttributes.LastLetterNotContinuant)
 
         return set(attrs)
 
+    @classmethod
+    def _get_last_vowel_flags(cls, seq):
+        for s in reversed(seq):
+            flags = TurkishAlphabet.get_flags_for_char(s)
+            if flags & TurkishAlphabet.Flag_Vowel:
+                return flags
+        return 0
+
     @classmethod
     def get_last_vowel(cls, seq):
         for s in reversed(seq):
-            turkish_letter = TurkishAlphabet.get_letter_for_char(s)
-            if turkish_letter.vowel:
-                return turkish_letter
+            if TurkishAlphabet.is_vowel(s):
+                return TurkishAlphabet.get_letter_for_char(s)
 
     @classmethod
     def application_matches(cls, word, applied_str, voicing_allowed):
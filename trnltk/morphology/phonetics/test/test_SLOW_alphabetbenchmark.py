@@ -0,0 +1,142 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures the letter lookups, Turkish aware lower casing and phonetic attribute calculation on the surfaces of the
+bundled simple parsesets, and compares them to the original implementations which are reproduced here.
+"""
+import os
+import time
+import unittest
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet, TurkishLetter
+from trnltk.morphology.phonetics.phonetics import Phonetics, PhoneticAttributes
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+
+SIMPLE_PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../../testresources/simpleparsesets')
+
+REPEAT = 10
+
+def _original_get_letter_for_char(char):
+    assert char and len(char)==1
+
+    if TurkishAlphabet.Lower_Case_Letter_Map.has_key(char):
+        return TurkishAlphabet.Lower_Case_Letter_Map[char]
+
+    elif TurkishAlphabet.Upper_Case_Letter_Map.has_key(char):
+        return TurkishAlphabet.Upper_Case_Letter_Map[char]
+
+    return TurkishLetter(char, char.upper(), 99)
+
+def _original_lower(word):
+    if not word:
+        return word
+    lower_word = u''
+    for c in word:
+        if c.isupper():
+            # original implementation fails for upper case chars that are not in the alphabet
+            lower_word += TurkishAlphabet.get_letter_for_upper_case_char(c).char_value
+        else:
+            lower_word += c.lower()
+
+    return lower_word
+
+def _original_get_last_vowel(seq):
+    for s in reversed(seq):
+        turkish_letter = _original_get_letter_for_char(s)
+        if turkish_letter.vowel:
+            return turkish_letter
+
+def _original_calculate_phonetic_attributes_of_plain_sequence(seq):
+    attrs = []
+
+    last_vowel = _original_get_last_vowel(seq)
+    last_letter = _original_get_letter_for_char(seq[-1])
+    if last_vowel:
+        if last_vowel.rounded:
+            attrs.append(PhoneticAttributes.LastVowelRounded)
+        else:
+            attrs.append(PhoneticAttributes.LastVowelUnrounded)
+
+        if last_vowel.frontal:
+            attrs.append(PhoneticAttributes.LastVowelFrontal)
+        else:
+            attrs.append(PhoneticAttributes.LastVowelBack)
+
+    if last_letter.vowel:
+        attrs.append(PhoneticAttributes.LastLetterVowel)
+    else:
+        attrs.append(PhoneticAttributes.LastLetterConsonant)
+
+    if last_letter.voiceless:
+        attrs.append(PhoneticAttributes.LastLetterVoiceless)
+        if not last_letter.continuant:
+            attrs.append(PhoneticAttributes.LastLetterVoicelessStop)
+    else:
+        attrs.append(PhoneticAttributes.LastLetterNotVoiceless)
+        if not last_letter.continuant and not last_letter.vowel:
+            attrs.append(PhoneticAttributes.LastLetterVoicedStop)
+
+    if last_letter.continuant:
+        attrs.append(PhoneticAttributes.LastLetterContinuant)
+    else:
+        attrs.append(PhoneticAttributes.LastLetterNotContinuant)
+
+    return set(attrs)
+
+def _measure(function, items):
+    start = time.time()
+    results = [function(item) for item in items]
+    return results, time.time() - start
+
+class AlphabetBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        surfaces = []
+        for file_name in sorted(os.listdir(SIMPLE_PARSESETS_FOLDER)):
+            for sentence in SimpleParseSetReader(os.path.join(SIMPLE_PARSESETS_FOLDER, file_name)):
+                surfaces.extend([surface for surface, parse_result in sentence])
+
+        cls.surfaces = surfaces * REPEAT
+        cls.chars = [c for surface in cls.surfaces for c in surface]
+
+    def _compare(self, name, original_function, function, items):
+        original_results, original_seconds = _measure(original_function, items)
+        results, seconds = _measure(function, items)
+
+        print u'{:<40}: {:>8} items, original {:>7.3f} s, now {:>7.3f} s, {:>5.1f}x'.format(name, len(items),
+            original_seconds, seconds, original_seconds / seconds)
+
+        self.assertEqual(results, original_results)
+        self.assertLess(seconds, original_seconds)
+
+    def test_benchmark_get_letter_for_char(self):
+        self._compare('get_letter_for_char', _original_get_letter_for_char, TurkishAlphabet.get_letter_for_char, self.chars)
+
+    def test_benchmark_lower(self):
+        # upper cased surfaces, with only the Turkish letters
+        surfaces = [TurkishAlphabet.upper(surface) for surface in self.surfaces if
+                    all([c in TurkishAlphabet.Lower_Case_Letter_Map for c in TurkishAlphabet.lower(surface)])]
+        first_chars = [surface[0] for surface in surfaces]
+
+        self._compare('lower, whole surface', _original_lower, TurkishAlphabet.lower, surfaces)
+        self._compare('lower, first char', _original_lower, TurkishAlphabet.lower, first_chars)
+
+    def test_benchmark_calculate_phonetic_attributes(self):
+        self._compare('calculate_phonetic_attributes', _original_calculate_phonetic_attributes_of_plain_sequence,
+            Phonetics.calculate_phonetic_attributes_of_plain_sequence, self.surfaces)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from hamcrest import *
+from trnltk.morphology.phonetics.alphabet import TurkishAlphabet, TurkishLetter
+
+class TurkishAlphabetTest(unittest.TestCase):
+    def test_should_get_letter_for_char(self):
+        assert_that(TurkishAlphabet.get_letter_for_char(u'a'), same_instance(TurkishAlphabet.L_a))
+        assert_that(TurkishAlphabet.get_letter_for_char(u'A'), same_instance(TurkishAlphabet.L_a))
+        assert_that(TurkishAlphabet.get_letter_for_char(u'ı'), same_instance(TurkishAlphabet.L_ii))
+        assert_that(TurkishAlphabet.get_letter_for_char(u'I'), same_instance(TurkishAlphabet.L_ii))
+        assert_that(TurkishAlphabet.get_letter_for_char(u'i'), same_instance(TurkishAlphabet.L_i))
+        assert_that(TurkishAlphabet.get_letter_for_char(u'İ'), same_instance(TurkishAlphabet.L_i))
+        assert_that(TurkishAlphabet.get_letter_for_char('k'), same_instance(TurkishAlphabet.L_k))
+
+    def test_should_reuse_letters_for_unknown_chars(self):
+        for char in (u'+', u'1', u'ä', u'Ä'):
+            letter = TurkishAlphabet.get_letter_for_char(char)
+
+            assert_that(letter, equal_to(TurkishLetter(char, char.upper(), 99)))
+            assert_that(letter.vowel, equal_to(False))
+            assert_that(letter.alphabetic_index, equal_to(99))
+            assert_that(TurkishAlphabet.get_letter_for_char(char), same_instance(letter))
+
+    def test_should_not_get_letter_for_empty_or_multiple_chars(self):
+        self.assertRaises(AssertionError, TurkishAlphabet.get_letter_for_char, u'')
+        self.assertRaises(AssertionError, TurkishAlphabet.get_letter_for_char, u'ab')
+
+    def test_should_get_flags_for_char(self):
+        for char in (u'+', u'1', u'ä', u'一', u'\U0001d11e'[0]):
+            assert_that(TurkishAlphabet.get_flags_for_char(char), equal_to(0))
+
+        for letter in TurkishAlphabet.Turkish_Letters:
+            for char in (letter.char_value, letter.upper_case_char_value):
+                flags = TurkishAlphabet.get_flags_for_char(char)
+                assert_that(bool(flags & TurkishAlphabet.Flag_Vowel), equal_to(letter.vowel), char)
+                assert_that(bool(flags & TurkishAlphabet.Flag_Frontal), equal_to(letter.frontal), char)
+                assert_that(bool(flags & TurkishAlphabet.Flag_Rounded), equal_to(letter.rounded), char)
+                assert_that(bool(flags & TurkishAlphabet.Flag_Voiceless), equal_to(letter.voiceless), char)
+                assert_that(bool(flags & TurkishAlphabet.Flag_Continuant), equal_to(letter.continuant), char)
+                assert_that(TurkishAlphabet.is_vowel(char), equal_to(letter.vowel), char)
+
+    def test_should_lower(self):
+        assert_that(TurkishAlphabet.lower(None), equal_to(None))
+        assert_that(TurkishAlphabet.lower(u''), equal_to(u''))
+        assert_that(TurkishAlphabet.lower(u'ISPARTA'), equal_to(u'ısparta'))
+        assert_that(TurkishAlphabet.lower(u'İSTANBUL'), equal_to(u'istanbul'))
+        assert_that(TurkishAlphabet.lower(u'ÇAĞRI ŞÜKRÜ ÖZ'), equal_to(u'çağrı şükrü öz'))
+        assert_that(TurkishAlphabet.lower(u'Âdem'), equal_to(u'âdem'))
+        assert_that(TurkishAlphabet.lower(u'Ankara\'DA 1923'), equal_to(u'ankara\'da 1923'))
+        assert_that(TurkishAlphabet.lower(u'ÄÉ'), equal_to(u'äé'))
+        assert_that(TurkishAlphabet.lower('ABC'), equal_to(u'abc'))
+
+    def test_should_upper(self):
+        assert_that(TurkishAlphabet.upper(None), equal_to(None))
+        assert_that(TurkishAlphabet.upper(u''), equal_to(u''))
+        assert_that(TurkishAlphabet.upper(u'ısparta'), equal_to(u'ISPARTA'))
+        assert_that(TurkishAlphabet.upper(u'istanbul'), equal_to(u'İSTANBUL'))
+        assert_that(TurkishAlphabet.upper(u'çağrı şükrü öz'), equal_to(u'ÇAĞRI ŞÜKRÜ ÖZ'))
+        assert_that(TurkishAlphabet.upper(u'âdem'), equal_to(u'ÂDEM'))
+        assert_that(TurkishAlphabet.upper(u'ankara\'da 1923'), equal_to(u'ANKARA\'DA 1923'))
+        assert_that(TurkishAlphabet.upper(u'äé'), equal_to(u'ÄÉ'))
+
+    def test_lower_and_upper_should_be_inverses_for_turkish_letters(self):
+        lower_case = u''.join(sorted([letter.char_value for letter in TurkishAlphabet.Turkish_Letters]))
+        upper_case = u''.join(sorted([letter.upper_case_char_value for letter in TurkishAlphabet.Turkish_Letters]))
+
+        assert_that(TurkishAlphabet.lower(TurkishAlphabet.upper(lower_case)), equal_to(lower_case))
+        assert_that(TurkishAlphabet.upper(TurkishAlphabet.lower(upper_case)), equal_to(upper_case))
+
+if __name__ == '__main__':
+    unittest.main()
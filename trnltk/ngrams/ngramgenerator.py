@@ -15,6 +15,7 @@ limitations under the License.
 """
 from collections import  deque
 from trnltk.parseset.xmlbindings import UnparsableWordBinding, DerivationalSuffixBinding
+from trnltk.parseset.xmlstreaming import iter_words
 
 class NGramGenerator(object):
     def __init__(self, n, extractor, start_of_text, end_of_text):
@@ -38,6 +39,13 @@ class NGramGenerator(object):
         for end_n_gram in end_n_grams:
             yield end_n_gram
 
+    def iter_ngrams_of_sentences(self, sentence_bindings):
+        """
+        Same with iter_ngrams, but for sentences; e.g. a StreamingParseSetReader.
+        @type sentence_bindings: iterable<SentenceBinding>
+        """
+        return self.iter_ngrams(iter_words(sentence_bindings))
+
 
 class NGramQueue(object):
     def __init__(self, size, start_of_text, end_of_text):
@@ -17,10 +17,12 @@ limitations under the License.
 from bson.code import Code
 import os
 import unittest
-from xml.dom.minidom import parse
-import pymongo
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
 from trnltk.ngrams.ngramgenerator import  WordNGramGenerator, WordUnigramWithParseResultGenerator
-from trnltk.parseset.xmlbindings import ParseSetBinding, UnparsableWordBinding
+from trnltk.parseset.xmlbindings import UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+connection_provider = ConnectionProvider(host="127.0.0.1")
 
 def _count_distinct_ngrams(collection, keys, filter_criteria):
     mapper = Code("""
@@ -55,8 +57,7 @@ class WordUnigramMongodbGeneratorTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         super(WordUnigramMongodbGeneratorTest, cls).setUpClass()
-        connection = pymongo.Connection(host="127.0.0.1")
-        cls.db = connection['trnltk']
+        cls.db = connection_provider.get_database()
 
     def test_create_unigrams_for_parseset_001(self):
         self._create_unigrams_for_parseset_n("001")
@@ -98,11 +99,11 @@ class WordUnigramMongodbGeneratorTest(unittest.TestCase):
     def _create_unigrams_for_parseset_n(self, parseset_index):
         print "Parsing parse set {} and generating unigrams with occurrence counts".format(parseset_index)
 
-        dom = parse(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
-        parseset = ParseSetBinding.build(dom.getElementsByTagName("parseset")[0])
+        parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index))
+        sentences = list(StreamingParseSetReader(parseset_path))
 
-        print "Found {} sentences".format(len(parseset.sentences))
-        words = [word for sentence in parseset.sentences for word in sentence.words]
+        print "Found {} sentences".format(len(sentences))
+        words = [word for sentence in sentences for word in sentence.words]
         print "Found {} words".format(len(words))
         print "Found {} parsable words".format(
             len(filter(lambda word: not isinstance(word, UnparsableWordBinding), words)))
@@ -195,8 +196,7 @@ class WordBigramMongodbGeneratorTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         super(WordBigramMongodbGeneratorTest, cls).setUpClass()
-        connection = pymongo.Connection(host="127.0.0.1")
-        cls.db = connection['trnltk']
+        cls.db = connection_provider.get_database()
 
     def test_create_bigrams_for_parseset_001(self):
         self._create_bigrams_for_parseset_n("001")
@@ -239,11 +239,11 @@ class WordBigramMongodbGeneratorTest(unittest.TestCase):
     def _create_bigrams_for_parseset_n(self, parseset_index):
         print "Parsing parse set {} and generating bigrams with occurrence counts".format(parseset_index)
 
-        dom = parse(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
-        parseset = ParseSetBinding.build(dom.getElementsByTagName("parseset")[0])
+        parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index))
+        sentences = list(StreamingParseSetReader(parseset_path))
 
-        print "Found {} sentences".format(len(parseset.sentences))
-        words = [word for sentence in parseset.sentences for word in sentence.words]
+        print "Found {} sentences".format(len(sentences))
+        words = [word for sentence in sentences for word in sentence.words]
         print "Found {} words".format(len(words))
         print "Found {} parsable words".format(
             len(filter(lambda word: not isinstance(word, UnparsableWordBinding), words)))
@@ -473,8 +473,7 @@ class WordTrigramMongodbGeneratorTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         super(WordTrigramMongodbGeneratorTest, cls).setUpClass()
-        connection = pymongo.Connection(host="127.0.0.1")
-        cls.db = connection['trnltk']
+        cls.db = connection_provider.get_database()
 
     def test_create_trigrams_for_parseset_001(self):
         self._create_trigrams_for_parseset_n("001")
@@ -498,11 +497,11 @@ class WordTrigramMongodbGeneratorTest(unittest.TestCase):
     def _create_trigrams_for_parseset_n(self, parseset_index):
         print "Parsing parse set {} and generating trigrams with occurrence counts".format(parseset_index)
 
-        dom = parse(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
-        parseset = ParseSetBinding.build(dom.getElementsByTagName("parseset")[0])
+        parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index))
+        sentences = list(StreamingParseSetReader(parseset_path))
 
-        print "Found {} sentences".format(len(parseset.sentences))
-        words = [word for sentence in parseset.sentences for word in sentence.words]
+        print "Found {} sentences".format(len(sentences))
+        words = [word for sentence in sentences for word in sentence.words]
         print "Found {} words".format(len(words))
         print "Found {} parsable words".format(
             len(filter(lambda word: not isinstance(word, UnparsableWordBinding), words)))
@@ -537,8 +536,7 @@ class WordUnigramWithParseResultGeneratorMongodbTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         super(WordUnigramWithParseResultGeneratorMongodbTest, cls).setUpClass()
-        connection = pymongo.Connection(host="127.0.0.1")
-        cls.db = connection['trnltk']
+        cls.db = connection_provider.get_database()
 
     def test_create_unigrams_for_parseset_001(self):
         self._create_unigrams_for_parseset_n("001")
@@ -580,11 +578,11 @@ class WordUnigramWithParseResultGeneratorMongodbTest(unittest.TestCase):
     def _create_unigrams_for_parseset_n(self, parseset_index):
         print "Parsing parse set {} and generating unigrams with occurrence counts and parse results".format(parseset_index)
 
-        dom = parse(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
-        parseset = ParseSetBinding.build(dom.getElementsByTagName("parseset")[0])
+        parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index))
+        sentences = list(StreamingParseSetReader(parseset_path))
 
-        print "Found {} sentences".format(len(parseset.sentences))
-        words = [word for sentence in parseset.sentences for word in sentence.words]
+        print "Found {} sentences".format(len(sentences))
+        words = [word for sentence in sentences for word in sentence.words]
         print "Found {} words".format(len(words))
         print "Found {} parsable words".format(
             len(filter(lambda word: not isinstance(word, UnparsableWordBinding), words)))
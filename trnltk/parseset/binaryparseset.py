@@ -0,0 +1,337 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Compact binary format for parsesets, with random access to sentences.
+
+File layout:
+    header          : magic, version, sentence count, offset of the string table, offset of the sentence index
+    sentence records: one after another, starting right after the header
+    string table    : varint count, then varint byte length and UTF-8 bytes of each string
+    sentence index  : little endian uint64 offset of each sentence record, plus the end offset of the last one
+
+All strings (surfaces, parse results, categories, suffix attributes...) are interned; records hold their ids in the
+string table. Id 0 is reserved for None, e.g. for a missing secondary syntactic category, thus the id of the first string
+in the table is 1. Integers in records are unsigned LEB128 varints.
+
+Sentence record:
+    varint word count, then for each word a varint kind followed by
+        unparsable word: str
+        word           : str, parse_result, syntactic_category, secondary_syntactic_category,
+                         root str, lemma, lemma_root, syntactic_category, secondary_syntactic_category,
+                         varint suffix count and for each suffix a varint kind followed by
+                         id, name, form, application, actual, word, matched_word, to_syntactic_category
+"""
+import mmap
+import os
+import struct
+import numpy
+from trnltk.parseset.xmlbindings import SentenceBinding, WordBinding, UnparsableWordBinding, RootBinding, InflectionalSuffixBinding, DerivationalSuffixBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader, iter_words
+
+MAGIC = 'TRNLTKPS'
+VERSION = 2
+
+_HEADER = struct.Struct('<8sIIQQ')
+
+_NONE_STRING_ID = 0
+
+_UNPARSABLE_WORD = 0
+_WORD = 1
+
+_INFLECTIONAL_SUFFIX = 0
+_DERIVATIONAL_SUFFIX = 1
+
+def _encode_varint(value, out):
+    while value >= 0x80:
+        out.append(chr((value & 0x7F) | 0x80))
+        value >>= 7
+    out.append(chr(value))
+
+def _decode_varint(data, position):
+    result = 0
+    shift = 0
+    while True:
+        byte = ord(data[position])
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+class BinaryParseSetWriter(object):
+    """
+    Writes sentence bindings in the binary format. Sentences are written as they come; only the string table and the
+    sentence offsets are kept in memory.
+    """
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+
+        self._file = None
+        self._string_ids = {}
+        self._strings = []
+        self._sentence_offsets = []
+
+        self.sentence_count = 0
+
+    def open(self):
+        assert self._file is None, "Writer is already open"
+
+        self._file = open(self._file_path, 'wb')
+        # placeholder, rewritten on close when the offsets are known
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        return self
+
+    def write_sentence(self, sentence_binding):
+        """
+        @type sentence_binding: SentenceBinding
+        """
+        assert self._file is not None, "Writer is not open"
+
+        out = []
+        _encode_varint(len(sentence_binding.words), out)
+        for word in sentence_binding.words:
+            if isinstance(word, UnparsableWordBinding):
+                _encode_varint(_UNPARSABLE_WORD, out)
+                self._write_strings(out, word.str)
+            else:
+                _encode_varint(_WORD, out)
+                self._write_word(out, word)
+
+        self._sentence_offsets.append(self._file.tell())
+        self._file.write(''.join(out))
+        self.sentence_count += 1
+
+    def write_sentences(self, sentence_bindings):
+        for sentence_binding in sentence_bindings:
+            self.write_sentence(sentence_binding)
+
+    def _write_word(self, out, word):
+        root = word.root
+        self._write_strings(out, word.str, word.parse_result, word.syntactic_category, word.secondary_syntactic_category,
+            root.str, root.lemma, root.lemma_root, root.syntactic_category, root.secondary_syntactic_category)
+
+        _encode_varint(len(word.suffixes), out)
+        for suffix in word.suffixes:
+            if isinstance(suffix, DerivationalSuffixBinding):
+                _encode_varint(_DERIVATIONAL_SUFFIX, out)
+            elif isinstance(suffix, InflectionalSuffixBinding):
+                _encode_varint(_INFLECTIONAL_SUFFIX, out)
+            else:
+                raise Exception("Unknown suffix type : " + suffix.__class__.__name__)
+
+            self._write_strings(out, suffix.id, suffix.name, suffix.form, suffix.application, suffix.actual, suffix.word,
+                suffix.matched_word, suffix.to_syntactic_category)
+
+    def _write_strings(self, out, *strings):
+        for string in strings:
+            _encode_varint(self._intern(string), out)
+
+    def _intern(self, string):
+        if string is None:
+            return _NONE_STRING_ID
+
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = len(self._strings) + 1
+            self._string_ids[string] = string_id
+            self._strings.append(string)
+        return string_id
+
+    def close(self):
+        if self._file is None:
+            return
+
+        end_of_sentences = self._file.tell()
+
+        string_table_offset = end_of_sentences
+        out = []
+        _encode_varint(len(self._strings), out)
+        for string in self._strings:
+            encoded = unicode(string).encode('utf-8')
+            _encode_varint(len(encoded), out)
+            out.append(encoded)
+        self._file.write(''.join(out))
+
+        index_offset = self._file.tell()
+        self._file.write(numpy.array(self._sentence_offsets + [end_of_sentences], dtype='<u8').tostring())
+
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(self._sentence_offsets), string_table_offset, index_offset))
+        self._file.close()
+        self._file = None
+
+    def abort(self):
+        """
+        Closes and removes the partially written file.
+        """
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        os.remove(self._file_path)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # a file without the string table and the sentence index is of no use
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class BinaryParseSetReader(object):
+    """
+    Memory maps a binary parseset file. Only the string table is decoded on open; sentences are decoded when they are
+    asked for, either by index or by iterating.
+    """
+
+    def __init__(self, file_path):
+        self._file = open(file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, sentence_count, string_table_offset, index_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise Exception("Not a binary parseset file : " + file_path)
+        if version != VERSION:
+            self.close()
+            raise Exception("Unsupported binary parseset version {} in {}".format(version, file_path))
+
+        self._sentence_count = sentence_count
+        self._sentence_offsets = numpy.frombuffer(self._mmap, dtype='<u8', count=sentence_count + 1, offset=index_offset)
+        self._strings = self._read_string_table(string_table_offset)
+
+    def _read_string_table(self, position):
+        data = self._mmap
+        string_count, position = _decode_varint(data, position)
+        strings = [None]
+        for i in xrange(string_count):
+            length, position = _decode_varint(data, position)
+            strings.append(data[position:position + length].decode('utf-8'))
+            position += length
+        return strings
+
+    def __len__(self):
+        return self._sentence_count
+
+    def __getitem__(self, index):
+        """
+        @type index: int
+        @rtype: SentenceBinding
+        """
+        if index < 0:
+            index += self._sentence_count
+        if not 0 <= index < self._sentence_count:
+            raise IndexError("Sentence index out of range : {}".format(index))
+
+        start = int(self._sentence_offsets[index])
+        end = int(self._sentence_offsets[index + 1])
+        return self._decode_sentence(self._mmap[start:end])
+
+    def __iter__(self):
+        return self.iter_sentences()
+
+    def iter_sentences(self):
+        for index in xrange(self._sentence_count):
+            yield self[index]
+
+    def iter_words(self):
+        return iter_words(self.iter_sentences())
+
+    def _decode_sentence(self, data):
+        strings = self._strings
+        # decoding is inlined, since this is the hot path of loading a parseset
+        values = []
+        position = 0
+        length = len(data)
+        while position < length:
+            byte = ord(data[position])
+            position += 1
+            if byte < 0x80:
+                values.append(byte)
+                continue
+            result = byte & 0x7F
+            shift = 7
+            while True:
+                byte = ord(data[position])
+                position += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            values.append(result)
+
+        sentence_binding = SentenceBinding()
+        words = sentence_binding.words
+
+        i = 1
+        for word_index in xrange(values[0]):
+            kind = values[i]
+            if kind == _UNPARSABLE_WORD:
+                words.append(UnparsableWordBinding(strings[values[i + 1]]))
+                i += 2
+                continue
+
+            word_strings = [strings[string_id] for string_id in values[i + 1:i + 10]]
+            suffix_count = values[i + 10]
+            i += 11
+
+            suffixes = []
+            for suffix_index in xrange(suffix_count):
+                suffix_binding_class = DerivationalSuffixBinding if values[i] == _DERIVATIONAL_SUFFIX else InflectionalSuffixBinding
+                suffixes.append(suffix_binding_class(*[strings[string_id] for string_id in values[i + 1:i + 9]]))
+                i += 9
+
+            root = RootBinding(*word_strings[4:9])
+            words.append(WordBinding(word_strings[0], word_strings[1], root, word_strings[2], word_strings[3], suffixes))
+
+        return sentence_binding
+
+    def close(self):
+        if self._mmap is not None:
+            # numpy array keeps a reference to the mmap
+            self._sentence_offsets = None
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def convert_xml_to_binary(xml_source, binary_file_path):
+    """
+    Converts a parseset XML file to the binary format, without loading the whole parseset into memory.
+
+    @param xml_source: path of the parseset XML file (gzip compressed if ends with ".gz") or a file object
+    @return: number of sentences converted
+    """
+    with BinaryParseSetWriter(binary_file_path) as writer:
+        writer.write_sentences(StreamingParseSetReader(xml_source))
+
+    return writer.sentence_count
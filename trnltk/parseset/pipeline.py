@@ -0,0 +1,472 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Pipeline for generating (silver standard) parsesets from raw text.
+
+Each non-empty line of the input files is a sentence, which is tokenized with TextTokenizer. With sentence splitting,
+input files are tokenized as a stream instead and split into sentences with SentenceSplitter, regardless of the lines.
+Sentences are sent to worker processes in batches, parsed and converted to bindings with ParseSetCreator; then written
+in input order, in parts of sentences_per_part sentences. A part is written to a temporary file, which is renamed when
+the part is complete and then the checkpoint is updated. Thus, a pipeline which is stopped can be run again with the
+same arguments and it continues from the first incomplete part.
+
+Workers can't share a parser with the main process, so they create their own with a sentence parser factory: a
+picklable callable that returns an object with a parse_sentence(text) method, and a parse_tokens(tokens) method for
+sentence splitting. The methods return a list of (word_str, morpheme_container or None) tuples, which is what
+ParseSetCreator expects. The finish() method of the sentence parser is called when a worker is done, e.g. to save the
+likelihood cache of the contextful parser. Workers save their caches to the same file, the one finishing last wins.
+
+Only a single parse result is written for each word. ContextfulSentenceParser picks the most likely one, but
+ContextlessSentenceParser can't rank the results and picks the first one the contextless parser returns, which is
+arbitrary among the ambiguous results of a word. Thus, parsesets generated without context are only useful where the
+parse of an ambiguous word doesn't matter much, e.g. for counting surfaces and roots.
+"""
+import codecs
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+from collections import deque
+from multiprocessing.util import Finalize
+from trnltk.morphology.contextful.likelihoodmetrics.hidden.database import ConnectionProvider
+from trnltk.parseset.creator import ParseSetCreator
+from trnltk.parseset.xmlbindings import SentenceBinding, UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetWriter
+from trnltk.tokenizer.sentencesplitter import iter_sentences_of_text, iter_batches
+from trnltk.tokenizer.texttokenizer import TextTokenizer
+
+logger = logging.getLogger('parsesetpipeline')
+
+DEFAULT_MASTER_DICTIONARY_PATH = os.path.join(os.path.dirname(__file__), '../resources/master_dictionary.txt')
+
+class ContextlessSentenceParser(object):
+    """
+    Picks the first parse result of the contextless parser for each word. Results of the contextless parser are not
+    ordered by likelihood, so for an ambiguous word the picked result is arbitrary.
+    """
+
+    def __init__(self, contextless_parser, tokenizer=None):
+        """
+        @type contextless_parser: ContextlessMorphologicalParser
+        @type tokenizer: TextTokenizer or None
+        """
+        self._contextless_parser = contextless_parser
+        self._tokenizer = tokenizer or TextTokenizer()
+
+    def parse_sentence(self, text):
+        """
+        @type text: unicode
+        @rtype: list<tuple<unicode, MorphemeContainer or None>>
+        """
+        return self.parse_tokens(self._tokenizer.tokenize(text))
+
+    def parse_tokens(self, tokens):
+        """
+        @type tokens: list<unicode>
+        @rtype: list<tuple<unicode, MorphemeContainer or None>>
+        """
+        result = []
+        for token in tokens:
+            parse_results = self._contextless_parser.parse(token)
+            result.append((token, parse_results[0] if parse_results else None))
+        return result
+
+    def finish(self):
+        pass
+
+
+class ContextfulSentenceParser(object):
+    """
+    Picks the most likely parse result of the contextful parser for each word. Context items are all contextless parse
+    results of the surrounding words.
+    """
+
+    def __init__(self, contextful_parser, leading_context_size=2, following_context_size=2, tokenizer=None):
+        """
+        @type contextful_parser: ContextfulMorphologicalParser
+        @type tokenizer: TextTokenizer or None
+        """
+        self._contextful_parser = contextful_parser
+        self._contextless_parser = contextful_parser._contextless_parser
+        self._leading_context_size = leading_context_size
+        self._following_context_size = following_context_size
+        self._tokenizer = tokenizer or TextTokenizer()
+
+    def parse_sentence(self, text):
+        return self.parse_tokens(self._tokenizer.tokenize(text))
+
+    def parse_tokens(self, tokens):
+        contextless_parse_results = [self._contextless_parser.parse(token) for token in tokens]
+
+        result = []
+        for index, token in enumerate(tokens):
+            if not contextless_parse_results[index]:
+                result.append((token, None))
+                continue
+
+            leading_context = contextless_parse_results[max(0, index - self._leading_context_size):index]
+            following_context = contextless_parse_results[index + 1:index + 1 + self._following_context_size]
+
+            likelihoods = self._contextful_parser.parse_with_likelihoods(token, leading_context, following_context)
+            best_parse_result, best_likelihood = max(likelihoods, key=lambda item: item[1])
+            result.append((token, best_parse_result))
+
+        return result
+
+    def finish(self):
+        self._contextful_parser.save_likelihood_cache()
+
+
+class ContextlessSentenceParserFactory(object):
+    def __init__(self, master_dictionary_path=DEFAULT_MASTER_DICTIONARY_PATH):
+        self._master_dictionary_path = master_dictionary_path
+
+    def __call__(self):
+        # imported here, since only the workers need them
+        from trnltk.morphology.contextless.parser.parser import UpperCaseSupportingContextlessMorphologicalParser
+        from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder, DigitNumeralRootFinder, TextNumeralRootFinder, ProperNounFromApostropheRootFinder, ProperNounWithoutApostropheRootFinder
+        from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+        from trnltk.morphology.lexicon.rootgenerator import RootGenerator, RootMapGenerator
+        from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+        from trnltk.morphology.morphotactics.copulasuffixgraph import CopulaSuffixGraph
+        from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
+        from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+        from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
+
+        all_roots = []
+        lexemes = LexiconLoader.load_from_file(self._master_dictionary_path)
+        for di in lexemes:
+            all_roots.extend(RootGenerator.generate(di))
+
+        root_map = RootMapGenerator().generate(all_roots)
+
+        suffix_graph = CopulaSuffixGraph(NumeralSuffixGraph(ProperNounSuffixGraph(BasicSuffixGraph())))
+        suffix_graph.initialize()
+
+        predefined_paths = PredefinedPaths(root_map, suffix_graph)
+        predefined_paths.create_predefined_paths()
+
+        contextless_parser = UpperCaseSupportingContextlessMorphologicalParser(suffix_graph, predefined_paths,
+            [WordRootFinder(root_map), DigitNumeralRootFinder(), TextNumeralRootFinder(root_map),
+             ProperNounFromApostropheRootFinder(), ProperNounWithoutApostropheRootFinder()])
+
+        return ContextlessSentenceParser(contextless_parser)
+
+
+class ContextfulSentenceParserFactory(object):
+    def __init__(self, parseset_index, db_host=ConnectionProvider.DEFAULT_HOST, master_dictionary_path=DEFAULT_MASTER_DICTIONARY_PATH,
+                 likelihood_cache_size=None, likelihood_cache_path=None):
+        """
+        @param likelihood_cache_size: max number of likelihoods to cache in each worker. likelihoods are not cached if None
+        @param likelihood_cache_path: file to load the likelihood cache from, and to save it to when a worker is done
+        """
+        self._parseset_index = parseset_index
+        self._db_host = db_host
+        self._master_dictionary_path = master_dictionary_path
+        self._likelihood_cache_size = likelihood_cache_size
+        self._likelihood_cache_path = likelihood_cache_path
+
+    def __call__(self):
+        from trnltk.morphology.contextful.parser.contexfulmorphologicalparser import ContextfulMorphologicalParserFactory
+
+        # each worker has its own connection
+        connection_provider = ConnectionProvider(host=self._db_host)
+        contextful_parser = ContextfulMorphologicalParserFactory.create_with_connection_provider(self._master_dictionary_path,
+            connection_provider, self._parseset_index, likelihood_cache_size=self._likelihood_cache_size,
+            likelihood_cache_path=self._likelihood_cache_path)
+        contextful_parser.build_indexes()
+
+        return ContextfulSentenceParser(contextful_parser)
+
+
+class _SentenceBindingCreator(object):
+    def __init__(self, sentence_parser):
+        self._sentence_parser = sentence_parser
+        self._parseset_creator = ParseSetCreator()
+
+    def create(self, sentence_input):
+        """
+        @param sentence_input: text of the sentence, or its tokens if the sentences are split by the pipeline
+        """
+        if isinstance(sentence_input, list):
+            parse_result_tuples = self._sentence_parser.parse_tokens(sentence_input)
+        else:
+            parse_result_tuples = self._sentence_parser.parse_sentence(sentence_input)
+
+        sentence = SentenceBinding()
+        for word_str, morpheme_container in parse_result_tuples:
+            word = None
+            if morpheme_container:
+                try:
+                    word = self._parseset_creator.create_word_binding_from_morpheme_container(word_str, morpheme_container)
+                except Exception:
+                    # a single bad parse result shouldn't stop a pipeline running for hours
+                    logger.exception(u'Unable to create binding for word {}, using an unparsable word'.format(word_str))
+
+            sentence.words.append(word or UnparsableWordBinding(word_str))
+
+        return sentence
+
+    def finish(self):
+        self._sentence_parser.finish()
+
+
+_worker_sentence_binding_creator = None
+
+def _initialize_worker(sentence_parser_factory):
+    global _worker_sentence_binding_creator
+    _worker_sentence_binding_creator = _SentenceBindingCreator(sentence_parser_factory())
+
+def _initialize_pool_worker(sentence_parser_factory):
+    _initialize_worker(sentence_parser_factory)
+    # pool workers exit normally after the pool is closed, which runs the finalizers with an exit priority
+    Finalize(None, _finish_worker, exitpriority=10)
+
+def _finish_worker():
+    _worker_sentence_binding_creator.finish()
+
+def _create_sentence_bindings(sentence_inputs):
+    return [_worker_sentence_binding_creator.create(sentence_input) for sentence_input in sentence_inputs]
+
+
+class _PartedParseSetWriter(object):
+    """
+    Writes the sentences to part files and keeps the checkpoint of the completed parts.
+    """
+
+    CHECKPOINT_FILE_NAME = 'checkpoint.json'
+
+    def __init__(self, output_folder, sentences_per_part, split_sentences, compress):
+        self._output_folder = output_folder
+        self._sentences_per_part = sentences_per_part
+        self._split_sentences = split_sentences
+        self._extension = '.xml.gz' if compress else '.xml'
+
+        self._writer = None
+        self._sentence_count_in_part = 0
+
+        self.completed_part_count = 0
+        self.sentence_count = 0
+        self.finished = False
+
+    def get_part_path(self, part_index):
+        return os.path.join(self._output_folder, 'part{:05d}{}'.format(part_index, self._extension))
+
+    def _get_temp_part_path(self, part_index):
+        # extension is kept, so that the writer compresses the temp file too
+        return os.path.join(self._output_folder, 'part{:05d}.tmp{}'.format(part_index, self._extension))
+
+    def _get_checkpoint_path(self):
+        return os.path.join(self._output_folder, self.CHECKPOINT_FILE_NAME)
+
+    def load_checkpoint(self):
+        checkpoint_path = self._get_checkpoint_path()
+        if not os.path.exists(checkpoint_path):
+            return
+
+        with open(checkpoint_path, 'rb') as f:
+            checkpoint = json.load(f)
+
+        if checkpoint['sentences_per_part'] != self._sentences_per_part:
+            raise Exception('Checkpoint in {} was written with {} sentences per part, cannot continue with {}'.format(
+                self._output_folder, checkpoint['sentences_per_part'], self._sentences_per_part))
+        # sentences to skip are counted differently
+        if checkpoint.get('split_sentences', False) != self._split_sentences:
+            raise Exception('Checkpoint in {} was written with split_sentences={}, cannot continue with {}'.format(
+                self._output_folder, checkpoint.get('split_sentences', False), self._split_sentences))
+
+        self.completed_part_count = checkpoint['completed_part_count']
+        self.sentence_count = checkpoint['sentence_count']
+        self.finished = checkpoint['finished']
+
+    def _save_checkpoint(self):
+        checkpoint = {
+            'sentences_per_part': self._sentences_per_part,
+            'split_sentences': self._split_sentences,
+            'completed_part_count': self.completed_part_count,
+            'sentence_count': self.sentence_count,
+            'finished': self.finished
+        }
+
+        temp_path = self._get_checkpoint_path() + '.tmp'
+        with open(temp_path, 'wb') as f:
+            json.dump(checkpoint, f)
+        os.rename(temp_path, self._get_checkpoint_path())
+
+    def write_sentence(self, sentence_binding):
+        if self._writer is None:
+            self._writer = StreamingParseSetWriter(self._get_temp_part_path(self.completed_part_count)).open()
+
+        self._writer.write_sentence(sentence_binding)
+        self._sentence_count_in_part += 1
+
+        if self._sentence_count_in_part == self._sentences_per_part:
+            self._complete_part()
+
+    def _complete_part(self):
+        self._writer.close()
+        self._writer = None
+
+        part_path = self.get_part_path(self.completed_part_count)
+        os.rename(self._get_temp_part_path(self.completed_part_count), part_path)
+
+        self.completed_part_count += 1
+        self.sentence_count += self._sentence_count_in_part
+        self._sentence_count_in_part = 0
+        self._save_checkpoint()
+
+        logger.info(u'Completed part {}, {} sentences so far'.format(part_path, self.sentence_count))
+
+    def finish(self):
+        if self._writer is not None:
+            self._complete_part()
+
+        self.finished = True
+        self._save_checkpoint()
+
+    def abort(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ParseSetGenerationPipeline(object):
+    """
+    Generates parseset parts from raw text files. See the module documentation.
+    """
+
+    DEFAULT_BATCH_SIZE = 50
+    DEFAULT_SENTENCES_PER_PART = 10000
+
+    def __init__(self, sentence_parser_factory, output_folder, process_count=None, batch_size=DEFAULT_BATCH_SIZE,
+                 sentences_per_part=DEFAULT_SENTENCES_PER_PART, max_pending_batch_count=None, compress=True, split_sentences=False):
+        """
+        @param sentence_parser_factory: picklable callable, which creates a sentence parser in each worker
+        @param output_folder: folder of the part files and the checkpoint
+        @param process_count: number of worker processes. defaults to the number of CPUs; 0 runs in this process
+        @param batch_size: number of sentences sent to a worker at once
+        @param sentences_per_part: number of sentences in a part file. must be the same when continuing
+        @param max_pending_batch_count: max number of batches sent to the workers but not written yet. input is not
+            read while there are that many. defaults to twice the number of processes
+        @param compress: write the parts gzip compressed
+        @param split_sentences: split the text into sentences with SentenceSplitter, instead of taking each line as a
+            sentence. must be the same when continuing
+        """
+        assert batch_size > 0
+        assert sentences_per_part > 0
+
+        self._sentence_parser_factory = sentence_parser_factory
+        self._output_folder = output_folder
+        self._process_count = process_count if process_count is not None else multiprocessing.cpu_count()
+        self._batch_size = batch_size
+        self._sentences_per_part = sentences_per_part
+        self._max_pending_batch_count = max_pending_batch_count or max(2 * self._process_count, 1)
+        self._compress = compress
+        self._split_sentences = split_sentences
+
+    def run(self, text_file_paths):
+        """
+        @type text_file_paths: list<str>
+        @return: paths of the part files, in order
+        @rtype: list<str>
+        """
+        if not os.path.exists(self._output_folder):
+            os.makedirs(self._output_folder)
+
+        parted_writer = _PartedParseSetWriter(self._output_folder, self._sentences_per_part, self._split_sentences, self._compress)
+        parted_writer.load_checkpoint()
+
+        if parted_writer.finished:
+            logger.info(u'Pipeline was already finished for {}'.format(self._output_folder))
+        else:
+            if parted_writer.sentence_count:
+                logger.info(u'Continuing from part {}, skipping {} sentences'.format(parted_writer.completed_part_count, parted_writer.sentence_count))
+
+            if self._split_sentences:
+                sentence_inputs = self._iter_split_sentences(text_file_paths)
+            else:
+                sentence_inputs = self._iter_sentence_texts(text_file_paths)
+            batches = iter_batches(self._skip(sentence_inputs, parted_writer.sentence_count), self._batch_size)
+            try:
+                if self._process_count:
+                    self._run_with_pool(batches, parted_writer)
+                else:
+                    self._run_in_process(batches, parted_writer)
+            except:
+                parted_writer.abort()
+                raise
+
+            parted_writer.finish()
+
+        return [parted_writer.get_part_path(part_index) for part_index in range(0, parted_writer.completed_part_count)]
+
+    def _run_in_process(self, batches, parted_writer):
+        _initialize_worker(self._sentence_parser_factory)
+        for batch in batches:
+            for sentence_binding in _create_sentence_bindings(batch):
+                parted_writer.write_sentence(sentence_binding)
+        _finish_worker()
+
+    def _run_with_pool(self, batches, parted_writer):
+        pool = multiprocessing.Pool(self._process_count, _initialize_pool_worker, (self._sentence_parser_factory,))
+        try:
+            # results are written in the order of submission. when there are too many pending batches, wait for the
+            # oldest one before reading more input
+            pending_results = deque()
+            for batch in batches:
+                if len(pending_results) >= self._max_pending_batch_count:
+                    self._write_result(pending_results.popleft(), parted_writer)
+                pending_results.append(pool.apply_async(_create_sentence_bindings, (batch,)))
+
+            while pending_results:
+                self._write_result(pending_results.popleft(), parted_writer)
+
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def _write_result(self, result, parted_writer):
+        for sentence_binding in result.get():
+            parted_writer.write_sentence(sentence_binding)
+
+    def _open_text_file(self, text_file_path):
+        if text_file_path.endswith('.gz'):
+            return gzip.open(text_file_path, 'rb')
+        else:
+            return open(text_file_path, 'rb')
+
+    def _iter_sentence_texts(self, text_file_paths):
+        for text_file_path in text_file_paths:
+            with self._open_text_file(text_file_path) as text_file:
+                for line in codecs.getreader('utf-8')(text_file):
+                    line = line.strip()
+                    if line:
+                        yield line
+
+    def _iter_split_sentences(self, text_file_paths):
+        for text_file_path in text_file_paths:
+            with self._open_text_file(text_file_path) as text_file:
+                for sentence in iter_sentences_of_text(text_file):
+                    yield sentence
+
+    def _skip(self, sentence_inputs, skip_count):
+        for index, sentence_input in enumerate(sentence_inputs):
+            if index >= skip_count:
+                yield sentence_input
@@ -0,0 +1,205 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Reader for the simple parseset text format, which the treebank gold standard is kept in:
+
+    şarklı=(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")(3,"Noun+Zero+A3sg+Pnon+Nom")
+    .=(1,".+Punc")
+    #END#OF#SENTENCE#
+
+Each word is a (surface, parse_result) tuple, where parse_result is the part after "=". Lines starting with "#" other
+than the end of sentence marker are comments.
+
+Gold parse results don't have the suffix forms, thus the parser is needed to create bindings (or ngram items, which are
+extracted from the bindings). SimpleParseSetBindingCreator finds the parse result of the parser which matches the gold
+one.
+"""
+import io
+import re
+from trnltk.morphology.model import formatter
+from trnltk.parseset.creator import ParseSetCreator
+
+END_OF_SENTENCE_MARKER = u'#END#OF#SENTENCE#'
+
+_GROUP_PATTERN = re.compile(r'\(\d+,"(.*?)"\)', re.UNICODE)
+
+# treebank tags which are different in trnltk
+_TREEBANK_REPLACEMENTS = [
+    (u'Prog1', u'Prog'),
+    (u'Prog2', u'Prog'),
+    (u'Inf1', u'Inf'),
+    (u'Inf2', u'Inf'),
+    (u'Inf3', u'Inf'),
+    (u'WithoutHavingDoneSo1', u'WithoutHavingDoneSo'),
+    (u'WithoutHavingDoneSo2', u'WithoutHavingDoneSo'),
+
+    #TODO
+    (u'Hastily', u'Hastily+Pos'),
+
+    (u'Postp+PCNom', u'Part'),
+    (u'Postp+PCDat', u'Postp'),
+    (u'Postp+PCAcc', u'Postp'),
+    (u'Postp+PCLoc', u'Postp'),
+    (u'Postp+PCAbl', u'Postp'),
+    (u'Postp+PCIns', u'Postp'),
+    (u'Postp+PCGen', u'Postp')
+]
+
+def normalize_treebank_parse_result(parse_result):
+    """
+    @return: treebank parse result with the tags trnltk uses
+    @rtype: unicode
+    """
+    for treebank_str, trnltk_str in _TREEBANK_REPLACEMENTS:
+        if treebank_str in parse_result:
+            parse_result = parse_result.replace(treebank_str, trnltk_str)
+    return parse_result
+
+def split_parse_result(parse_result):
+    """
+    @return: inflectional groups, e.g. [u'şark+Noun+A3sg+Pnon+Nom', u'Adj+With'] for (1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")
+    @rtype: list<unicode>
+    """
+    return _GROUP_PATTERN.findall(parse_result)
+
+
+class SimpleParseSetReader(object):
+    """
+    Iterates over the sentences of a simple parseset file. File is read in chunks of CHUNK_SIZE chars, which are split
+    into lines; only the current chunk and sentence are kept in memory.
+
+    The reader can be iterated more than once; the file is read again each time.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, source):
+        """
+        @param source: path of the simple parseset file or a file object which reads unicode
+        """
+        self._source = source
+
+    def __iter__(self):
+        return self.iter_sentences()
+
+    def iter_sentences(self):
+        """
+        @rtype: generator<list<tuple<unicode, unicode>>>
+        """
+        if isinstance(self._source, basestring):
+            with io.open(self._source, mode='r', encoding='utf-8-sig') as source_file:
+                for sentence in self._iter_sentences(source_file):
+                    yield sentence
+        else:
+            for sentence in self._iter_sentences(self._source):
+                yield sentence
+
+    def _iter_sentences(self, source_file):
+        # reading in chunks and splitting them is a lot faster than iterating over the lines of the file
+        sentence = []
+        rest = u''
+        while True:
+            chunk = source_file.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+
+            lines = (rest + chunk).split(u'\n')
+            rest = lines.pop()
+            for line in lines:
+                if not line or line[0] == u'#':
+                    if line.startswith(END_OF_SENTENCE_MARKER):
+                        yield sentence
+                        sentence = []
+                    continue
+
+                sentence.append(self._parse_line(line))
+
+        if rest and rest[0] != u'#':
+            sentence.append(self._parse_line(rest))
+        elif rest.startswith(END_OF_SENTENCE_MARKER):
+            yield sentence
+            sentence = []
+
+        if sentence:
+            yield sentence
+
+    def _parse_line(self, line):
+        # surface can't have "=(", but can be "="
+        separator_index = line.find(u'=(')
+        if separator_index < 0:
+            raise Exception(u'Invalid simple parseset line : ' + line)
+
+        return line[:separator_index], line[separator_index + 1:].rstrip()
+
+    def iter_words(self):
+        """
+        @rtype: generator<tuple<unicode, unicode>>
+        """
+        for sentence in self.iter_sentences():
+            for word in sentence:
+                yield word
+
+
+class SimpleParseSetBindingCreator(object):
+    """
+    Creates bindings of the simple parseset words, using the parse results of the parser which match the gold parse
+    results. Words without a matching parse result become unparsable words.
+    """
+
+    def __init__(self, contextless_parser):
+        """
+        @type contextless_parser: ContextlessMorphologicalParser
+        """
+        self._contextless_parser = contextless_parser
+        self._parseset_creator = ParseSetCreator()
+        # surface -> [(formatted parse result, parse result)]. words like "," and "bir" are very frequent in the sets
+        self._formatted_parse_results = {}
+
+    def find_matching_parse_result(self, surface, parse_result):
+        """
+        @type surface: unicode
+        @param parse_result: gold parse result in simple parseset format
+        @rtype: MorphemeContainer or None
+        """
+        formatted_parse_results = self._formatted_parse_results.get(surface)
+        if formatted_parse_results is None:
+            formatted_parse_results = [(formatter.format_morpheme_container_for_simple_parseset(morpheme_container), morpheme_container)
+                                       for morpheme_container in self._contextless_parser.parse(surface)]
+            self._formatted_parse_results[surface] = formatted_parse_results
+
+        normalized_parse_result = normalize_treebank_parse_result(parse_result)
+        for formatted_parse_result, morpheme_container in formatted_parse_results:
+            if formatted_parse_result == parse_result or formatted_parse_result == normalized_parse_result:
+                return morpheme_container
+
+        return None
+
+    def create_sentence_binding(self, sentence):
+        """
+        @type sentence: list<tuple<unicode, unicode>>
+        @rtype: SentenceBinding
+        """
+        return self._parseset_creator.create_sentence_binding_from_morpheme_containers(
+            [(surface, self.find_matching_parse_result(surface, parse_result)) for surface, parse_result in sentence])
+
+    def iter_sentence_bindings(self, sentences):
+        """
+        @param sentences: e.g. a SimpleParseSetReader
+        @rtype: generator<SentenceBinding>
+        """
+        for sentence in sentences:
+            yield self.create_sentence_binding(sentence)
@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures the memory needed to hold the bundled parsesets as bindings.
+
+Sizes are calculated by walking the object graph with sys.getsizeof, counting each object once. The dict-backed
+estimate is what the same graph would take if the bindings had an instance dict and their strings were not interned.
+"""
+import os
+import sys
+import unittest
+from trnltk.parseset.xmlbindings import Binding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets')
+
+class _DictBacked(object):
+    pass
+
+def _slots(binding):
+    return [slot for cls in type(binding).__mro__ for slot in getattr(cls, '__slots__', ())]
+
+class MemoryUsage(object):
+    def __init__(self):
+        self.binding_count = 0
+        self.string_count = 0
+        self.unique_string_count = 0
+        self.slotted_size = 0
+        self.dict_backed_size = 0
+
+def _measure(sentences):
+    usage = MemoryUsage()
+    seen_ids = set()
+    empty_dict_backed_size = sys.getsizeof(_DictBacked())
+
+    stack = [sentences]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, Binding):
+            slots = _slots(obj)
+            usage.binding_count += 1
+            usage.slotted_size += sys.getsizeof(obj)
+            usage.dict_backed_size += empty_dict_backed_size + sys.getsizeof(dict.fromkeys(slots))
+            stack.extend([getattr(obj, slot) for slot in slots])
+        elif isinstance(obj, list):
+            usage.slotted_size += sys.getsizeof(obj)
+            usage.dict_backed_size += sys.getsizeof(obj)
+            stack.extend(obj)
+        elif isinstance(obj, basestring):
+            usage.string_count += 1
+            # without interning, each occurrence would be a separate object
+            usage.dict_backed_size += sys.getsizeof(obj)
+            if id(obj) not in seen_ids:
+                seen_ids.add(id(obj))
+                usage.unique_string_count += 1
+                usage.slotted_size += sys.getsizeof(obj)
+
+    return usage
+
+class MemoryBenchmark(unittest.TestCase):
+    def test_benchmark_bundled_parsesets(self):
+        file_names = sorted([file_name for file_name in os.listdir(PARSESETS_FOLDER) if file_name.endswith('.xml')])
+        for file_name in file_names:
+            sentences = list(StreamingParseSetReader(os.path.join(PARSESETS_FOLDER, file_name)))
+            usage = _measure(sentences)
+
+            word_count = sum([len(sentence.words) for sentence in sentences])
+            print u'{}: {} sentences, {} words, {} bindings, {} strings ({} unique)'.format(file_name, len(sentences),
+                word_count, usage.binding_count, usage.string_count, usage.unique_string_count)
+            print u'    slotted and interned : {:>10} bytes, {:>6.0f} bytes/word'.format(usage.slotted_size, float(usage.slotted_size) / word_count)
+            print u'    dict-backed estimate : {:>10} bytes, {:>6.0f} bytes/word'.format(usage.dict_backed_size, float(usage.dict_backed_size) / word_count)
+
+            self.assertLess(usage.slotted_size, usage.dict_backed_size)
+
+if __name__ == '__main__':
+    unittest.main()
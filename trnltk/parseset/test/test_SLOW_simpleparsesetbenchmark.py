@@ -0,0 +1,71 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Compares reading the bundled simple parsesets with SimpleParseSetReader to just reading their lines and to reading them
+the way the tests used to, with codecs and splitting each line.
+"""
+import codecs
+import io
+import os
+import time
+import unittest
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+
+SIMPLE_PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../testresources/simpleparsesets')
+
+REPEAT_COUNT = 10
+
+class SimpleParseSetReaderBenchmark(unittest.TestCase):
+    def test_benchmark_bundled_simple_parsesets(self):
+        paths = [os.path.join(SIMPLE_PARSESETS_FOLDER, file_name) for file_name in sorted(os.listdir(SIMPLE_PARSESETS_FOLDER))]
+
+        start = time.time()
+        line_count = 0
+        for i in range(0, REPEAT_COUNT):
+            for path in paths:
+                with io.open(path, mode='r', encoding='utf-8-sig') as f:
+                    for line in f:
+                        line_count += 1
+        line_reading_time = time.time() - start
+
+        start = time.time()
+        for i in range(0, REPEAT_COUNT):
+            for path in paths:
+                with codecs.open(path, mode='r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.startswith('#'):
+                            continue
+                        word = line[:line.find('=')].strip()
+                        parse_result = line[line.find('=') + 1:].strip()
+        line_splitting_time = time.time() - start
+
+        start = time.time()
+        word_count = 0
+        for i in range(0, REPEAT_COUNT):
+            for path in paths:
+                for sentence in SimpleParseSetReader(path):
+                    word_count += len(sentence)
+        reader_time = time.time() - start
+
+        print u'{} lines read in {:.3f} s'.format(line_count, line_reading_time)
+        print u'{} lines read and split with codecs in {:.3f} s'.format(line_count, line_splitting_time)
+        print u'{} words read in {:.3f} s, {:.0f} words/s'.format(word_count, reader_time, word_count / reader_time)
+
+        self.assertLess(reader_time, line_splitting_time)
+
+if __name__ == '__main__':
+    unittest.main()
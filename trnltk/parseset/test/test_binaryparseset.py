@@ -0,0 +1,123 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from hamcrest import *
+from trnltk.parseset.binaryparseset import BinaryParseSetReader, BinaryParseSetWriter, convert_xml_to_binary, _encode_varint, _decode_varint
+from trnltk.parseset.xmlbindings import Binding, SentenceBinding, WordBinding, RootBinding, UnparsableWordBinding, InflectionalSuffixBinding, DerivationalSuffixBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset001.xml')
+
+def _to_comparable(binding):
+    if isinstance(binding, list):
+        return [_to_comparable(item) for item in binding]
+    elif isinstance(binding, Binding):
+        comparable = dict((slot, _to_comparable(getattr(binding, slot))) for cls in type(binding).__mro__ for slot in getattr(cls, '__slots__', ()))
+        comparable['__class__'] = binding.__class__.__name__
+        return comparable
+    else:
+        return binding
+
+class BinaryParseSetTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, 'parseset.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_should_encode_and_decode_varints(self):
+        for value in (0, 1, 127, 128, 255, 300, 16383, 16384, 2 ** 32, 2 ** 40 + 5):
+            out = []
+            _encode_varint(value, out)
+            data = 'x' + ''.join(out)
+            assert_that(_decode_varint(data, 1), equal_to((value, len(data))))
+
+        out = []
+        _encode_varint(127, out)
+        assert_that(len(out), equal_to(1))
+        _encode_varint(128, out)
+        assert_that(len(out), equal_to(3))
+
+    def test_should_convert_xml_and_read_back(self):
+        sentences = list(StreamingParseSetReader(PARSESET_PATH))
+
+        assert_that(convert_xml_to_binary(PARSESET_PATH, self.file_path), equal_to(len(sentences)))
+        assert_that(os.path.getsize(self.file_path), less_than(os.path.getsize(PARSESET_PATH) / 4))
+
+        with BinaryParseSetReader(self.file_path) as reader:
+            assert_that(len(reader), equal_to(len(sentences)))
+            assert_that(_to_comparable(list(reader)), equal_to(_to_comparable(sentences)))
+            assert_that(_to_comparable(list(reader.iter_words())), equal_to(_to_comparable([word for sentence in sentences for word in sentence.words])))
+
+    def test_should_load_sentences_by_index(self):
+        sentences = list(StreamingParseSetReader(PARSESET_PATH))
+        convert_xml_to_binary(PARSESET_PATH, self.file_path)
+
+        with BinaryParseSetReader(self.file_path) as reader:
+            for index in (len(sentences) - 1, 0, 7, 3):
+                assert_that(_to_comparable(reader[index]), equal_to(_to_comparable(sentences[index])))
+
+            assert_that(_to_comparable(reader[-2]), equal_to(_to_comparable(sentences[-2])))
+            self.assertRaises(IndexError, lambda: reader[len(sentences)])
+
+    def test_should_write_sentences(self):
+        first_sentence = SentenceBinding()
+        first_sentence.words.append(UnparsableWordBinding(u'xyz'))
+        root = RootBinding(u'kitap', u'kitap', u'kitap', u'Noun', None)
+        suffixes = [
+            InflectionalSuffixBinding(u'A3Sg_Noun', u'A3sg', u'', u'', u'', u'kitap', u'kitap', u'Noun'),
+            DerivationalSuffixBinding(u'Agt_Noun', u'Agt', u'cI', u'çı', u'çı', u'kitapçı', u'kitapçı', u'Noun')
+        ]
+        first_sentence.words.append(WordBinding(u'kitapçı', u'kitap(kitap)+Noun+A3sg+Noun+Agt', root, u'Noun', None, suffixes))
+        second_sentence = SentenceBinding()
+
+        with BinaryParseSetWriter(self.file_path) as writer:
+            writer.write_sentences([first_sentence, second_sentence])
+
+        with BinaryParseSetReader(self.file_path) as reader:
+            assert_that(len(reader), equal_to(2))
+            words = reader[0].words
+            assert_that(words[0], instance_of(UnparsableWordBinding))
+            assert_that(words[0].str, equal_to(u'xyz'))
+            assert_that(words[1].str, equal_to(u'kitapçı'))
+            assert_that(words[1].secondary_syntactic_category, is_(None))
+            assert_that(words[1].root.secondary_syntactic_category, is_(None))
+            assert_that(words[1].suffixes[0].form, equal_to(u''))
+            assert_that(words[1].root.lemma_root, equal_to(u'kitap'))
+            assert_that(words[1].suffixes[0], instance_of(InflectionalSuffixBinding))
+            assert_that(words[1].suffixes[1], instance_of(DerivationalSuffixBinding))
+            assert_that(words[1].suffixes[1].application, equal_to(u'çı'))
+            assert_that(reader[1].words, equal_to([]))
+
+    def test_should_remove_file_when_writing_fails(self):
+        def write():
+            with BinaryParseSetWriter(self.file_path) as writer:
+                writer.write_sentence(SentenceBinding())
+                raise ValueError()
+
+        self.assertRaises(ValueError, write)
+        assert_that(os.path.exists(self.file_path), equal_to(False))
+
+    def test_should_not_read_other_files(self):
+        self.assertRaises(Exception, lambda: BinaryParseSetReader(PARSESET_PATH))
+
+if __name__ == '__main__':
+    unittest.main()
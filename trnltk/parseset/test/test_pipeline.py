@@ -0,0 +1,163 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import codecs
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from hamcrest import *
+from trnltk.parseset.pipeline import ParseSetGenerationPipeline, ContextlessSentenceParserFactory
+from trnltk.parseset.xmlbindings import UnparsableWordBinding, WordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+class _WhitespaceSentenceParser(object):
+    def __init__(self, failing_word=None, finished_folder=None):
+        self._failing_word = failing_word
+        self._finished_folder = finished_folder
+
+    def parse_sentence(self, text):
+        return self.parse_tokens(text.split())
+
+    def parse_tokens(self, tokens):
+        if self._failing_word in tokens:
+            raise Exception('Failing for ' + self._failing_word)
+        return [(token, None) for token in tokens]
+
+    def finish(self):
+        if self._finished_folder:
+            open(os.path.join(self._finished_folder, str(os.getpid())), 'w').close()
+
+class _WhitespaceSentenceParserFactory(object):
+    # module level and with simple state, so that it can be sent to the workers
+    def __init__(self, failing_word=None, finished_folder=None):
+        self._failing_word = failing_word
+        self._finished_folder = finished_folder
+
+    def __call__(self):
+        return _WhitespaceSentenceParser(self._failing_word, self._finished_folder)
+
+class ParseSetGenerationPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_folder = os.path.join(self.temp_dir, 'output')
+
+        self.text_file_paths = [os.path.join(self.temp_dir, 'text1.txt'), os.path.join(self.temp_dir, 'text2.txt.gz')]
+        self.sentences = [u'cümle{} kelime{} şey{}'.format(i, i, i) for i in range(0, 57)]
+
+        with codecs.open(self.text_file_paths[0], 'w', encoding='utf-8') as f:
+            f.write(u'\n'.join(self.sentences[:30]))
+            f.write(u'\n\n   \n')
+        with gzip.open(self.text_file_paths[1], 'wb') as f:
+            f.write(u'\n'.join(self.sentences[30:]).encode('utf-8'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read_sentences(self, part_paths):
+        return [u' '.join([word.str for word in sentence.words]) for part_path in part_paths for sentence in StreamingParseSetReader(part_path)]
+
+    def test_should_write_sentences_in_order_in_parts(self):
+        for process_count in (0, 3):
+            output_folder = os.path.join(self.temp_dir, 'output{}'.format(process_count))
+            pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), output_folder, process_count=process_count,
+                batch_size=4, sentences_per_part=10, max_pending_batch_count=2)
+
+            part_paths = pipeline.run(self.text_file_paths)
+
+            assert_that(part_paths, has_length(6))
+            assert_that(part_paths[0], ends_with('part00000.xml.gz'))
+            assert_that(len(list(StreamingParseSetReader(part_paths[-1]))), equal_to(7))
+            assert_that(self._read_sentences(part_paths), equal_to(self.sentences))
+            assert_that(sorted(os.listdir(output_folder)), equal_to(sorted([os.path.basename(p) for p in part_paths] + ['checkpoint.json'])))
+
+    def test_should_finish_sentence_parsers(self):
+        for process_count in (0, 3):
+            finished_folder = os.path.join(self.temp_dir, 'finished{}'.format(process_count))
+            os.makedirs(finished_folder)
+            pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(finished_folder=finished_folder),
+                os.path.join(self.temp_dir, 'output{}'.format(process_count)), process_count=process_count, batch_size=4)
+
+            pipeline.run(self.text_file_paths)
+
+            if process_count:
+                assert_that(os.listdir(finished_folder), has_length(process_count))
+            else:
+                assert_that(os.listdir(finished_folder), equal_to([str(os.getpid())]))
+
+    def test_should_continue_from_checkpoint(self):
+        failing_pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(u'kelime35'), self.output_folder,
+            process_count=0, batch_size=4, sentences_per_part=10)
+        self.assertRaises(Exception, failing_pipeline.run, self.text_file_paths)
+
+        # parts before the failing sentence are completed, the rest is in a temp file
+        completed_part_names = sorted([name for name in os.listdir(self.output_folder) if name.startswith('part') and '.tmp' not in name])
+        assert_that(completed_part_names, equal_to(['part00000.xml.gz', 'part00001.xml.gz', 'part00002.xml.gz']))
+
+        pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), self.output_folder, process_count=0,
+            batch_size=4, sentences_per_part=10)
+        part_paths = pipeline.run(self.text_file_paths)
+
+        assert_that(self._read_sentences(part_paths), equal_to(self.sentences))
+
+        # already finished, nothing is parsed again
+        pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(u'kelime0'), self.output_folder, process_count=0,
+            batch_size=4, sentences_per_part=10)
+        assert_that(pipeline.run(self.text_file_paths), equal_to(part_paths))
+
+    def test_should_not_continue_with_different_part_size(self):
+        ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), self.output_folder, process_count=0, sentences_per_part=10).run(self.text_file_paths)
+
+        pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), self.output_folder, process_count=0, sentences_per_part=20)
+        self.assertRaises(Exception, pipeline.run, self.text_file_paths)
+
+    def test_should_split_sentences(self):
+        with codecs.open(self.text_file_paths[0], 'w', encoding='utf-8') as f:
+            f.write(u'Dr. Ali geldi. "Gel. Otur." dedi\nve oturdu.\n\nYüzde 10. Bitti')
+
+        for process_count in (0, 2):
+            output_folder = os.path.join(self.temp_dir, 'output{}'.format(process_count))
+            pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), output_folder, process_count=process_count,
+                batch_size=2, sentences_per_part=3, split_sentences=True)
+            part_paths = pipeline.run(self.text_file_paths)
+
+            assert_that(self._read_sentences(part_paths)[:4], equal_to([u'Dr . Ali geldi .', u'"Gel . Otur ." dedi ve oturdu .', u'Yüzde 10 .', u'Bitti']))
+            # no sentence ends in the second file, so it is a single sentence
+            assert_that(self._read_sentences(part_paths)[4:], equal_to([u' '.join(self.sentences[30:])]))
+
+        pipeline = ParseSetGenerationPipeline(_WhitespaceSentenceParserFactory(), output_folder, process_count=0, sentences_per_part=3)
+        self.assertRaises(Exception, pipeline.run, self.text_file_paths)
+
+    def test_should_parse_with_contextless_parser(self):
+        with codecs.open(self.text_file_paths[0], 'w', encoding='utf-8') as f:
+            f.write(u'Ali kitabı okudu.\nqxwz 3 elma\n')
+
+        pipeline = ParseSetGenerationPipeline(ContextlessSentenceParserFactory(), self.output_folder, process_count=0, compress=False)
+        part_paths = pipeline.run(self.text_file_paths[:1])
+
+        assert_that(part_paths, has_length(1))
+        sentences = list(StreamingParseSetReader(part_paths[0]))
+        assert_that([[word.str for word in sentence.words] for sentence in sentences], equal_to([[u'Ali', u'kitabı', u'okudu', u'.'], [u'qxwz', u'3', u'elma']]))
+
+        assert_that(sentences[0].words[1], instance_of(WordBinding))
+        assert_that(sentences[0].words[1].root.lemma_root, equal_to(u'kitap'))
+        assert_that(sentences[0].words[2].root.lemma_root, equal_to(u'oku'))
+        assert_that(sentences[1].words[0], instance_of(UnparsableWordBinding))
+        assert_that(sentences[1].words[1].root.syntactic_category, equal_to(u'Num'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import itertools
+import os
+import unittest
+from StringIO import StringIO
+from hamcrest import *
+from trnltk.morphology.contextless.parser.parser import UpperCaseSupportingContextlessMorphologicalParser
+from trnltk.morphology.contextless.parser.rootfinder import WordRootFinder, DigitNumeralRootFinder, TextNumeralRootFinder, ProperNounFromApostropheRootFinder, ProperNounWithoutApostropheRootFinder
+from trnltk.morphology.lexicon.lexiconloader import LexiconLoader
+from trnltk.morphology.lexicon.rootgenerator import RootGenerator, RootMapGenerator
+from trnltk.morphology.morphotactics.basicsuffixgraph import BasicSuffixGraph
+from trnltk.morphology.morphotactics.copulasuffixgraph import CopulaSuffixGraph
+from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
+from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
+from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
+from trnltk.ngrams.ngramgenerator import WordNGramGenerator
+from trnltk.parseset.simpleparseset import SimpleParseSetReader, SimpleParseSetBindingCreator, split_parse_result, normalize_treebank_parse_result
+from trnltk.parseset.xmlbindings import UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+
+SIMPLE_PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/simpleparsesets/simpleparseset001.txt')
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset001.xml')
+
+SIMPLE_PARSESET = u'''Hayır=(1,"hayır+Adv")
+şarklı=(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")(3,"Noun+Zero+A3sg+Pnon+Nom")
+#END#OF#SENTENCE#
+# some comment
+
+==(1,"=+Punc")
+gelerek=(1,"gel+Verb+Pos")(2,"Adv+ByDoingSo")
+#END#OF#SENTENCE#
+kitap=(1,"kitap+Noun+A3sg+Pnon+Nom")
+'''
+
+class SimpleParseSetReaderTest(unittest.TestCase):
+    def test_should_read_sentences(self):
+        sentences = list(SimpleParseSetReader(StringIO(SIMPLE_PARSESET)))
+
+        assert_that(sentences, equal_to([
+            [(u'Hayır', u'(1,"hayır+Adv")'), (u'şarklı', u'(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")(3,"Noun+Zero+A3sg+Pnon+Nom")')],
+            [(u'=', u'(1,"=+Punc")'), (u'gelerek', u'(1,"gel+Verb+Pos")(2,"Adv+ByDoingSo")')],
+            [(u'kitap', u'(1,"kitap+Noun+A3sg+Pnon+Nom")')]
+        ]))
+
+    def test_should_read_words(self):
+        words = list(SimpleParseSetReader(StringIO(SIMPLE_PARSESET)).iter_words())
+        assert_that([surface for surface, parse_result in words], equal_to([u'Hayır', u'şarklı', u'=', u'gelerek', u'kitap']))
+
+    def test_should_not_read_invalid_lines(self):
+        self.assertRaises(Exception, list, SimpleParseSetReader(StringIO(u'kitap+Noun\n')))
+
+    def test_should_read_same_sentences_with_the_parseset(self):
+        simple_sentences = list(SimpleParseSetReader(SIMPLE_PARSESET_PATH))
+        sentences = list(StreamingParseSetReader(PARSESET_PATH))
+
+        assert_that(len(simple_sentences), equal_to(len(sentences)))
+        assert_that([[surface for surface, parse_result in simple_sentence] for simple_sentence in simple_sentences],
+            equal_to([[word.str for word in sentence.words] for sentence in sentences]))
+
+    def test_should_split_parse_result(self):
+        assert_that(split_parse_result(u'(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")(3,"Noun+Zero+A3sg+Pnon+Nom")'),
+            equal_to([u'şark+Noun+A3sg+Pnon+Nom', u'Adj+With', u'Noun+Zero+A3sg+Pnon+Nom']))
+        assert_that(split_parse_result(u'(1,".+Punc")'), equal_to([u'.+Punc']))
+
+    def test_should_normalize_treebank_parse_result(self):
+        assert_that(normalize_treebank_parse_result(u'(1,"gel+Verb+Pos")(2,"Noun+Inf2+A3sg+Pnon+Nom")'), equal_to(u'(1,"gel+Verb+Pos")(2,"Noun+Inf+A3sg+Pnon+Nom")'))
+        assert_that(normalize_treebank_parse_result(u'(1,"gibi+Postp+PCNom")'), equal_to(u'(1,"gibi+Part")'))
+
+
+class SimpleParseSetBindingCreatorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        all_roots = []
+
+        lexemes = LexiconLoader.load_from_file(os.path.join(os.path.dirname(__file__), '../../resources/master_dictionary.txt'))
+        for di in lexemes:
+            all_roots.extend(RootGenerator.generate(di))
+
+        root_map = (RootMapGenerator()).generate(all_roots)
+
+        suffix_graph = CopulaSuffixGraph(NumeralSuffixGraph(ProperNounSuffixGraph(BasicSuffixGraph())))
+        suffix_graph.initialize()
+
+        predefined_paths = PredefinedPaths(root_map, suffix_graph)
+        predefined_paths.create_predefined_paths()
+
+        cls.parser = UpperCaseSupportingContextlessMorphologicalParser(suffix_graph, predefined_paths,
+            [WordRootFinder(root_map), DigitNumeralRootFinder(), TextNumeralRootFinder(root_map),
+             ProperNounFromApostropheRootFinder(), ProperNounWithoutApostropheRootFinder()])
+
+    def setUp(self):
+        self.binding_creator = SimpleParseSetBindingCreator(self.parser)
+
+    def test_should_create_bindings_matching_gold_parse_results(self):
+        sentence_binding = self.binding_creator.create_sentence_binding([
+            (u'şarklı', u'(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")(3,"Noun+Zero+A3sg+Pnon+Nom")'),
+            (u'şarklı', u'(1,"şark+Noun+A3sg+Pnon+Nom")(2,"Adj+With")'),
+            (u'kitap', u'(1,"kitap+Noun+A3pl+Pnon+Nom")')
+        ])
+
+        assert_that(sentence_binding.words[0].parse_result, equal_to(u'şark+Noun+A3sg+Pnon+Nom+Adj+With+Noun+Zero+A3sg+Pnon+Nom'))
+        assert_that(sentence_binding.words[1].parse_result, equal_to(u'şark+Noun+A3sg+Pnon+Nom+Adj+With'))
+        assert_that(sentence_binding.words[2], instance_of(UnparsableWordBinding))
+
+    def test_should_create_same_bindings_and_ngrams_with_the_parseset(self):
+        # parseset001.xml is created from simpleparseset001.txt
+        sentence_bindings = list(itertools.islice(self.binding_creator.iter_sentence_bindings(SimpleParseSetReader(SIMPLE_PARSESET_PATH)), 20))
+        parseset_sentences = list(itertools.islice(StreamingParseSetReader(PARSESET_PATH), 20))
+
+        assert_that([[word.parse_result if not isinstance(word, UnparsableWordBinding) else None for word in sentence.words] for sentence in sentence_bindings],
+            equal_to([[word.parse_result if not isinstance(word, UnparsableWordBinding) else None for word in sentence.words] for sentence in parseset_sentences]))
+
+        generator = WordNGramGenerator(2)
+        assert_that(list(generator.iter_ngrams_of_sentences(sentence_bindings)), equal_to(list(generator.iter_ngrams_of_sentences(parseset_sentences))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+from xml.dom.minidom import parse, parseString
+from hamcrest import *
+from trnltk.morphology.model.lexeme import SyntacticCategory
+from trnltk.ngrams.ngramgenerator import WordNGramGenerator
+from trnltk.parseset.xmlbindings import _interned_strings, Binding, NAMESPACE, ParseSetBinding, UnparsableWordBinding, DerivationalSuffixBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader, StreamingParseSetWriter
+from trnltk.statistics.suffixtransitionstats import SuffixTransitionProbabilityGenerator
+from trnltk.treebank.explorer import build_concordance_indexes, CompleteWordConcordanceIndex, RootConcordanceIndex, TransitionWordConcordanceIndex
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset001.xml')
+SAMPLE_PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../treebank/test/concordance_sample_parseset.xml')
+
+def _to_comparable(binding):
+    if isinstance(binding, list):
+        return [_to_comparable(item) for item in binding]
+    elif isinstance(binding, Binding):
+        comparable = dict((slot, _to_comparable(getattr(binding, slot))) for cls in type(binding).__mro__ for slot in getattr(cls, '__slots__', ()))
+        comparable['__class__'] = binding.__class__.__name__
+        return comparable
+    else:
+        return binding
+
+class StreamingParseSetReaderTest(unittest.TestCase):
+    def _read_with_dom(self, path):
+        dom = parse(path)
+        return ParseSetBinding.build(dom.getElementsByTagName("parseset")[0]).sentences
+
+    def test_should_read_same_with_dom(self):
+        for path in (PARSESET_PATH, SAMPLE_PARSESET_PATH):
+            dom_sentences = self._read_with_dom(path)
+            streamed_sentences = list(StreamingParseSetReader(path))
+
+            assert_that(len(streamed_sentences), equal_to(len(dom_sentences)))
+            assert_that(_to_comparable(streamed_sentences), equal_to(_to_comparable(dom_sentences)))
+
+    def test_should_read_values_as_unicode(self):
+        sentence = next(iter(StreamingParseSetReader(SAMPLE_PARSESET_PATH)))
+        word = sentence.words[0]
+
+        assert_that(word.str, equal_to(u'o'))
+        assert_that(word.str, instance_of(unicode))
+        assert_that(word.root.secondary_syntactic_category, equal_to(u'Pers'))
+        assert_that(word.suffixes[0].to_syntactic_category, equal_to(u'Pron'))
+
+    def test_should_not_intern_surfaces(self):
+        for sentence in StreamingParseSetReader(PARSESET_PATH):
+            for word in sentence.words:
+                if not isinstance(word, UnparsableWordBinding):
+                    assert_that(_interned_strings, is_not(has_key(word.parse_result)))
+
+    def test_should_read_from_file_object(self):
+        xml = u'''<?xml version="1.0"?>
+        <parseset xmlns="http://trnltk.org/parseset">
+            <sentence>
+                <unparsable_word str="xyz"/>
+                <word str="kitapçı" parse_result="kitap(kitap)+Noun+A3sg+Pnon+Nom+Noun+Agt" syntactic_category="Noun">
+                    <root str="kitap" lemma="kitap" lemma_root="kitap" syntactic_category="Noun"/>
+                    <suffixes>
+                        <inflectionalSuffix id="A3Sg_Noun" name="A3sg" form="" application="" actual="" word="kitap" matched_word="kitap" to_syntactic_category="Noun"/>
+                        <derivationalSuffix id="Agt_Noun" name="Agt" form="cI" application="çı" actual="çı" word="kitapçı" matched_word="kitapçı" to_syntactic_category="Noun"/>
+                    </suffixes>
+                </word>
+            </sentence>
+            <sentence>
+                <unparsable_word str="abc"/>
+            </sentence>
+        </parseset>'''
+
+        sentences = list(StreamingParseSetReader(StringIO(xml.encode('utf-8'))))
+
+        assert_that(len(sentences), equal_to(2))
+        assert_that(sentences[0].words[0], instance_of(UnparsableWordBinding))
+        assert_that(sentences[0].words[1].str, equal_to(u'kitapçı'))
+        assert_that(sentences[0].words[1].secondary_syntactic_category, equal_to(u''))
+        assert_that(sentences[0].words[1].suffixes[1], instance_of(DerivationalSuffixBinding))
+        assert_that(sentences[0].words[1].suffixes[1].application, equal_to(u'çı'))
+        assert_that(sentences[1].words[0].str, equal_to(u'abc'))
+
+    def test_consumers_should_accept_streamed_words(self):
+        dom_words = [word for sentence in self._read_with_dom(PARSESET_PATH) for word in sentence.words]
+        reader = StreamingParseSetReader(PARSESET_PATH)
+
+        generator = WordNGramGenerator(2)
+        assert_that(list(generator.iter_ngrams_of_sentences(reader)), equal_to(generator.get_ngrams(dom_words)))
+
+        streamed_stats = SuffixTransitionProbabilityGenerator(reader.iter_words())
+        dom_stats = SuffixTransitionProbabilityGenerator(dom_words)
+        assert_that(streamed_stats.suffix_transition_probability_matrix, equal_to(dom_stats.suffix_transition_probability_matrix))
+
+        complete_word_index, root_index, transition_word_index = build_concordance_indexes(reader.iter_words(),
+            [CompleteWordConcordanceIndex, RootConcordanceIndex, TransitionWordConcordanceIndex])
+
+        assert_that(complete_word_index.offsets(u'bir'), equal_to(CompleteWordConcordanceIndex(dom_words).offsets(u'bir')))
+        assert_that(complete_word_index.offsets(u'bir'), is_not(empty()))
+        assert_that(root_index.offsets(u'ol', SyntacticCategory.VERB), equal_to(RootConcordanceIndex(dom_words).offsets(u'ol', SyntacticCategory.VERB)))
+        assert_that(transition_word_index.offsets(u'ol'), equal_to(TransitionWordConcordanceIndex(dom_words).offsets(u'ol')))
+
+
+class StreamingParseSetWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.sentences = list(StreamingParseSetReader(PARSESET_PATH))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_should_write_same_with_dom(self):
+        output = StringIO()
+        with StreamingParseSetWriter(output) as writer:
+            writer.write_sentences(self.sentences)
+
+        assert_that(writer.sentence_count, equal_to(len(self.sentences)))
+
+        parseset_binding = ParseSetBinding()
+        parseset_binding.sentences = self.sentences
+        parseset_dom = parseset_binding.to_dom()
+        parseset_dom.setAttribute("xmlns", NAMESPACE)
+
+        written = output.getvalue().decode('utf-8')
+        assert_that(written.startswith(u'<?xml version="1.0" encoding="utf-8"?>\n<parseset xmlns="http://trnltk.org/parseset">\n'))
+        written_body = written[written.index(u'\n') + 1:]
+        assert_that(written_body, equal_to(parseset_dom.toprettyxml(indent='\t')))
+
+    def test_should_write_and_read_back(self):
+        for file_name in ('parseset.xml', 'parseset.xml.gz'):
+            file_path = os.path.join(self.temp_dir, file_name)
+            with StreamingParseSetWriter(file_path, header=u'<!-- some header -->') as writer:
+                for sentence in self.sentences:
+                    writer.write_sentence(sentence)
+
+            assert_that(_to_comparable(list(StreamingParseSetReader(file_path))), equal_to(_to_comparable(self.sentences)))
+            assert_that(_to_comparable(self._read_with_dom(file_path)), equal_to(_to_comparable(self.sentences)))
+
+    def test_should_write_gzip(self):
+        file_path = os.path.join(self.temp_dir, 'parseset.xml.gz')
+        with StreamingParseSetWriter(file_path) as writer:
+            writer.write_sentences(self.sentences[:2])
+
+        with gzip.open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+
+        assert_that(content.count(u'<sentence>'), equal_to(2))
+        assert_that(content.rstrip().endswith(u'</parseset>'))
+
+    def test_should_remove_file_when_writing_fails(self):
+        def write(destination):
+            with StreamingParseSetWriter(destination) as writer:
+                writer.write_sentences(self.sentences[:2])
+                raise ValueError()
+
+        for file_name in ('parseset.xml', 'parseset.xml.gz'):
+            file_path = os.path.join(self.temp_dir, file_name)
+            self.assertRaises(ValueError, lambda: write(file_path))
+            assert_that(os.path.exists(file_path), equal_to(False))
+
+        output = StringIO()
+        self.assertRaises(ValueError, lambda: write(output))
+        assert_that(output.closed, equal_to(False))
+        assert_that(output.getvalue().decode('utf-8'), is_not(contains_string(u'</parseset>')))
+
+    def _read_with_dom(self, file_path):
+        if file_path.endswith('.gz'):
+            with gzip.open(file_path, 'rb') as f:
+                dom = parseString(f.read())
+        else:
+            dom = parse(file_path)
+        return ParseSetBinding.build(dom.getElementsByTagName("parseset")[0]).sentences
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,24 @@ from xml.dom.minidom import Element, Text
 
 NAMESPACE = "http://trnltk.org/parseset"
 
+_interned_strings = {}
+
+def intern_string(value):
+    """
+    Returns the canonical instance of the given string, so that same values share a single object. Unlike the builtin
+    intern, works with unicode strings too.
+
+    Interned strings are never released, thus only values from a small set like suffix names, forms and syntactic
+    categories should be interned. Surfaces, lemmas and parse results are not.
+    """
+    if value is None:
+        return None
+    return _interned_strings.setdefault(value, value)
+
 class Binding(object):
+    # bindings have __slots__, since a treebank has millions of them in memory
+    __slots__ = ()
+
     @classmethod
     def build(cls, node):
         raise NotImplementedError()
@@ -26,6 +43,8 @@ class Binding(object):
         raise NotImplementedError()
 
 class ParseSetBinding(Binding):
+    __slots__ = ('sentences',)
+
     def __init__(self):
         self.sentences = []
 
@@ -45,6 +64,8 @@ class ParseSetBinding(Binding):
         return parseset_node
 
 class SentenceBinding (Binding):
+    __slots__ = ('words',)
+
     def __init__(self):
         self.words = []
 
@@ -72,12 +93,14 @@ class SentenceBinding (Binding):
         return sentence_node
 
 class WordBinding (Binding):
+    __slots__ = ('str', 'parse_result', 'root', 'syntactic_category', 'secondary_syntactic_category', 'suffixes')
+
     def __init__(self, str, parse_result, root, syntactic_category, secondary_syntactic_category=None, suffixes=None):
         self.str = str
         self.parse_result = parse_result
         self.root = root
-        self.syntactic_category = syntactic_category
-        self.secondary_syntactic_category = secondary_syntactic_category
+        self.syntactic_category = intern_string(syntactic_category)
+        self.secondary_syntactic_category = intern_string(secondary_syntactic_category)
         self.suffixes = suffixes or []
 
     @classmethod
@@ -128,15 +151,17 @@ class WordBinding (Binding):
 
 
 class SuffixBinding (Binding):
+    __slots__ = ('id', 'name', 'form', 'application', 'actual', 'word', 'matched_word', 'to_syntactic_category')
+
     def __init__(self, id, name, form, application, actual, word, matched_word, to_syntactic_category):
         self.id = id
-        self.name = name
-        self.form = form
-        self.application = application
-        self.actual = actual
+        self.name = intern_string(name)
+        self.form = intern_string(form)
+        self.application = intern_string(application)
+        self.actual = intern_string(actual)
         self.word = word
         self.matched_word = matched_word
-        self.to_syntactic_category = to_syntactic_category
+        self.to_syntactic_category = intern_string(to_syntactic_category)
 
     @classmethod
     def build(cls, node):
@@ -165,6 +190,8 @@ class SuffixBinding (Binding):
 
 
 class InflectionalSuffixBinding(SuffixBinding):
+    __slots__ = ()
+
     def __init__(self, id, name, form, application, actual, word, matched_word, to_syntactic_category):
         super(InflectionalSuffixBinding, self).__init__(id, name, form, application, actual, word, matched_word, to_syntactic_category)
 
@@ -179,6 +206,8 @@ class InflectionalSuffixBinding(SuffixBinding):
         return node
 
 class DerivationalSuffixBinding(SuffixBinding):
+    __slots__ = ()
+
     def __init__(self, id, name, form, application, actual, word, matched_word, to_syntactic_category):
         super(DerivationalSuffixBinding, self).__init__(id, name, form, application, actual, word, matched_word, to_syntactic_category)
 
@@ -194,6 +223,8 @@ class DerivationalSuffixBinding(SuffixBinding):
 
 
 class UnparsableWordBinding(Binding):
+    __slots__ = ('str',)
+
     def __init__(self, str):
         self.str = str
 
@@ -208,12 +239,14 @@ class UnparsableWordBinding(Binding):
         return unparsable_word_node
 
 class RootBinding (Binding):
+    __slots__ = ('str', 'lemma', 'lemma_root', 'syntactic_category', 'secondary_syntactic_category')
+
     def __init__(self, root, lemma, lemma_root, syntactic_category, secondary_syntactic_category=None):
         self.str = root
         self.lemma = lemma
         self.lemma_root = lemma_root
-        self.syntactic_category = syntactic_category
-        self.secondary_syntactic_category = secondary_syntactic_category
+        self.syntactic_category = intern_string(syntactic_category)
+        self.secondary_syntactic_category = intern_string(secondary_syntactic_category)
 
     @classmethod
     def build(cls, node):
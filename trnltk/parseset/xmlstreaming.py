@@ -0,0 +1,251 @@
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Streaming access to parseset XML files.
+
+ParseSetBinding.build needs the DOM of the whole parseset in memory. StreamingParseSetReader parses the file
+incrementally and yields a SentenceBinding as soon as its sentence element is closed; the element is discarded right
+after, so memory usage depends on the size of a sentence, not on the size of the parseset.
+
+Similarly, StreamingParseSetWriter writes the sentences one by one, instead of building the DOM of the whole parseset
+with ParseSetBinding.to_dom.
+
+Files with names ending with ".gz" are read and written gzip compressed.
+"""
+import codecs
+import gzip
+import os
+from xml.etree import cElementTree
+from trnltk.parseset.xmlbindings import NAMESPACE, SentenceBinding, WordBinding, UnparsableWordBinding, RootBinding, InflectionalSuffixBinding, DerivationalSuffixBinding
+
+def _local_name(tag):
+    # tags are like "{http://trnltk.org/parseset}sentence"
+    return tag[tag.index('}') + 1:] if tag[0] == '{' else tag
+
+def _attribute(element, name):
+    # same with minidom's getAttribute: empty string for missing attributes, always unicode
+    return unicode(element.get(name, u''))
+
+def _is_gzip_path(source):
+    return isinstance(source, basestring) and source.endswith('.gz')
+
+class StreamingParseSetReader(object):
+    """
+    Iterates over the sentences of a parseset XML file, building a SentenceBinding for each.
+
+    The reader can be iterated more than once; the file is parsed again each time.
+    """
+
+    def __init__(self, source):
+        """
+        @param source: path of the parseset file or a file object
+        """
+        self._source = source
+
+    def __iter__(self):
+        return self.iter_sentences()
+
+    def iter_sentences(self):
+        """
+        @rtype: generator<SentenceBinding>
+        """
+        if _is_gzip_path(self._source):
+            with gzip.open(self._source, 'rb') as source_file:
+                for sentence_binding in self._iter_sentences(source_file):
+                    yield sentence_binding
+        else:
+            for sentence_binding in self._iter_sentences(self._source):
+                yield sentence_binding
+
+    def _iter_sentences(self, source):
+        events = cElementTree.iterparse(source, events=('start', 'end'))
+        root = None
+        for event, element in events:
+            if event == 'start':
+                if root is None:
+                    root = element
+                continue
+
+            if _local_name(element.tag) == 'sentence':
+                yield self._build_sentence(element)
+                # free the sentence and also the reference from the root, which is kept by iterparse
+                element.clear()
+                root.clear()
+
+    def iter_words(self):
+        """
+        @rtype: generator<WordBinding or UnparsableWordBinding>
+        """
+        return iter_words(self.iter_sentences())
+
+    def _build_sentence(self, element):
+        binding = SentenceBinding()
+        for child_element in element:
+            tag = _local_name(child_element.tag)
+            if tag == 'word':
+                binding.words.append(self._build_word(child_element))
+            elif tag == 'unparsable_word':
+                binding.words.append(UnparsableWordBinding(_attribute(child_element, 'str')))
+            else:
+                raise Exception("Unknown tag type : " + tag)
+
+        return binding
+
+    def _build_word(self, element):
+        root = None
+        suffixes = []
+        for child_element in element:
+            tag = _local_name(child_element.tag)
+            if tag == 'root':
+                root = self._build_root(child_element)
+            elif tag == 'suffixes':
+                for suffix_element in child_element:
+                    suffixes.append(self._build_suffix(suffix_element))
+
+        return WordBinding(_attribute(element, 'str'), _attribute(element, 'parse_result'), root,
+            _attribute(element, 'syntactic_category'), _attribute(element, 'secondary_syntactic_category'), suffixes)
+
+    def _build_root(self, element):
+        return RootBinding(_attribute(element, 'str'), _attribute(element, 'lemma'), _attribute(element, 'lemma_root'),
+            _attribute(element, 'syntactic_category'), _attribute(element, 'secondary_syntactic_category'))
+
+    def _build_suffix(self, element):
+        tag = _local_name(element.tag)
+        if tag == 'inflectionalSuffix':
+            suffix_binding_class = InflectionalSuffixBinding
+        elif tag == 'derivationalSuffix':
+            suffix_binding_class = DerivationalSuffixBinding
+        else:
+            raise Exception("Unknown suffix type : " + tag)
+
+        return suffix_binding_class(_attribute(element, 'id'), _attribute(element, 'name'), _attribute(element, 'form'),
+            _attribute(element, 'application'), _attribute(element, 'actual'), _attribute(element, 'word'),
+            _attribute(element, 'matched_word'), _attribute(element, 'to_syntactic_category'))
+
+
+class StreamingParseSetWriter(object):
+    """
+    Writes sentences to a parseset XML file as they are produced. Only the DOM of the sentence being written is kept in
+    memory. Output is same with ParseSetBinding.to_dom().toprettyxml(), thus valid against parseset.xsd as long as there
+    is at least one sentence.
+
+    Usage:
+        with StreamingParseSetWriter(path) as writer:
+            for sentence_binding in sentence_bindings:
+                writer.write_sentence(sentence_binding)
+    """
+
+    def __init__(self, destination, header=None):
+        """
+        @param destination: path of the parseset file or a file object opened in binary mode
+        @param header: written between the XML declaration and the parseset element, e.g. a license comment
+        """
+        self._destination = destination
+        self._header = header
+
+        self._file = None
+        self._writer = None
+        self._owns_file = False
+
+        self.sentence_count = 0
+
+    def open(self):
+        assert self._writer is None, "Writer is already open"
+
+        if _is_gzip_path(self._destination):
+            self._file = gzip.open(self._destination, 'wb')
+            self._owns_file = True
+        elif isinstance(self._destination, basestring):
+            self._file = open(self._destination, 'wb')
+            self._owns_file = True
+        else:
+            self._file = self._destination
+            self._owns_file = False
+
+        self._writer = codecs.getwriter('utf-8')(self._file)
+        self._writer.write(u'<?xml version="1.0" encoding="utf-8"?>\n')
+        if self._header:
+            self._writer.write(self._header)
+            self._writer.write(u'\n')
+        self._writer.write(u'<parseset xmlns="{}">\n'.format(NAMESPACE))
+
+        return self
+
+    def write_sentence(self, sentence_binding):
+        """
+        @type sentence_binding: SentenceBinding
+        """
+        assert self._writer is not None, "Writer is not open"
+
+        sentence_binding.to_dom().writexml(self._writer, indent=u'\t', addindent=u'\t', newl=u'\n')
+        self.sentence_count += 1
+
+    def write_sentences(self, sentence_bindings):
+        """
+        @type sentence_bindings: iterable<SentenceBinding>
+        """
+        for sentence_binding in sentence_bindings:
+            self.write_sentence(sentence_binding)
+
+    def close(self):
+        if self._writer is None:
+            return
+
+        self._writer.write(u'</parseset>\n')
+        self._writer.flush()
+        if self._owns_file:
+            self._file.close()
+
+        self._writer = None
+        self._file = None
+
+    def abort(self):
+        """
+        Closes and removes the partially written file, so that it is not taken for a complete parseset. A file object
+        given as the destination is left open as it is.
+        """
+        if self._writer is None:
+            return
+
+        if self._owns_file:
+            self._file.close()
+            os.remove(self._destination)
+
+        self._writer = None
+        self._file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # closing the parseset element would make the partial file look complete
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_words(sentence_bindings):
+    """
+    Flattens the sentences into a stream of words, which is what ngram generators, concordance indexes and statistics
+    generators consume.
+
+    @type sentence_bindings: iterable<SentenceBinding>
+    @rtype: generator<WordBinding or UnparsableWordBinding>
+    """
+    for sentence_binding in sentence_bindings:
+        for word_binding in sentence_binding.words:
+            yield word_binding
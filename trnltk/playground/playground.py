@@ -25,6 +25,8 @@ from trnltk.morphology.morphotactics.copulasuffixgraph import CopulaSuffixGraph
 from trnltk.morphology.morphotactics.numeralsuffixgraph import NumeralSuffixGraph
 from trnltk.morphology.morphotactics.predefinedpaths import PredefinedPaths
 from trnltk.morphology.morphotactics.propernounsuffixgraph import ProperNounSuffixGraph
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.service import load_concordance_indexes
 
 
 contextless_parser = None
@@ -75,25 +77,63 @@ def parse_contextless(word_str, *syntactic_categories):
             else:
                 print formatted_output
 
+DEFAULT_CONCORDANCE_PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../testresources/parsesets/parseset004.xml')
+
+concordance_word_list = None
+concordance_indexes = None
+
+def initialize_concordance(parseset_path=DEFAULT_CONCORDANCE_PARSESET_PATH, index_folder_path=None):
+    """
+    @param index_folder_path: folder to keep the built indexes. if indexes are there, they are loaded instead of
+        being built
+    """
+    global concordance_word_list, concordance_indexes
+    concordance_word_list = list(StreamingParseSetReader(parseset_path).iter_words())
+    concordance_indexes = load_concordance_indexes(concordance_word_list, index_folder_path)
+
+def _to_unicode(s):
+    if not isinstance(s, unicode) and isinstance(s, str):
+        return s.decode('utf-8')
+    return s
+
+def _concordance(index_name, query, *args):
+    if concordance_indexes is None:
+        initialize_concordance()
+
+    offsets = getattr(concordance_indexes[index_name], query)(*args)
+    print_concordance(concordance_word_list, offsets)
+
 # yapacagimi, yapacagimi -> true
 def concordance_full_word(full_word, syntactic_category=None, secondary_syntactic_category=None):
-    pass
+    _concordance('full_word', 'offsets', _to_unicode(full_word), syntactic_category, secondary_syntactic_category)
 
 # kitabimi, kitab -> true
 def concordance_root(root, syntactic_category=None, secondary_syntactic_category=None):
-    pass
+    _concordance('root', 'offsets', _to_unicode(root), syntactic_category, secondary_syntactic_category)
 
 # kitabimi, kitap -> true
 def concordance_lemma(lemma, syntactic_category=None, secondary_syntactic_category=None):
-    pass
+    _concordance('lemma', 'offsets', _to_unicode(lemma), syntactic_category, secondary_syntactic_category)
 
 # yapacagimi, yapacak -> true
 def concordance_transition_word(transition_word, syntactic_category=None, secondary_syntactic_category=None):
-    pass
+    _concordance('transition_word', 'offsets', _to_unicode(transition_word), syntactic_category, secondary_syntactic_category)
 
 # yapacagimi, yapacag => true
 def concordance_transition_matched_word(transition_matched_word, syntactic_category=None, secondary_syntactic_category=None):
-    pass
+    _concordance('transition_matched_word', 'offsets', _to_unicode(transition_matched_word), syntactic_category, secondary_syntactic_category)
+
+# yapacagimi, yapaca -> true
+def concordance_prefix(prefix, syntactic_category=None, secondary_syntactic_category=None):
+    _concordance('full_word', 'prefix_offsets', _to_unicode(prefix), syntactic_category, secondary_syntactic_category)
+
+# yapacagimi, acag -> true
+def concordance_substring(substring, syntactic_category=None, secondary_syntactic_category=None):
+    _concordance('full_word', 'substring_offsets', _to_unicode(substring), syntactic_category, secondary_syntactic_category)
+
+# "bir kitap" -> true
+def concordance_phrase(*word_strs):
+    _concordance('full_word', 'phrase_offsets', [_to_unicode(word_str) for word_str in word_strs])
 
 
 
@@ -23,6 +23,9 @@ class SuffixTransitionProbabilityGenerator(object):
     """
 
     def __init__(self, word_bindings):
+        """
+        @param word_bindings: any iterable of word bindings, e.g. StreamingParseSetReader.iter_words()
+        """
         self.suffix_transition_count_matrix = defaultdict(lambda: defaultdict(int))
         self.suffix_transition_probability_matrix = defaultdict(lambda: defaultdict(float))
         self.first_suffix_transition_count_matrix = defaultdict(lambda: defaultdict(float))
@@ -0,0 +1,186 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Splits a stream of tokens into sentences.
+
+A sentence ends with a punctuation token containing ".", "!" or "?", like ".", "...", "?!" or '."'; except:
+    1. Dot after an abbreviation or an initial : "Dr. Ali", "M. Kemal"
+    2. Next token starts with a lowercase letter : '"Geliyorum." dedi', "vb. şeyler"
+    3. Inside quoted speech : '"Gel. Otur." dedi.' A quote which isn't closed in max_quoted_length tokens is ignored
+A number with a dot, like "10." or "5.30.", is an ordinal unless it is at the end of the text or the next token starts with an
+uppercase letter; then the dot is split from the number as the end of the sentence. "1. Dünya Savaşı" is split
+incorrectly by this rule.
+
+Sentences longer than max_sentence_length tokens are cut, so that a text without punctuation can't make a sentence of
+unbounded length.
+"""
+import re
+from trnltk.tokenizer.texttokenizer import TextTokenizer, Token
+
+ABBREVIATIONS = frozenset([
+    u'av', u'bkz', u'bnb', u'cad', u'çev', u'doç', u'dr', u'haz', u'hz', u'kar', u'mah', u'md', u'müh', u'no', u'ord',
+    u'öğr', u'op', u'prof', u'sn', u'sok', u'st', u'şti', u'tel', u'vb', u'vd', u'vs', u'yay', u'yd', u'yrd', u'yzb'
+])
+
+_PUNC_CHARS = u'.,-!?:"()'
+
+_SENTENCE_TERMINATORS = u'.!?'
+
+_QUOTE = u'"'
+
+# "10.", also "5.30." since the tokenizer keeps a dot after a digit
+_NUMBER_WITH_DOT_REGEX = re.compile(u'^\\d+([.,:]\\d+)*\\.$', re.UNICODE)
+
+DEFAULT_MAX_SENTENCE_LENGTH = 200
+DEFAULT_MAX_QUOTED_LENGTH = 50
+
+def _token_str(token):
+    return token if isinstance(token, basestring) else token.str
+
+class SentenceSplitter(object):
+    """
+    Splits tokens into sentences. Tokens are either strings, as returned by TextTokenizer.tokenize, or Token objects
+    with offsets, as returned by TextTokenizer.iter_tokens.
+    """
+
+    def __init__(self, abbreviations=ABBREVIATIONS, max_sentence_length=DEFAULT_MAX_SENTENCE_LENGTH,
+                 max_quoted_length=DEFAULT_MAX_QUOTED_LENGTH):
+        """
+        @param abbreviations: lowercase abbreviations, without the dot
+        """
+        assert max_sentence_length > 0
+
+        self._abbreviations = abbreviations
+        self._max_sentence_length = max_sentence_length
+        self._max_quoted_length = max_quoted_length
+
+    def split(self, tokens):
+        """
+        @rtype: list<list>
+        """
+        return list(self.iter_sentences(tokens))
+
+    def iter_sentences(self, tokens):
+        """
+        Yields the sentences as soon as they end, which can be decided after seeing the next token.
+
+        @param tokens: iterable of tokens, e.g. TextTokenizer.iter_tokens of a file
+        @return: generator of sentences, each a list of tokens
+        """
+        sentence = []
+        # index of the token with an unclosed quote in the sentence
+        quote_start = None
+
+        tokens = iter(tokens)
+        token = next(tokens, None)
+        while token is not None:
+            next_token = next(tokens, None)
+            token_str = _token_str(token)
+            next_token_str = _token_str(next_token) if next_token is not None else None
+
+            if token_str.count(_QUOTE) % 2:
+                if len(token_str) > 1 and token_str[-1] == _QUOTE and self._is_punctuation(token_str):
+                    # like '."', which closes a quote even if the opening quote is missed, e.g. dropped by the
+                    # tokenizer at the beginning of the text
+                    quote_start = None
+                else:
+                    quote_start = len(sentence) if quote_start is None else None
+            elif quote_start is not None and len(sentence) - quote_start > self._max_quoted_length:
+                quote_start = None
+
+            if self._is_end_of_sentence(sentence, quote_start, token_str, next_token_str):
+                if _NUMBER_WITH_DOT_REGEX.match(token_str):
+                    sentence.extend(self._split_dot(token))
+                else:
+                    sentence.append(token)
+                yield sentence
+                sentence = []
+                quote_start = None
+            else:
+                sentence.append(token)
+                if len(sentence) >= self._max_sentence_length:
+                    yield sentence
+                    sentence = []
+                    quote_start = None
+
+            token = next_token
+
+        if sentence:
+            yield sentence
+
+    def _is_end_of_sentence(self, sentence, quote_start, token_str, next_token_str):
+        if _NUMBER_WITH_DOT_REGEX.match(token_str):
+            return quote_start is None and (next_token_str is None or next_token_str[0].isupper())
+
+        if not self._is_punctuation(token_str) or not any([c in _SENTENCE_TERMINATORS for c in token_str]):
+            return False
+
+        if quote_start is not None:
+            return False
+
+        if next_token_str is not None and next_token_str[0].islower():
+            return False
+
+        if token_str[0] == u'.' and sentence:
+            previous_token_str = _token_str(sentence[-1])
+            if previous_token_str.lower() in self._abbreviations:
+                return False
+            if len(previous_token_str) == 1 and previous_token_str.isupper():
+                return False
+
+        return True
+
+    def _is_punctuation(self, token_str):
+        return all([c in _PUNC_CHARS for c in token_str])
+
+    def _split_dot(self, token):
+        if isinstance(token, basestring):
+            return [token[:-1], token[-1]]
+
+        # dot is a single byte in ASCII compatible encodings, which are the ones the offsets can be calculated for
+        return [Token(token.str[:-1], token.start, token.end - 1, token.byte_start, token.byte_end - 1),
+                Token(token.str[-1], token.end - 1, token.end, token.byte_end - 1, token.byte_end)]
+
+
+def iter_sentences_of_text(source, tokenizer=None, sentence_splitter=None, **iter_tokens_kwargs):
+    """
+    Tokenizes the source lazily and splits it into sentences.
+
+    @param source: a file-like object, an iterable of chunks or a string; see TextTokenizer.iter_tokens
+    @param iter_tokens_kwargs: passed to TextTokenizer.iter_tokens, e.g. with_offsets or encoding
+    @return: generator of sentences, each a list of tokens
+    """
+    tokenizer = tokenizer or TextTokenizer()
+    sentence_splitter = sentence_splitter or SentenceSplitter()
+    return sentence_splitter.iter_sentences(tokenizer.iter_tokens(source, **iter_tokens_kwargs))
+
+
+def iter_batches(sentences, batch_size):
+    """
+    Groups the sentences into lists of batch_size sentences, except the last one. Since a batch is made of complete
+    sentences, the context of a word never crosses a batch, thus batches can be parsed independently.
+    """
+    assert batch_size > 0
+
+    batch = []
+    for sentence in sentences:
+        batch.append(sentence)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,111 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures the throughput of TextTokenizer on a few MB of text built from the sentences of the bundled simple parsesets,
+both for the whole text at once and line by line, and compares it to the original char by char implementation.
+Streaming tokenization of the same text from a file is measured too, with and without the offsets.
+
+Original implementation is quadratic in the length of the text, thus it is measured on smaller texts only.
+"""
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+from trnltk.tokenizer.texttokenizer import TextTokenizer, CharacterLoopTextTokenizer
+
+SIMPLE_PARSESETS_FOLDER = os.path.join(os.path.dirname(__file__), '../../testresources/simpleparsesets')
+
+TEXT_SIZE = 4 * 1024 * 1024
+
+def _build_lines():
+    lines = []
+    for file_name in sorted(os.listdir(SIMPLE_PARSESETS_FOLDER)):
+        for sentence in SimpleParseSetReader(os.path.join(SIMPLE_PARSESETS_FOLDER, file_name)):
+            # punctuation is written next to the previous word, like in raw text
+            lines.append(u''.join([(u' ' if surface.isalnum() else u'') + surface for surface, parse_result in sentence]).strip())
+    return lines
+
+def _measure(tokenizer, texts):
+    start = time.time()
+    token_count = 0
+    for text in texts:
+        token_count += len(tokenizer.tokenize(text))
+    return token_count, time.time() - start
+
+class TextTokenizerBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lines = _build_lines()
+        text = u'\n'.join(lines)
+        cls.lines = lines * (TEXT_SIZE / len(text) + 1)
+        cls.text = u'\n'.join(cls.lines)
+
+    def _print(self, name, character_count, token_count, seconds):
+        print u'{:<45}: {:>9} chars, {:>8} tokens in {:>7.3f} s, {:>6.2f} MB/s'.format(name, character_count, token_count,
+            seconds, character_count / seconds / 1024 / 1024)
+
+    def test_benchmark_whole_text(self):
+        token_count, seconds = _measure(TextTokenizer(), [self.text])
+        self._print('TextTokenizer, whole text', len(self.text), token_count, seconds)
+
+        for size in (16 * 1024, 32 * 1024, 64 * 1024):
+            text = self.text[:size]
+            reference_token_count, reference_seconds = _measure(CharacterLoopTextTokenizer(), [text])
+            token_count, seconds = _measure(TextTokenizer(), [text])
+            self._print('CharacterLoopTextTokenizer, first {} KB'.format(size / 1024), len(text), reference_token_count, reference_seconds)
+            self._print('TextTokenizer, first {} KB'.format(size / 1024), len(text), token_count, seconds)
+
+            self.assertEqual(token_count, reference_token_count)
+            self.assertLess(seconds, reference_seconds)
+
+    def test_benchmark_lines(self):
+        character_count = sum([len(line) for line in self.lines])
+
+        token_count, seconds = _measure(TextTokenizer(), self.lines)
+        self._print('TextTokenizer, line by line', character_count, token_count, seconds)
+
+        reference_token_count, reference_seconds = _measure(CharacterLoopTextTokenizer(), self.lines)
+        self._print('CharacterLoopTextTokenizer, line by line', character_count, reference_token_count, reference_seconds)
+
+        self.assertEqual(token_count, reference_token_count)
+        self.assertLess(seconds, reference_seconds)
+
+    def test_benchmark_streaming(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(temp_dir, 'text.txt')
+            with io.open(file_path, 'w', encoding='utf-8') as f:
+                f.write(self.text)
+
+            expected_token_count = len(TextTokenizer().tokenize(self.text))
+
+            for with_offsets in (False, True):
+                start = time.time()
+                with open(file_path, 'rb') as f:
+                    token_count = sum(1 for token in TextTokenizer().iter_tokens(f, with_offsets=with_offsets))
+                seconds = time.time() - start
+                self._print('TextTokenizer, streamed{}'.format(' with offsets' if with_offsets else ''), len(self.text), token_count, seconds)
+
+                self.assertEqual(token_count, expected_token_count)
+        finally:
+            shutil.rmtree(temp_dir)
+
+if __name__ == '__main__':
+    unittest.main()
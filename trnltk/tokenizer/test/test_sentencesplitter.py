@@ -0,0 +1,95 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import io
+import unittest
+from hamcrest import *
+from trnltk.tokenizer.sentencesplitter import SentenceSplitter, iter_sentences_of_text, iter_batches
+from trnltk.tokenizer.texttokenizer import TextTokenizer
+
+class SentenceSplitterTest(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = TextTokenizer()
+        self.splitter = SentenceSplitter()
+
+    def _split(self, text):
+        return [u' '.join(sentence) for sentence in self.splitter.split(self.tokenizer.tokenize(text))]
+
+    def test_should_split_sentences(self):
+        assert_that(self._split(u''), equal_to([]))
+        assert_that(self._split(u'Ali geldi'), equal_to([u'Ali geldi']))
+        assert_that(self._split(u'Ali geldi. Veli gitti.'), equal_to([u'Ali geldi .', u'Veli gitti .']))
+        assert_that(self._split(u'Geldi mi? Gelmedi! Bilmem...'), equal_to([u'Geldi mi ?', u'Gelmedi !', u'Bilmem ...']))
+        assert_that(self._split(u'Ne?! Olamaz!.. Evet.'), equal_to([u'Ne ?!', u'Olamaz !..', u'Evet .']))
+        assert_that(self._split(u'Ali geldi, Veli: gitti.'), equal_to([u'Ali geldi , Veli : gitti .']))
+
+    def test_should_not_split_after_abbreviations_and_initials(self):
+        assert_that(self._split(u'Prof. Dr. Ali geldi. Doç. Veli de.'), equal_to([u'Prof . Dr . Ali geldi .', u'Doç . Veli de .']))
+        assert_that(self._split(u'Elma, armut vb. meyveler. Kitap vs. Sonra'), equal_to([u'Elma , armut vb . meyveler .', u'Kitap vs . Sonra']))
+        assert_that(self._split(u'M. Kemal geldi.'), equal_to([u'M . Kemal geldi .']))
+
+        splitter = SentenceSplitter(abbreviations=frozenset([u'abc']))
+        assert_that([u' '.join(s) for s in splitter.split(self.tokenizer.tokenize(u'Dr. Ali ABC. Veli'))], equal_to([u'Dr .', u'Ali ABC . Veli']))
+
+    def test_should_handle_numbers_with_dots(self):
+        assert_that(self._split(u'Saat 5.30. Sonra 3. sınıf geldi.'), equal_to([u'Saat 5.30 .', u'Sonra 3. sınıf geldi .']))
+        assert_that(self._split(u'Yüzde 10. Bu kadar 5.'), equal_to([u'Yüzde 10 .', u'Bu kadar 5 .']))
+        assert_that(self._split(u'5.600 TL, 5,60 TL ve 5:20.'), equal_to([u'5.600 TL , 5,60 TL ve 5:20 .']))
+        assert_that(self._split(u'6., 7. ve 8. adamlar'), equal_to([u'6. , 7. ve 8. adamlar']))
+
+    def test_should_handle_quoted_speech(self):
+        assert_that(self._split(u'Ali: "Geliyorum." dedi. Gitti.'), equal_to([u'Ali : "Geliyorum ." dedi .', u'Gitti .']))
+        # opening quote is dropped by the tokenizer
+        assert_that(self._split(u'"Geliyorum." dedi. Gitti.'), equal_to([u'Geliyorum ." dedi .', u'Gitti .']))
+        assert_that(self._split(u'Ali "Gel. Otur. Kalk!" dedi. Gitti.'), equal_to([u'Ali "Gel . Otur . Kalk !" dedi .', u'Gitti .']))
+        assert_that(self._split(u'Dedi ki "Geldim." Ali gitti.'), equal_to([u'Dedi ki "Geldim ."', u'Ali gitti .']))
+
+        splitter = SentenceSplitter(max_quoted_length=3)
+        sentences = splitter.split(self.tokenizer.tokenize(u'Ali "Bir iki. Üç dört beş altı. Yedi.'))
+        assert_that([u' '.join(sentence) for sentence in sentences], equal_to([u'Ali "Bir iki . Üç dört beş altı .', u'Yedi .']))
+
+    def test_should_cut_long_sentences(self):
+        splitter = SentenceSplitter(max_sentence_length=3)
+        assert_that(splitter.split(u'a b c d e f g . H'.split()), equal_to([[u'a', u'b', u'c'], [u'd', u'e', u'f'], [u'g', u'.'], [u'H']]))
+
+    def test_should_split_streamed_tokens_with_offsets(self):
+        text = u'Dr. Şükrü geldi. Yüzde 10. Çok güzel!'
+        sentences = list(iter_sentences_of_text(io.BytesIO(text.encode('utf-8')), with_offsets=True, chunk_size=4))
+
+        assert_that([[token.str for token in sentence] for sentence in sentences], equal_to(
+            [[u'Dr', u'.', u'Şükrü', u'geldi', u'.'], [u'Yüzde', u'10', u'.'], [u'Çok', u'güzel', u'!']]))
+
+        encoded_text = text.encode('utf-8')
+        for sentence in sentences:
+            for token in sentence:
+                assert_that(text[token.start:token.end], equal_to(token.str))
+                assert_that(encoded_text[token.byte_start:token.byte_end].decode('utf-8'), equal_to(token.str))
+
+    def test_should_yield_sentences_lazily(self):
+        def tokens():
+            for token in [u'Ali', u'geldi', u'.', u'Veli']:
+                yield token
+            raise Exception('Should not be read')
+
+        sentences = self.splitter.iter_sentences(tokens())
+        assert_that(next(sentences), equal_to([u'Ali', u'geldi', u'.']))
+
+    def test_should_iterate_batches(self):
+        assert_that(list(iter_batches(range(7), 3)), equal_to([[0, 1, 2], [3, 4, 5], [6]]))
+        assert_that(list(iter_batches([], 3)), equal_to([]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,9 +14,14 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import io
+import os
+import random
+import sys
 import unittest
 from hamcrest import *
-from trnltk.tokenizer.texttokenizer import TextTokenizer
+from trnltk.parseset.simpleparseset import SimpleParseSetReader
+from trnltk.tokenizer.texttokenizer import TextTokenizer, CharacterLoopTextTokenizer, Token, _DIGIT_RANGES
 
 class TextTokenizerTest(unittest.TestCase):
     def setUp(self):
@@ -122,5 +127,124 @@ Uluslararası piyasalarda altının onsu yıl içerinde en düşük 1527,22 dola
         for a in tokens:
             print u'=={}=='.format(a)
 
+class TextTokenizerDifferentialTest(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = TextTokenizer()
+        self.reference_tokenizer = CharacterLoopTextTokenizer()
+
+    def _assert_same_tokens(self, text):
+        assert_that(self.tokenizer.tokenize(text), equal_to(self.reference_tokenizer.tokenize(text)), repr(text))
+
+    def test_should_tokenize_same_with_reference_for_edge_cases(self):
+        texts = [u'', u' ', u'.', u'...', u'"', u'(a)', u'.a', u'..,a', u'a.', u'a.,', u'a,.', u'a ,', u'3.', u'3.,', u'3,',
+                 u'3,a', u'3,4', u'3:4', u'3-4', u'3(4', u'3.4', u'3..4', u'3.,4', u'a.4', u'a,4', u'"a"di', u'5.\'de',
+                 u'6., 7.', u'1\n,2', u'\u0663,\u0664', u'\u00b2,\u00b3', u'\u00b2.', u'a\u00a0.', u'\u2003.a.\u2003',
+                 u'a\x0b.b', u'ABD\'de', u'-5', u'a-b', u'a--b', u'a - b', u'!..', u'?!', u'a?!']
+        for text in texts:
+            self._assert_same_tokens(text)
+            self._assert_same_tokens(text + u' ' + text)
+
+    def test_should_have_same_digits_with_isdigit(self):
+        digits = [code_point for start, end in _DIGIT_RANGES for code_point in range(start, end + 1) if code_point <= sys.maxunicode]
+        assert_that(digits, equal_to([code_point for code_point in xrange(sys.maxunicode + 1) if unichr(code_point).isdigit()]))
+
+    def test_should_tokenize_same_with_reference_for_str(self):
+        for text in ['abc.', '3.4, 5', '"a"di 6., 7.', 'Istanbul\'da 5:20\'de.']:
+            self._assert_same_tokens(text)
+            assert_that(all([isinstance(token, unicode) for token in self.tokenizer.tokenize(text)]))
+
+        self.assertRaises(UnicodeDecodeError, lambda: self.tokenizer.tokenize('\xc4\xb0stanbul.'))
+
+    def test_should_tokenize_same_with_reference_for_random_text(self):
+        alphabet = u'aAb\u0131\u0130\u00e7\u011f0159.,-!?:"()\' \t\n\r\u0663\u00b2\u00a0'
+        random_generator = random.Random(1234)
+        for i in range(2000):
+            text = u''.join([random_generator.choice(alphabet) for j in range(random_generator.randint(0, 30))])
+            self._assert_same_tokens(text)
+
+    def test_should_tokenize_same_with_reference_for_corpus(self):
+        simple_parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/simpleparsesets/simpleparseset001.txt')
+        for sentence in SimpleParseSetReader(simple_parseset_path):
+            text = u''.join([surface + (u' ' if surface.isalnum() else u'') for surface, parse_result in sentence])
+            self._assert_same_tokens(text)
+            self._assert_same_tokens(u' '.join([surface for surface, parse_result in sentence]))
+
+class TextTokenizerStreamingTest(unittest.TestCase):
+    def setUp(self):
+        self.tokenizer = TextTokenizer()
+
+    def _chunks(self, text, chunk_size):
+        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    def _assert_same_tokens_streamed(self, text):
+        expected_tokens = self.tokenizer.tokenize(text)
+        encoded_text = text.encode('utf-8')
+
+        for chunk_size in (1, 2, 3, 7, 64, len(text) + 1):
+            assert_that(list(self.tokenizer.iter_tokens(self._chunks(text, chunk_size))), equal_to(expected_tokens), repr(text))
+            assert_that(list(self.tokenizer.iter_tokens(self._chunks(encoded_text, chunk_size))), equal_to(expected_tokens), repr(text))
+
+            tokens = list(self.tokenizer.iter_tokens(self._chunks(encoded_text, chunk_size), with_offsets=True))
+            assert_that([token.str for token in tokens], equal_to(expected_tokens), repr(text))
+            for token in tokens:
+                assert_that(text[token.start:token.end], equal_to(token.str))
+                assert_that(encoded_text[token.byte_start:token.byte_end].decode('utf-8'), equal_to(token.str))
+
+    def test_should_iterate_same_tokens_with_tokenize(self):
+        texts = [u'', u'  ', u'..', u' . ', u'  .. \u00a0', u'..  \u00a0x', u'. , abc', u'abc\u00a0', u'abc\u00a0 \u00a0',
+                 u'abc\u00a0 def', u'Fiyatlar\u0131 u\u00e7u\u015fa ge\u00e7ti.', u'\r\tABD\'de\n elma 3. 5:20 6., 7.\t',
+                 u'\u0130stanbul\'da "aptal"di 5.600,1234 TL (yakla\u015f\u0131k)!..', u'a.\nb', u'a \n\t\r b']
+        for text in texts:
+            self._assert_same_tokens_streamed(text)
+
+        alphabet = u'a\u0131\u00e70\u00b2.,-!?:"()\' \t\n\r\u00a0'
+        random_generator = random.Random(1234)
+        for i in range(300):
+            text = u''.join([random_generator.choice(alphabet) for j in range(random_generator.randint(0, 30))])
+            self._assert_same_tokens_streamed(text)
+
+    def test_should_iterate_tokens_of_files(self):
+        simple_parseset_path = os.path.join(os.path.dirname(__file__), '../../testresources/simpleparsesets/simpleparseset001.txt')
+        lines = []
+        for sentence in SimpleParseSetReader(simple_parseset_path):
+            lines.append(u''.join([(u' ' if surface.isalnum() else u'') + surface for surface, parse_result in sentence]))
+        text = u'\n'.join(lines)
+        expected_tokens = self.tokenizer.tokenize(text)
+
+        tokens = list(self.tokenizer.iter_tokens(io.BytesIO(text.encode('utf-8')), with_offsets=True, chunk_size=1000))
+        assert_that([token.str for token in tokens], equal_to(expected_tokens))
+        assert_that(tokens[-1].end, equal_to(len(text.rstrip())))
+        assert_that(tokens[-1].byte_end, equal_to(len(text.rstrip().encode('utf-8'))))
+
+        assert_that(list(self.tokenizer.iter_tokens(io.StringIO(text), chunk_size=1000)), equal_to(expected_tokens))
+        assert_that(list(self.tokenizer.iter_tokens(text)), equal_to(expected_tokens))
+
+    def test_should_calculate_offsets(self):
+        tokens = list(self.tokenizer.iter_tokens(u'\u00c7ok g\u00fczel, de\u011fil mi?', with_offsets=True))
+
+        assert_that([(token.str, token.start, token.end, token.byte_start, token.byte_end) for token in tokens], equal_to([
+            (u'\u00c7ok', 0, 3, 0, 4),
+            (u'g\u00fczel', 4, 9, 5, 11),
+            (u',', 9, 10, 11, 12),
+            (u'de\u011fil', 11, 16, 13, 19),
+            (u'mi', 17, 19, 20, 22),
+            (u'?', 19, 20, 22, 23)
+        ]))
+        assert_that(tokens[0], instance_of(Token))
+
+        tokens = list(self.tokenizer.iter_tokens([u'\u00c7ok g\u00fczel'.encode('iso-8859-9')], with_offsets=True, encoding='iso-8859-9'))
+        assert_that([(token.str, token.byte_start, token.byte_end) for token in tokens], equal_to([(u'\u00c7ok', 0, 3), (u'g\u00fczel', 4, 9)]))
+
+    def test_should_be_lazy(self):
+        def chunks():
+            yield u'bir iki '
+            yield u'\u00fc\u00e7 d\u00f6rt'
+            raise Exception('Should not be read')
+
+        tokens = self.tokenizer.iter_tokens(chunks())
+        assert_that(next(tokens), equal_to(u'bir'))
+        assert_that(next(tokens), equal_to(u'iki'))
+        assert_that(next(tokens), equal_to(u'\u00fc\u00e7'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,13 +13,241 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+"""
+Splits text into tokens, separating the punctuation from the words.
+
+TextTokenizer inserts the spaces in front of the punctuation with a single regular expression substitution, where the
+exception rules are lookbehind and lookahead assertions. CharacterLoopTextTokenizer is the original implementation,
+which builds the output char by char; it is kept as the reference of the rules.
+
+TextTokenizer.iter_tokens tokenizes a file or an iterable of chunks lazily, with the same result as tokenizing the whole
+text at once. Text is cut at the separators, so a token is never split between two chunks.
+"""
+import codecs
+import re
+import sys
+
+_PUNC_CHARS = u'.,-!?:"()'     #  " ' " is not included
+
+# ranges of the chars which unicode.isdigit is true for, in the Unicode 5.2 database of Python 2.7. \d is not the same:
+# it doesn't match superscripts and such. finding them with isdigit takes much longer than compiling the regex
+_DIGIT_RANGES = (
+    (0x0030, 0x0039), (0x00B2, 0x00B3), (0x00B9, 0x00B9), (0x0660, 0x0669), (0x06F0, 0x06F9), (0x07C0, 0x07C9),
+    (0x0966, 0x096F), (0x09E6, 0x09EF), (0x0A66, 0x0A6F), (0x0AE6, 0x0AEF), (0x0B66, 0x0B6F), (0x0BE6, 0x0BEF),
+    (0x0C66, 0x0C6F), (0x0CE6, 0x0CEF), (0x0D66, 0x0D6F), (0x0E50, 0x0E59), (0x0ED0, 0x0ED9), (0x0F20, 0x0F29),
+    (0x1040, 0x1049), (0x1090, 0x1099), (0x1369, 0x1371), (0x17E0, 0x17E9), (0x1810, 0x1819), (0x1946, 0x194F),
+    (0x19D0, 0x19DA), (0x1A80, 0x1A89), (0x1A90, 0x1A99), (0x1B50, 0x1B59), (0x1BB0, 0x1BB9), (0x1C40, 0x1C49),
+    (0x1C50, 0x1C59), (0x2070, 0x2070), (0x2074, 0x2079), (0x2080, 0x2089), (0x2460, 0x2468), (0x2474, 0x247C),
+    (0x2488, 0x2490), (0x24EA, 0x24EA), (0x24F5, 0x24FD), (0x24FF, 0x24FF), (0x2776, 0x277E), (0x2780, 0x2788),
+    (0x278A, 0x2792), (0xA620, 0xA629), (0xA8D0, 0xA8D9), (0xA900, 0xA909), (0xA9D0, 0xA9D9), (0xAA50, 0xAA59),
+    (0xABF0, 0xABF9), (0xFF10, 0xFF19), (0x104A0, 0x104A9), (0x10A40, 0x10A43), (0x10E60, 0x10E68), (0x1D7CE, 0x1D7FF),
+    (0x1F100, 0x1F10A)
+)
+
+def _to_char_class_range(start, end):
+    if start == end:
+        return re.escape(unichr(start))
+    return re.escape(unichr(start)) + u'-' + re.escape(unichr(end))
+
+# as a regex char class. a narrow build has no chars above 0xFFFF, so isdigit is not true for any of them
+_DIGITS = u''.join([_to_char_class_range(start, end) for start, end in _DIGIT_RANGES if end <= sys.maxunicode])
+
+def _compile_space_regex():
+    punc_class = u'[' + re.escape(_PUNC_CHARS) + u']'
+    digit_class = u'[' + _DIGITS + u']'
+    punc_class_except_dot = u'[' + re.escape(_PUNC_CHARS.replace(u'.', u'')) + u']'
+    non_punc_non_digit_class = u'[^' + re.escape(_PUNC_CHARS) + _DIGITS + u']'
+
+    # positions in front of a punc char, to insert a space. the lookahead for the punc char comes first, so that the
+    # other positions are skipped with a single check
+    return re.compile(u'(?={})(?:{})'.format(punc_class, u'|'.join([
+        # after a char which is neither a punc char nor a digit: always
+        u'(?<={})'.format(non_punc_non_digit_class),
+        # after a punc char: never, but comma after dot : "6., 7."
+        u'(?<=\\.)(?=,)',
+        # after a digit: except a dot ("3.") and a punc char between digits ("5:20", "5.123.456", "5,12")
+        u'(?<={})(?={}(?!{}))'.format(digit_class, punc_class_except_dot, digit_class)
+    ])), re.UNICODE)
+
+_SPACE_REGEX = _compile_space_regex()
+
+# tokens are separated by these only. other whitespace is stripped from the ends of the text, but is a part of a token
+# in the middle of the text
+_SEPARATORS = u' \n\t\r'
+
+CHUNK_SIZE = 64 * 1024
+
+class Token(object):
+    """
+    A token with its offsets in the source. end and byte_end are exclusive.
+    """
+    __slots__ = ('str', 'start', 'end', 'byte_start', 'byte_end')
+
+    def __init__(self, str, start, end, byte_start, byte_end):
+        self.str = str
+        self.start = start
+        self.end = end
+        self.byte_start = byte_start
+        self.byte_end = byte_end
+
+    def __repr__(self):
+        return u'Token({!r}, {}, {}, {}, {})'.format(self.str, self.start, self.end, self.byte_start, self.byte_end)
+
 class TextTokenizer(object):
     """
     Splits the text into words.
+
+    Punc chars get a space in front of them. Exceptions:
+        1. Dot comes after number : "3."
+        2. Punc char comes after punc char : "..." (except comma after dot)
+        3. The apostrophe used in a proper name : "Ahmet'in"  # apostrophe is not a punc char anymore
+        4. The quoted stuff for emphasis : 'Cok "aptal"di o adam' #TODO
+        5. Punc chars between numbers : "5:20", "5.123.456", "5,12" (but not "5, 6, 7")
+    Punc chars at the beginning of the text are dropped.
     """
 
     PUNC_CHARS = [u'.', u',', u',', u'..', u'...', u'-', u'!', u'?', u':', u'-', u'"', u'(', u')']     #  " ' " is not included
 
+    def tokenize(self, text):
+        """
+        @type text: str or unicode
+        @rtype list or None
+        """
+        # tokens are unicode, as with the reference implementation; which fails for non-ASCII str too
+        text = unicode(text.strip())
+
+        # punc chars at the beginning have no char before them to stick to
+        text = text.lstrip(_PUNC_CHARS)
+
+        text = _SPACE_REGEX.sub(u' ', text)
+
+        text = self._replace_all_space_with_whitespace(text)
+
+        return [token for token in text.split(u' ') if token]
+
+    def iter_tokens(self, source, with_offsets=False, encoding='utf-8', chunk_size=CHUNK_SIZE):
+        """
+        Yields the same tokens with tokenize, without reading the whole source into memory.
+
+        @param source: a file-like object or an iterable of chunks. str chunks are decoded with the encoding; a chunk
+            may end in the middle of a token or of a multibyte char
+        @param with_offsets: if True, Token objects with the char and the byte offsets in the source are yielded instead
+            of the token strings
+        @param encoding: encoding of the str chunks and of the byte offsets. byte offsets of unicode chunks are the
+            offsets in the text encoded with it. shouldn't be one writing a BOM, like utf-8-sig
+        @param chunk_size: number of bytes or chars read from a file-like object at once
+        @rtype: generator<unicode> or generator<Token>
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+
+        buffer = u''
+        started = False
+        # offsets of the beginning of the buffer in the source
+        char_position = 0
+        byte_position = 0
+
+        for chunk in self._iter_decoded_chunks(source, decoder, chunk_size):
+            buffer += chunk
+
+            if not started:
+                # same with the stripping in tokenize. can be done when a char which is not stripped is seen
+                stripped_buffer = buffer.lstrip().lstrip(_PUNC_CHARS)
+                if not stripped_buffer:
+                    continue
+                char_position, byte_position = self._advance(buffer[:len(buffer) - len(stripped_buffer)], char_position, byte_position, encoding)
+                buffer = stripped_buffer
+                started = True
+
+            # cut before the last separator which is followed by non-whitespace, since whitespace at the end of the
+            # text is stripped
+            rstripped_length = len(buffer.rstrip())
+            cut = max([buffer.rfind(separator, 0, rstripped_length) for separator in _SEPARATORS])
+            if cut <= 0:
+                continue
+
+            segment = buffer[:cut]
+            buffer = buffer[cut:]
+            for token in self._iter_segment_tokens(segment, with_offsets, char_position, byte_position, encoding):
+                yield token
+            if with_offsets:
+                char_position, byte_position = self._advance(segment, char_position, byte_position, encoding)
+
+        buffer += decoder.decode('', True)
+        if not started:
+            stripped_buffer = buffer.lstrip().lstrip(_PUNC_CHARS)
+            char_position, byte_position = self._advance(buffer[:len(buffer) - len(stripped_buffer)], char_position, byte_position, encoding)
+            buffer = stripped_buffer
+
+        for token in self._iter_segment_tokens(buffer.rstrip(), with_offsets, char_position, byte_position, encoding):
+            yield token
+
+    def _advance(self, text, char_position, byte_position, encoding):
+        return char_position + len(text), byte_position + len(text.encode(encoding))
+
+    def _iter_decoded_chunks(self, source, decoder, chunk_size):
+        if isinstance(source, basestring):
+            chunks = [source]
+        elif hasattr(source, 'read'):
+            chunks = self._iter_read_chunks(source, chunk_size)
+        else:
+            chunks = source
+
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            if chunk:
+                yield chunk
+
+    def _iter_read_chunks(self, source_file, chunk_size):
+        while True:
+            chunk = source_file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def _iter_segment_tokens(self, segment, with_offsets, char_position, byte_position, encoding):
+        """
+        Tokenizes a part of the text which starts with a separator, or at the beginning of the text after stripping.
+        """
+        token_strs = [token_str for token_str in self._replace_all_space_with_whitespace(_SPACE_REGEX.sub(u' ', segment)).split(u' ') if token_str]
+        if not with_offsets:
+            for token_str in token_strs:
+                yield token_str
+            return
+
+        # only separators are between the tokens, thus a token is the first match of it after the previous token.
+        # separators are a byte each in ASCII compatible encodings, otherwise the text between the tokens is encoded too
+        separators_are_single_bytes = len(_SEPARATORS.encode(encoding)) == len(_SEPARATORS)
+        end = 0
+        byte_end = byte_position
+        for token_str in token_strs:
+            start = segment.find(token_str, end)
+            if separators_are_single_bytes:
+                byte_start = byte_end + start - end
+            else:
+                byte_start = byte_end + len(segment[end:start].encode(encoding))
+            end = start + len(token_str)
+            byte_end = byte_start + len(token_str.encode(encoding))
+            yield Token(token_str, char_position + start, char_position + end, byte_start, byte_end)
+
+    def _replace_all_space_with_whitespace(self, text):
+
+        """
+        @type text: str or unicode
+        """
+        text = text.replace(u'\n', u' ')
+        text = text.replace(u'\t', u' ')
+        text = text.replace(u'\r', u' ')
+
+        return text
+
+
+class CharacterLoopTextTokenizer(TextTokenizer):
+    """
+    Original implementation of TextTokenizer, which checks the exception cases char by char. Its running time is
+    quadratic in the length of the text, thus it is only used as the reference in tests and benchmarks.
+    """
+
     def tokenize(self, text):
         """
         @type text: str or unicode
@@ -83,14 +311,3 @@ class TextTokenizer(object):
                 builder = builder + char
 
         return builder
-
-    def _replace_all_space_with_whitespace(self, text):
-
-        """
-        @type text: str or unicode
-        """
-        text = text.replace(u'\n', u' ')
-        text = text.replace(u'\t', u' ')
-        text = text.replace(u'\r', u' ')
-
-        return text
\ No newline at end of file
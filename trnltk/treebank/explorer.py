@@ -15,21 +15,50 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from trnltk.parseset.xmlbindings import  UnparsableWordBinding, DerivationalSuffixBinding
-from trnltk.treebank.model import HierarchicalIndex
+from trnltk.treebank.model import SortedArrayHierarchicalIndex
 
 class ConcordanceIndex(object):
-    def offsets(self, sth, syntactic_category, secondary_syntactic_category):
-        raise NotImplementedError()
-
-class CompleteWordConcordanceIndex(ConcordanceIndex):
-    def __init__(self, word_list):
-        self._offsets = HierarchicalIndex(3)
+    def __init__(self, word_list=()):
+        """
+        @param word_list: any iterable of word bindings, e.g. StreamingParseSetReader.iter_words()
+        """
+        self._offsets = SortedArrayHierarchicalIndex(3)
 
         for index, word in enumerate(word_list):
             if isinstance(word, UnparsableWordBinding):
                 continue
 
-            self._offsets.insert(index, word.str, word.syntactic_category, word.secondary_syntactic_category)
+            self.add_word(index, word)
+
+    def add_word(self, index, word):
+        """
+        @type index: int
+        @type word: WordBinding
+        """
+        raise NotImplementedError()
+
+    def offsets(self, sth, syntactic_category, secondary_syntactic_category):
+        raise NotImplementedError()
+
+    def save(self, folder_path, **attributes):
+        """
+        Saves the index to the folder, to be loaded with load of the same class.
+        @param attributes: additional attributes to keep in the metadata
+        """
+        self._offsets.save(folder_path, index_type=self.__class__.__name__, **attributes)
+
+    @classmethod
+    def load(cls, folder_path, mmap=True):
+        """
+        @param mmap: if True, offsets are memory-mapped instead of being read into memory
+        """
+        concordance_index = cls()
+        concordance_index._offsets = SortedArrayHierarchicalIndex.load(folder_path, mmap, index_type=cls.__name__)
+        return concordance_index
+
+class CompleteWordConcordanceIndex(ConcordanceIndex):
+    def add_word(self, index, word):
+        self._offsets.insert(index, word.str, word.syntactic_category, word.secondary_syntactic_category)
 
     def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
         assert word_str is not None
@@ -42,14 +71,8 @@ class CompleteWordConcordanceIndex(ConcordanceIndex):
         return self._offsets.get(*args)
 
 class RootConcordanceIndex(ConcordanceIndex):
-    def __init__(self, word_list):
-        self._offsets = HierarchicalIndex(3)
-
-        for index, word in enumerate(word_list):
-            if isinstance(word, UnparsableWordBinding):
-                continue
-
-            self._offsets.insert(index, word.root.str, word.root.syntactic_category, word.root.secondary_syntactic_category)
+    def add_word(self, index, word):
+        self._offsets.insert(index, word.root.str, word.root.syntactic_category, word.root.secondary_syntactic_category)
 
 
     def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
@@ -63,14 +86,8 @@ class RootConcordanceIndex(ConcordanceIndex):
         return self._offsets.get(*args)
 
 class DictionaryItemConcordanceIndex(ConcordanceIndex):
-    def __init__(self, word_list):
-        self._offsets = HierarchicalIndex(3)
-
-        for index, word in enumerate(word_list):
-            if isinstance(word, UnparsableWordBinding):
-                continue
-
-            self._offsets.insert(index, word.root.lemma_root, word.root.syntactic_category, word.root.secondary_syntactic_category)
+    def add_word(self, index, word):
+        self._offsets.insert(index, word.root.lemma_root, word.root.syntactic_category, word.root.secondary_syntactic_category)
 
     def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
         assert word_str is not None
@@ -83,20 +100,14 @@ class DictionaryItemConcordanceIndex(ConcordanceIndex):
         return self._offsets.get(*args)
 
 class TransitionWordConcordanceIndex(ConcordanceIndex):
-    def __init__(self, word_list):
-        self._offsets = HierarchicalIndex(3)
-
-        for index, word in enumerate(word_list):
-            if isinstance(word, UnparsableWordBinding):
-                continue
-
-            secondary_syntactic_category = word.root.secondary_syntactic_category
-            for suffix in word.suffixes:
-                syntactic_category = suffix.to_syntactic_category
-                if isinstance(suffix, DerivationalSuffixBinding):
-                    secondary_syntactic_category = None
+    def add_word(self, index, word):
+        secondary_syntactic_category = word.root.secondary_syntactic_category
+        for suffix in word.suffixes:
+            syntactic_category = suffix.to_syntactic_category
+            if isinstance(suffix, DerivationalSuffixBinding):
+                secondary_syntactic_category = None
 
-                self._offsets.insert(index, suffix.word, syntactic_category, secondary_syntactic_category)
+            self._offsets.insert(index, suffix.word, syntactic_category, secondary_syntactic_category)
 
     def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
         assert word_str is not None
@@ -109,21 +120,15 @@ class TransitionWordConcordanceIndex(ConcordanceIndex):
         return self._offsets.get(*args)
 
 class TransitionMatchedWordConcordanceIndex(ConcordanceIndex):
-    def __init__(self, word_list):
-        self._offsets = HierarchicalIndex(3)
+    def add_word(self, index, word):
+        syntactic_category = word.root.syntactic_category
+        secondary_syntactic_category = word.root.secondary_syntactic_category
+        for suffix in word.suffixes:
+            syntactic_category = suffix.to_syntactic_category
+            if isinstance(suffix, DerivationalSuffixBinding):
+                secondary_syntactic_category = None
 
-        for index, word in enumerate(word_list):
-            if isinstance(word, UnparsableWordBinding):
-                continue
-
-            syntactic_category = word.root.syntactic_category
-            secondary_syntactic_category = word.root.secondary_syntactic_category
-            for suffix in word.suffixes:
-                syntactic_category = suffix.to_syntactic_category
-                if isinstance(suffix, DerivationalSuffixBinding):
-                    secondary_syntactic_category = None
-
-                self._offsets.insert(index, suffix.matched_word, syntactic_category, secondary_syntactic_category)
+            self._offsets.insert(index, suffix.matched_word, syntactic_category, secondary_syntactic_category)
 
     def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
         assert word_str is not None
@@ -134,3 +139,24 @@ class TransitionMatchedWordConcordanceIndex(ConcordanceIndex):
         args = filter(lambda x : x is not None, args)
 
         return self._offsets.get(*args)
+
+
+def build_concordance_indexes(words, concordance_index_classes):
+    """
+    Builds multiple concordance indexes in a single pass over the words. Useful for one-shot iterators, like the
+    words read from a StreamingParseSetReader.
+
+    @param words: iterable of word bindings
+    @type concordance_index_classes: list<type>
+    @rtype: list<ConcordanceIndex>
+    """
+    concordance_indexes = [concordance_index_class() for concordance_index_class in concordance_index_classes]
+
+    for index, word in enumerate(words):
+        if isinstance(word, UnparsableWordBinding):
+            continue
+
+        for concordance_index in concordance_indexes:
+            concordance_index.add_word(index, word)
+
+    return concordance_indexes
@@ -15,6 +15,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from collections import defaultdict
+import numpy
+from trnltk.treebank import storage
+
+_EMPTY_POSTING_LIST = numpy.zeros(0, dtype=numpy.int32)
+_EMPTY_POSTING_LIST.flags.writeable = False
+
 class HierarchicalIndex(object):
     def __init__(self, depth):
         assert depth > 1 and isinstance(depth, int)
@@ -59,4 +65,139 @@ class HierarchicalIndex(object):
         else:
             return lambda : defaultdict(cls._get_indices_type(depth-1))
 
-    __hash__ = None
\ No newline at end of file
+    __hash__ = None
+
+class SortedArrayHierarchicalIndex(HierarchicalIndex):
+    """
+    HierarchicalIndex with precomputed posting lists. For each path and each prefix of it, the sorted and unique values
+    are kept in a numpy array; thus a query doesn't need to gather and sort the leaves and returns in O(result).
+
+    Posting lists are built on the first query after an insert. Returned arrays are shared and read-only.
+
+    Posting lists can be saved to a folder and loaded memory-mapped from there. A loaded index can't be modified.
+    """
+
+    def __init__(self, depth):
+        super(SortedArrayHierarchicalIndex, self).__init__(depth)
+        # all posting lists are kept in a single array; i-th path's posting list is postings[bounds[i]:bounds[i+1]]
+        self._path_ids = None
+        self._postings = None
+        self._bounds = None
+        self._loaded_from = None
+
+    def get(self, *args):
+        return self.get_array(*args).tolist()
+
+    def get_array(self, *args):
+        """
+        @rtype: numpy.ndarray
+        """
+        assert args[0] is not None
+        assert len(args)<=self._depth
+
+        if self._path_ids is None:
+            self._build_posting_lists()
+
+        path_id = self._path_ids.get(args)
+        if path_id is None:
+            return _EMPTY_POSTING_LIST
+
+        return self._postings[self._bounds[path_id]:self._bounds[path_id + 1]]
+
+    def insert(self, value, *args):
+        if self._loaded_from is not None:
+            raise Exception('Index loaded from {} cannot be modified'.format(self._loaded_from))
+
+        super(SortedArrayHierarchicalIndex, self).insert(value, *args)
+        self._path_ids = None
+
+    def _build_posting_lists(self):
+        paths = []
+        posting_lists = []
+        for key, node in self._indices.iteritems():
+            self._build_posting_list(node, (key,), paths, posting_lists)
+
+        self._set_posting_lists(paths, numpy.concatenate(posting_lists) if posting_lists else _EMPTY_POSTING_LIST,
+            numpy.cumsum([0] + [len(posting_list) for posting_list in posting_lists]))
+
+    def _build_posting_list(self, node, path, paths, posting_lists):
+        if isinstance(node, dict):
+            children = [self._build_posting_list(node[key], path + (key,), paths, posting_lists) for key in node.iterkeys()]
+            posting_list = numpy.unique(numpy.concatenate(children)) if children else _EMPTY_POSTING_LIST
+        else:       #then it must be a <list>
+            posting_list = numpy.unique(numpy.array(node, dtype=numpy.int32))
+
+        paths.append(path)
+        posting_lists.append(posting_list)
+        return posting_list
+
+    def _set_posting_lists(self, paths, postings, bounds):
+        if postings.flags.writeable:
+            postings.flags.writeable = False
+
+        self._path_ids = dict((path, path_id) for path_id, path in enumerate(paths))
+        self._postings = postings
+        self._bounds = bounds
+
+    def save(self, folder_path, index_type=None, **attributes):
+        """
+        @param index_type: type recorded in the metadata, defaults to the class name
+        @param attributes: additional attributes to keep in the metadata
+        """
+        if self._path_ids is None:
+            self._build_posting_lists()
+
+        paths = [None] * len(self._path_ids)
+        for path, path_id in self._path_ids.iteritems():
+            paths[path_id] = path
+
+        storage.create_folder(folder_path)
+        storage.save_array(folder_path, 'postings', self._postings)
+        storage.save_array(folder_path, 'bounds', numpy.asarray(self._bounds, dtype=numpy.int64))
+        storage.save_json(folder_path, 'paths.json', paths)
+        storage.save_metadata(folder_path, index_type or self.__class__.__name__, depth=self._depth, **attributes)
+
+    @classmethod
+    def load(cls, folder_path, mmap=True, index_type=None):
+        """
+        @param mmap: if True, posting lists are not read into memory but memory-mapped
+        @param index_type: expected type in the metadata, defaults to the class name
+        @rtype: SortedArrayHierarchicalIndex
+        """
+        metadata = storage.load_metadata(folder_path, index_type or cls.__name__)
+
+        index = cls(metadata['depth'])
+        index._set_posting_lists([tuple(path) for path in storage.load_json(folder_path, 'paths.json')],
+            storage.load_array(folder_path, 'postings', mmap), storage.load_array(folder_path, 'bounds', mmap))
+        index._loaded_from = folder_path
+        return index
+
+
+def intersect_posting_lists(*posting_lists):
+    """
+    @param posting_lists: sorted and unique values, e.g. the results of SortedArrayHierarchicalIndex.get_array
+    @return: sorted values which are in all posting lists
+    @rtype: numpy.ndarray
+    """
+    assert posting_lists
+
+    # each item of the shortest one is looked up in the others with binary search
+    posting_lists = sorted([numpy.asarray(posting_list, dtype=numpy.int32) for posting_list in posting_lists], key=len)
+    result = posting_lists[0]
+    for posting_list in posting_lists[1:]:
+        if not len(result):
+            break
+        positions = numpy.searchsorted(posting_list, result)
+        positions[positions == len(posting_list)] = 0
+        result = result[posting_list[positions] == result]
+
+    return result
+
+def union_posting_lists(*posting_lists):
+    """
+    @param posting_lists: sorted and unique values, e.g. the results of SortedArrayHierarchicalIndex.get_array
+    @return: sorted values which are in any of the posting lists
+    @rtype: numpy.ndarray
+    """
+    assert posting_lists
+    return numpy.unique(numpy.concatenate([numpy.asarray(posting_list, dtype=numpy.int32) for posting_list in posting_lists]))
@@ -0,0 +1,396 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Concordance query service.
+
+Loads the words of a parseset and the suffix array concordance indexes once, and answers concordance queries over
+HTTP. A request is a batch of queries; for each query, a page of the matches is returned with their context (KWIC
+lines), assembled on the server.
+
+Request, POSTed as JSON to /concordance:
+    {
+        "queries": [
+            {"index": "root", "type": "word", "key": "kitap", "syntactic_category": "Noun"},
+            {"index": "full_word", "type": "prefix", "key": "gel", "page": 2},
+            {"index": "full_word", "type": "phrase", "key": ["bir", "kitap"]}
+        ],
+        "page_size": 25,
+        "context": 5
+    }
+
+    index      : one of INDEX_NAMES
+    type       : one of "word", "prefix", "substring" and "phrase". categories are not used for phrases
+    page       : 0 based
+    page_size  : number of matches in a page, at most MAX_PAGE_SIZE
+    context    : number of words on each side of a match, at most MAX_CONTEXT
+
+    page, page_size, context, syntactic_category and secondary_syntactic_category can be given for the whole batch and
+    be overridden in a query.
+
+Response:
+    {
+        "results": [
+            {"total": 12, "page": 0, "page_size": 25, "lines": [
+                {"offset": 104, "left": ["..."], "match": ["kitabı"], "right": ["..."], "parse_results": ["..."]}
+            ]},
+            {"error": "..."}
+        ]
+    }
+
+Results are in the order of the queries. An invalid query gets an error result, without failing the rest of the batch.
+
+GET /indexes returns the index names and the number of words.
+"""
+import BaseHTTPServer
+import SocketServer
+import hashlib
+import json
+import logging
+import os
+import threading
+import urllib2
+from trnltk.parseset.xmlbindings import UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.explorer import build_concordance_indexes
+from trnltk.treebank.storage import has_metadata
+from trnltk.treebank.suffixarray import CompleteWordSuffixArrayConcordanceIndex, RootSuffixArrayConcordanceIndex, DictionaryItemSuffixArrayConcordanceIndex, TransitionWordSuffixArrayConcordanceIndex, TransitionMatchedWordSuffixArrayConcordanceIndex
+
+logger = logging.getLogger('concordanceservice')
+
+CONCORDANCE_INDEX_CLASSES = [
+    ('full_word', CompleteWordSuffixArrayConcordanceIndex),
+    ('root', RootSuffixArrayConcordanceIndex),
+    ('lemma', DictionaryItemSuffixArrayConcordanceIndex),
+    ('transition_word', TransitionWordSuffixArrayConcordanceIndex),
+    ('transition_matched_word', TransitionMatchedWordSuffixArrayConcordanceIndex)
+]
+
+INDEX_NAMES = [name for name, index_class in CONCORDANCE_INDEX_CLASSES]
+
+QUERY_TYPES = ['word', 'prefix', 'substring', 'phrase']
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 1000
+
+DEFAULT_CONTEXT = 5
+MAX_CONTEXT = 50
+
+def get_word_list_attributes(word_list):
+    """
+    @return: number of words and a checksum of their surfaces and parse results, to be kept in the metadata of the
+        indexes built from the words
+    @rtype: dict
+    """
+    checksum = hashlib.md5()
+    for word in word_list:
+        parse_result = u'' if isinstance(word, UnparsableWordBinding) else word.parse_result
+        checksum.update(u'{}\t{}\n'.format(word.str, parse_result).encode('utf-8'))
+
+    return {'word_count': len(word_list), 'word_list_checksum': checksum.hexdigest()}
+
+def load_concordance_indexes(word_list, index_folder_path=None):
+    """
+    Loads the indexes from the subfolders of the index folder if all of them are there and are built from the same
+    words; otherwise builds them from the words and saves them to the index folder, if given.
+
+    @param word_list: word bindings, as a list since the indexes can be built in a single pass only
+    @param index_folder_path: folder to keep the built indexes
+    @return: index name -> index
+    @rtype: dict
+    """
+    if index_folder_path:
+        word_list_attributes = get_word_list_attributes(word_list)
+        if all([has_metadata(os.path.join(index_folder_path, name), index_class.__name__, **word_list_attributes)
+                for name, index_class in CONCORDANCE_INDEX_CLASSES]):
+            return dict([(name, index_class.load(os.path.join(index_folder_path, name))) for name, index_class in CONCORDANCE_INDEX_CLASSES])
+        logger.info(u'Building the concordance indexes in {}, since they are missing or built from other words'.format(index_folder_path))
+
+    indexes = build_concordance_indexes(word_list, [index_class for name, index_class in CONCORDANCE_INDEX_CLASSES])
+    concordance_indexes = dict(zip(INDEX_NAMES, indexes))
+
+    if index_folder_path:
+        for name, index in concordance_indexes.iteritems():
+            index.save(os.path.join(index_folder_path, name), **word_list_attributes)
+
+    return concordance_indexes
+
+
+class ConcordanceQueryException(Exception):
+    pass
+
+
+class ConcordanceService(object):
+    """
+    Answers batches of concordance queries. Doesn't know about HTTP; ConcordanceServer exposes it.
+
+    Indexes are built when the service is created, so queries don't modify anything and the service can be used from
+    multiple threads.
+    """
+
+    def __init__(self, word_list, concordance_indexes):
+        """
+        @param word_list: word bindings of the parseset, which the offsets in the indexes point to
+        @param concordance_indexes: index name -> suffix array concordance index
+        @type concordance_indexes: dict
+        """
+        self._surfaces = [word.str for word in word_list]
+        self._parse_results = [None if isinstance(word, UnparsableWordBinding) else word.parse_result for word in word_list]
+        self._concordance_indexes = concordance_indexes
+
+        for index in self._concordance_indexes.itervalues():
+            index.build()
+
+    @classmethod
+    def from_parseset(cls, parseset_path, index_folder_path=None):
+        """
+        @param index_folder_path: folder to keep the built indexes. if indexes are there, they are loaded instead of
+            being built
+        @rtype: ConcordanceService
+        """
+        word_list = list(StreamingParseSetReader(parseset_path).iter_words())
+        return cls(word_list, load_concordance_indexes(word_list, index_folder_path))
+
+    @property
+    def word_count(self):
+        return len(self._surfaces)
+
+    def query_batch(self, request):
+        """
+        @param request: dict with the queries and the defaults for them, as described in the module documentation
+        @return: dict with a result for each query
+        """
+        if not isinstance(request, dict) or not isinstance(request.get('queries'), list):
+            raise ConcordanceQueryException('Request should have a list of queries')
+
+        defaults = dict((key, value) for key, value in request.iteritems() if key != 'queries')
+
+        results = []
+        for query in request['queries']:
+            try:
+                if not isinstance(query, dict):
+                    raise ConcordanceQueryException('Query should be an object')
+
+                merged_query = dict(defaults)
+                merged_query.update(query)
+                results.append(self.query(merged_query))
+            except ConcordanceQueryException, e:
+                results.append({'error': unicode(e)})
+
+        return {'results': results}
+
+    def query(self, query):
+        """
+        @param query: dict with the index, type, key and optionally the categories and paging of the query
+        @return: dict with the total number of matches and the KWIC lines of the requested page
+        """
+        index_name = self._get_str(query, 'index', 'full_word')
+        if index_name not in self._concordance_indexes:
+            raise ConcordanceQueryException(u'Unknown index : {}'.format(index_name))
+
+        query_type = self._get_str(query, 'type', 'word')
+        if query_type not in QUERY_TYPES:
+            raise ConcordanceQueryException(u'Unknown query type : {}'.format(query_type))
+
+        page = self._get_int(query, 'page', 0, 0, None)
+        page_size = self._get_int(query, 'page_size', DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+        context = self._get_int(query, 'context', DEFAULT_CONTEXT, 0, MAX_CONTEXT)
+
+        offsets, match_length = self._find_offsets(self._concordance_indexes[index_name], query_type, query)
+
+        page_offsets = offsets[page * page_size:(page + 1) * page_size]
+
+        return {
+            'total': len(offsets),
+            'page': page,
+            'page_size': page_size,
+            'lines': [self._kwic_line(offset, match_length, context) for offset in page_offsets]
+        }
+
+    def _find_offsets(self, index, query_type, query):
+        key = query.get('key')
+
+        if query_type == 'phrase':
+            if not isinstance(key, list) or not key or not all([isinstance(word_str, basestring) and word_str for word_str in key]):
+                raise ConcordanceQueryException('Key of a phrase query should be a non-empty list of words')
+            return index.phrase_offsets(key, bool(query.get('last_word_as_prefix'))), len(key)
+
+        if not isinstance(key, basestring) or not key:
+            raise ConcordanceQueryException('Key of a query should be a non-empty string')
+
+        syntactic_category = self._get_str(query, 'syntactic_category', None)
+        secondary_syntactic_category = self._get_str(query, 'secondary_syntactic_category', None)
+        if secondary_syntactic_category and not syntactic_category:
+            raise ConcordanceQueryException('Secondary syntactic category is given without a syntactic category')
+
+        if query_type == 'word':
+            offsets = index.offsets(key, syntactic_category, secondary_syntactic_category)
+        elif query_type == 'prefix':
+            offsets = index.prefix_offsets(key, syntactic_category, secondary_syntactic_category)
+        else:
+            offsets = index.substring_offsets(key, syntactic_category, secondary_syntactic_category)
+
+        return offsets, 1
+
+    def _get_str(self, query, name, default):
+        value = query.get(name)
+        if value is None:
+            return default
+        if not isinstance(value, basestring):
+            raise ConcordanceQueryException(u'Invalid {} : {}'.format(name, value))
+        return value
+
+    def _get_int(self, query, name, default, minimum, maximum):
+        value = query.get(name)
+        if value is None:
+            return default
+        if not isinstance(value, (int, long)) or isinstance(value, bool) or value < minimum or (maximum is not None and value > maximum):
+            raise ConcordanceQueryException(u'Invalid {} : {}'.format(name, value))
+        return value
+
+    def _kwic_line(self, offset, match_length, context):
+        match_end = offset + match_length
+        return {
+            'offset': offset,
+            'left': self._surfaces[max(0, offset - context):offset],
+            'match': self._surfaces[offset:match_end],
+            'right': self._surfaces[match_end:match_end + context],
+            'parse_results': self._parse_results[offset:match_end]
+        }
+
+
+class _ConcordanceRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != '/indexes':
+            self._send_json(404, {'error': 'Not found : ' + self.path})
+            return
+
+        self._send_json(200, {'indexes': INDEX_NAMES, 'word_count': self.server.service.word_count})
+
+    def do_POST(self):
+        if self.path != '/concordance':
+            self._send_json(404, {'error': 'Not found : ' + self.path})
+            return
+
+        try:
+            content_length = int(self.headers.getheader('content-length', 0))
+            request = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            response = self.server.service.query_batch(request)
+        except (ValueError, ConcordanceQueryException), e:
+            self._send_json(400, {'error': unicode(e)})
+            return
+
+        self._send_json(200, response)
+
+    def _send_json(self, status, content):
+        body = json.dumps(content, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+class ConcordanceServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    HTTP server of a ConcordanceService. Each request is handled in its own thread.
+
+    Usage:
+        server = ConcordanceServer(service, ('localhost', 8080))
+        server.serve_forever()
+
+    Port 0 binds to a free port, which is available as server.server_address[1].
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, service, server_address=('localhost', 0)):
+        """
+        @type service: ConcordanceService
+        """
+        BaseHTTPServer.HTTPServer.__init__(self, server_address, _ConcordanceRequestHandler)
+        self.service = service
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        """
+        Starts serving in a daemon thread, e.g. for using the server from a notebook or a test.
+        @return: the thread serving
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+class ConcordanceClient(object):
+    """
+    Sends queries to a ConcordanceServer.
+    """
+
+    def __init__(self, url, timeout=60):
+        """
+        @param url: url of the server, like "http://localhost:8080"
+        """
+        self._url = url.rstrip('/')
+        self._timeout = timeout
+
+    def indexes(self):
+        return self._open(urllib2.Request(self._url + '/indexes'))
+
+    def query_batch(self, queries, **defaults):
+        """
+        @param queries: list of query dicts
+        @param defaults: page, page_size, context, syntactic_category... for all queries
+        @return: list of results, in the order of the queries
+        """
+        request = dict(defaults)
+        request['queries'] = queries
+        body = json.dumps(request, ensure_ascii=False)
+        if isinstance(body, unicode):
+            body = body.encode('utf-8')
+        http_request = urllib2.Request(self._url + '/concordance', body, {'Content-Type': 'application/json; charset=utf-8'})
+        return self._open(http_request)['results']
+
+    def query(self, index, query_type, key, **kwargs):
+        """
+        Sends a single query.
+        @return: result of the query
+        """
+        query = dict(kwargs)
+        query.update({'index': index, 'type': query_type, 'key': key})
+        result = self.query_batch([query])[0]
+        if 'error' in result:
+            raise ConcordanceQueryException(result['error'])
+        return result
+
+    def _open(self, http_request):
+        try:
+            response = urllib2.urlopen(http_request, timeout=self._timeout)
+        except urllib2.HTTPError, e:
+            raise ConcordanceQueryException(json.loads(e.read().decode('utf-8')).get('error', unicode(e)))
+
+        try:
+            return json.loads(response.read().decode('utf-8'))
+        finally:
+            response.close()
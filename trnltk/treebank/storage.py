@@ -0,0 +1,100 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Folder format of the persisted treebank indexes.
+
+Each array is a ".npy" file, which is opened memory-mapped; thus opening an index doesn't read the arrays and
+processes opening the same index share the pages of the files. Other attributes are kept in JSON files.
+
+Metadata file is written last, so a folder without it is an incomplete index. Metadata can have other attributes too,
+e.g. to tell which words the index is built from.
+"""
+import json
+import os
+import numpy
+
+FORMAT_VERSION = 1
+
+METADATA_FILE_NAME = 'metadata.json'
+
+def is_index_folder(folder_path):
+    return os.path.exists(os.path.join(folder_path, METADATA_FILE_NAME))
+
+def save_metadata(folder_path, index_type, **attributes):
+    """
+    @param index_type: name of the class of the index, checked when loading
+    """
+    metadata = dict(attributes)
+    metadata['index_type'] = index_type
+    metadata['format_version'] = FORMAT_VERSION
+    save_json(folder_path, METADATA_FILE_NAME, metadata)
+
+def has_metadata(folder_path, index_type, **attributes):
+    """
+    @return: True if the folder has a complete index of the type and version, with the given metadata attributes
+    @rtype: bool
+    """
+    if not is_index_folder(folder_path):
+        return False
+
+    metadata = load_json(folder_path, METADATA_FILE_NAME)
+    if metadata.get('format_version') != FORMAT_VERSION or metadata.get('index_type') != index_type:
+        return False
+
+    return all([metadata.get(name) == value for name, value in attributes.iteritems()])
+
+def load_metadata(folder_path, index_type):
+    """
+    @rtype: dict
+    """
+    if not is_index_folder(folder_path):
+        raise Exception('No index found in {}'.format(folder_path))
+
+    metadata = load_json(folder_path, METADATA_FILE_NAME)
+    if metadata['format_version'] != FORMAT_VERSION:
+        raise Exception('Unsupported index format version {} in {}'.format(metadata['format_version'], folder_path))
+    if metadata['index_type'] != index_type:
+        raise Exception('Index in {} is a {}, not a {}'.format(folder_path, metadata['index_type'], index_type))
+
+    return metadata
+
+def create_folder(folder_path):
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+
+    # previous index is not valid anymore, even if writing the new one fails
+    metadata_path = os.path.join(folder_path, METADATA_FILE_NAME)
+    if os.path.exists(metadata_path):
+        os.remove(metadata_path)
+
+def save_array(folder_path, name, array):
+    numpy.save(os.path.join(folder_path, name + '.npy'), array)
+
+def load_array(folder_path, name, mmap=True):
+    """
+    @param mmap: if True, array is memory-mapped read-only. otherwise, it is read into memory
+    @rtype: numpy.ndarray
+    """
+    return numpy.load(os.path.join(folder_path, name + '.npy'), mmap_mode='r' if mmap else None)
+
+def save_json(folder_path, file_name, obj):
+    with open(os.path.join(folder_path, file_name), 'wb') as f:
+        json.dump(obj, f)
+
+def load_json(folder_path, file_name):
+    with open(os.path.join(folder_path, file_name), 'rb') as f:
+        return json.load(f)
@@ -0,0 +1,344 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+r"""
+Concordance indexes backed by a suffix array over the token stream of a treebank.
+
+Concordance indexes in explorer module can only find exact keys. Here, the keys of the words (e.g. surfaces for
+the complete word index) are concatenated into a text, with a separator (SEPARATOR, the NUL char, written as \0 below)
+before and after each one:
+
+    \0o\0onu\0gittim\0giderim\0
+
+and a suffix array of that text is built. Then, finding all occurrences of any string is two binary searches on the
+suffix array:
+    * "\0kitab"          : keys starting with "kitab"
+    * "itab"             : keys containing "itab"
+    * "\0kitabı\0"       : key "kitabı"
+    * "\0bir\0kitabı\0"  : key "bir" followed by "kitabı", i.e. a phrase
+
+Keys of non-consecutive words are separated by two separators, so that a phrase matches consecutive words only.
+
+Suffix array is a numpy array and the text is a unicode string; results are offsets of the words in the word list,
+like the offsets of the concordance indexes in explorer module.
+"""
+import io
+import os
+import numpy
+from trnltk.parseset.xmlbindings import UnparsableWordBinding, DerivationalSuffixBinding
+from trnltk.treebank import storage
+
+SEPARATOR = u'\x00'
+
+def build_suffix_array(codes):
+    """
+    Builds the suffix array by prefix doubling: suffixes are sorted by their first 1, 2, 4, ... characters, using the
+    ranks of the previous round, until all ranks are distinct.
+
+    @param codes: code points of the text
+    @type codes: numpy.ndarray
+    @return: start positions of the suffixes of the text, in the sorted order of the suffixes
+    @rtype: numpy.ndarray
+    """
+    length = len(codes)
+    if length == 0:
+        return numpy.zeros(0, dtype=numpy.int32)
+
+    rank = codes.astype(numpy.int64)
+    step = 1
+    while True:
+        # rank of the suffix starting "step" characters later; -1 when there is no such suffix, which sorts first
+        next_rank = numpy.full(length, -1, dtype=numpy.int64)
+        next_rank[:length - step] = rank[step:]
+
+        suffix_array = numpy.lexsort((next_rank, rank))
+
+        sorted_rank = rank[suffix_array]
+        sorted_next_rank = next_rank[suffix_array]
+        changes = (sorted_rank[1:] != sorted_rank[:-1]) | (sorted_next_rank[1:] != sorted_next_rank[:-1])
+
+        rank = numpy.empty(length, dtype=numpy.int64)
+        rank[suffix_array] = numpy.concatenate(([0], numpy.cumsum(changes)))
+
+        if rank[suffix_array[-1]] == length - 1 or step >= length:
+            return suffix_array.astype(numpy.int32)
+
+        step *= 2
+
+
+class SuffixArrayConcordanceIndex(object):
+    """
+    Base class of the suffix array concordance indexes. Subclasses decide which keys a word has, just like the
+    concordance indexes in explorer module; thus they can be built in the same pass with
+    explorer.build_concordance_indexes.
+
+    Suffix array is built on the first query after the words are added.
+
+    Index can be saved to a folder and loaded from there, with the arrays memory-mapped. Text of the keys is read into
+    memory, since the binary search compares its slices. A loaded index can't be modified.
+    """
+
+    def __init__(self, word_list=()):
+        """
+        @param word_list: any iterable of word bindings, e.g. StreamingParseSetReader.iter_words()
+        """
+        self._keys = []
+        self._key_offsets = []
+        self._key_syntactic_categories = []
+        self._key_secondary_syntactic_categories = []
+
+        self._text = None
+        self._suffix_array = None
+        self._key_starts = None
+        self._offset_array = None
+        self._syntactic_category_array = None
+        self._secondary_syntactic_category_array = None
+        self._category_ids = None
+        self._loaded_from = None
+
+        for index, word in enumerate(word_list):
+            if isinstance(word, UnparsableWordBinding):
+                continue
+
+            self.add_word(index, word)
+
+    def add_word(self, index, word):
+        """
+        @type index: int
+        @type word: WordBinding
+        """
+        raise NotImplementedError()
+
+    def _add_key(self, index, key, syntactic_category, secondary_syntactic_category):
+        if self._loaded_from is not None:
+            raise Exception('Index loaded from {} cannot be modified'.format(self._loaded_from))
+
+        if not key:
+            return
+
+        assert SEPARATOR not in key
+
+        self._keys.append(key)
+        self._key_offsets.append(index)
+        self._key_syntactic_categories.append(syntactic_category)
+        self._key_secondary_syntactic_categories.append(secondary_syntactic_category)
+
+        # needs to be built again
+        self._suffix_array = None
+
+    def build(self):
+        """
+        Builds the suffix array now, instead of on the first query. Queries don't modify a built index, thus it can be
+        queried from multiple threads.
+        """
+        if self._suffix_array is None:
+            self._build()
+
+    def _build(self):
+        text_parts = []
+        key_starts = []
+        position = 0
+        previous_offset = None
+        for key, offset in zip(self._keys, self._key_offsets):
+            if previous_offset is not None and offset != previous_offset + 1:
+                # an extra separator, so that a phrase can't match the keys of non-consecutive words or the keys of
+                # the same word
+                text_parts.append(SEPARATOR)
+                position += 1
+
+            key_starts.append(position)
+            text_parts.append(SEPARATOR)
+            text_parts.append(key)
+            position += 1 + len(key)
+            previous_offset = offset
+        text_parts.append(SEPARATOR)
+
+        self._text = u''.join(text_parts)
+        self._suffix_array = build_suffix_array(numpy.fromiter((ord(c) for c in self._text), dtype=numpy.int32, count=len(self._text)))
+        self._key_starts = numpy.array(key_starts, dtype=numpy.int32)
+        self._offset_array = numpy.array(self._key_offsets, dtype=numpy.int32)
+
+        self._category_ids = {}
+        self._syntactic_category_array = numpy.array([self._get_category_id(c) for c in self._key_syntactic_categories], dtype=numpy.int32)
+        self._secondary_syntactic_category_array = numpy.array([self._get_category_id(c) for c in self._key_secondary_syntactic_categories], dtype=numpy.int32)
+
+    def save(self, folder_path, **attributes):
+        """
+        @param attributes: additional attributes to keep in the metadata
+        """
+        if self._suffix_array is None:
+            self._build()
+
+        categories = [None] * len(self._category_ids)
+        for category, category_id in self._category_ids.iteritems():
+            categories[category_id] = category
+
+        storage.create_folder(folder_path)
+        with io.open(os.path.join(folder_path, 'text.txt'), 'w', encoding='utf-8') as f:
+            f.write(self._text)
+        storage.save_array(folder_path, 'suffix_array', self._suffix_array)
+        storage.save_array(folder_path, 'key_starts', self._key_starts)
+        storage.save_array(folder_path, 'offsets', self._offset_array)
+        storage.save_array(folder_path, 'syntactic_categories', self._syntactic_category_array)
+        storage.save_array(folder_path, 'secondary_syntactic_categories', self._secondary_syntactic_category_array)
+        storage.save_json(folder_path, 'categories.json', categories)
+        storage.save_metadata(folder_path, self.__class__.__name__, **attributes)
+
+    @classmethod
+    def load(cls, folder_path, mmap=True):
+        """
+        @param mmap: if True, arrays are memory-mapped instead of being read into memory
+        """
+        storage.load_metadata(folder_path, cls.__name__)
+
+        index = cls()
+        with io.open(os.path.join(folder_path, 'text.txt'), 'r', encoding='utf-8', newline='') as f:
+            index._text = f.read()
+        index._suffix_array = storage.load_array(folder_path, 'suffix_array', mmap)
+        index._key_starts = storage.load_array(folder_path, 'key_starts', mmap)
+        index._offset_array = storage.load_array(folder_path, 'offsets', mmap)
+        index._syntactic_category_array = storage.load_array(folder_path, 'syntactic_categories', mmap)
+        index._secondary_syntactic_category_array = storage.load_array(folder_path, 'secondary_syntactic_categories', mmap)
+        index._category_ids = dict((category, category_id) for category_id, category in enumerate(storage.load_json(folder_path, 'categories.json')))
+        index._loaded_from = folder_path
+        return index
+
+    def _get_category_id(self, category):
+        return self._category_ids.setdefault(category, len(self._category_ids))
+
+    def _find(self, pattern):
+        """
+        @return: range of the suffixes starting with the pattern, in the suffix array
+        """
+        text = self._text
+        suffix_array = self._suffix_array
+        pattern_length = len(pattern)
+
+        low, high = 0, len(suffix_array)
+        while low < high:
+            middle = (low + high) // 2
+            position = suffix_array[middle]
+            if text[position:position + pattern_length] < pattern:
+                low = middle + 1
+            else:
+                high = middle
+        start = low
+
+        high = len(suffix_array)
+        while low < high:
+            middle = (low + high) // 2
+            position = suffix_array[middle]
+            if text[position:position + pattern_length] <= pattern:
+                low = middle + 1
+            else:
+                high = middle
+
+        return start, low
+
+    def _search(self, pattern, syntactic_category, secondary_syntactic_category):
+        if secondary_syntactic_category:
+            assert syntactic_category is not None
+
+        if self._suffix_array is None:
+            self._build()
+
+        start, end = self._find(pattern)
+        if start == end:
+            return []
+
+        key_indexes = numpy.searchsorted(self._key_starts, self._suffix_array[start:end], side='right') - 1
+
+        if syntactic_category is not None:
+            if syntactic_category not in self._category_ids:
+                return []
+            key_indexes = key_indexes[self._syntactic_category_array[key_indexes] == self._category_ids[syntactic_category]]
+
+        if secondary_syntactic_category is not None:
+            if secondary_syntactic_category not in self._category_ids:
+                return []
+            key_indexes = key_indexes[self._secondary_syntactic_category_array[key_indexes] == self._category_ids[secondary_syntactic_category]]
+
+        return numpy.unique(self._offset_array[key_indexes]).tolist()
+
+    def offsets(self, word_str, syntactic_category=None, secondary_syntactic_category=None):
+        """
+        @return: offsets of the words with the key, same with the explorer concordance indexes
+        @rtype: list<int>
+        """
+        assert word_str
+        return self._search(SEPARATOR + word_str + SEPARATOR, syntactic_category, secondary_syntactic_category)
+
+    def prefix_offsets(self, prefix, syntactic_category=None, secondary_syntactic_category=None):
+        """
+        @return: offsets of the words with a key starting with the prefix
+        @rtype: list<int>
+        """
+        assert prefix
+        return self._search(SEPARATOR + prefix, syntactic_category, secondary_syntactic_category)
+
+    def substring_offsets(self, substring, syntactic_category=None, secondary_syntactic_category=None):
+        """
+        @return: offsets of the words with a key containing the substring
+        @rtype: list<int>
+        """
+        assert substring
+        return self._search(substring, syntactic_category, secondary_syntactic_category)
+
+    def phrase_offsets(self, word_strs, last_word_as_prefix=False):
+        """
+        @param word_strs: keys of consecutive words
+        @param last_word_as_prefix: if True, key of the last word only needs to start with the last item
+        @return: offsets of the first words of the phrases
+        @rtype: list<int>
+        """
+        assert word_strs and all(word_strs)
+        pattern = SEPARATOR + SEPARATOR.join(word_strs)
+        if not last_word_as_prefix:
+            pattern += SEPARATOR
+        return self._search(pattern, None, None)
+
+
+class CompleteWordSuffixArrayConcordanceIndex(SuffixArrayConcordanceIndex):
+    def add_word(self, index, word):
+        self._add_key(index, word.str, word.syntactic_category, word.secondary_syntactic_category)
+
+class RootSuffixArrayConcordanceIndex(SuffixArrayConcordanceIndex):
+    def add_word(self, index, word):
+        self._add_key(index, word.root.str, word.root.syntactic_category, word.root.secondary_syntactic_category)
+
+class DictionaryItemSuffixArrayConcordanceIndex(SuffixArrayConcordanceIndex):
+    def add_word(self, index, word):
+        self._add_key(index, word.root.lemma_root, word.root.syntactic_category, word.root.secondary_syntactic_category)
+
+class TransitionWordSuffixArrayConcordanceIndex(SuffixArrayConcordanceIndex):
+    def add_word(self, index, word):
+        secondary_syntactic_category = word.root.secondary_syntactic_category
+        for suffix in word.suffixes:
+            syntactic_category = suffix.to_syntactic_category
+            if isinstance(suffix, DerivationalSuffixBinding):
+                secondary_syntactic_category = None
+
+            self._add_key(index, suffix.word, syntactic_category, secondary_syntactic_category)
+
+class TransitionMatchedWordSuffixArrayConcordanceIndex(SuffixArrayConcordanceIndex):
+    def add_word(self, index, word):
+        secondary_syntactic_category = word.root.secondary_syntactic_category
+        for suffix in word.suffixes:
+            syntactic_category = suffix.to_syntactic_category
+            if isinstance(suffix, DerivationalSuffixBinding):
+                secondary_syntactic_category = None
+
+            self._add_key(index, suffix.matched_word, syntactic_category, secondary_syntactic_category)
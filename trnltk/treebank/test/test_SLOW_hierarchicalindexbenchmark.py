@@ -0,0 +1,72 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Compares the query times of HierarchicalIndex and SortedArrayHierarchicalIndex for broad queries, i.e. words without
+syntactic categories, on the transition word concordance of the biggest bundled parseset.
+"""
+import os
+import time
+import unittest
+from trnltk.parseset.xmlbindings import UnparsableWordBinding, DerivationalSuffixBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.model import HierarchicalIndex, SortedArrayHierarchicalIndex
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset004.xml')
+
+REPEAT_COUNT = 20
+
+class HierarchicalIndexBenchmark(unittest.TestCase):
+    def _build(self, index_class, word_list):
+        idx = index_class(3)
+        for index, word in enumerate(word_list):
+            if isinstance(word, UnparsableWordBinding):
+                continue
+            for suffix in word.suffixes:
+                secondary_syntactic_category = None if isinstance(suffix, DerivationalSuffixBinding) else word.root.secondary_syntactic_category
+                idx.insert(index, suffix.word, suffix.to_syntactic_category, secondary_syntactic_category)
+        return idx
+
+    def _query_all(self, idx, keys):
+        start = time.time()
+        for i in range(0, REPEAT_COUNT):
+            for key in keys:
+                idx.get(key)
+        return (time.time() - start) / (REPEAT_COUNT * len(keys))
+
+    def test_benchmark_broad_queries(self):
+        word_list = list(StreamingParseSetReader(PARSESET_PATH).iter_words())
+
+        nested_index = self._build(HierarchicalIndex, word_list)
+        array_index = self._build(SortedArrayHierarchicalIndex, word_list)
+        keys = list(nested_index._indices.keys())
+
+        array_index.get(keys[0])
+
+        nested_time = self._query_all(nested_index, keys)
+        array_time = self._query_all(array_index, keys)
+
+        print u'{} keys'.format(len(keys))
+        print u'HierarchicalIndex            : {:.4f} ms/query'.format(nested_time * 1000)
+        print u'SortedArrayHierarchicalIndex : {:.4f} ms/query'.format(array_time * 1000)
+
+        for key in keys:
+            self.assertEqual(array_index.get(key), nested_index.get(key))
+
+        self.assertLess(array_time, nested_time)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""
+Measures the build time and the query latency of the suffix array concordance index on the biggest bundled parseset.
+"""
+import os
+import time
+import unittest
+from trnltk.parseset.xmlbindings import UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.suffixarray import CompleteWordSuffixArrayConcordanceIndex
+
+PARSESET_PATH = os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset004.xml')
+
+class SuffixArrayConcordanceIndexBenchmark(unittest.TestCase):
+    def test_benchmark_queries(self):
+        word_list = list(StreamingParseSetReader(PARSESET_PATH).iter_words())
+        surfaces = [word.str for word in word_list if not isinstance(word, UnparsableWordBinding)]
+
+        start = time.time()
+        idx = CompleteWordSuffixArrayConcordanceIndex(word_list)
+        idx.offsets(surfaces[0])
+        print u'Built index of {} words in {:.3f} s'.format(len(word_list), time.time() - start)
+
+        queries = [
+            ('exact', idx.offsets, surfaces[::50]),
+            ('prefix', idx.prefix_offsets, [surface[:3] for surface in surfaces[::50]]),
+            ('substring', idx.substring_offsets, [surface[1:4] for surface in surfaces[::50] if len(surface) > 3]),
+            ('phrase', idx.phrase_offsets, [surfaces[i:i + 3] for i in range(0, len(surfaces) - 3, 50)])
+        ]
+
+        for name, query, arguments in queries:
+            start = time.time()
+            result_count = 0
+            for argument in arguments:
+                result_count += len(query(argument))
+            average_latency = (time.time() - start) / len(arguments)
+
+            print u'{:>10} : {} queries, {:.1f} results/query, {:.3f} ms/query'.format(name, len(arguments),
+                float(result_count) / len(arguments), average_latency * 1000)
+
+            self.assertLess(average_latency, 0.001)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,9 +16,8 @@ limitations under the License.
 """
 import os
 import unittest
-from xml.dom.minidom import parse
 from hamcrest import *
-from trnltk.parseset.xmlbindings import ParseSetBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
 from trnltk.treebank.explorer import CompleteWordConcordanceIndex, RootConcordanceIndex, DictionaryItemConcordanceIndex, TransitionWordConcordanceIndex, TransitionMatchedWordConcordanceIndex
 
 class ExplorerTest(unittest.TestCase):
@@ -43,11 +42,8 @@ class ExplorerTest(unittest.TestCase):
 
 
     def _validate_concordances_for_parse_set_n(self, parseset_index):
-        dom = parse(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
-        parseset = ParseSetBinding.build(dom.getElementsByTagName("parseset")[0])
-        word_list = []
-        for sentence in parseset.sentences:
-            word_list.extend(sentence.words)
+        reader = StreamingParseSetReader(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index)))
+        word_list = list(reader.iter_words())
 
         self._validate_complete_word_concordance_indexes(word_list)
         self._validate_root_concordance_indexes(word_list)
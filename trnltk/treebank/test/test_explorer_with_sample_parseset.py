@@ -15,6 +15,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
+import shutil
+import tempfile
 import unittest
 from xml.dom.minidom import parse
 from hamcrest import *
@@ -136,5 +138,23 @@ class ExplorerTestWithSampleParseSet(unittest.TestCase):
         assert_that(idx.offsets(u"gideceğ", SyntacticCategory.NOUN), equal_to([11]))
         assert_that(idx.offsets(u"gideceğ", SyntacticCategory.VERB), equal_to([9]))
 
+    def test_should_save_and_load_concordance_indexes(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for index_class in (CompleteWordConcordanceIndex, RootConcordanceIndex, DictionaryItemConcordanceIndex, TransitionWordConcordanceIndex, TransitionMatchedWordConcordanceIndex):
+                idx = index_class(self.word_list)
+                folder_path = os.path.join(temp_dir, index_class.__name__)
+                idx.save(folder_path)
+                loaded = index_class.load(folder_path)
+
+                for key in idx._offsets._indices.keys():
+                    assert_that(loaded.offsets(key), equal_to(idx.offsets(key)))
+                    for syntactic_category in idx._offsets._indices[key].keys():
+                        assert_that(loaded.offsets(key, syntactic_category), equal_to(idx.offsets(key, syntactic_category)))
+
+            self.assertRaises(Exception, lambda: RootConcordanceIndex.load(os.path.join(temp_dir, 'CompleteWordConcordanceIndex')))
+        finally:
+            shutil.rmtree(temp_dir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,13 +14,17 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import shutil
+import tempfile
 import unittest
 from hamcrest import *
-from trnltk.treebank.model import HierarchicalIndex
+from trnltk.treebank.model import HierarchicalIndex, SortedArrayHierarchicalIndex, intersect_posting_lists, union_posting_lists
 
 class HierarchicalIndexTest(unittest.TestCase):
+    index_class = HierarchicalIndex
+
     def test_index_with_sample_case_for_depth_2(self):
-        idx = HierarchicalIndex(2)
+        idx = self.index_class(2)
 
         # A
         idx.insert(1, 'A', 'X')
@@ -46,7 +50,7 @@ class HierarchicalIndexTest(unittest.TestCase):
 
 
     def test_index_with_sample_case_for_depth_3(self):
-        idx = HierarchicalIndex(3)
+        idx = self.index_class(3)
 
         # A
         idx.insert(1, 'A', 'X', 'i')
@@ -76,16 +80,16 @@ class HierarchicalIndexTest(unittest.TestCase):
         assert_that(idx.get('A', 'X', 'ii'), equal_to([2, 3]))
 
     def test_index_should_not_init_with_wrong_args(self):
-        self.assertRaises(AssertionError, lambda: HierarchicalIndex(depth=1))
-        self.assertRaises(AssertionError, lambda: HierarchicalIndex(depth=0))
-        self.assertRaises(AssertionError, lambda: HierarchicalIndex(depth='a'))
-        self.assertRaises(AssertionError, lambda: HierarchicalIndex(depth=list()))
-        self.assertRaises(AssertionError, lambda: HierarchicalIndex(depth=2.3))
+        self.assertRaises(AssertionError, lambda: self.index_class(depth=1))
+        self.assertRaises(AssertionError, lambda: self.index_class(depth=0))
+        self.assertRaises(AssertionError, lambda: self.index_class(depth='a'))
+        self.assertRaises(AssertionError, lambda: self.index_class(depth=list()))
+        self.assertRaises(AssertionError, lambda: self.index_class(depth=2.3))
 
 
     def test_index_should_validate_depth_in_operations(self):
         # depth=2
-        idx = HierarchicalIndex(2)
+        idx = self.index_class(2)
 
         assert_that(idx.get('A'), has_length(0))
         assert_that(idx.get('A', 'X'), has_length(0))
@@ -99,7 +103,7 @@ class HierarchicalIndexTest(unittest.TestCase):
         assert_that(idx.get('A', 'X'), equal_to([1]))
 
         # depth=3
-        idx = HierarchicalIndex(3)
+        idx = self.index_class(3)
 
         assert_that(idx.get('A'), has_length(0))
         assert_that(idx.get('A', 'X'), has_length(0))
@@ -116,7 +120,7 @@ class HierarchicalIndexTest(unittest.TestCase):
 
         # depth=N
         N = 100
-        idx = HierarchicalIndex(N)
+        idx = self.index_class(N)
         for i in range(1, N + 1):
             assert_that(idx.get(*range(0, i)), has_length(0))   # try calling idx.get(0,0,0,0.....0) with N items at last iteration
         self.assertRaises(AssertionError, lambda: idx.get(*range(0, N + 1)))
@@ -127,5 +131,57 @@ class HierarchicalIndexTest(unittest.TestCase):
 
         assert_that(idx.get(*range(0, N)), equal_to([1]))
 
+class SortedArrayHierarchicalIndexTest(HierarchicalIndexTest):
+    index_class = SortedArrayHierarchicalIndex
+
+    def test_should_return_sorted_arrays(self):
+        idx = SortedArrayHierarchicalIndex(2)
+        idx.insert(5, 'A', 'X')
+        idx.insert(1, 'A', 'Y')
+        idx.insert(5, 'A', 'Y')
+
+        assert_that(idx.get_array('A').tolist(), equal_to([1, 5]))
+        assert_that(idx.get_array('B').tolist(), equal_to([]))
+        self.assertRaises(ValueError, lambda: idx.get_array('A').fill(0))
+
+        # posting lists are built again after an insert
+        idx.insert(3, 'A', 'X')
+        assert_that(idx.get('A'), equal_to([1, 3, 5]))
+        assert_that(idx.get('A', 'X'), equal_to([3, 5]))
+
+    def test_should_save_and_load(self):
+        idx = SortedArrayHierarchicalIndex(3)
+        idx.insert(1, u'A', u'X', None)
+        idx.insert(2, u'A', u'X', u'i')
+        idx.insert(3, u'A', u'Y', u'')
+        idx.insert(4, u'B', u'X', u'i')
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            idx.save(temp_dir)
+
+            for mmap in (True, False):
+                loaded = SortedArrayHierarchicalIndex.load(temp_dir, mmap)
+                for path in [(u'A',), (u'A', u'X'), (u'A', u'X', None), (u'A', u'X', u'i'), (u'A', u'Y', u''), (u'B',), (u'C',)]:
+                    assert_that(loaded.get(*path), equal_to(idx.get(*path)))
+
+                self.assertRaises(Exception, lambda: loaded.insert(5, u'A', u'X', u'i'))
+
+            self.assertRaises(Exception, lambda: SortedArrayHierarchicalIndex.load(temp_dir, index_type='SomeOtherIndex'))
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertRaises(Exception, lambda: SortedArrayHierarchicalIndex.load(temp_dir))
+
+    def test_should_intersect_posting_lists(self):
+        assert_that(intersect_posting_lists([1, 3, 5, 7]).tolist(), equal_to([1, 3, 5, 7]))
+        assert_that(intersect_posting_lists([1, 3, 5, 7], [3, 4, 7, 8]).tolist(), equal_to([3, 7]))
+        assert_that(intersect_posting_lists([1, 3, 5, 7], [3, 4, 7, 8], [0, 7, 100]).tolist(), equal_to([7]))
+        assert_that(intersect_posting_lists([1, 3, 5, 7], [100, 200]).tolist(), equal_to([]))
+        assert_that(intersect_posting_lists([1, 3, 5, 7], []).tolist(), equal_to([]))
+
+    def test_should_union_posting_lists(self):
+        assert_that(union_posting_lists([1, 3, 5, 7], [3, 4, 7, 8], []).tolist(), equal_to([1, 3, 4, 5, 7, 8]))
+
 if __name__ == '__main__':
     unittest.main()
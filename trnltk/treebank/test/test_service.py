@@ -0,0 +1,172 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from hamcrest import *
+from trnltk.morphology.model.lexeme import SyntacticCategory, SecondarySyntacticCategory
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.service import ConcordanceService, ConcordanceServer, ConcordanceClient, ConcordanceQueryException, load_concordance_indexes, INDEX_NAMES
+
+SAMPLE_PARSESET_PATH = os.path.join(os.path.dirname(__file__), 'concordance_sample_parseset.xml')
+
+class ConcordanceServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ConcordanceService.from_parseset(SAMPLE_PARSESET_PATH)
+
+    def test_should_answer_batch_of_queries(self):
+        response = self.service.query_batch({
+            'queries': [
+                {'index': 'full_word', 'type': 'word', 'key': u'o'},
+                {'index': 'root', 'type': 'word', 'key': u'o', 'syntactic_category': SyntacticCategory.PRONOUN, 'secondary_syntactic_category': SecondarySyntacticCategory.PERSONAL},
+                {'index': 'full_word', 'type': 'prefix', 'key': u'gidece'},
+                {'index': 'full_word', 'type': 'substring', 'key': u'ece', 'context': 0},
+                {'index': 'full_word', 'type': 'phrase', 'key': [u'gittim', u'giderim']},
+                {'index': 'full_word', 'type': 'word', 'key': u'kitap'}
+            ],
+            'context': 2
+        })
+
+        results = response['results']
+        assert_that(len(results), equal_to(6))
+
+        assert_that(results[0]['total'], equal_to(3))
+        assert_that([line['offset'] for line in results[0]['lines']], equal_to([0, 1, 2]))
+        assert_that(results[0]['lines'][1], equal_to({'offset': 1, 'left': [u'o'], 'match': [u'o'], 'right': [u'o', u'onu'], 'parse_results': [self.service._parse_results[1]]}))
+
+        assert_that([line['offset'] for line in results[1]['lines']], equal_to([0, 3]))
+
+        assert_that([line['offset'] for line in results[2]['lines']], equal_to([8, 9, 10, 11]))
+        assert_that(results[2]['lines'][0]['left'], equal_to([u'gittim', u'giderim']))
+        assert_that(results[2]['lines'][3]['right'], equal_to([]))
+
+        assert_that(results[3]['lines'][0], has_entries({'offset': 8, 'left': [], 'match': [u'gidecekler'], 'right': []}))
+
+        assert_that(results[4]['lines'], equal_to([{'offset': 6, 'left': [u'onu', u'something'], 'match': [u'gittim', u'giderim'], 'right': [u'gidecekler', u'gideceğim'], 'parse_results': self.service._parse_results[6:8]}]))
+
+        assert_that(results[5], equal_to({'total': 0, 'page': 0, 'page_size': 25, 'lines': []}))
+
+    def test_should_page_results(self):
+        queries = [{'index': 'full_word', 'type': 'prefix', 'key': u'gid', 'page': page} for page in range(4)]
+        results = self.service.query_batch({'queries': queries, 'page_size': 2})['results']
+
+        assert_that([result['total'] for result in results], equal_to([5, 5, 5, 5]))
+        assert_that([[line['offset'] for line in result['lines']] for result in results], equal_to([[7, 8], [9, 10], [11], []]))
+
+    def test_should_return_errors_of_invalid_queries(self):
+        results = self.service.query_batch({
+            'queries': [
+                {'index': 'unknown', 'key': u'o'},
+                {'type': 'unknown', 'key': u'o'},
+                {'key': u''},
+                {'type': 'phrase', 'key': u'o'},
+                {'key': u'o', 'page_size': 0},
+                {'key': u'o', 'secondary_syntactic_category': SecondarySyntacticCategory.PERSONAL},
+                'o',
+                {'key': u'o'}
+            ]
+        })['results']
+
+        assert_that(all(['error' in result for result in results[:-1]]))
+        assert_that(results[-1]['total'], equal_to(3))
+
+        self.assertRaises(ConcordanceQueryException, lambda: self.service.query_batch({'query': []}))
+
+    def test_should_return_errors_of_queries_with_invalid_field_types(self):
+        results = self.service.query_batch({
+            'queries': [
+                {'index': ['full_word'], 'key': u'o'},
+                {'type': {'word': True}, 'key': u'o'},
+                {'key': u'o', 'syntactic_category': [u'Pron']},
+                {'key': u'o', 'syntactic_category': u'Pron', 'secondary_syntactic_category': 1},
+                {'key': u'o'}
+            ]
+        })['results']
+
+        assert_that(all(['error' in result for result in results[:-1]]))
+        assert_that(results[-1]['total'], equal_to(3))
+
+
+class ConcordanceServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ConcordanceServer(ConcordanceService.from_parseset(SAMPLE_PARSESET_PATH))
+        cls.server.start()
+        cls.client = ConcordanceClient(cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_should_answer_queries_over_http(self):
+        assert_that(self.client.indexes(), equal_to({'indexes': INDEX_NAMES, 'word_count': 12}))
+
+        results = self.client.query_batch([
+            {'index': 'full_word', 'type': 'word', 'key': u'gideceğim'},
+            {'index': 'lemma', 'type': 'word', 'key': u'git', 'syntactic_category': SyntacticCategory.VERB},
+            {'index': 'full_word', 'type': 'word', 'key': u''}
+        ], context=1)
+
+        assert_that(results[0]['total'], equal_to(2))
+        assert_that(results[0]['lines'][0], has_entries({'offset': 9, 'left': [u'gidecekler'], 'match': [u'gideceğim'], 'right': [u'gidecekler']}))
+        assert_that(results[1]['total'], equal_to(6))
+        assert_that(results[2], has_key('error'))
+
+        assert_that(self.client.query('full_word', 'phrase', [u'o', u'o'])['total'], equal_to(2))
+        self.assertRaises(ConcordanceQueryException, lambda: self.client.query('unknown', 'word', u'o'))
+
+    def test_should_reject_malformed_requests(self):
+        self.assertRaises(ConcordanceQueryException, lambda: self.client.query_batch(None))
+
+
+class LoadConcordanceIndexesTest(unittest.TestCase):
+    def test_should_save_and_load_indexes(self):
+        word_list = list(StreamingParseSetReader(SAMPLE_PARSESET_PATH).iter_words())
+        temp_dir = tempfile.mkdtemp()
+        try:
+            built_indexes = load_concordance_indexes(word_list, temp_dir)
+            loaded_indexes = load_concordance_indexes(word_list, temp_dir)
+
+            for name in INDEX_NAMES:
+                assert_that(loaded_indexes[name]._loaded_from, equal_to(os.path.join(temp_dir, name)))
+                assert_that(loaded_indexes[name].prefix_offsets(u'g'), equal_to(built_indexes[name].prefix_offsets(u'g')))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_should_build_again_when_words_are_different(self):
+        word_list = list(StreamingParseSetReader(SAMPLE_PARSESET_PATH).iter_words())
+        temp_dir = tempfile.mkdtemp()
+        try:
+            load_concordance_indexes(word_list, temp_dir)
+
+            shorter_word_list = word_list[1:]
+            indexes = load_concordance_indexes(shorter_word_list, temp_dir)
+            assert_that(indexes['full_word']._loaded_from, is_(None))
+            assert_that(indexes['full_word'].prefix_offsets(u'g'), equal_to(load_concordance_indexes(shorter_word_list)['full_word'].prefix_offsets(u'g')))
+
+            # same number of words, but a different one
+            edited_word_list = word_list[:1] + word_list[:1] + word_list[2:]
+            assert_that(load_concordance_indexes(edited_word_list, temp_dir)['full_word']._loaded_from, is_(None))
+            assert_that(load_concordance_indexes(edited_word_list, temp_dir)['full_word']._loaded_from, equal_to(os.path.join(temp_dir, 'full_word')))
+        finally:
+            shutil.rmtree(temp_dir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# coding=utf-8
+"""
+Copyright  2012  Ali Ok (aliokATapacheDOTorg)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+from hamcrest import *
+from trnltk.morphology.model.lexeme import SyntacticCategory, SecondarySyntacticCategory
+from trnltk.parseset.xmlbindings import UnparsableWordBinding
+from trnltk.parseset.xmlstreaming import StreamingParseSetReader
+from trnltk.treebank.explorer import CompleteWordConcordanceIndex, RootConcordanceIndex, DictionaryItemConcordanceIndex, TransitionWordConcordanceIndex, TransitionMatchedWordConcordanceIndex, build_concordance_indexes
+from trnltk.treebank.suffixarray import build_suffix_array, CompleteWordSuffixArrayConcordanceIndex, RootSuffixArrayConcordanceIndex, DictionaryItemSuffixArrayConcordanceIndex, TransitionWordSuffixArrayConcordanceIndex, TransitionMatchedWordSuffixArrayConcordanceIndex
+
+SAMPLE_PARSESET_PATH = os.path.join(os.path.dirname(__file__), 'concordance_sample_parseset.xml')
+
+class BuildSuffixArrayTest(unittest.TestCase):
+    def _assert_suffix_array(self, text):
+        codes = numpy.array([ord(c) for c in text], dtype=numpy.int32)
+        expected = sorted(range(len(text)), key=lambda i: text[i:])
+        assert_that(build_suffix_array(codes).tolist(), equal_to(expected))
+
+    def test_should_build_suffix_array(self):
+        self._assert_suffix_array(u'')
+        self._assert_suffix_array(u'a')
+        self._assert_suffix_array(u'banana')
+        self._assert_suffix_array(u'aaaaaaaaaaaaaaaaaaaaa')
+        self._assert_suffix_array(u'\x00kitap\x00kitabı\x00\x00ağaç\x00kitapçı\x00')
+
+
+class SuffixArrayConcordanceIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.word_list = list(StreamingParseSetReader(SAMPLE_PARSESET_PATH).iter_words())
+
+    def test_should_find_same_offsets_with_explorer_indexes(self):
+        index_class_pairs = [
+            (CompleteWordConcordanceIndex, CompleteWordSuffixArrayConcordanceIndex),
+            (RootConcordanceIndex, RootSuffixArrayConcordanceIndex),
+            (DictionaryItemConcordanceIndex, DictionaryItemSuffixArrayConcordanceIndex),
+            (TransitionWordConcordanceIndex, TransitionWordSuffixArrayConcordanceIndex),
+            (TransitionMatchedWordConcordanceIndex, TransitionMatchedWordSuffixArrayConcordanceIndex)
+        ]
+
+        for parseset_index in ('001', '002'):
+            word_list = list(StreamingParseSetReader(os.path.join(os.path.dirname(__file__), '../../testresources/parsesets/parseset{}.xml'.format(parseset_index))).iter_words())
+            indexes = build_concordance_indexes(word_list, [index_class for pair in index_class_pairs for index_class in pair])
+
+            for i in range(0, len(indexes), 2):
+                explorer_index, suffix_array_index = indexes[i], indexes[i + 1]
+                hierarchy = explorer_index._offsets._indices
+                for key in hierarchy.iterkeys():
+                    if not key:
+                        continue
+                    assert_that(suffix_array_index.offsets(key), equal_to(explorer_index.offsets(key)), key)
+                    for syntactic_category in hierarchy[key].iterkeys():
+                        assert_that(suffix_array_index.offsets(key, syntactic_category), equal_to(explorer_index.offsets(key, syntactic_category)))
+                        for secondary_syntactic_category in hierarchy[key][syntactic_category].iterkeys():
+                            assert_that(suffix_array_index.offsets(key, syntactic_category, secondary_syntactic_category),
+                                equal_to(explorer_index.offsets(key, syntactic_category, secondary_syntactic_category)))
+
+    def test_should_find_exact_keys(self):
+        idx = CompleteWordSuffixArrayConcordanceIndex(self.word_list)
+
+        assert_that(idx.offsets(u'something'), equal_to([]))
+        assert_that(idx.offsets(u'o'), equal_to([0, 1, 2]))
+        assert_that(idx.offsets(u'o', SyntacticCategory.PRONOUN), equal_to([0, 1]))
+        assert_that(idx.offsets(u'o', SyntacticCategory.PRONOUN, SecondarySyntacticCategory.DEMONSTRATIVE), equal_to([1]))
+        assert_that(idx.offsets(u'o', u'UnknownCategory'), equal_to([]))
+        assert_that(idx.offsets(u'gidecekler', SyntacticCategory.NOUN), equal_to([10]))
+
+    def test_should_find_prefixes(self):
+        idx = CompleteWordSuffixArrayConcordanceIndex(self.word_list)
+
+        assert_that(idx.prefix_offsets(u'o'), equal_to([i for i, word in enumerate(self.word_list) if word.str.startswith(u'o')]))
+        assert_that(idx.prefix_offsets(u'on'), equal_to([3, 4]))
+        assert_that(idx.prefix_offsets(u'gidecek'), equal_to([8, 10]))
+        assert_that(idx.prefix_offsets(u'gide', SyntacticCategory.NOUN), equal_to([10, 11]))
+        assert_that(idx.prefix_offsets(u'xyz'), equal_to([]))
+
+    def test_should_find_substrings(self):
+        idx = CompleteWordSuffixArrayConcordanceIndex(self.word_list)
+
+        for substring in (u'ecek', u'e', u'ğim', u'nu'):
+            assert_that(idx.substring_offsets(substring), equal_to([i for i, word in enumerate(self.word_list) if substring in word.str and not isinstance(word, UnparsableWordBinding)]))
+
+        assert_that(idx.substring_offsets(u'ecek', SyntacticCategory.VERB), equal_to([8]))
+
+    def test_should_find_phrases(self):
+        idx = CompleteWordSuffixArrayConcordanceIndex(self.word_list)
+        surfaces = [word.str for word in self.word_list]
+
+        assert_that(idx.phrase_offsets([u'o', u'o']), equal_to([0, 1]))
+        assert_that(idx.phrase_offsets([u'o', u'o', u'o']), equal_to([0]))
+        assert_that(idx.phrase_offsets([u'o', u'on'], last_word_as_prefix=True), equal_to([2]))
+        assert_that(idx.phrase_offsets([u'o', u'on']), equal_to([]))
+        assert_that(idx.phrase_offsets(surfaces[6:9]), equal_to([6]))
+
+    def test_should_not_find_phrases_over_unparsable_words_or_in_a_word(self):
+        word_list = list(self.word_list[:4])
+        word_list.insert(2, UnparsableWordBinding(u'xyz'))
+
+        idx = CompleteWordSuffixArrayConcordanceIndex(word_list)
+        assert_that(idx.phrase_offsets([u'o', u'o']), equal_to([0]))
+        assert_that(idx.offsets(u'onu'), equal_to([4]))
+
+        # last transition of the first word and the first transition of the second one
+        idx = TransitionWordSuffixArrayConcordanceIndex(self.word_list)
+        assert_that(idx.phrase_offsets([u'o', u'o']), equal_to([0]))
+
+    def test_should_save_and_load(self):
+        idx = TransitionWordSuffixArrayConcordanceIndex(self.word_list)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            idx.save(temp_dir)
+            loaded = TransitionWordSuffixArrayConcordanceIndex.load(temp_dir)
+
+            assert_that(loaded.offsets(u'gidecek', SyntacticCategory.ADJECTIVE), equal_to(idx.offsets(u'gidecek', SyntacticCategory.ADJECTIVE)))
+            assert_that(loaded.prefix_offsets(u'gid'), equal_to(idx.prefix_offsets(u'gid')))
+            assert_that(loaded.substring_offsets(u'ece'), equal_to(idx.substring_offsets(u'ece')))
+            assert_that(loaded.phrase_offsets([u'o', u'o']), equal_to(idx.phrase_offsets([u'o', u'o'])))
+            assert_that(loaded.prefix_offsets(u'gid'), is_not(empty()))
+
+            self.assertRaises(Exception, lambda: loaded.add_word(100, self.word_list[0]))
+            self.assertRaises(Exception, lambda: RootSuffixArrayConcordanceIndex.load(temp_dir))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_should_build_again_after_adding_words(self):
+        idx = CompleteWordSuffixArrayConcordanceIndex(self.word_list[:3])
+        assert_that(idx.offsets(u'onu'), equal_to([]))
+
+        idx.add_word(3, self.word_list[3])
+        assert_that(idx.offsets(u'onu'), equal_to([3]))
+
+if __name__ == '__main__':
+    unittest.main()